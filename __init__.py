@@ -151,14 +151,29 @@ def ensure_dependencies():
         logger.error(f"依存関係管理システムをインポートできません: {e}")
         return False
 
-# 依存関係を確認
-DEPENDENCIES_AVAILABLE = ensure_dependencies()
+# 遅延ロードとインポート時間の計測
+from .utils import lazy_loader
 
-# サーバーモジュール（条件付きインポート）
-if DEPENDENCIES_AVAILABLE:
-    from .core import server_adapter
-else:
-    logger.error("依存関係が不足しているため、MCPサーバーは起動できません")
+# 依存関係の確認は起動パスの外（register後のメインスレッドのタイマー）で実行する
+_dependency_check = None
+
+def dependencies_available(timeout=None):
+    """
+    依存関係チェックの結果を取得（未完了の場合は完了を待つ）
+    
+    Args:
+        timeout: 最大待機時間（秒、Noneで完了まで待機）
+        
+    Returns:
+        依存関係が揃っている場合はTrue
+    """
+    global _dependency_check
+    if _dependency_check is None:
+        _dependency_check = lazy_loader.DeferredTask("dependency_check", ensure_dependencies)
+    return bool(_dependency_check.wait(timeout))
+
+# サーバーモジュール（最初に必要になった時点でインポート）
+server_adapter = lazy_loader.lazy_import('.core.server_adapter', __name__, purpose="GraphQL/RESTサーバー")
 
 # BlenderにMCP設定を登録
 class MCPAddonPreferences(bpy.types.AddonPreferences):
@@ -211,8 +226,8 @@ class MCP_PT_server_panel(bpy.types.Panel):
         # 強制的に状態を再取得する - 複数の方法で状態を確認
         is_running = False
         
-        # サーバーアダプタからの状態取得を試行
-        if 'server_adapter' in globals() and hasattr(server_adapter, 'is_server_running'):
+        # サーバーアダプタからの状態取得を試行（未ロードならサーバーは起動していない）
+        if lazy_loader.is_loaded(server_adapter) and hasattr(server_adapter, 'is_server_running'):
             # サーバー状態を明示的に確認
             is_running = server_adapter.is_server_running()
             
@@ -265,8 +280,8 @@ class MCP_OT_start_server(bpy.types.Operator):
         except ImportError:
             logger.warning("エラーハンドラモジュールをインポートできません")
         
-        # 依存関係チェック
-        deps_result = ensure_dependencies()
+        # 依存関係チェック（バックグラウンドのチェックが未完了なら完了を待つ）
+        deps_result = dependencies_available()
         if not deps_result:
             logger.warning("依存関係が不足していますが、サーバー起動を試みます")
             # エラーハンドラを使用してエラーログを記録（オプション）
@@ -355,7 +370,7 @@ class MCP_OT_start_server(bpy.types.Operator):
                 def health_check_timer():
                     """サーバー状態を定期的に確認し、必要であれば回復する"""
                     try:
-                        if 'server_adapter' in globals():
+                        if lazy_loader.is_loaded(server_adapter):
                             # サーバーが実行中フラグだが、接続テストに失敗する場合は再起動を試みる
                             is_running_flag = server_adapter.is_server_running()
                             
@@ -577,6 +592,8 @@ classes = (
 
 # アドオン登録
 def register():
+    global _dependency_check
+    
     # 各クラスを登録
     for cls in classes:
         bpy.utils.register_class(cls)
@@ -591,6 +608,10 @@ def register():
     except Exception as e:
         logger.error(f"標準MCP対応の登録でエラーが発生しました: {str(e)}")
     
+    # 依存関係チェックをregister完了後のメインスレッドで実行
+    if _dependency_check is None:
+        _dependency_check = lazy_loader.run_deferred("dependency_check", ensure_dependencies)
+    
     # ハンドラを登録
     if hasattr(bpy.app, 'handlers') and hasattr(bpy.app.handlers, 'save_pre'):
         # save_pre ハンドラが存在する場合のみ追加
@@ -602,19 +623,20 @@ def register():
         
         # 保存前にサーバーを停止する関数
         def mcp_save_handler(dummy):
-            # server_adapterが存在するか確認
-            if 'server_adapter' in globals():
+            # server_adapterがロード済みか確認（未ロードならサーバーは起動していない）
+            if lazy_loader.is_loaded(server_adapter):
                 # サーバーが起動しているか確認
                 if hasattr(server_adapter, 'is_server_running') and server_adapter.is_server_running():
                     # サーバーを停止
                     server_adapter.stop_server()
                     print("MCPサーバーを保存前に停止しました")
             
-            # 標準MCPサーバーも停止
+            # 標準MCPサーバーも停止（ロード済みの場合のみ）
             try:
-                from blender_mcp.tools.mcp_server_manager import stop_mcp_server
-                stop_mcp_server()
-                print("標準MCPサーバーを保存前に停止しました")
+                manager = sys.modules.get('blender_mcp.tools.mcp_server_manager')
+                if manager is not None:
+                    manager.stop_mcp_server()
+                    print("標準MCPサーバーを保存前に停止しました")
             except ImportError:
                 pass
             except Exception as e:
@@ -624,6 +646,10 @@ def register():
         bpy.app.handlers.save_pre.append(mcp_save_handler)
     
     logger.info("Blender JSON MCP アドオンを登録しました")
+    
+    # 起動時間と遅延したモジュールを記録
+    lazy_loader.profiler.startup_complete()
+    lazy_loader.profiler.log_report()
 
 # アドオン登録解除
 def unregister():
@@ -638,11 +664,12 @@ def unregister():
                 except ValueError:
                     pass
     
-    # 標準MCPサーバーを停止
+    # 標準MCPサーバーを停止（ロード済みの場合のみ）
     try:
-        from blender_mcp.tools.mcp_server_manager import stop_mcp_server
-        stop_mcp_server()
-        print("標準MCPサーバーを停止しました")
+        manager = sys.modules.get('blender_mcp.tools.mcp_server_manager')
+        if manager is not None:
+            manager.stop_mcp_server()
+            print("標準MCPサーバーを停止しました")
     except ImportError:
         pass
     except Exception as e:
@@ -658,9 +685,34 @@ def unregister():
     except Exception as e:
         logger.error(f"標準MCP対応の登録解除でエラーが発生しました: {str(e)}")
     
+    # メッシュ解析キャッシュのハンドラを削除（ロード済みの場合のみ）
+    analysis_cache = sys.modules.get(f"{__name__}.core.mesh_analysis_cache")
+    if analysis_cache is not None:
+        analysis_cache.mesh_analysis_cache.unregister_handlers()
+    
+    # BVHキャッシュのハンドラを削除（ロード済みの場合のみ）
+    numpy_optimizers = sys.modules.get(f"{__name__}.core.numpy_optimizers")
+    if numpy_optimizers is not None:
+        numpy_optimizers.unregister_handlers()
+    
+    # シーン階層インデックスのハンドラを削除（ロード済みの場合のみ）
+    hierarchy_index = sys.modules.get(f"{__name__}.core.scene_hierarchy_index")
+    if hierarchy_index is not None:
+        hierarchy_index.scene_hierarchy_index.unregister_handlers()
+    
+    # マテリアルフィンガープリントインデックスのハンドラを削除（ロード済みの場合のみ）
+    fingerprint_index = sys.modules.get(f"{__name__}.core.material_fingerprint_index")
+    if fingerprint_index is not None:
+        fingerprint_index.material_fingerprint_index.unregister_handlers()
+
+    # クエリコスト分析のハンドラを削除（ロード済みの場合のみ）
+    query_cost = sys.modules.get(f"{__name__}.tools.query_cost") or sys.modules.get("tools.query_cost")
+    if query_cost is not None:
+        query_cost.unregister_handlers()
+
     # GraphQLサーバーが起動している場合は停止
     try:
-        if 'server_adapter' in globals() and hasattr(server_adapter, 'is_server_running') and server_adapter.is_server_running():
+        if lazy_loader.is_loaded(server_adapter) and server_adapter.is_server_running():
             server_adapter.stop_server()
             print("GraphQL MCPサーバーを停止しました")
     except:
@@ -673,6 +725,10 @@ def unregister():
         except:
             pass
     
+    # 今回のインポート計測値を次回の削減量推定用に保存
+    lazy_loader.profiler.log_report()
+    lazy_loader.profiler.save()
+    
     logger.info("Blender JSON MCP アドオンの登録を解除しました")
 
 # モジュールが直接実行された場合
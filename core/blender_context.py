@@ -6,15 +6,23 @@ Blenderの現在の状態を取得・管理するモジュール
 import bpy
 import json
 import logging
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, Optional, Set, Tuple, Union
 from datetime import datetime
 
+from .context.base_context import BaseContext
+
 # モジュールレベルのロガー
 logger = logging.getLogger('blender_mcp.core.context')
 
 class BlenderContextManager:
     """Blenderの状態を管理するクラス"""
     
+    # get_complete_contextで取得できるセクション
+    CONTEXT_SECTIONS = [
+        "scene", "selected_objects", "active_object", "viewport",
+        "mode", "tool", "preferences", "available_operations"
+    ]
+    
     def __init__(self):
         self.last_context = None
         self.context_history = []
@@ -40,24 +48,55 @@ class BlenderContextManager:
     
     def get_selected_objects(self) -> List[Dict[str, Any]]:
         """選択中のオブジェクト情報を取得"""
+        selected, _ = self._get_selected_objects_page(None, len(bpy.context.selected_objects) or 1, None)
+        return selected
+    
+    def _get_selected_objects_page(self, items: Optional[Set[str]], limit: int,
+                                   cursor: Optional[str]) -> Tuple[List[Dict[str, Any]], Dict[str, Any]]:
+        """
+        選択中のオブジェクト情報をページ単位で取得
+        
+        Args:
+            items: 取得する項目（Noneで全項目、idは常に含む）
+            limit: 1ページの件数
+            cursor: 前のページのnext_cursor
+            
+        Returns:
+            (オブジェクト情報のリスト, ページ情報)
+        """
         selected = []
+        page = {"next_cursor": None, "total": 0, "count": 0}
+        
+        def wanted(item: str) -> bool:
+            return items is None or item in items
+        
         try:
-            for obj in bpy.context.selected_objects:
-                obj_info = {
-                    "id": obj.name,
-                    "type": obj.type,
-                    "location": list(obj.location),
-                    "rotation": list(obj.rotation_euler),
-                    "scale": list(obj.scale),
-                    "visible": obj.visible_get(),
-                    "parent": obj.parent.name if obj.parent else None,
-                    "children": [child.name for child in obj.children],
-                    "modifiers": [mod.name for mod in obj.modifiers],
-                    "data": self._get_object_data(obj)
-                }
+            objects, page = BaseContext.paginate(
+                list(bpy.context.selected_objects), lambda obj: obj.name, limit, cursor
+            )
+            for obj in objects:
+                obj_info = {"id": obj.name}
+                if wanted("type"):
+                    obj_info["type"] = obj.type
+                if wanted("location"):
+                    obj_info["location"] = list(obj.location)
+                if wanted("rotation"):
+                    obj_info["rotation"] = list(obj.rotation_euler)
+                if wanted("scale"):
+                    obj_info["scale"] = list(obj.scale)
+                if wanted("visible"):
+                    obj_info["visible"] = obj.visible_get()
+                if wanted("parent"):
+                    obj_info["parent"] = obj.parent.name if obj.parent else None
+                if wanted("children"):
+                    obj_info["children"] = [child.name for child in obj.children]
+                if wanted("modifiers"):
+                    obj_info["modifiers"] = [mod.name for mod in obj.modifiers]
+                if wanted("data"):
+                    obj_info["data"] = self._get_object_data(obj)
                 
                 # メッシュ特有の情報
-                if obj.type == 'MESH' and obj.data:
+                if wanted("mesh") and obj.type == 'MESH' and obj.data:
                     obj_info["mesh"] = {
                         "vertices": len(obj.data.vertices),
                         "edges": len(obj.data.edges),
@@ -70,7 +109,7 @@ class BlenderContextManager:
         except Exception as e:
             logger.error(f"選択オブジェクト取得エラー: {e}")
             
-        return selected
+        return selected, page
     
     def get_active_object(self) -> Optional[Dict[str, Any]]:
         """アクティブオブジェクトの詳細情報を取得"""
@@ -132,22 +171,50 @@ class BlenderContextManager:
             logger.error(f"ビューポートコンテキスト取得エラー: {e}")
             return {}
     
-    def get_complete_context(self) -> Dict[str, Any]:
-        """完全なコンテキスト情報を取得"""
-        context = {
-            "scene": self.get_scene_context(),
-            "selected_objects": self.get_selected_objects(),
-            "active_object": self.get_active_object(),
-            "viewport": self.get_viewport_context(),
-            "mode": bpy.context.mode,
-            "tool": bpy.context.workspace.tools.active.idname if bpy.context.workspace.tools.active else None,
-            "preferences": {
+    def get_complete_context(self, fields: Union[str, List[str], None] = None,
+                             limit: Optional[int] = None,
+                             cursor: Optional[str] = None) -> Dict[str, Any]:
+        """
+        完全なコンテキスト情報を取得
+        
+        Args:
+            fields: 取得するフィールド（例: ["scene", "selected_objects.location"]、Noneで全セクション）
+            limit: selected_objectsの1ページの件数（Noneで全件）
+            cursor: selected_objectsの前回のnext_cursor
+            
+        Returns:
+            要求されたセクションのみを含むコンテキスト情報
+        """
+        selection = BaseContext.parse_fields(fields)
+        if selection is None:
+            selection = {section: None for section in self.CONTEXT_SECTIONS}
+        limit = BaseContext.normalize_limit(limit)
+        
+        builders = {
+            "scene": self.get_scene_context,
+            "active_object": self.get_active_object,
+            "viewport": self.get_viewport_context,
+            "mode": lambda: bpy.context.mode,
+            "tool": lambda: bpy.context.workspace.tools.active.idname if bpy.context.workspace.tools.active else None,
+            "preferences": lambda: {
                 "units": bpy.context.scene.unit_settings.system,
                 "scale_length": bpy.context.scene.unit_settings.scale_length
             },
-            "available_operations": self._get_available_operations()
+            "available_operations": self._get_available_operations
         }
         
+        # 要求されたセクションのみ計算
+        context = {}
+        for section, items in selection.items():
+            if section == "selected_objects":
+                context[section], page = self._get_selected_objects_page(items, limit, cursor)
+                context["page_info"] = {section: page}
+            elif section in builders:
+                value = builders[section]()
+                context[section] = BaseContext.project(value, items) if isinstance(value, dict) else value
+            else:
+                context.setdefault("unknown_fields", []).append(section)
+        
         # 履歴に保存
         self.last_context = context
         self.context_history.append({
@@ -4,11 +4,18 @@ LLMの自然言語指示を正確なBlender操作に変換するためのテン
 """
 
 import logging
-from typing import Dict, Any, List, Optional, Callable
+from collections import deque, OrderedDict
+from typing import Dict, Any, List, Optional, Callable, Set
 from dataclasses import dataclass, field
 
 logger = logging.getLogger('blender_mcp.command_templates')
 
+# find_best_matchの結果を保持する最近の入力数
+MATCH_MEMO_SIZE = 256
+
+# テンプレートとして採用する最低スコア
+MIN_MATCH_SCORE = 0.3
+
 @dataclass
 class CommandTemplate:
     """コマンドテンプレートの定義"""
@@ -39,11 +46,90 @@ class CommandTemplate:
             logger.error(f"Missing parameter for template {self.id}: {e}")
             raise
 
+class KeywordMatcher:
+    """
+    Aho-Corasickオートマトンによるキーワード検索
+    
+    全テンプレートのキーワードを一つのオートマトンにまとめ、入力テキストを
+    一度走査するだけで出現したキーワードをすべて検出する。日本語のキーワードは
+    単語境界を持たないため、トークン単位ではなく部分文字列として照合する。
+    """
+    
+    def __init__(self, keywords: List[str]):
+        self.keywords = keywords
+        self._goto: List[Dict[str, int]] = [{}]
+        self._fail: List[int] = [0]
+        self._output: List[List[int]] = [[]]
+        
+        for index, keyword in enumerate(keywords):
+            self._insert(keyword, index)
+        self._build_failure_links()
+    
+    def _insert(self, keyword: str, index: int):
+        """キーワードをトライに追加"""
+        node = 0
+        for char in keyword:
+            next_node = self._goto[node].get(char)
+            if next_node is None:
+                next_node = len(self._goto)
+                self._goto[node][char] = next_node
+                self._goto.append({})
+                self._fail.append(0)
+                self._output.append([])
+            node = next_node
+        self._output[node].append(index)
+    
+    def _build_failure_links(self):
+        """幅優先で失敗リンクを構築し、出力を失敗先から継承"""
+        queue = deque(self._goto[0].values())
+        while queue:
+            node = queue.popleft()
+            for char, child in self._goto[node].items():
+                queue.append(child)
+                fallback = self._fail[node]
+                while fallback and char not in self._goto[fallback]:
+                    fallback = self._fail[fallback]
+                target = self._goto[fallback].get(char, 0)
+                self._fail[child] = target if target != child else 0
+                self._output[child] = self._output[child] + self._output[self._fail[child]]
+    
+    def find(self, text: str) -> Set[int]:
+        """
+        テキストに含まれるキーワードのインデックスを取得
+        
+        Args:
+            text: 検索対象のテキスト
+            
+        Returns:
+            出現したキーワードのインデックス
+        """
+        found = set(self._output[0])
+        node = 0
+        goto = self._goto
+        fail = self._fail
+        output = self._output
+        for char in text:
+            while node and char not in goto[node]:
+                node = fail[node]
+            node = goto[node].get(char, 0)
+            if output[node]:
+                found.update(output[node])
+        return found
+
+
 class CommandTemplateLibrary:
     """コマンドテンプレートのライブラリ"""
     
     def __init__(self):
         self.templates: Dict[str, CommandTemplate] = {}
+        
+        # キーワード索引（テンプレート追加時に無効化し、次の検索で再構築）
+        self._matcher: Optional[KeywordMatcher] = None
+        self._keyword_templates: List[List[tuple]] = []
+        self._template_order: Dict[str, int] = {}
+        self._indexed_count = 0
+        self._match_memo: "OrderedDict[str, Optional[str]]" = OrderedDict()
+        
         self._initialize_templates()
     
     def _initialize_templates(self):
@@ -238,19 +324,93 @@ obj.data.materials.append(mat)
     def add_template(self, template: CommandTemplate):
         """テンプレートを追加"""
         self.templates[template.id] = template
+        self._invalidate_index()
+    
+    def remove_template(self, template_id: str) -> bool:
+        """テンプレートを削除"""
+        if self.templates.pop(template_id, None) is None:
+            return False
+        self._invalidate_index()
+        return True
+    
+    def _invalidate_index(self):
+        """キーワード索引とマッチ結果のメモを破棄"""
+        self._matcher = None
+        self._match_memo.clear()
+    
+    def _build_index(self):
+        """全テンプレートのキーワードからオートマトンを構築"""
+        keyword_ids: Dict[str, int] = {}
+        keyword_templates: List[List[tuple]] = []
+        
+        for template in self.templates.values():
+            # 同じキーワードが複数回あれば、その回数だけスコアに寄与する（matches()と同じ）
+            counts: Dict[str, int] = {}
+            for keyword in template.keywords:
+                counts[keyword] = counts.get(keyword, 0) + 1
+            for keyword, count in counts.items():
+                index = keyword_ids.get(keyword)
+                if index is None:
+                    index = keyword_ids[keyword] = len(keyword_templates)
+                    keyword_templates.append([])
+                keyword_templates[index].append((template.id, count))
+        
+        self._matcher = KeywordMatcher(list(keyword_ids))
+        self._keyword_templates = keyword_templates
+        self._template_order = {template_id: order for order, template_id in enumerate(self.templates)}
+        self._indexed_count = len(self.templates)
+        logger.debug(f"テンプレート索引を構築: {len(self.templates)}テンプレート, {len(keyword_ids)}キーワード")
+    
+    def score_templates(self, text: str) -> Dict[str, float]:
+        """
+        入力テキストに対する各テンプレートのスコアを一度の走査で計算
+        
+        Args:
+            text: 自然言語コマンド
+            
+        Returns:
+            テンプレートID -> スコア（キーワードが一つも出現しないテンプレートは含まない）
+        """
+        if self._matcher is None or self._indexed_count != len(self.templates):
+            self._invalidate_index()
+            self._build_index()
+        
+        matched: Dict[str, int] = {}
+        for index in self._matcher.find(text.lower()):
+            for template_id, count in self._keyword_templates[index]:
+                matched[template_id] = matched.get(template_id, 0) + count
+        return {
+            template_id: count / len(self.templates[template_id].keywords)
+            for template_id, count in matched.items()
+        }
     
     def find_best_match(self, text: str) -> Optional[CommandTemplate]:
         """最も適合するテンプレートを検索"""
-        best_match = None
-        best_score = 0.0
+        if text in self._match_memo and self._matcher is not None \
+                and self._indexed_count == len(self.templates):
+            self._match_memo.move_to_end(text)
+            template_id = self._match_memo[text]
+            return self.templates.get(template_id) if template_id else None
         
-        for template in self.templates.values():
-            score = template.matches(text)
-            if score > best_score:
+        scores = self.score_templates(text)
+        
+        # 同点の場合は先に登録されたテンプレートを優先
+        best_id = None
+        best_score = 0.0
+        for template_id, score in scores.items():
+            if score > best_score or (score == best_score and best_id is not None
+                                      and self._template_order[template_id] < self._template_order[best_id]):
                 best_score = score
-                best_match = template
+                best_id = template_id
+        
+        if best_score <= MIN_MATCH_SCORE:
+            best_id = None
+        
+        self._match_memo[text] = best_id
+        if len(self._match_memo) > MATCH_MEMO_SIZE:
+            self._match_memo.popitem(last=False)
         
-        return best_match if best_score > 0.3 else None
+        return self.templates.get(best_id) if best_id else None
     
     def get_template(self, template_id: str) -> Optional[CommandTemplate]:
         """IDでテンプレートを取得"""
@@ -13,6 +13,7 @@ from mathutils import Vector, Matrix
 from .base import BlenderCommand, register_command
 from ..validation.mesh_checker import MeshChecker
 from ..validation.change_detector import ChangeDetector
+from ..mesh_operations import run_batch_boolean_operation
 
 class BooleanOperationCommand(BlenderCommand):
     """
@@ -391,7 +392,130 @@ class FixBooleanIssuesCommand(BlenderCommand):
         return result
 
 
+class BatchBooleanOperationCommand(BlenderCommand):
+    """
+    複数のカッターによるブーリアン操作を1回の評価で実行するコマンド
+    """
+    
+    command_name = "batch_boolean_operation"
+    description = "1つのメッシュに複数のカッターでブーリアン操作をまとめて実行"
+    
+    parameters_schema = {
+        "target_object": {
+            "type": "string",
+            "description": "操作のターゲットとなるオブジェクト名"
+        },
+        "cutter_objects": {
+            "type": "array",
+            "description": "カッターとして使用するオブジェクト名のリスト",
+            "items": {"type": "string"}
+        },
+        "operation": {
+            "type": "string",
+            "description": "実行するブーリアン操作のタイプ",
+            "enum": ["union", "difference", "intersect"]
+        },
+        "auto_repair": {
+            "type": "boolean",
+            "description": "問題が検出された入力のみ操作前に修復するかどうか",
+            "default": True
+        },
+        "delete_cutters": {
+            "type": "boolean",
+            "description": "操作後にカッターオブジェクトを削除するかどうか",
+            "default": False
+        },
+        "solver": {
+            "type": "string",
+            "description": "使用するブーリアンソルバー",
+            "enum": ["fast", "exact"],
+            "default": "exact"
+        }
+    }
+    
+    def validate(self, params: Dict[str, Any]) -> Dict[str, Any]:
+        """パラメータのバリデーション"""
+        errors = []
+        
+        if "target_object" not in params:
+            errors.append("target_object パラメータが必要です")
+        elif not bpy.data.objects.get(params["target_object"]):
+            errors.append(f"ターゲットオブジェクト '{params['target_object']}' が見つかりません")
+        
+        cutter_names = params.get("cutter_objects")
+        if not cutter_names:
+            errors.append("cutter_objects パラメータが必要です")
+        elif not isinstance(cutter_names, list):
+            errors.append("cutter_objects はオブジェクト名の配列である必要があります")
+        else:
+            not_found = [name for name in cutter_names if not bpy.data.objects.get(name)]
+            if not_found:
+                errors.append(f"次のカッターオブジェクトが見つかりません: {', '.join(not_found)}")
+            if params.get("target_object") in cutter_names:
+                errors.append("ターゲットとカッターは異なるオブジェクトである必要があります")
+        
+        if "operation" not in params:
+            errors.append("operation パラメータが必要です")
+        elif params["operation"] not in ["union", "difference", "intersect"]:
+            errors.append(f"無効な操作タイプ: {params['operation']}。'union', 'difference', 'intersect' のいずれかである必要があります")
+        
+        if "solver" in params and params["solver"] not in ["fast", "exact"]:
+            errors.append(f"無効なソルバー: {params['solver']}。'fast' または 'exact' である必要があります")
+        
+        return {"valid": len(errors) == 0, "errors": errors}
+    
+    def pre_execute(self, params: Dict[str, Any]) -> Dict[str, Any]:
+        """実行前処理"""
+        return {
+            "before_state": ChangeDetector.capture_state("standard")
+        }
+    
+    def execute(self, params: Dict[str, Any], pre_state: Dict[str, Any]) -> Dict[str, Any]:
+        """コマンド実行"""
+        target_name = params["target_object"]
+        cutter_names = params["cutter_objects"]
+        operation = params["operation"]
+        
+        # 修復の要否はジオメトリのキャッシュで判定し、問題のある入力のみ修復する
+        operation_result = run_batch_boolean_operation(
+            target_name, cutter_names, operation.upper(),
+            solver=params.get("solver", "exact").upper(),
+            auto_repair=params.get("auto_repair", True)
+        )
+        success = operation_result["status"] == "success"
+        
+        # カッターの削除（オプション）
+        deleted_cutters = []
+        if success and params.get("delete_cutters", False):
+            for name in cutter_names:
+                cutter = bpy.data.objects.get(name)
+                if cutter:
+                    bpy.data.objects.remove(cutter, do_unlink=True)
+                    deleted_cutters.append(name)
+        
+        result = {
+            "success": success,
+            "operation": operation,
+            "target": target_name,
+            "cutters": cutter_names,
+            "details": operation_result["details"]
+        }
+        if deleted_cutters:
+            result["deleted_cutters"] = deleted_cutters
+        if not success:
+            result["error"] = operation_result["message"]
+        
+        return result
+    
+    def post_execute(self, params: Dict[str, Any], result: Dict[str, Any], pre_state: Dict[str, Any]) -> Dict[str, Any]:
+        """実行後処理"""
+        after_state = ChangeDetector.capture_state("standard")
+        result["changes"] = ChangeDetector.compare_states(pre_state["before_state"], after_state)
+        return result
+
+
 # コマンドを登録
 def register():
     register_command(BooleanOperationCommand)
     register_command(FixBooleanIssuesCommand)
+    register_command(BatchBooleanOperationCommand)
@@ -12,6 +12,7 @@ from mathutils import Vector, Matrix, Euler
 
 from .base import BlenderCommand, register_command
 from ..validation.change_detector import ChangeDetector
+from ..scene_hierarchy_index import scene_hierarchy_index
 
 class CreateObjectCommand(BlenderCommand):
     """
@@ -446,7 +447,10 @@ class DeleteObjectCommand(BlenderCommand):
         return result
     
     def _get_children_recursive(self, obj) -> List[bpy.types.Object]:
-        """指定オブジェクトの子孫をすべて取得（再帰的に）"""
+        """指定オブジェクトの子孫をすべて取得（削除対象なので常にライブの親子関係を使う）"""
+        if hasattr(obj, "children_recursive"):
+            # Blender 3.1以降
+            return list(obj.children_recursive)
         children = []
         for child in obj.children:
             children.append(child)
@@ -454,6 +458,80 @@ class DeleteObjectCommand(BlenderCommand):
         return children
 
 
+class GetObjectHierarchyCommand(BlenderCommand):
+    """
+    オブジェクトの階層情報（親・祖先・子孫）を取得するコマンド
+    """
+    
+    command_name = "get_object_hierarchy"
+    description = "指定されたオブジェクトの親子関係・深さ・祖先・子孫を取得"
+    
+    parameters_schema = {
+        "object_name": {
+            "type": "string",
+            "description": "起点のオブジェクト名"
+        },
+        "include_ancestors": {
+            "type": "boolean",
+            "description": "親からルートまでの祖先を含めるかどうか",
+            "default": True
+        },
+        "include_subtree": {
+            "type": "boolean",
+            "description": "子孫（サブツリー）を含めるかどうか",
+            "default": True
+        },
+        "select_subtree": {
+            "type": "boolean",
+            "description": "起点とその子孫を選択状態にするかどうか",
+            "default": False
+        }
+    }
+    
+    def validate(self, params: Dict[str, Any]) -> Dict[str, Any]:
+        """パラメータのバリデーション"""
+        errors = []
+        
+        if "object_name" not in params or not params["object_name"]:
+            errors.append("object_name パラメータが必要です")
+        elif not bpy.data.objects.get(params["object_name"]):
+            errors.append(f"オブジェクト '{params['object_name']}' が見つかりません")
+        
+        return {"valid": len(errors) == 0, "errors": errors}
+    
+    def execute(self, params: Dict[str, Any], pre_state: Dict[str, Any]) -> Dict[str, Any]:
+        """コマンド実行"""
+        object_name = params["object_name"]
+        
+        result = {
+            "success": True,
+            "object": scene_hierarchy_index.get_node(object_name)
+        }
+        
+        if params.get("include_ancestors", True):
+            result["ancestors"] = scene_hierarchy_index.get_ancestors(object_name)
+        
+        subtree = None
+        if params.get("include_subtree", True) or params.get("select_subtree", False):
+            subtree = scene_hierarchy_index.get_subtree(object_name, include_root=False)
+        if params.get("include_subtree", True):
+            result["subtree"] = subtree
+        
+        if params.get("select_subtree", False):
+            # サブツリーを選択
+            bpy.ops.object.select_all(action='DESELECT')
+            selected = []
+            for name in [object_name] + subtree:
+                obj = bpy.data.objects.get(name)
+                if obj:
+                    obj.select_set(True)
+                    selected.append(name)
+            bpy.context.view_layer.objects.active = bpy.data.objects[object_name]
+            result["selected_objects"] = selected
+        
+        return result
+
+
 class TransformObjectCommand(BlenderCommand):
     """
     オブジェクトを変形（移動・回転・スケール）するコマンド
@@ -633,3 +711,4 @@ def register():
     register_command(CreateObjectCommand)
     register_command(DeleteObjectCommand)
     register_command(TransformObjectCommand)
+    register_command(GetObjectHierarchyCommand)
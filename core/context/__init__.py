@@ -11,10 +11,10 @@ from .object_context import ObjectContext
 # ロガー設定
 logger = logging.getLogger('unified_mcp.context')
 
-def get_scene_context(detail_level: str = "standard"):
-    """シーンコンテキストを取得"""
+def get_scene_context(detail_level: str = "standard", fields=None, limit=None, cursor=None):
+    """シーンコンテキストを取得（fields・limit・cursorはSceneContext.get_contextを参照）"""
     try:
-        return SceneContext.get_context(detail_level)
+        return SceneContext.get_context(detail_level, fields=fields, limit=limit, cursor=cursor)
     except Exception as e:
         logger.error(f"シーンコンテキスト取得エラー: {e}")
         import traceback
@@ -3,10 +3,17 @@
 コンテキスト分析の共通機能を提供する基底クラス
 """
 
+import os
+import bisect
 import bpy
 import bmesh
 from typing import Dict, List, Any, Optional, Tuple, Set, Union
 
+# ページングの既定件数と上限
+# 既定のページ件数（0の場合、limit未指定ではページ分割しない）
+DEFAULT_PAGE_SIZE = int(os.environ.get('MCP_CONTEXT_PAGE_SIZE', '0'))
+MAX_PAGE_SIZE = int(os.environ.get('MCP_CONTEXT_MAX_PAGE_SIZE', '1000'))
+
 class BaseContext:
     """
     コンテキスト分析のための共通機能を提供する基底クラス
@@ -90,4 +97,89 @@ class BaseContext:
             "selected": obj.select_get(),
             "parent": obj.parent.name if obj.parent else None,
             "children_count": len(obj.children)
-        }
\ No newline at end of file
+        }
+    
+    @staticmethod
+    def parse_fields(fields: Union[str, List[str], None]) -> Optional[Dict[str, Optional[Set[str]]]]:
+        """
+        フィールド指定をセクションごとの選択に変換
+        
+        "objects" はセクション全体、"objects.name" はセクション内の項目を表す。
+        
+        Args:
+            fields: カンマ区切りの文字列またはフィールド名のリスト（Noneで指定なし）
+            
+        Returns:
+            セクション名 → 項目名の集合（Noneは全項目）、指定がなければNone
+        """
+        if fields is None:
+            return None
+        if isinstance(fields, str):
+            fields = fields.split(',')
+        
+        selection: Dict[str, Optional[Set[str]]] = {}
+        for field in fields:
+            field = field.strip()
+            if not field:
+                continue
+            section, _, item = field.partition('.')
+            if not item:
+                selection[section] = None
+            elif section not in selection:
+                selection[section] = {item}
+            elif selection[section] is not None:
+                selection[section].add(item)
+        return selection
+    
+    @staticmethod
+    def project(data: Dict[str, Any], items: Optional[Set[str]]) -> Dict[str, Any]:
+        """
+        辞書から指定された項目のみを取り出す
+        
+        Args:
+            data: 元の辞書
+            items: 残す項目名の集合（Noneで全項目）
+            
+        Returns:
+            射影後の辞書
+        """
+        if items is None:
+            return data
+        return {key: value for key, value in data.items() if key in items}
+    
+    @staticmethod
+    def normalize_limit(limit: Optional[int]) -> Optional[int]:
+        """ページの件数を既定値・上限に合わせて正規化（Noneは全件）"""
+        if limit is None:
+            return DEFAULT_PAGE_SIZE or None
+        return max(1, min(int(limit), MAX_PAGE_SIZE))
+    
+    @staticmethod
+    def paginate(items: List[Any], key, limit: Optional[int],
+                 cursor: Optional[str] = None) -> Tuple[List[Any], Dict[str, Any]]:
+        """
+        名前をキーとしたカーソルでリストをページ分割
+        
+        カーソルは前のページの最後の要素の名前で、要素の追加・削除があっても
+        ページの境界がずれない。
+        
+        Args:
+            items: 対象の要素
+            key: 要素から名前を取得する関数
+            limit: ページの件数（Noneでカーソル以降の全件）
+            cursor: 前のページのnext_cursor（Noneで先頭から）
+            
+        Returns:
+            (ページの要素, ページ情報 {next_cursor, total, count})
+        """
+        keyed = sorted((key(item), index) for index, item in enumerate(items))
+        start = bisect.bisect_right(keyed, (cursor, float('inf'))) if cursor is not None else 0
+        stop = len(keyed) if limit is None else start + limit
+        page = keyed[start:stop]
+        has_more = stop < len(keyed)
+        
+        return [items[index] for _, index in page], {
+            "next_cursor": page[-1][0] if page and has_more else None,
+            "total": len(keyed),
+            "count": len(page)
+        }
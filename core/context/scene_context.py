@@ -6,45 +6,108 @@ Blenderのシーン状態を詳細に取得する機能を提供
 import bpy
 import math
 import bmesh
-from mathutils import Vector
+from mathutils import Vector, kdtree
 from typing import Dict, List, Any, Optional, Tuple, Set, Union
 from .base_context import BaseContext
 
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
+
+# 項目を指定したオブジェクト情報の取得関数（指定された項目のみ計算する）
+OBJECT_FIELD_GETTERS = {
+    "type": lambda obj: obj.type,
+    "location": lambda obj: [round(v, 4) for v in obj.location],
+    "rotation": lambda obj: [round(math.degrees(v), 2) for v in obj.rotation_euler],
+    "scale": lambda obj: [round(v, 4) for v in obj.scale],
+    "dimensions": lambda obj: [round(v, 4) for v in obj.dimensions],
+    "visible": lambda obj: not obj.hide_viewport,
+    "selected": lambda obj: obj.select_get(),
+    "parent": lambda obj: obj.parent.name if obj.parent else None,
+    "children_count": lambda obj: len(obj.children),
+    "collections": lambda obj: [coll.name for coll in obj.users_collection],
+    "materials": lambda obj: [slot.material.name for slot in obj.material_slots if slot.material],
+    "modifiers": lambda obj: [mod.name for mod in obj.modifiers],
+    "vertex_count": lambda obj: len(obj.data.vertices) if obj.type == 'MESH' and obj.data else None,
+    "edge_count": lambda obj: len(obj.data.edges) if obj.type == 'MESH' and obj.data else None,
+    "polygon_count": lambda obj: len(obj.data.polygons) if obj.type == 'MESH' and obj.data else None,
+    "material_count": lambda obj: len(obj.material_slots),
+}
+
 class SceneContext(BaseContext):
     """
     Blenderのシーン情報を取得・管理するクラス
     """
     
+    # 詳細レベルごとに含めるセクション
+    DETAIL_SECTIONS = {
+        "basic": ["system", "scene", "selection"],
+        "standard": ["system", "scene", "selection", "objects", "collections", "scene_bounds"],
+        "detailed": ["system", "scene", "selection", "objects", "collections", "scene_bounds",
+                     "materials", "spatial", "topology"]
+    }
+    
+    # 近接オブジェクトの判定距離と件数
+    NEIGHBOR_DISTANCE = 10.0
+    NEIGHBOR_COUNT = 3
+    
     @classmethod
-    def get_context(cls, detail_level: str = "standard") -> Dict[str, Any]:
+    def get_context(cls, detail_level: str = "standard",
+                    fields: Union[str, List[str], None] = None,
+                    limit: Optional[int] = None,
+                    cursor: Union[str, Dict[str, str], None] = None) -> Dict[str, Any]:
         """
         現在のシーンコンテキストを取得
         
+        要求されたセクションのみを計算し、オブジェクト単位のセクションは
+        名前をキーとしたカーソルでページ分割する。
+        
         Args:
-            detail_level: 詳細レベル ("basic", "standard", "detailed")
+            detail_level: 詳細レベル ("basic", "standard", "detailed")。fields指定時は無視
+            fields: 取得するフィールド（例: ["scene", "objects.name", "objects.location"]）
+            limit: オブジェクト単位のセクションの1ページの件数（Noneで全件）
+            cursor: 前回のpage_infoのnext_cursor（セクション名 → カーソルの辞書も可）
             
         Returns:
-            シーンコンテキスト情報
+            シーンコンテキスト情報（ページ分割したセクションはpage_infoを含む）
         """
         try:
-            # 基本情報（どのレベルでも含まれる）
-            context = {
-                "system": cls._get_system_info(),
-                "scene": cls._get_scene_info(),
-                "selection": cls._get_selection_info()
+            selection = cls.parse_fields(fields)
+            if selection is None:
+                sections = cls.DETAIL_SECTIONS.get(detail_level, cls.DETAIL_SECTIONS["standard"])
+                selection = {section: None for section in sections}
+            limit = cls.normalize_limit(limit)
+            
+            builders = {
+                "system": cls._get_system_info,
+                "scene": cls._get_scene_info,
+                "selection": lambda: cls._get_selection_info(limit),
+                "scene_bounds": cls._get_scene_bounds,
+            }
+            paged_builders = {
+                "objects": lambda items, page_cursor: cls._get_objects_info(detail_level, items, limit, page_cursor),
+                "collections": lambda items, page_cursor: cls._get_collections_info(items, limit, page_cursor),
+                "materials": lambda items, page_cursor: cls._get_materials_info(items, limit, page_cursor),
+                "spatial": lambda items, page_cursor: cls._get_spatial_info(items, limit, page_cursor),
+                "topology": lambda items, page_cursor: cls._get_topology_info(items, limit, page_cursor),
             }
             
-            # 標準以上のレベルならオブジェクト情報を追加
-            if detail_level in ["standard", "detailed"]:
-                context["objects"] = cls._get_objects_info(detail_level)
-                context["collections"] = cls._get_collections_info()
-                context["scene_bounds"] = cls._get_scene_bounds()
+            context = {}
+            page_info = {}
+            for section, items in selection.items():
+                if section in builders:
+                    context[section] = cls.project(builders[section](), items)
+                elif section in paged_builders:
+                    page_cursor = cursor.get(section) if isinstance(cursor, dict) else cursor
+                    context[section], page_info[section] = paged_builders[section](items, page_cursor)
+                else:
+                    context.setdefault("unknown_fields", []).append(section)
             
-            # 詳細レベルならさらに詳細情報を追加
-            if detail_level == "detailed":
-                context["materials"] = cls._get_materials_info()
-                context["spatial"] = cls._get_spatial_info()
-                context["topology"] = cls._get_topology_info()
+            if page_info:
+                context["page_info"] = page_info
             
             return context
             
@@ -83,57 +146,74 @@ class SceneContext(BaseContext):
         }
     
     @classmethod
-    def _get_selection_info(cls) -> Dict[str, Any]:
-        """選択情報を取得"""
+    def _get_selection_info(cls, limit: int) -> Dict[str, Any]:
+        """選択情報を取得（選択オブジェクト名はlimit件まで）"""
         selected_objects = bpy.context.selected_objects
         
+        selected_types = {}
+        for obj in selected_objects:
+            selected_types[obj.type] = selected_types.get(obj.type, 0) + 1
+        
         return {
             "selected_count": len(selected_objects),
             "active_object": bpy.context.active_object.name if bpy.context.active_object else None,
-            "selected_objects": [obj.name for obj in selected_objects],
-            "selected_types": {obj.type: selected_objects.count(obj.type) for obj in selected_objects} if selected_objects else {}
+            "selected_objects": [obj.name for obj in selected_objects[:limit]],
+            "selected_types": selected_types
         }
     
     @classmethod
-    def _get_objects_info(cls, detail_level: str) -> List[Dict[str, Any]]:
-        """オブジェクト情報を取得"""
-        objects_info = []
-        
-        # 取得対象のオブジェクト（制限が必要なら指定する）
-        target_objects = bpy.context.scene.objects
+    def _get_objects_info(cls, detail_level: str, items: Optional[Set[str]], limit: int,
+                          cursor: Optional[str]) -> Tuple[List[Dict[str, Any]], Dict[str, Any]]:
+        """オブジェクト情報を取得（itemsで項目を指定した場合はその項目のみ計算）"""
+        objects, page = cls.paginate(list(bpy.context.scene.objects), lambda obj: obj.name, limit, cursor)
         
-        for obj in target_objects:
-            # 基本クラスの共通メソッドを使用
-            obj_info = cls.get_object_basic_info(obj)
-            
-            # タイプ固有の情報を追加（詳細レベルに応じて）
-            if detail_level == "detailed" and obj.type == 'MESH' and obj.data:
-                # メッシュ固有の情報
-                mesh = obj.data
-                obj_info.update({
-                    "vertex_count": len(mesh.vertices),
-                    "edge_count": len(mesh.edges),
-                    "polygon_count": len(mesh.polygons),
-                    "material_count": len(obj.material_slots)
-                })
+        objects_info = []
+        for obj in objects:
+            if items is None:
+                # 基本クラスの共通メソッドを使用
+                obj_info = cls.get_object_basic_info(obj)
+                
+                # タイプ固有の情報を追加（詳細レベルに応じて）
+                if detail_level == "detailed" and obj.type == 'MESH' and obj.data:
+                    obj_info.update(cls._get_mesh_counts(obj))
+            else:
+                obj_info = {"name": obj.name}
+                for item in items:
+                    getter = OBJECT_FIELD_GETTERS.get(item)
+                    if getter is not None:
+                        obj_info[item] = getter(obj)
             
             objects_info.append(obj_info)
         
-        return objects_info
+        return objects_info, page
+    
+    @staticmethod
+    def _get_mesh_counts(obj) -> Dict[str, Any]:
+        """メッシュ固有の要素数を取得"""
+        mesh = obj.data
+        return {
+            "vertex_count": len(mesh.vertices),
+            "edge_count": len(mesh.edges),
+            "polygon_count": len(mesh.polygons),
+            "material_count": len(obj.material_slots)
+        }
     
     @classmethod
-    def _get_collections_info(cls) -> List[Dict[str, Any]]:
+    def _get_collections_info(cls, items: Optional[Set[str]], limit: int,
+                              cursor: Optional[str]) -> Tuple[List[Dict[str, Any]], Dict[str, Any]]:
         """コレクション情報を取得"""
-        collections_info = []
+        collections, page = cls.paginate(list(bpy.data.collections), lambda coll: coll.name, limit, cursor)
         
-        for coll in bpy.data.collections:
-            collections_info.append({
-                "name": coll.name,
-                "objects": [obj.name for obj in coll.objects],
-                "children": [child.name for child in coll.children]
-            })
+        collections_info = []
+        for coll in collections:
+            coll_info = {"name": coll.name}
+            if items is None or "objects" in items:
+                coll_info["objects"] = [obj.name for obj in coll.objects]
+            if items is None or "children" in items:
+                coll_info["children"] = [child.name for child in coll.children]
+            collections_info.append(coll_info)
         
-        return collections_info
+        return collections_info, page
     
     @classmethod
     def _get_scene_bounds(cls) -> Dict[str, Any]:
@@ -175,11 +255,13 @@ class SceneContext(BaseContext):
         }
     
     @classmethod
-    def _get_materials_info(cls) -> List[Dict[str, Any]]:
+    def _get_materials_info(cls, items: Optional[Set[str]], limit: int,
+                            cursor: Optional[str]) -> Tuple[List[Dict[str, Any]], Dict[str, Any]]:
         """マテリアル情報を取得"""
+        materials, page = cls.paginate(list(bpy.data.materials), lambda mat: mat.name, limit, cursor)
         materials_info = []
         
-        for mat in bpy.data.materials:
+        for mat in materials:
             mat_info = {
                 "name": mat.name,
                 "users": mat.users,
@@ -188,7 +270,7 @@ class SceneContext(BaseContext):
             }
             
             # ノードベースのマテリアルの場合、基本的なノード情報を取得
-            if mat.use_nodes and mat.node_tree:
+            if mat.use_nodes and mat.node_tree and (items is None or "nodes" in items):
                 node_types = {}
                 for node in mat.node_tree.nodes:
                     node_type = node.type
@@ -199,63 +281,74 @@ class SceneContext(BaseContext):
                     "types": node_types
                 }
             
-            materials_info.append(mat_info)
+            materials_info.append(cls.project(mat_info, items | {"name"} if items is not None else None))
         
-        return materials_info
+        return materials_info, page
     
     @classmethod
-    def _get_spatial_info(cls) -> Dict[str, Any]:
-        """空間関係の情報を取得"""
-        # 各オブジェクトの近接オブジェクトを探す
-        relationships = []
-        objects = list(bpy.context.scene.objects)
+    def _get_spatial_info(cls, items: Optional[Set[str]], limit: int,
+                          cursor: Optional[str]) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+        """
+        空間関係の情報を取得
         
-        # 十分な数のオブジェクトがあるかチェック
-        if len(objects) < 2:
-            return {"objects_relationships": [], "origin_reference": {"objects_at_origin": []}}
+        メッシュオブジェクトの位置からKDツリーを構築し、ページ内のオブジェクト
+        についてのみ近接オブジェクトを検索する（全ペアの比較は行わない）。
+        """
+        spatial = {}
+        mesh_objects = [obj for obj in bpy.context.scene.objects if obj.type == 'MESH']
+        page_objects, page = cls.paginate(mesh_objects, lambda obj: obj.name, limit, cursor)
+        
+        if items is None or "objects_relationships" in items:
+            relationships = []
             
-        # 近接オブジェクトを見つける
-        for obj in objects:
-            if obj.type != 'MESH':
-                continue
+            if len(mesh_objects) >= 2:
+                tree = kdtree.KDTree(len(mesh_objects))
+                index_of = {}
+                for index, obj in enumerate(mesh_objects):
+                    tree.insert(obj.location, index)
+                    index_of[obj.name] = index
+                tree.balance()
                 
-            obj_loc = obj.location
-            neighbors = []
-            
-            for other in objects:
-                if other == obj or other.type != 'MESH':
-                    continue
+                for obj in page_objects:
+                    own_index = index_of[obj.name]
+                    neighbors = [
+                        {"name": mesh_objects[index].name, "distance": round(distance, 3)}
+                        for _, index, distance in tree.find_n(obj.location, cls.NEIGHBOR_COUNT + 1)
+                        if index != own_index and distance < cls.NEIGHBOR_DISTANCE
+                    ][:cls.NEIGHBOR_COUNT]
                     
-                # 距離計算
-                distance = (other.location - obj_loc).length
-                if distance < 10.0:  # 近接閾値
-                    neighbors.append({
-                        "name": other.name,
-                        "distance": round(distance, 3)
-                    })
+                    if neighbors:
+                        relationships.append({
+                            "object": obj.name,
+                            "neighbors": neighbors
+                        })
             
-            # 距離でソート
-            neighbors.sort(key=lambda x: x["distance"])
-            
-            if neighbors:
-                relationships.append({
-                    "object": obj.name,
-                    "neighbors": neighbors[:3]  # 最も近い3つのみ
-                })
+            spatial["objects_relationships"] = relationships
         
-        return {
-            "objects_relationships": relationships,
-            "origin_reference": {
-                "objects_at_origin": [
-                    obj.name for obj in bpy.data.objects 
-                    if all(abs(v) < 0.01 for v in obj.location)
-                ]
+        if items is None or "origin_reference" in items:
+            objects_at_origin = [
+                obj.name for obj in bpy.data.objects
+                if all(abs(v) < 0.01 for v in obj.location)
+            ]
+            spatial["origin_reference"] = {
+                "objects_at_origin": objects_at_origin[:limit],
+                "count": len(objects_at_origin)
             }
-        }
+        
+        return spatial, page
     
     @classmethod
-    def _get_topology_info(cls) -> Dict[str, Any]:
-        """トポロジー情報を取得"""
+    def _get_topology_info(cls, items: Optional[Set[str]], limit: int,
+                           cursor: Optional[str]) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+        """
+        トポロジー情報を取得
+        
+        合計はすべてのメッシュのポリゴン数から求め、非マニフォールド解析を
+        含むオブジェクトごとの分析はページ内のオブジェクトのみ行う。
+        """
+        mesh_objects = [obj for obj in bpy.data.objects if obj.type == 'MESH' and obj.data]
+        page_objects, page = cls.paginate(mesh_objects, lambda obj: obj.name, limit, cursor)
+        
         topology = {
             "total_quads": 0,
             "total_tris": 0,
@@ -263,19 +356,24 @@ class SceneContext(BaseContext):
             "objects": []
         }
         
-        for obj in bpy.data.objects:
-            if obj.type != 'MESH' or not obj.data:
-                continue
-                
-            mesh = obj.data
-            
+        # 合計は全メッシュから（共有メッシュデータの集計は再利用する）
+        counted = {}
+        for obj in mesh_objects:
+            pointer = obj.data.as_pointer()
+            if pointer not in counted:
+                counted[pointer] = cls._count_polygon_sizes(obj.data)
+            tris, quads, ngons = counted[pointer]
+            topology["total_tris"] += tris
+            topology["total_quads"] += quads
+            topology["total_ngons"] += ngons
+        
+        if items is not None and "objects" not in items:
+            del topology["objects"]
+            return topology, page
+        
+        for obj in page_objects:
             # 基底クラスのメソッドを使用してトポロジーを分析
-            mesh_topology = cls.analyze_mesh_topology(mesh)
-            
-            # トータルカウントを更新
-            topology["total_quads"] += mesh_topology["quads"]
-            topology["total_tris"] += mesh_topology["tris"]
-            topology["total_ngons"] += mesh_topology["ngons"]
+            mesh_topology = cls.analyze_mesh_topology(obj.data)
             
             # オブジェクト固有の情報を追加
             obj_topo = {
@@ -292,4 +390,22 @@ class SceneContext(BaseContext):
             
             topology["objects"].append(obj_topo)
         
-        return topology
\ No newline at end of file
+        return topology, page
+    
+    @staticmethod
+    def _count_polygon_sizes(mesh) -> Tuple[int, int, int]:
+        """メッシュの三角形・四角形・多角形の数を数える"""
+        count = len(mesh.polygons)
+        if NUMPY_AVAILABLE:
+            loop_totals = np.empty(count, dtype=np.int32)
+            mesh.polygons.foreach_get("loop_total", loop_totals)
+            tris = int(np.count_nonzero(loop_totals == 3))
+            quads = int(np.count_nonzero(loop_totals == 4))
+        else:
+            tris = quads = 0
+            for poly in mesh.polygons:
+                if poly.loop_total == 3:
+                    tris += 1
+                elif poly.loop_total == 4:
+                    quads += 1
+        return tris, quads, count - tris - quads
\ No newline at end of file
@@ -41,6 +41,13 @@ except ImportError as e:
 # 常にFastAPIモードを有効に設定
 FASTAPI_AVAILABLE = True
 
+# 高速JSONエンコード・応答圧縮
+try:
+    from ..utils.json_responses import FastJSONResponse, CompressionMiddleware, json_response
+    JSON_RESPONSES_AVAILABLE = True
+except (ImportError, ValueError):
+    JSON_RESPONSES_AVAILABLE = False
+
 # GraphQL関連のインポート
 try:
     import graphene
@@ -229,7 +236,8 @@ class MCPFastAPIServer:
             description="Blenderの3D機能にAPIからアクセスするためのModel Context Protocol",
             version="1.1.0",
             docs_url="/docs",
-            redoc_url="/redoc"
+            redoc_url="/redoc",
+            default_response_class=FastJSONResponse if JSON_RESPONSES_AVAILABLE else JSONResponse
         )
         
         # CORSミドルウェアの設定
@@ -241,6 +249,10 @@ class MCPFastAPIServer:
             allow_headers=["*"],
         )
         
+        # リクエストごとにbrotli/gzipで応答を圧縮
+        if JSON_RESPONSES_AVAILABLE:
+            self.app.add_middleware(CompressionMiddleware)
+        
         # JSON APIエンドポイントを直接追加
         self._add_json_api_endpoints()
         
@@ -485,10 +497,14 @@ class MCPFastAPIServer:
             
             objects = execute_in_main_thread(get_objects_data)
             
-            return APIResponse.success("Objects list", {
+            content = APIResponse.success("Objects list", {
                 "count": len(objects),
                 "objects": objects
             })
+            # 大きなリストはjsonable_encoderを通さずチャンクごとにエンコードして送信
+            if JSON_RESPONSES_AVAILABLE:
+                return json_response(content)
+            return content
         
         # シーン情報エンドポイント
         @self.app.get("/api/scene", tags=["Scene"])
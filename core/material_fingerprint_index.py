@@ -0,0 +1,473 @@
+"""
+マテリアルのフィンガープリントインデックス
+ノードグラフの構造（ノードの種類・リンク・主要パラメータ）からマテリアルごとの
+フィンガープリントとノード統計を計算して保持し、変更されたマテリアルのみを再解析します
+"""
+
+import hashlib
+import logging
+import threading
+from collections import Counter
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+import bpy
+from bpy.app.handlers import persistent
+
+logger = logging.getLogger("unified_mcp.material_fingerprint_index")
+
+# フィンガープリントに含める数値の桁数
+FINGERPRINT_PRECISION = 5
+
+# リンク先のソケット名からテクスチャの用途を推測するキーワード（先に一致したものを採用）
+TEXTURE_TYPE_KEYWORDS = (
+    (("color", "base"), "color"),
+    (("normal",), "normal"),
+    (("rough",), "roughness"),
+    (("metal",), "metallic"),
+    (("spec",), "specular"),
+    (("bump", "displace"), "bump"),
+)
+
+# すべてのシェーダーノードに共通するプロパティ（フィンガープリントには含めない）
+_base_node_properties: Optional[Set[str]] = None
+
+
+def _round_value(value: Any) -> Any:
+    """フィンガープリント用に値を丸めてハッシュ可能な形に変換"""
+    if isinstance(value, float):
+        return round(value, FINGERPRINT_PRECISION)
+    if isinstance(value, (bool, int, str)) or value is None:
+        return value
+    try:
+        return tuple(_round_value(v) for v in value)
+    except TypeError:
+        return repr(value)
+
+
+def _node_parameters(node) -> Tuple:
+    """ノード固有のパラメータ（enum・数値・参照データ名）を取得"""
+    global _base_node_properties
+    if _base_node_properties is None:
+        _base_node_properties = {prop.identifier for prop in bpy.types.ShaderNode.bl_rna.properties}
+
+    params = []
+    for prop in node.bl_rna.properties:
+        identifier = prop.identifier
+        if identifier in _base_node_properties:
+            continue
+        if prop.type == 'POINTER':
+            value = getattr(node, identifier, None)
+            if value is not None and hasattr(value, 'elements'):
+                # カラーランプ
+                params.append((identifier, tuple(
+                    (_round_value(element.position), _round_value(tuple(element.color)))
+                    for element in value.elements
+                )))
+            elif value is not None and isinstance(value, bpy.types.ID):
+                # 画像・ノードグループなどは名前で比較
+                params.append((identifier, value.name))
+        elif prop.type in {'ENUM', 'BOOLEAN', 'INT', 'FLOAT', 'STRING'}:
+            params.append((identifier, _round_value(getattr(node, identifier, None))))
+    return tuple(params)
+
+
+def _node_signature(node) -> Tuple:
+    """ノード名に依存しないノードのシグネチャ（種類・パラメータ・未接続入力の値）"""
+    defaults = []
+    for socket in node.inputs:
+        if not socket.is_linked and hasattr(socket, 'default_value'):
+            defaults.append((socket.identifier, _round_value(socket.default_value)))
+    return (node.bl_idname, _node_parameters(node), tuple(defaults))
+
+
+def _texture_type(socket_name: str) -> str:
+    """リンク先のソケット名からテクスチャの用途を推測"""
+    name = socket_name.lower()
+    for keywords, texture_type in TEXTURE_TYPE_KEYWORDS:
+        if any(keyword in name for keyword in keywords):
+            return texture_type
+    return "unknown"
+
+
+def analyze_material(material) -> Dict[str, Any]:
+    """
+    マテリアルのノードグラフを1回走査して解析
+
+    フィンガープリントはノードのシグネチャとリンク（両端のシグネチャと
+    ソケット）の多重集合から求めるため、ノード名や追加順が異なっても
+    構造とパラメータが同じマテリアルは同じ値になる。
+
+    Args:
+        material: マテリアル
+
+    Returns:
+        fingerprint / node_count / node_types / node_io / textures / images / image_pointers / tree_pointer
+    """
+    record = {
+        'fingerprint': None,
+        'use_nodes': bool(material.use_nodes),
+        'node_count': 0,
+        'node_types': {},
+        'node_io': {},
+        'textures': [],
+        'images': set(),
+        'image_pointers': set(),
+        'tree_pointer': None
+    }
+
+    settings = (
+        material.use_nodes,
+        getattr(material, 'blend_method', None),
+        _round_value(tuple(material.diffuse_color)),
+        _round_value(material.metallic),
+        _round_value(material.roughness)
+    )
+    node_tree = material.node_tree
+    if node_tree is None:
+        record['fingerprint'] = hashlib.sha1(repr((settings,)).encode('utf-8')).hexdigest()
+        return record
+
+    signatures = {}
+    node_types = Counter()
+    node_io = Counter()
+    for node in node_tree.nodes:
+        signatures[node.name] = _node_signature(node)
+        node_types[node.type] += 1
+        node_io[f"{node.type}_{len(node.inputs)}in_{len(node.outputs)}out"] += 1
+
+    # リンクは両端のシグネチャで表し、テクスチャの用途判定にも使う
+    links = []
+    first_target = {}
+    for link in node_tree.links:
+        links.append((
+            signatures[link.from_node.name], link.from_socket.identifier,
+            signatures[link.to_node.name], link.to_socket.identifier
+        ))
+        first_target.setdefault(link.from_node.name, link.to_socket.name)
+
+    # ノードを使用しないマテリアルではテクスチャは参照されない
+    texture_nodes = node_tree.nodes if material.use_nodes else ()
+    for node in texture_nodes:
+        if node.type == 'TEX_IMAGE' and node.image:
+            image = node.image
+            record['images'].add(image.name)
+            record['image_pointers'].add(image.as_pointer())
+            record['textures'].append({
+                'name': image.name,
+                'type': _texture_type(first_target[node.name]) if node.name in first_target else "unknown",
+                'path': image.filepath,
+                'resolution': [image.size[0], image.size[1]]
+            })
+
+    structure = (settings, sorted(map(repr, signatures.values())), sorted(map(repr, links)))
+    record['fingerprint'] = hashlib.sha1(repr(structure).encode('utf-8')).hexdigest()
+    record['tree_pointer'] = node_tree.as_pointer()
+    record['node_count'] = len(node_tree.nodes)
+    record['node_types'] = dict(node_types)
+    record['node_io'] = dict(node_io)
+    return record
+
+
+class MaterialFingerprintIndex:
+    """
+    マテリアルのフィンガープリント・ノード統計・テクスチャの逆引きインデックス
+
+    マテリアルごとの解析結果を保持し、depsgraphの更新通知で変更された
+    マテリアル（および更新された画像を使うマテリアル）だけを再解析する。
+    ノード統計の合計とフィンガープリント・画像の逆引きは差分で維持するため、
+    統計・重複検出・テクスチャ検索はノードグラフを走査せずに応答できる。
+    """
+
+    def __init__(self):
+        self._lock = threading.RLock()
+        self._dirty_all = True
+        self._dirty: Set[str] = set()
+        self._handlers_registered = False
+
+        self.records: Dict[str, Dict[str, Any]] = {}
+        self.by_fingerprint: Dict[str, Set[str]] = {}
+        self.by_image: Dict[str, Set[str]] = {}
+        # 画像の更新通知は名前が変わっていても届くため、ポインタでも逆引きする
+        self.image_users: Dict[int, Set[str]] = {}
+        self.tree_owners: Dict[int, str] = {}
+        self.node_type_totals: Counter = Counter()
+        self.node_io_totals: Counter = Counter()
+
+        self.full_rebuilds = 0
+        self.material_updates = 0
+
+    # ------------------------------------------------------------------
+    # 構築と更新
+    # ------------------------------------------------------------------
+
+    def invalidate(self, material_name: Optional[str] = None):
+        """
+        解析結果を無効化
+
+        Args:
+            material_name: 対象のマテリアル名（Noneですべて）
+        """
+        with self._lock:
+            if material_name is None:
+                self._dirty_all = True
+            else:
+                self._dirty.add(material_name)
+
+    def ensure_current(self):
+        """無効化されたマテリアルを再解析し、追加・削除・名前変更を反映"""
+        self._ensure_handlers()
+        with self._lock:
+            if self._dirty_all:
+                self._rebuild()
+                return
+
+            names = set(bpy.data.materials.keys())
+            for name in set(self.records) - names:
+                self._drop(name)
+            self._dirty.update(names - set(self.records))
+
+            for name in self._dirty:
+                material = bpy.data.materials.get(name)
+                if material is None:
+                    self._drop(name)
+                else:
+                    self._store(name, analyze_material(material))
+                    self.material_updates += 1
+            self._dirty.clear()
+
+    def _rebuild(self):
+        """すべてのマテリアルを解析（ロック内で呼び出す）"""
+        self.records = {}
+        self.by_fingerprint = {}
+        self.by_image = {}
+        self.image_users = {}
+        self.tree_owners = {}
+        self.node_type_totals = Counter()
+        self.node_io_totals = Counter()
+
+        for material in bpy.data.materials:
+            self._store(material.name, analyze_material(material))
+
+        self._dirty_all = False
+        self._dirty.clear()
+        self.full_rebuilds += 1
+
+    def _store(self, name: str, record: Dict[str, Any]):
+        """解析結果を保存し、逆引きと合計を更新（ロック内で呼び出す）"""
+        self._drop(name)
+        self.records[name] = record
+        self.by_fingerprint.setdefault(record['fingerprint'], set()).add(name)
+        for image_name in record['images']:
+            self.by_image.setdefault(image_name, set()).add(name)
+        for image_pointer in record['image_pointers']:
+            self.image_users.setdefault(image_pointer, set()).add(name)
+        if record['tree_pointer'] is not None:
+            self.tree_owners[record['tree_pointer']] = name
+        if record['use_nodes']:
+            self.node_type_totals.update(record['node_types'])
+            self.node_io_totals.update(record['node_io'])
+
+    def _drop(self, name: str):
+        """解析結果を削除し、逆引きと合計から外す（ロック内で呼び出す）"""
+        record = self.records.pop(name, None)
+        if record is None:
+            return
+        _discard(self.by_fingerprint, record['fingerprint'], name)
+        for image_name in record['images']:
+            _discard(self.by_image, image_name, name)
+        for image_pointer in record['image_pointers']:
+            _discard(self.image_users, image_pointer, name)
+        if self.tree_owners.get(record['tree_pointer']) == name:
+            del self.tree_owners[record['tree_pointer']]
+        if record['use_nodes']:
+            self.node_type_totals.subtract(record['node_types'])
+            self.node_io_totals.subtract(record['node_io'])
+            self.node_type_totals += Counter()  # 0以下の項目を除去
+            self.node_io_totals += Counter()
+
+    def apply_depsgraph_updates(self, updates):
+        """
+        depsgraphの更新をインデックスに反映
+
+        Args:
+            updates: depsgraph.updates
+        """
+        with self._lock:
+            if self._dirty_all:
+                return
+            for update in updates:
+                datablock = update.id.original
+                if isinstance(datablock, bpy.types.Material):
+                    self._dirty.add(datablock.name)
+                elif isinstance(datablock, bpy.types.Image):
+                    # 解像度・パス・名前の変更をテクスチャ情報と逆引きに反映
+                    self._dirty.update(self.image_users.get(datablock.as_pointer(), ()))
+                elif isinstance(datablock, bpy.types.ShaderNodeTree):
+                    owner = self.tree_owners.get(datablock.as_pointer())
+                    if owner is not None:
+                        # マテリアルに埋め込まれたノードツリー
+                        self._dirty.add(owner)
+                    elif not datablock.is_embedded_data:
+                        # ノードグループの変更は参照するマテリアルを特定できないため全体を再解析
+                        self._dirty_all = True
+                        return
+
+    # ------------------------------------------------------------------
+    # クエリ
+    # ------------------------------------------------------------------
+
+    def get_record(self, material_name: str) -> Optional[Dict[str, Any]]:
+        """
+        マテリアルの解析結果を取得
+
+        Args:
+            material_name: マテリアル名
+
+        Returns:
+            fingerprint / node_count / node_types / node_io / textures（存在しない場合はNone）
+        """
+        self.ensure_current()
+        with self._lock:
+            record = self.records.get(material_name)
+            if record is None:
+                return None
+            return {
+                'name': material_name,
+                'fingerprint': record['fingerprint'],
+                'node_count': record['node_count'],
+                'node_types': dict(record['node_types']),
+                'node_io': dict(record['node_io']),
+                'textures': [dict(texture) for texture in record['textures']]
+            }
+
+    def get_textures(self, material_name: str) -> List[Dict[str, Any]]:
+        """
+        マテリアルが使用する画像テクスチャを取得
+
+        Args:
+            material_name: マテリアル名
+
+        Returns:
+            name / type / path / resolution のリスト
+        """
+        record = self.get_record(material_name)
+        return record['textures'] if record else []
+
+    def get_node_statistics(self) -> Dict[str, Any]:
+        """
+        ノードを使用するマテリアル全体のノード統計を取得
+
+        Returns:
+            node_types: ノードタイプ別の数
+            node_io: ノードタイプ・入出力ソケット数別の数
+        """
+        self.ensure_current()
+        with self._lock:
+            return {
+                'node_types': dict(self.node_type_totals),
+                'node_io': dict(self.node_io_totals)
+            }
+
+    def get_node_counts(self) -> Dict[str, int]:
+        """マテリアル名 → ノード数"""
+        self.ensure_current()
+        with self._lock:
+            return {name: record['node_count'] for name, record in self.records.items()}
+
+    def find_duplicates(self) -> List[List[str]]:
+        """
+        構造が同じマテリアルのグループを取得
+
+        Returns:
+            重複するマテリアル名のリスト（2件以上のグループのみ）
+        """
+        self.ensure_current()
+        with self._lock:
+            return sorted(
+                sorted(names) for names in self.by_fingerprint.values() if len(names) > 1
+            )
+
+    def get_materials_using_image(self, image_name: str) -> List[str]:
+        """
+        画像を使用するマテリアル名を取得
+
+        Args:
+            image_name: 画像名
+
+        Returns:
+            マテリアル名のリスト
+        """
+        self.ensure_current()
+        with self._lock:
+            return sorted(self.by_image.get(image_name, ()))
+
+    def get_stats(self) -> Dict[str, Any]:
+        """インデックスの統計情報を取得"""
+        with self._lock:
+            return {
+                'materials': len(self.records),
+                'unique_fingerprints': len(self.by_fingerprint),
+                'images': len(self.by_image),
+                'dirty': len(self._dirty) if not self._dirty_all else 'all',
+                'full_rebuilds': self.full_rebuilds,
+                'material_updates': self.material_updates
+            }
+
+    # ------------------------------------------------------------------
+    # ハンドラ
+    # ------------------------------------------------------------------
+
+    def _ensure_handlers(self):
+        """depsgraph・ファイル読み込みハンドラを初回使用時に登録"""
+        if self._handlers_registered:
+            return
+        handlers = bpy.app.handlers
+        if _on_depsgraph_update not in handlers.depsgraph_update_post:
+            handlers.depsgraph_update_post.append(_on_depsgraph_update)
+        if _on_load_post not in handlers.load_post:
+            handlers.load_post.append(_on_load_post)
+        self._handlers_registered = True
+
+    def unregister_handlers(self):
+        """登録したハンドラを削除し、インデックスを無効化"""
+        handlers = bpy.app.handlers
+        if _on_depsgraph_update in handlers.depsgraph_update_post:
+            handlers.depsgraph_update_post.remove(_on_depsgraph_update)
+        if _on_load_post in handlers.load_post:
+            handlers.load_post.remove(_on_load_post)
+        self._handlers_registered = False
+        self.invalidate()
+
+
+def _discard(index: Dict[Any, Set[str]], key: Any, name: str):
+    """逆引きから名前を外し、空になったキーを削除"""
+    names = index.get(key)
+    if names is not None:
+        names.discard(name)
+        if not names:
+            del index[key]
+
+
+# グローバルインスタンス
+material_fingerprint_index = MaterialFingerprintIndex()
+
+
+@persistent
+def _on_depsgraph_update(scene, depsgraph):
+    """変更されたマテリアル・画像をインデックスに反映"""
+    try:
+        material_fingerprint_index.apply_depsgraph_updates(depsgraph.updates)
+    except Exception as e:
+        logger.debug(f"マテリアルインデックスの更新に失敗したため再構築します: {e}")
+        material_fingerprint_index.invalidate()
+
+
+@persistent
+def _on_load_post(*args):
+    """ファイル読み込み時はすべて再構築"""
+    material_fingerprint_index.invalidate()
+
+
+def get_material_fingerprint_index() -> MaterialFingerprintIndex:
+    """マテリアルフィンガープリントインデックスのインスタンスを取得"""
+    return material_fingerprint_index
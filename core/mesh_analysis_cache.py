@@ -0,0 +1,200 @@
+"""
+メッシュ解析結果のキャッシュ
+ジオメトリのフィンガープリントが変わらない限り、解析関数の結果を再利用します
+"""
+
+import os
+import copy
+import logging
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Tuple
+
+import bpy
+from bpy.app.handlers import persistent
+
+logger = logging.getLogger("unified_mcp.mesh_analysis_cache")
+
+# キャッシュの上限（解析種別 × メッシュ）
+MAX_CACHE_ENTRIES = int(os.environ.get('MCP_MESH_ANALYSIS_CACHE_SIZE', '256'))
+
+# フィンガープリントに含める頂点座標のサンプル数（全頂点は読まない）
+FINGERPRINT_SAMPLES = 64
+
+
+def mesh_fingerprint(mesh) -> Tuple:
+    """
+    メッシュのジオメトリの簡易フィンガープリントを計算
+
+    データブロックのポインタ・要素数と、均等に間引いた少数の頂点座標から構成する。
+    取得のたびに呼ばれるため頂点バッファ全体は読まず、要素数が変わらない編集は
+    主にdepsgraphの更新通知（is_updated_geometry）による無効化で検出する。
+    サンプルは通知前に同じスクリプト内で再取得された場合の簡易な保険となる。
+
+    Args:
+        mesh: メッシュデータ
+
+    Returns:
+        フィンガープリント（比較可能なタプル）
+    """
+    count = len(mesh.vertices)
+    step = max(1, count // FINGERPRINT_SAMPLES)
+    vertices = mesh.vertices
+    sample = tuple(tuple(vertices[i].co) for i in range(0, count, step))
+
+    return (mesh.as_pointer(), count, len(mesh.edges), len(mesh.polygons), len(mesh.loops), hash(sample))
+
+
+class MeshAnalysisCache:
+    """
+    解析種別とメッシュごとに結果を保持するLRUキャッシュ
+
+    エントリはフィンガープリントと共に保存し、取得時に一致を確認する。
+    depsgraphでジオメトリ更新が通知されたメッシュのエントリは破棄する。
+    """
+
+    def __init__(self, max_entries: int = MAX_CACHE_ENTRIES):
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[Tuple[str, int], Tuple[Tuple, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._handlers_registered = False
+        self.hits = 0
+        self.misses = 0
+        self.invalidations = 0
+
+    def get_or_compute(self, kind: str, mesh, compute: Callable[[], Any]) -> Any:
+        """
+        キャッシュ済みの解析結果を返し、なければ計算して保存
+
+        Args:
+            kind: 解析の種類（関数名など）
+            mesh: 解析対象のメッシュデータ
+            compute: 結果を計算する関数
+
+        Returns:
+            解析結果（呼び出し側が変更しても影響しないコピー）
+        """
+        self._ensure_handlers()
+
+        key = (kind, mesh.as_pointer())
+        fingerprint = mesh_fingerprint(mesh)
+
+        with self._lock:
+            cached = self._entries.get(key)
+            if cached is not None and cached[0] == fingerprint:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return copy.deepcopy(cached[1])
+            self.misses += 1
+
+        result = compute()
+
+        with self._lock:
+            self._entries[key] = (fingerprint, copy.deepcopy(result))
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+        return result
+
+    def invalidate(self, mesh=None) -> int:
+        """
+        キャッシュエントリを破棄
+
+        Args:
+            mesh: 対象メッシュ（Noneですべて）
+
+        Returns:
+            破棄したエントリ数
+        """
+        with self._lock:
+            if mesh is None:
+                removed = len(self._entries)
+                self._entries.clear()
+            else:
+                pointer = mesh.as_pointer()
+                keys = [key for key in self._entries if key[1] == pointer]
+                for key in keys:
+                    del self._entries[key]
+                removed = len(keys)
+            self.invalidations += removed
+        return removed
+
+    def get_stats(self) -> Dict[str, Any]:
+        """キャッシュの統計情報を取得"""
+        with self._lock:
+            total = self.hits + self.misses
+            return {
+                'entries': len(self._entries),
+                'max_entries': self.max_entries,
+                'hits': self.hits,
+                'misses': self.misses,
+                'hit_rate': self.hits / total if total else 0.0,
+                'invalidations': self.invalidations
+            }
+
+    def _ensure_handlers(self):
+        """depsgraph・ファイル読み込みハンドラを初回使用時に登録"""
+        if self._handlers_registered:
+            return
+        handlers = bpy.app.handlers
+        if _on_depsgraph_update not in handlers.depsgraph_update_post:
+            handlers.depsgraph_update_post.append(_on_depsgraph_update)
+        if _on_load_post not in handlers.load_post:
+            handlers.load_post.append(_on_load_post)
+        self._handlers_registered = True
+
+    def unregister_handlers(self):
+        """登録したハンドラを削除し、キャッシュを破棄"""
+        handlers = bpy.app.handlers
+        if _on_depsgraph_update in handlers.depsgraph_update_post:
+            handlers.depsgraph_update_post.remove(_on_depsgraph_update)
+        if _on_load_post in handlers.load_post:
+            handlers.load_post.remove(_on_load_post)
+        self._handlers_registered = False
+        self.invalidate()
+
+
+# グローバルインスタンス
+mesh_analysis_cache = MeshAnalysisCache()
+
+
+@persistent
+def _on_depsgraph_update(scene, depsgraph):
+    """ジオメトリが更新されたメッシュのキャッシュを破棄"""
+    try:
+        for update in depsgraph.updates:
+            if not update.is_updated_geometry:
+                continue
+            datablock = update.id.original
+            if isinstance(datablock, bpy.types.Object):
+                datablock = datablock.data
+            if isinstance(datablock, bpy.types.Mesh):
+                mesh_analysis_cache.invalidate(datablock)
+    except Exception as e:
+        logger.debug(f"メッシュ解析キャッシュの無効化に失敗しました: {e}")
+
+
+@persistent
+def _on_load_post(*args):
+    """ファイル読み込み時はポインタが変わるためすべて破棄"""
+    mesh_analysis_cache.invalidate()
+
+
+def cached_mesh_analysis(kind: str, mesh, compute: Callable[[], Any]) -> Any:
+    """
+    メッシュ解析結果をキャッシュ経由で取得
+
+    Args:
+        kind: 解析の種類
+        mesh: 解析対象のメッシュデータ
+        compute: 結果を計算する関数
+
+    Returns:
+        解析結果
+    """
+    return mesh_analysis_cache.get_or_compute(kind, mesh, compute)
+
+
+def get_mesh_analysis_cache() -> MeshAnalysisCache:
+    """メッシュ解析キャッシュのインスタンスを取得"""
+    return mesh_analysis_cache
@@ -10,17 +10,23 @@ import numpy as np
 from typing import Dict, List, Any, Optional, Union, Tuple
 import logging
 
+from .mesh_analysis_cache import cached_mesh_analysis
+from .validation.mesh_checker import MeshChecker
+
 # ロギング設定
 logger = logging.getLogger(__name__)
 
-def run_boolean_operation(target_name: str, cutter_name: str, operation: str, 
+# コレクションオペランドを使用できるソルバー
+COLLECTION_OPERAND_SOLVERS = ('EXACT',)
+
+def run_boolean_operation(target_name: str, cutter_name: Union[str, List[str]], operation: str, 
                           solver: str = 'EXACT', auto_repair: bool = True) -> Dict[str, Any]:
     """
     ブーリアン操作を実行
     
     Args:
         target_name: 対象オブジェクト名
-        cutter_name: カッターオブジェクト名
+        cutter_name: カッターオブジェクト名（リストで複数指定可）
         operation: 操作タイプ ('UNION', 'DIFFERENCE', 'INTERSECT')
         solver: 使用するソルバー ('EXACT', 'FAST')
         auto_repair: 操作前に自動修復を行うかどうか
@@ -28,29 +34,64 @@ def run_boolean_operation(target_name: str, cutter_name: str, operation: str,
     Returns:
         Dict: 操作結果
     """
+    cutter_names = [cutter_name] if isinstance(cutter_name, str) else list(cutter_name)
+    result = run_batch_boolean_operation(target_name, cutter_names, operation, solver, auto_repair)
+    
+    # 単一カッターの場合は従来の形式も維持
+    if isinstance(cutter_name, str):
+        result["details"]["cutter"] = cutter_name
+    return result
+
+def run_batch_boolean_operation(target_name: str, cutter_names: List[str], operation: str,
+                                solver: str = 'EXACT', auto_repair: bool = True) -> Dict[str, Any]:
+    """
+    複数のカッターによるブーリアン操作を1回の評価で実行
+    
+    EXACTソルバーではカッターをまとめた一時コレクションを1つのモディファイアの
+    オペランドとし、それ以外ではカッターごとのモディファイアを重ねる。
+    いずれも評価済みメッシュを1回だけ取得して対象のメッシュに書き戻すため、
+    bpy.ops.object.modifier_applyによるコンテキスト切り替えは発生しない。
+    
+    Args:
+        target_name: 対象オブジェクト名
+        cutter_names: カッターオブジェクト名のリスト
+        operation: 操作タイプ ('UNION', 'DIFFERENCE', 'INTERSECT')
+        solver: 使用するソルバー ('EXACT', 'FAST')
+        auto_repair: 問題が検出された入力のみ操作前に修復するかどうか
+        
+    Returns:
+        Dict: 操作結果
+    """
+    temp_modifiers = []
+    temp_collection = None
+    disabled_modifiers = []
+    
     try:
         # オブジェクトの存在確認
         target = bpy.data.objects.get(target_name)
-        cutter = bpy.data.objects.get(cutter_name)
+        cutters = [bpy.data.objects.get(name) for name in cutter_names]
+        missing_cutters = [name for name, cutter in zip(cutter_names, cutters) if cutter is None]
         
-        if not target or not cutter:
+        if not target or missing_cutters or not cutters:
             return {
                 "status": "error",
-                "message": f"Objects not found: {'target' if not target else 'cutter'}",
+                "message": f"Objects not found: {'target' if not target else ', '.join(missing_cutters) or 'cutter'}",
                 "details": {
                     "target_exists": target is not None,
-                    "cutter_exists": cutter is not None
+                    "cutter_exists": bool(cutters) and not missing_cutters,
+                    "missing_cutters": missing_cutters
                 }
             }
         
         # オブジェクトタイプの確認
-        if target.type != 'MESH' or cutter.type != 'MESH':
+        non_mesh = [obj.name for obj in [target] + cutters if obj.type != 'MESH']
+        if non_mesh:
             return {
                 "status": "error",
                 "message": "Both objects must be meshes",
                 "details": {
                     "target_type": target.type,
-                    "cutter_type": cutter.type
+                    "non_mesh_objects": non_mesh
                 }
             }
         
@@ -66,43 +107,88 @@ def run_boolean_operation(target_name: str, cutter_name: str, operation: str,
                 }
             }
         
-        # 自動修復が有効な場合、メッシュの前処理を行う
+        # modifier_applyと同様、シェイプキーを持つメッシュへの書き戻しは行わない
+        if target.data.shape_keys is not None:
+            return {
+                "status": "error",
+                "message": "Target mesh has shape keys; boolean result cannot be applied",
+                "details": {
+                    "target": target_name,
+                    "shape_keys": [key.name for key in target.data.shape_keys.key_blocks]
+                }
+            }
+        
+        if target.mode != 'OBJECT':
+            return {
+                "status": "error",
+                "message": "Target must be in object mode",
+                "details": {
+                    "target": target_name,
+                    "mode": target.mode
+                }
+            }
+        
+        # 自動修復が有効な場合、問題のある入力のみ前処理を行う
+        repairs = {}
         if auto_repair:
-            repair_result_target = repair_mesh(target_name)
-            repair_result_cutter = repair_mesh(cutter_name)
-            
-            if repair_result_target.get("status") == "error" or repair_result_cutter.get("status") == "error":
+            repairs = _repair_unclean_inputs([target] + cutters)
+            failed = {name: repair for name, repair in repairs.items()
+                      if isinstance(repair, dict) and repair.get("status") == "error"}
+            if failed:
                 return {
                     "status": "error",
                     "message": "Failed to repair meshes",
                     "details": {
-                        "target_repair": repair_result_target,
-                        "cutter_repair": repair_result_cutter
+                        "repairs": failed
                     }
                 }
         
         # オブジェクトの状態を保存（操作比較用）
         before_stats = get_mesh_stats(target_name)
         
-        # 既存のブーリアンモディファイア確認
-        existing_modifiers = [mod for mod in target.modifiers if mod.type == 'BOOLEAN' and mod.object == cutter]
-        
-        # 既存のモディファイアを使用するか新規作成
-        if existing_modifiers:
-            bool_mod = existing_modifiers[0]
-            bool_mod.operation = operation.upper()
-            bool_mod.solver = solver
-        else:
-            # 新しいブーリアンモディファイアを追加
+        # 既存のモディファイアは適用対象から外す（modifier_applyと同様に元メッシュに対して評価）
+        for mod in target.modifiers:
+            if mod.show_viewport:
+                mod.show_viewport = False
+                disabled_modifiers.append(mod)
+        
+        # ブーリアンモディファイアを構成
+        if len(cutters) > 1 and solver in COLLECTION_OPERAND_SOLVERS:
+            temp_collection = bpy.data.collections.new("MCP_Boolean_Cutters")
+            for cutter in cutters:
+                temp_collection.objects.link(cutter)
             bool_mod = target.modifiers.new(name="MCP_Boolean", type='BOOLEAN')
             bool_mod.operation = operation.upper()
-            bool_mod.object = cutter
             bool_mod.solver = solver
-        
-        # モディファイアを適用
-        bpy.context.view_layer.objects.active = target
-        bpy.ops.object.modifier_apply(modifier=bool_mod.name)
-        
+            bool_mod.operand_type = 'COLLECTION'
+            bool_mod.collection = temp_collection
+            temp_modifiers.append(bool_mod)
+        else:
+            for cutter in cutters:
+                bool_mod = target.modifiers.new(name="MCP_Boolean", type='BOOLEAN')
+                bool_mod.operation = operation.upper()
+                bool_mod.object = cutter
+                bool_mod.solver = solver
+                temp_modifiers.append(bool_mod)
+        
+        # カッターのマテリアルを評価結果に含める（EXACTソルバー、Blender 3.0以降）
+        for bool_mod in temp_modifiers:
+            if bool_mod.solver == 'EXACT' and hasattr(bool_mod, 'material_mode'):
+                bool_mod.material_mode = 'TRANSFER'
+        
+        # 評価済みメッシュを1回だけ取得して書き戻す
+        depsgraph = bpy.context.evaluated_depsgraph_get()
+        evaluated = target.evaluated_get(depsgraph)
+        result_mesh = bpy.data.meshes.new_from_object(evaluated, preserve_all_data_layers=True, depsgraph=depsgraph)
+        _cleanup_boolean_setup(target, temp_modifiers, disabled_modifiers, temp_collection)
+        temp_modifiers, disabled_modifiers, temp_collection = [], [], None
+        
+        _write_mesh_geometry(target, result_mesh)
+
+        # 同じカッターを参照していた既存のブーリアンモディファイアは適用済みとして削除
+        for mod in [mod for mod in target.modifiers if mod.type == 'BOOLEAN' and mod.object in cutters]:
+            target.modifiers.remove(mod)
+
         # 操作後の統計
         after_stats = get_mesh_stats(target_name)
         
@@ -114,9 +200,11 @@ def run_boolean_operation(target_name: str, cutter_name: str, operation: str,
             "message": f"Boolean {operation.lower()} operation completed",
             "details": {
                 "target": target_name,
-                "cutter": cutter_name,
+                "cutters": cutter_names,
                 "operation": operation.upper(),
                 "solver": solver,
+                "repairs": {name: repair if isinstance(repair, str) else repair.get("status")
+                            for name, repair in repairs.items()},
                 "changes": changes,
                 "before": before_stats,
                 "after": after_stats
@@ -125,17 +213,134 @@ def run_boolean_operation(target_name: str, cutter_name: str, operation: str,
         
     except Exception as e:
         logger.error(f"Boolean operation failed: {str(e)}")
+        try:
+            target = bpy.data.objects.get(target_name)
+            if target is not None:
+                _cleanup_boolean_setup(target, temp_modifiers, disabled_modifiers, temp_collection)
+        except Exception:
+            pass
         return {
             "status": "error",
             "message": f"Boolean operation failed: {str(e)}",
             "details": {
                 "target": target_name,
-                "cutter": cutter_name,
+                "cutters": cutter_names,
                 "operation": operation,
                 "exception": str(e)
             }
         }
 
+def _is_clean_mesh(object_name: str) -> bool:
+    """
+    ブーリアン前の修復が不要なメッシュかを判定
+    
+    解析結果はジオメトリのフィンガープリントでキャッシュされるため、
+    前回から変更のないメッシュの判定は辞書参照のみで済む。
+    
+    Args:
+        object_name: 判定するオブジェクト名
+        
+    Returns:
+        bool: 問題が検出されなければTrue
+    """
+    check = MeshChecker.check_mesh(object_name)
+    if not check.get("valid") or check.get("issues"):
+        return False
+    issues = detect_mesh_issues(object_name)
+    return not ("error" in issues or issues["inconsistent_normals"] or issues["zero_area_faces"]
+                or issues["non_manifold_vertices"])
+
+def _repair_unclean_inputs(objects: List[bpy.types.Object]) -> Dict[str, Any]:
+    """
+    問題のある入力メッシュのみ修復（メッシュデータを共有するオブジェクトは1回だけ）
+    
+    Args:
+        objects: 対象オブジェクトとカッター
+        
+    Returns:
+        Dict: オブジェクト名 -> 修復結果（修復不要の場合は"clean"）
+    """
+    repairs = {}
+    checked = {}
+    for obj in objects:
+        key = obj.data.as_pointer()
+        if key in checked:
+            repairs[obj.name] = checked[key]
+            continue
+        if _is_clean_mesh(obj.name):
+            repairs[obj.name] = checked[key] = "clean"
+        else:
+            repairs[obj.name] = checked[key] = repair_mesh(obj.name)
+    return repairs
+
+def _cleanup_boolean_setup(target, temp_modifiers, disabled_modifiers, temp_collection) -> None:
+    """
+    一時的に追加したモディファイア・コレクションを削除し、無効化したモディファイアを戻す
+    """
+    for mod in temp_modifiers:
+        target.modifiers.remove(mod)
+    for mod in disabled_modifiers:
+        mod.show_viewport = True
+    if temp_collection is not None:
+        bpy.data.collections.remove(temp_collection)
+
+def _write_mesh_geometry(target, source_mesh) -> None:
+    """
+    評価結果のメッシュを対象のメッシュデータに書き込み、一時メッシュを削除
+    
+    メッシュデータブロック自体は維持するため、参照や既存のマテリアルの割り当ては変わらない。
+    カッターから来たマテリアルは対象のスロットに追加し、面のマテリアル番号を付け替える。
+    他のオブジェクトと共有している場合は単一ユーザー化してから書き込む。
+    """
+    if target.data.users > 1:
+        target.data = target.data.copy()
+    
+    index_map = _merge_material_slots(target.data, source_mesh)
+    
+    bm = bmesh.new()
+    try:
+        bm.from_mesh(source_mesh)
+        bm.to_mesh(target.data)
+    finally:
+        bm.free()
+        bpy.data.meshes.remove(source_mesh)
+    
+    if index_map is not None and len(target.data.polygons) > 0:
+        polygons = target.data.polygons
+        indices = np.empty(len(polygons), dtype=np.int32)
+        polygons.foreach_get("material_index", indices)
+        remapped = np.asarray(index_map, dtype=np.int32)[np.clip(indices, 0, len(index_map) - 1)]
+        polygons.foreach_set("material_index", remapped)
+    target.data.update()
+
+def _merge_material_slots(mesh, source_mesh) -> Optional[List[int]]:
+    """
+    評価結果のマテリアルを対象メッシュのマテリアルスロットに統合
+    
+    Args:
+        mesh: 書き込み先のメッシュ
+        source_mesh: 評価結果のメッシュ
+        
+    Returns:
+        評価結果のマテリアル番号 -> 対象のマテリアル番号（付け替えが不要な場合はNone）
+    """
+    index_map = []
+    for index, material in enumerate(source_mesh.materials):
+        if index < len(mesh.materials) and mesh.materials[index] == material:
+            index_map.append(index)
+            continue
+        existing = None
+        if material is not None:
+            existing = next((i for i, slot in enumerate(mesh.materials) if slot == material), None)
+        if existing is None:
+            mesh.materials.append(material)
+            existing = len(mesh.materials) - 1
+        index_map.append(existing)
+    
+    if not index_map or index_map == list(range(len(index_map))):
+        return None
+    return index_map
+
 def repair_mesh(object_name: str) -> Dict[str, Any]:
     """
     メッシュの問題を自動修復
@@ -255,8 +460,23 @@ def get_mesh_stats(object_name: str) -> Dict[str, Any]:
     if not obj or obj.type != 'MESH':
         return {}
     
-    mesh = obj.data
+    # ジオメトリが変わっていなければキャッシュ済みの統計を使用
+    stats = cached_mesh_analysis("get_mesh_stats", obj.data, lambda: _compute_mesh_stats(obj.data))
+    
+    # 寸法はオブジェクトのスケールに依存するため毎回取得
+    stats["dimensions"] = [round(d, 6) for d in obj.dimensions]
+    return stats
+
+def _compute_mesh_stats(mesh) -> Dict[str, Any]:
+    """
+    BMeshを使用してメッシュの統計情報を計算
     
+    Args:
+        mesh: 分析するメッシュデータ
+        
+    Returns:
+        Dict: メッシュ統計情報（寸法を除く）
+    """
     # BMeshを使用してより詳細な分析を行う
     bm = bmesh.new()
     bm.from_mesh(mesh)
@@ -279,8 +499,9 @@ def get_mesh_stats(object_name: str) -> Dict[str, Any]:
     total_area = sum(f.calc_area() for f in bm.faces)
     
     # 閉じたメッシュの場合のみ体積を計算
+    is_manifold = all(e.is_manifold for e in bm.edges)
     volume = 0
-    if all(e.is_manifold for e in bm.edges):
+    if is_manifold:
         volume = bm.calc_volume()
     
     # BMeshを解放
@@ -295,8 +516,7 @@ def get_mesh_stats(object_name: str) -> Dict[str, Any]:
         "ngons": ngons,
         "area": round(total_area, 6),
         "volume": round(volume, 6) if volume else 0,
-        "dimensions": [round(d, 6) for d in obj.dimensions],
-        "is_manifold": all(e.is_manifold for e in bm.edges) if bm else False
+        "is_manifold": is_manifold
     }
 
 def detect_mesh_issues(object_name: str) -> Dict[str, Any]:
@@ -314,9 +534,22 @@ def detect_mesh_issues(object_name: str) -> Dict[str, Any]:
     if not obj or obj.type != 'MESH':
         return {"error": f"Object {object_name} is not a valid mesh"}
     
+    # ジオメトリが変わっていなければキャッシュ済みの結果を使用
+    return cached_mesh_analysis("detect_mesh_issues", obj.data, lambda: _compute_mesh_issues(obj.data))
+
+def _compute_mesh_issues(mesh) -> Dict[str, Any]:
+    """
+    BMeshを使用してメッシュの問題を検出
+    
+    Args:
+        mesh: 検査するメッシュデータ
+        
+    Returns:
+        Dict: 検出された問題
+    """
     # BMeshを使用して問題を検出
     bm = bmesh.new()
-    bm.from_mesh(obj.data)
+    bm.from_mesh(mesh)
     
     # 非マニフォールドの検出
     non_manifold_verts = [v.index for v in bm.verts if not v.is_manifold]
@@ -15,6 +15,7 @@ logger = logging.getLogger(__name__)
 
 # 安全なコマンドシステムのインポート
 from .commands.secure_command_handler import register_command
+from .mesh_analysis_cache import cached_mesh_analysis
 
 #-------------------------------------------------------------------------
 # 分析コマンド
@@ -241,6 +242,19 @@ def calculate_mesh_quality(mesh) -> Dict[str, Any]:
     """
     メッシュの品質を計算
     
+    Args:
+        mesh: メッシュデータ
+        
+    Returns:
+        Dict: 品質指標
+    """
+    # ジオメトリが変わっていなければキャッシュ済みの結果を使用
+    return cached_mesh_analysis("calculate_mesh_quality", mesh, lambda: _compute_mesh_quality(mesh))
+
+def _compute_mesh_quality(mesh) -> Dict[str, Any]:
+    """
+    メッシュの品質指標を計算
+    
     Args:
         mesh: メッシュデータ
         
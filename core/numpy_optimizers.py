@@ -5,11 +5,33 @@ NumPy最適化モジュール
 
 import numpy as np
 import bpy
+from bpy.app.handlers import persistent
+from mathutils.bvhtree import BVHTree
 import time
 import logging
 
+from .mesh_analysis_cache import cached_mesh_analysis, mesh_analysis_cache
+
+try:
+    from scipy.spatial import cKDTree
+    SCIPY_AVAILABLE = True
+except ImportError:
+    SCIPY_AVAILABLE = False
+
 logger = logging.getLogger("blender_graphql_mcp.numpy_optimizers")
 
+# BVHキャッシュ（オブジェクト名 -> (ジオメトリシグネチャ, ローカル座標のBVHTree)）
+_bvh_cache = {}
+
+# ジオメトリシグネチャの計算に使う頂点サンプル数
+BVH_SIGNATURE_SAMPLES = 64
+
+# 頂点カラー補間（mean/weighted）で参照する近傍の既知頂点数
+VERTEX_COLOR_NEIGHBORS = 4
+
+# scipyがない場合のk近傍探索で一度に計算する距離行列の要素数
+KNN_CHUNK_ELEMENTS = 32 * 1024 * 1024
+
 def fast_vertex_transform(obj_name, transform_matrix):
     """NumPyを使用した高速頂点変換
     
@@ -47,6 +69,8 @@ def fast_vertex_transform(obj_name, transform_matrix):
         transformed_vertices = transformed_vertices.flatten()
         mesh.vertices.foreach_set("co", transformed_vertices)
         mesh.update()
+        # depsgraphの通知を待たずに解析キャッシュを破棄
+        mesh_analysis_cache.invalidate(mesh)
         
         logger.info(f"頂点変換完了: {obj_name}, {len(mesh.vertices)}頂点, {time.time() - start_time:.4f}秒")
         return True
@@ -55,9 +79,57 @@ def fast_vertex_transform(obj_name, transform_matrix):
         logger.error(f"頂点変換中にエラー発生: {str(e)}")
         return False
 
+def _analyze_mesh_vertices(mesh):
+    """頂点座標の境界ボックスと重心からの距離を計算
+    
+    Args:
+        mesh: メッシュデータ
+    
+    Returns:
+        dict: メッシュ分析結果（処理時間を除く）
+    """
+    # 頂点座標をNumPy配列として取得
+    vertices = np.zeros(len(mesh.vertices) * 3, dtype=np.float32)
+    mesh.vertices.foreach_get("co", vertices)
+    vertices = vertices.reshape(len(mesh.vertices), 3)
+    
+    # NumPyで高速分析
+    # 境界ボックス
+    min_coords = np.min(vertices, axis=0)
+    max_coords = np.max(vertices, axis=0)
+    
+    # 中心と寸法
+    center = (min_coords + max_coords) / 2
+    dimensions = max_coords - min_coords
+    
+    # 頂点間の距離
+    # すべての頂点の重心からの距離を計算
+    centroid = np.mean(vertices, axis=0)
+    distances = np.linalg.norm(vertices - centroid, axis=1)
+    avg_distance = np.mean(distances)
+    max_distance = np.max(distances)
+    
+    return {
+        "vertex_count": len(mesh.vertices),
+        "face_count": len(mesh.polygons),
+        "edge_count": len(mesh.edges),
+        "bounds": {
+            "min": min_coords.tolist(),
+            "max": max_coords.tolist(),
+            "center": center.tolist(),
+            "dimensions": dimensions.tolist()
+        },
+        "vertex_stats": {
+            "average_distance_from_center": float(avg_distance),
+            "max_distance_from_center": float(max_distance)
+        }
+    }
+
 def fast_mesh_analysis(obj_name):
     """NumPyを使用したメッシュ分析の高速化
     
+    ジオメトリが変わっていなければキャッシュ済みの結果を返す。
+    
     Args:
         obj_name: 対象オブジェクト名
     
@@ -73,50 +145,8 @@ def fast_mesh_analysis(obj_name):
             
         mesh = obj.data
         
-        # 頂点座標をNumPy配列として取得
-        vertices = np.zeros(len(mesh.vertices) * 3, dtype=np.float32)
-        mesh.vertices.foreach_get("co", vertices)
-        vertices = vertices.reshape(len(mesh.vertices), 3)
-        
-        # 面情報をNumPy配列として取得
-        polygons = []
-        for poly in mesh.polygons:
-            vertices_indices = list(poly.vertices)
-            polygons.append(vertices_indices)
-        
-        # NumPyで高速分析
-        # 境界ボックス
-        min_coords = np.min(vertices, axis=0)
-        max_coords = np.max(vertices, axis=0)
-        
-        # 中心と寸法
-        center = (min_coords + max_coords) / 2
-        dimensions = max_coords - min_coords
-        
-        # 頂点間の距離
-        # すべての頂点の重心からの距離を計算
-        centroid = np.mean(vertices, axis=0)
-        distances = np.linalg.norm(vertices - centroid, axis=1)
-        avg_distance = np.mean(distances)
-        max_distance = np.max(distances)
-        
-        # 結果をまとめる
-        result = {
-            "vertex_count": len(mesh.vertices),
-            "face_count": len(mesh.polygons),
-            "edge_count": len(mesh.edges),
-            "bounds": {
-                "min": min_coords.tolist(),
-                "max": max_coords.tolist(),
-                "center": center.tolist(),
-                "dimensions": dimensions.tolist()
-            },
-            "vertex_stats": {
-                "average_distance_from_center": float(avg_distance),
-                "max_distance_from_center": float(max_distance)
-            },
-            "processing_time_ms": (time.time() - start_time) * 1000
-        }
+        result = cached_mesh_analysis("fast_mesh_analysis", mesh, lambda: _analyze_mesh_vertices(mesh))
+        result["processing_time_ms"] = (time.time() - start_time) * 1000
         
         logger.info(f"メッシュ分析完了: {obj_name}, 処理時間: {time.time() - start_time:.4f}秒")
         return result
@@ -204,20 +234,21 @@ def fast_raycast(origin, direction, max_distance=100.0):
         direction_np = np.array(direction, dtype=np.float32)
         direction_np = direction_np / np.linalg.norm(direction_np)
         
-        # シーンのレイキャスト（Blender内部機能を使用）
-        result, obj, matrix, location, normal = bpy.context.scene.ray_cast(
+        # シーンのレイキャスト（Blender内部機能を使用、ワールド座標）
+        result, location, normal, index, obj, matrix = bpy.context.scene.ray_cast(
             bpy.context.view_layer.depsgraph,
-            bpy.data.objects["Camera"].matrix_world.inverted() @ np.array(origin, dtype=np.float32),
-            direction_np
+            origin,
+            direction_np,
+            distance=max_distance
         )
         
         if result:
             hit_info = {
                 'hit': True,
                 'object': obj.name if obj else None,
-                'location': location.tolist() if location else None,
-                'normal': normal.tolist() if normal else None,
-                'distance': np.linalg.norm(np.array(location) - np.array(origin)) if location else None,
+                'location': list(location),
+                'normal': list(normal),
+                'distance': float(np.linalg.norm(np.array(location) - np.array(origin))),
                 'processing_time_ms': (time.time() - start_time) * 1000
             }
         else:
@@ -233,14 +264,426 @@ def fast_raycast(origin, direction, max_distance=100.0):
         logger.error(f"レイキャスト中にエラー発生: {str(e)}")
         return {'hit': False, 'error': str(e)}
 
+def _geometry_signature(obj, depsgraph):
+    """BVHキャッシュの有効性を判定するジオメトリの簡易シグネチャ
+    
+    元データのポインタ、モディファイア適用後の評価済みメッシュの要素数と、
+    均等に間引いた少数の頂点座標から計算する（頂点バッファ全体は読まない）。
+    要素数が変わらない編集は主にdepsgraphハンドラでの破棄で検出する。
+    """
+    mesh = obj.evaluated_get(depsgraph).data
+    count = len(mesh.vertices)
+    step = max(1, count // BVH_SIGNATURE_SAMPLES)
+    vertices = mesh.vertices
+    sample = tuple(tuple(vertices[i].co) for i in range(0, count, step))
+    return (obj.data.as_pointer(), count, len(mesh.polygons), hash(sample))
+
+def get_object_bvh(obj, depsgraph):
+    """オブジェクトのBVHツリーを取得（ローカル座標、ジオメトリが変わるまでキャッシュ）
+    
+    Args:
+        obj: メッシュオブジェクト
+        depsgraph: 評価済みジオメトリを取得するdepsgraph
+    
+    Returns:
+        BVHTree: ローカル座標のBVHツリー
+    """
+    _ensure_bvh_handlers()
+    
+    signature = _geometry_signature(obj, depsgraph)
+    cached = _bvh_cache.get(obj.name)
+    if cached and cached[0] == signature:
+        return cached[1]
+    
+    bvh = BVHTree.FromObject(obj.evaluated_get(depsgraph), depsgraph)
+    _bvh_cache[obj.name] = (signature, bvh)
+    return bvh
+
+def clear_bvh_cache(obj_name=None):
+    """BVHキャッシュを破棄
+    
+    Args:
+        obj_name: 対象オブジェクト名（Noneですべて）
+    """
+    if obj_name is None:
+        _bvh_cache.clear()
+    else:
+        _bvh_cache.pop(obj_name, None)
+
+@persistent
+def _on_bvh_depsgraph_update(scene, depsgraph):
+    """ジオメトリが更新されたオブジェクトと、削除・改名されたオブジェクトのBVHを破棄"""
+    if not _bvh_cache:
+        return
+    try:
+        for update in depsgraph.updates:
+            if update.is_updated_geometry and isinstance(update.id.original, bpy.types.Object):
+                _bvh_cache.pop(update.id.original.name, None)
+        objects = bpy.data.objects
+        for name in [name for name in _bvh_cache if name not in objects]:
+            del _bvh_cache[name]
+    except Exception as e:
+        logger.debug(f"BVHキャッシュの無効化に失敗しました: {e}")
+
+@persistent
+def _on_bvh_load_post(*args):
+    """ファイル読み込み時はすべて破棄"""
+    _bvh_cache.clear()
+
+def _ensure_bvh_handlers():
+    """BVHキャッシュのハンドラを初回使用時に登録"""
+    handlers = bpy.app.handlers
+    if _on_bvh_depsgraph_update not in handlers.depsgraph_update_post:
+        handlers.depsgraph_update_post.append(_on_bvh_depsgraph_update)
+    if _on_bvh_load_post not in handlers.load_post:
+        handlers.load_post.append(_on_bvh_load_post)
+
+def unregister_handlers():
+    """BVHキャッシュのハンドラを削除し、キャッシュを破棄"""
+    handlers = bpy.app.handlers
+    if _on_bvh_depsgraph_update in handlers.depsgraph_update_post:
+        handlers.depsgraph_update_post.remove(_on_bvh_depsgraph_update)
+    if _on_bvh_load_post in handlers.load_post:
+        handlers.load_post.remove(_on_bvh_load_post)
+    _bvh_cache.clear()
+
+def _ray_box_candidates(origins, directions, box_min, box_max, max_distance):
+    """レイとAABBのスラブ判定で、ヒットの可能性があるレイを一括抽出
+    
+    Returns:
+        np.ndarray: 候補レイのインデックス
+    """
+    with np.errstate(divide='ignore', invalid='ignore'):
+        inv = 1.0 / directions
+        t1 = (box_min - origins) * inv
+        t2 = (box_max - origins) * inv
+    # 軸に平行なレイ（方向成分0）はスラブ内にあれば制約なし
+    t1 = np.where(np.isnan(t1), -np.inf, t1)
+    t2 = np.where(np.isnan(t2), np.inf, t2)
+    t_near = np.max(np.minimum(t1, t2), axis=1)
+    t_far = np.min(np.maximum(t1, t2), axis=1)
+    hit = (t_far >= np.maximum(t_near, 0.0)) & (t_near <= max_distance)
+    return np.nonzero(hit)[0]
+
+def batch_raycast(origins, directions, max_distance=100.0, object_names=None):
+    """複数のレイを一括でキャスト
+    
+    オブジェクトごとにキャッシュしたBVHツリーに対して、AABBで絞り込んだレイのみを
+    ローカル座標で判定する。全レイを1回のメインスレッド処理で評価する。
+    
+    Args:
+        origins: レイの開始点 (N, 3) またはフラットな配列
+        directions: レイの方向 (N, 3) または (3,)（全レイ共通）
+        max_distance: 最大検索距離
+        object_names: 対象オブジェクト名のリスト（Noneで可視のメッシュすべて）
+    
+    Returns:
+        dict: パックされたヒット情報
+            hit (N,), object_index (N,)（ヒットなしは-1）, objects（インデックス→名前）,
+            location (N, 3), normal (N, 3), distance (N,)
+    """
+    start_time = time.time()
+    origins = np.asarray(origins, dtype=np.float64).reshape(-1, 3)
+    directions = np.asarray(directions, dtype=np.float64).reshape(-1, 3)
+    if len(directions) == 1:
+        directions = np.broadcast_to(directions, origins.shape)
+    if directions.shape != origins.shape:
+        raise ValueError("origins と directions の数が一致しません")
+    
+    norms = np.linalg.norm(directions, axis=1, keepdims=True)
+    directions = directions / np.where(norms > 0, norms, 1.0)
+    ray_count = len(origins)
+    
+    hit_object = np.full(ray_count, -1, dtype=np.int32)
+    hit_distance = np.full(ray_count, np.inf)
+    hit_location = np.zeros((ray_count, 3))
+    hit_normal = np.zeros((ray_count, 3))
+    object_list = []
+    
+    depsgraph = bpy.context.evaluated_depsgraph_get()
+    if object_names is None:
+        candidates = [obj for obj in bpy.context.visible_objects if obj.type == 'MESH']
+    else:
+        candidates = [bpy.data.objects[name] for name in object_names
+                      if name in bpy.data.objects and bpy.data.objects[name].type == 'MESH']
+    
+    for obj in candidates:
+        matrix = np.array(obj.matrix_world, dtype=np.float64)
+        corners = np.array(obj.bound_box, dtype=np.float64) @ matrix[:3, :3].T + matrix[:3, 3]
+        rays = _ray_box_candidates(origins, directions, corners.min(axis=0), corners.max(axis=0), max_distance)
+        if len(rays) == 0:
+            continue
+        
+        # レイをローカル座標に変換（非一様スケールでは方向の長さが変わる）
+        inverse = np.linalg.inv(matrix)
+        local_origins = origins[rays] @ inverse[:3, :3].T + inverse[:3, 3]
+        local_directions = directions[rays] @ inverse[:3, :3].T
+        local_scale = np.linalg.norm(local_directions, axis=1)
+        
+        bvh = get_object_bvh(obj, depsgraph)
+        ray_cast = bvh.ray_cast
+        hits = []
+        for row, ray in enumerate(rays):
+            location, normal, _, _ = ray_cast(local_origins[row], local_directions[row],
+                                             max_distance * local_scale[row])
+            if location is not None:
+                hits.append((ray, location, normal))
+        if not hits:
+            continue
+        
+        # ヒットをワールド座標に戻し、より近いヒットのみ採用
+        rays_hit = np.array([hit[0] for hit in hits])
+        locations = np.array([hit[1] for hit in hits]) @ matrix[:3, :3].T + matrix[:3, 3]
+        normals = np.array([hit[2] for hit in hits]) @ inverse[:3, :3]
+        normals /= np.maximum(np.linalg.norm(normals, axis=1, keepdims=True), 1e-12)
+        distances = np.linalg.norm(locations - origins[rays_hit], axis=1)
+        
+        closer = distances < hit_distance[rays_hit]
+        if not closer.any():
+            continue
+        index = len(object_list)
+        object_list.append(obj.name)
+        rays_hit = rays_hit[closer]
+        hit_object[rays_hit] = index
+        hit_distance[rays_hit] = distances[closer]
+        hit_location[rays_hit] = locations[closer]
+        hit_normal[rays_hit] = normals[closer]
+    
+    hit = hit_object >= 0
+    hit_distance[~hit] = 0.0
+    
+    processing_time = time.time() - start_time
+    logger.info(f"バッチレイキャスト完了: {ray_count}レイ, {int(hit.sum())}ヒット, "
+                f"{len(candidates)}オブジェクト, 処理時間: {processing_time:.4f}秒")
+    return {
+        'ray_count': ray_count,
+        'hit_count': int(hit.sum()),
+        'hit': hit,
+        'object_index': hit_object,
+        'objects': object_list,
+        'location': hit_location.astype(np.float32),
+        'normal': hit_normal.astype(np.float32),
+        'distance': hit_distance.astype(np.float32),
+        'processing_time_ms': processing_time * 1000
+    }
+
+def grid_ray_pattern(center, size, resolution, height=100.0, direction=(0.0, 0.0, -1.0)):
+    """XY平面上の格子状のレイを生成（地形への配置用）
+    
+    Args:
+        center: 格子の中心 [x, y]（またはz成分を含む [x, y, z]、zは無視）
+        size: 格子の大きさ [幅, 奥行き] または単一値
+        resolution: 各軸のレイ数 [nx, ny] または単一値
+        height: レイの開始点の高さ（Z）
+        direction: 全レイ共通の方向
+    
+    Returns:
+        tuple: (origins (N, 3), directions (N, 3))
+    """
+    size = np.broadcast_to(np.asarray(size, dtype=np.float64), (2,))
+    nx, ny = np.broadcast_to(np.asarray(resolution, dtype=np.int64), (2,))
+    xs = np.linspace(-size[0] / 2, size[0] / 2, nx) + center[0]
+    ys = np.linspace(-size[1] / 2, size[1] / 2, ny) + center[1]
+    gx, gy = np.meshgrid(xs, ys, indexing='xy')
+    origins = np.column_stack([gx.ravel(), gy.ravel(), np.full(gx.size, height)])
+    directions = np.broadcast_to(np.asarray(direction, dtype=np.float64), origins.shape).copy()
+    return origins, directions
+
+def hemisphere_ray_pattern(origin, count, up=(0.0, 0.0, 1.0)):
+    """半球上に均等に分布するレイを生成（フィボナッチ格子）
+    
+    Args:
+        origin: 全レイの開始点 [x, y, z]
+        count: レイ数
+        up: 半球の向き
+    
+    Returns:
+        tuple: (origins (N, 3), directions (N, 3))
+    """
+    i = np.arange(count, dtype=np.float64) + 0.5
+    z = 1.0 - i / count  # 天頂から地平線まで
+    radius = np.sqrt(1.0 - z * z)
+    phi = i * np.pi * (3.0 - np.sqrt(5.0))
+    local = np.column_stack([radius * np.cos(phi), radius * np.sin(phi), z])
+    
+    # +Z を up に回転させる正規直交基底
+    up = np.asarray(up, dtype=np.float64)
+    up = up / np.linalg.norm(up)
+    helper = np.array([1.0, 0.0, 0.0]) if abs(up[0]) < 0.9 else np.array([0.0, 1.0, 0.0])
+    tangent = np.cross(up, helper)
+    tangent /= np.linalg.norm(tangent)
+    bitangent = np.cross(up, tangent)
+    directions = local @ np.vstack([tangent, bitangent, up])
+    
+    origins = np.broadcast_to(np.asarray(origin, dtype=np.float64), directions.shape).copy()
+    return origins, directions
+
+def _known_vertex_colors(color_data, vertex_count):
+    """色データ辞書を既知頂点のインデックス配列と色配列(RGBA)に変換
+    
+    Args:
+        color_data: 色データ (dict: vertex_index -> [r,g,b] または [r,g,b,a])
+        vertex_count: メッシュの頂点数
+    
+    Returns:
+        tuple: (インデックス配列, RGBA色配列)
+    """
+    indices = np.fromiter((int(idx) for idx in color_data.keys()), dtype=np.int64, count=len(color_data))
+    colors = np.ones((len(color_data), 4), dtype=np.float32)
+    for row, color in enumerate(color_data.values()):
+        colors[row, :len(color)] = color[:4]
+    
+    # 範囲外のインデックスは無視（重複は後の値を優先）
+    valid = (indices >= 0) & (indices < vertex_count)
+    indices, colors = indices[valid], colors[valid]
+    indices, first = np.unique(indices[::-1], return_index=True)
+    return indices, colors[::-1][first]
+
+def _nearest_known(points, known_points, k):
+    """各点に対してk個の最近傍既知点を検索
+    
+    scipyがあればKDツリーで一括検索し、なければメモリを抑えたチャンク単位の総当たりで計算する。
+    
+    Args:
+        points: 検索する点 (N, 3)
+        known_points: 既知点 (K, 3)
+        k: 近傍数
+    
+    Returns:
+        tuple: (距離 (N, k), 既知点のインデックス (N, k))
+    """
+    k = min(k, len(known_points))
+    if SCIPY_AVAILABLE:
+        distances, neighbors = cKDTree(known_points).query(points, k=k, workers=-1)
+        if k == 1:
+            distances, neighbors = distances[:, None], neighbors[:, None]
+        return distances.astype(np.float32), neighbors
+    
+    distances = np.empty((len(points), k), dtype=np.float32)
+    neighbors = np.empty((len(points), k), dtype=np.int64)
+    # 1チャンクあたりの距離行列を約32M要素に制限
+    chunk = max(1, KNN_CHUNK_ELEMENTS // max(len(known_points), 1))
+    known_sq = np.einsum('ij,ij->i', known_points, known_points)
+    for start in range(0, len(points), chunk):
+        block = points[start:start + chunk]
+        block_sq = np.einsum('ij,ij->i', block, block)
+        sq = block_sq[:, None] - 2.0 * block @ known_points.T + known_sq[None, :]
+        np.maximum(sq, 0.0, out=sq)
+        if k < len(known_points):
+            part = np.argpartition(sq, k - 1, axis=1)[:, :k]
+        else:
+            part = np.broadcast_to(np.arange(k), (len(block), k))
+        part_sq = np.take_along_axis(sq, part, axis=1)
+        order = np.argsort(part_sq, axis=1)
+        neighbors[start:start + chunk] = np.take_along_axis(part, order, axis=1)
+        distances[start:start + chunk] = np.sqrt(np.take_along_axis(part_sq, order, axis=1))
+    return distances, neighbors
+
+def interpolate_vertex_colors(vertices, known_indices, known_colors, algorithm='mean', neighbors=None):
+    """既知頂点の色から全頂点の色を一括補間
+    
+    Args:
+        vertices: 頂点座標 (N, 3)
+        known_indices: 色が指定された頂点のインデックス (K,)
+        known_colors: 指定された色 (K, 4)
+        algorithm: 'nearest'（最近傍）、'mean'（k近傍の平均）、'weighted'（k近傍の逆距離加重）
+        neighbors: 補間に使う近傍数（デフォルトはVERTEX_COLOR_NEIGHBORS）
+    
+    Returns:
+        np.ndarray: 全頂点の色 (N, 4)
+    """
+    colors = np.zeros((len(vertices), 4), dtype=np.float32)
+    colors[:, 3] = 1.0
+    if len(known_indices) == 0:
+        return colors
+    colors[known_indices] = known_colors
+    
+    unknown = np.ones(len(vertices), dtype=bool)
+    unknown[known_indices] = False
+    if not unknown.any():
+        return colors
+    
+    k = 1 if algorithm == 'nearest' else (neighbors or VERTEX_COLOR_NEIGHBORS)
+    distances, nearest = _nearest_known(vertices[unknown], vertices[known_indices], k)
+    neighbor_colors = known_colors[nearest]  # (U, k, 4)
+    
+    if algorithm == 'nearest':
+        colors[unknown] = neighbor_colors[:, 0]
+    elif algorithm == 'weighted':
+        # ゼロ除算を防ぐ
+        weights = 1.0 / np.maximum(distances, 1e-6)
+        weights /= weights.sum(axis=1, keepdims=True)
+        colors[unknown] = np.einsum('uk,ukc->uc', weights, neighbor_colors)
+    else:
+        colors[unknown] = neighbor_colors.mean(axis=1)
+    return colors
+
+def _evaluate_color_function(color_func, vertices):
+    """色関数を全頂点の座標に一括で適用
+    
+    color_funcは頂点座標の (N, 3) 配列を1回で受け取り、頂点順の (N, 3) または
+    (N, 4) の色配列を返す必要がある。それ以外の形状は転置などを推測せずエラーとする。
+    
+    Args:
+        color_func: 頂点座標 (N, 3) を受け取り色 (N, 3) / (N, 4) を返す関数
+        vertices: 頂点座標 (N, 3)
+    
+    Returns:
+        np.ndarray: 全頂点の色 (N, 4)
+    
+    Raises:
+        ValueError: 色関数の戻り値の形状が (N, 3) / (N, 4) でない場合
+    """
+    result = np.asarray(color_func(vertices), dtype=np.float32)
+    if result.ndim != 2 or result.shape[0] != len(vertices) or result.shape[1] not in (3, 4):
+        raise ValueError(
+            f"色関数は ({len(vertices)}, 3) または ({len(vertices)}, 4) の配列を返す必要があります"
+            f"（戻り値の形状: {result.shape}）"
+        )
+    colors = np.ones((len(vertices), 4), dtype=np.float32)
+    colors[:, :result.shape[1]] = result
+    return colors
+
+def _write_vertex_colors(mesh, colors):
+    """頂点ごとの色をメッシュのカラー属性に一括で書き込む
+    
+    Args:
+        mesh: 対象メッシュ
+        colors: 頂点ごとの色 (V, 4)
+    
+    Returns:
+        int: 書き込んだ要素数
+    """
+    if hasattr(mesh, "color_attributes"):
+        # Blender 3.2以降: カラー属性
+        attribute = mesh.color_attributes.active_color
+        if attribute is None:
+            attribute = mesh.color_attributes.new("Col", 'BYTE_COLOR', 'CORNER')
+            mesh.color_attributes.active_color = attribute
+        if attribute.domain == 'POINT':
+            attribute.data.foreach_set("color", colors.ravel())
+            return len(colors)
+        data = attribute.data
+    else:
+        # 旧API: 頂点カラーレイヤー（コーナー単位）
+        if not mesh.vertex_colors:
+            mesh.vertex_colors.new()
+        data = mesh.vertex_colors.active.data
+    
+    # ループ→頂点のマッピングで頂点色をコーナーに展開
+    loop_vertices = np.empty(len(mesh.loops), dtype=np.int32)
+    mesh.loops.foreach_get("vertex_index", loop_vertices)
+    data.foreach_set("color", colors[loop_vertices].ravel())
+    return len(loop_vertices)
+
 def batch_vertex_colors(obj_name, color_data, algorithm='mean'):
     """NumPyを使用した頂点カラーの一括設定
     
     Args:
         obj_name: 対象オブジェクト名
-        color_data: 色データ (dict: vertex_index -> [r,g,b])
-                   または関数 (位置を受け取り色を返す)
-        algorithm: 補間アルゴリズム ('nearest', 'mean', 'weighted')
+        color_data: 色データ (dict: vertex_index -> [r,g,b] または [r,g,b,a])
+                   または関数 (頂点座標の (N, 3) 配列を受け取り (N, 3) / (N, 4) の色配列を返す)
+        algorithm: 未指定頂点の補間アルゴリズム ('nearest', 'mean', 'weighted')
     
     Returns:
         bool: 処理の成功/失敗
@@ -254,11 +697,6 @@ def batch_vertex_colors(obj_name, color_data, algorithm='mean'):
             
         mesh = obj.data
         
-        # 頂点カラーレイヤーを取得または作成
-        if not mesh.vertex_colors:
-            mesh.vertex_colors.new()
-        color_layer = mesh.vertex_colors.active
-        
         # 頂点データを取得
         vertices = np.zeros(len(mesh.vertices) * 3, dtype=np.float32)
         mesh.vertices.foreach_get("co", vertices)
@@ -266,68 +704,289 @@ def batch_vertex_colors(obj_name, color_data, algorithm='mean'):
         
         # 結果の色データを準備
         if callable(color_data):
-            # 関数が与えられた場合、各頂点の位置に適用
-            colors = np.zeros((len(vertices), 3), dtype=np.float32)
-            for i, vertex in enumerate(vertices):
-                color = color_data(vertex)
-                colors[i] = color
+            colors = _evaluate_color_function(color_data, vertices)
         elif isinstance(color_data, dict):
-            # 辞書が与えられた場合、指定された頂点に色を設定
-            colors = np.zeros((len(vertices), 3), dtype=np.float32)
-            for idx, color in color_data.items():
-                if 0 <= idx < len(vertices):
-                    colors[idx] = color
-                    
-            # 残りの頂点の補間
-            if algorithm == 'nearest' and len(color_data) > 0:
-                # 最近傍補間
-                known_indices = list(color_data.keys())
-                known_colors = np.array([color_data[idx] for idx in known_indices])
-                
-                for i in range(len(vertices)):
-                    if i not in color_data:
-                        # 最も近い既知の頂点を探す
-                        distances = np.linalg.norm(vertices[known_indices] - vertices[i], axis=1)
-                        nearest_idx = known_indices[np.argmin(distances)]
-                        colors[i] = color_data[nearest_idx]
-                        
-            elif algorithm == 'weighted' and len(color_data) > 0:
-                # 距離加重補間
-                known_indices = list(color_data.keys())
-                for i in range(len(vertices)):
-                    if i not in color_data:
-                        distances = np.array([
-                            np.linalg.norm(vertices[i] - vertices[idx]) 
-                            for idx in known_indices
-                        ])
-                        # ゼロ除算を防ぐ
-                        distances = np.maximum(distances, 1e-6)
-                        weights = 1.0 / distances
-                        weights = weights / np.sum(weights)  # 正規化
-                        
-                        # 加重平均
-                        weighted_color = np.zeros(3, dtype=np.float32)
-                        for j, idx in enumerate(known_indices):
-                            weighted_color += weights[j] * np.array(color_data[idx])
-                        
-                        colors[i] = weighted_color
+            known_indices, known_colors = _known_vertex_colors(color_data, len(vertices))
+            colors = interpolate_vertex_colors(vertices, known_indices, known_colors, algorithm)
         else:
             # 無効な入力
             logger.error(f"無効な色データ形式: {type(color_data)}")
             return False
-            
-        # メッシュの各ループに色を設定
-        i = 0
-        for poly in mesh.polygons:
-            for loop_idx in poly.loop_indices:
-                vertex_idx = mesh.loops[loop_idx].vertex_index
-                color_layer.data[loop_idx].color = (*colors[vertex_idx], 1.0)  # RGBA
-                i += 1
+        
+        count = _write_vertex_colors(mesh, colors)
         
         mesh.update()
-        logger.info(f"頂点カラー設定完了: {obj_name}, {i}ループ, 処理時間: {time.time() - start_time:.4f}秒")
+        logger.info(f"頂点カラー設定完了: {obj_name}, {count}要素, 処理時間: {time.time() - start_time:.4f}秒")
         return True
         
     except Exception as e:
         logger.error(f"頂点カラー設定中にエラー発生: {str(e)}")
-        return False
\ No newline at end of file
+        return False
+
+# 名前付き属性のデータ型 -> (foreach用プロパティ名, 成分数, NumPyデータ型)
+ATTRIBUTE_LAYOUTS = {
+    'FLOAT': ('value', 1, np.float32),
+    'INT': ('value', 1, np.int32),
+    'INT8': ('value', 1, np.int32),
+    'BOOLEAN': ('value', 1, bool),
+    'FLOAT2': ('vector', 2, np.float32),
+    'INT32_2D': ('value', 2, np.int32),
+    'FLOAT_VECTOR': ('vector', 3, np.float32),
+    'FLOAT_COLOR': ('color', 4, np.float32),
+    'BYTE_COLOR': ('color', 4, np.float32),
+    'QUATERNION': ('value', 4, np.float32),
+}
+
+class MeshAttributeAccessor:
+    """メッシュ属性の一括読み書き（foreach_get/foreach_set）
+    
+    属性名は次の形式を受け付ける:
+        'co' / 'position': 頂点座標
+        'normal': 頂点法線（書き込み時はカスタム法線として設定）
+        'uv' / 'uv:<レイヤー名>': UVレイヤー（'uv'はアクティブレイヤー）
+        その他: 名前付き属性（mesh.attributes）
+    """
+    
+    def __init__(self, mesh, name):
+        self.mesh = mesh
+        self.name = name
+        self.collection = None
+        self.prop = None
+        self.data_type = None
+        
+        if name in ('co', 'position'):
+            self.collection, self.prop = mesh.vertices, 'co'
+            self.domain, self.components, self.dtype, self.data_type = 'POINT', 3, np.float32, 'FLOAT_VECTOR'
+        elif name == 'normal':
+            # Blender 4.1以降はvertex_normals、それ以前はvertices.normal
+            if hasattr(mesh, 'vertex_normals'):
+                self.collection, self.prop = mesh.vertex_normals, 'vector'
+            else:
+                self.collection, self.prop = mesh.vertices, 'normal'
+            self.domain, self.components, self.dtype, self.data_type = 'POINT', 3, np.float32, 'FLOAT_VECTOR'
+        elif name == 'uv' or name.startswith('uv:'):
+            layer_name = name[3:] if name.startswith('uv:') else None
+            layer = mesh.uv_layers.get(layer_name) if layer_name else mesh.uv_layers.active
+            if layer is None:
+                raise KeyError(f"UVレイヤー '{layer_name or 'active'}' が見つかりません")
+            self.collection, self.prop = layer.data, 'uv'
+            self.domain, self.components, self.dtype, self.data_type = 'CORNER', 2, np.float32, 'FLOAT2'
+        else:
+            attribute = mesh.attributes.get(name)
+            if attribute is None:
+                raise KeyError(f"属性 '{name}' が見つかりません")
+            if attribute.data_type not in ATTRIBUTE_LAYOUTS:
+                raise ValueError(f"属性 '{name}' のデータ型 {attribute.data_type} は未対応です")
+            self.prop, self.components, self.dtype = ATTRIBUTE_LAYOUTS[attribute.data_type]
+            self.collection = attribute.data
+            self.domain, self.data_type = attribute.domain, attribute.data_type
+    
+    @property
+    def length(self):
+        """ドメインの要素数"""
+        return len(self.collection)
+    
+    def info(self):
+        """属性のメタデータ"""
+        return {
+            'name': self.name,
+            'domain': self.domain,
+            'data_type': self.data_type,
+            'components': self.components,
+            'length': self.length,
+        }
+    
+    def read(self, start=0, count=None):
+        """属性値を読み込む
+        
+        foreach_getは範囲指定できないため全体を一度に読み込み、スライスを返す。
+        
+        Args:
+            start: 開始要素インデックス
+            count: 要素数（Noneで末尾まで）
+        
+        Returns:
+            np.ndarray: (count, components) の配列（成分数1の場合は (count,)）
+        """
+        length = self.length
+        start, stop = _clamp_range(start, count, length)
+        buffer = np.empty(length * self.components, dtype=self.dtype)
+        self.collection.foreach_get(self.prop, buffer)
+        if self.components > 1:
+            buffer = buffer.reshape(length, self.components)
+        return buffer[start:stop]
+    
+    def write(self, values, start=0):
+        """属性値を書き込む
+        
+        範囲が属性全体でない場合は現在値を読み込んで部分的に置き換える。
+        
+        Args:
+            values: 書き込む値（フラットまたは (N, components)）
+            start: 開始要素インデックス
+        
+        Returns:
+            int: 書き込んだ要素数
+        """
+        values = np.asarray(values, dtype=self.dtype).reshape(-1)
+        if len(values) % self.components:
+            raise ValueError(f"値の数 {len(values)} が成分数 {self.components} の倍数ではありません")
+        count = len(values) // self.components
+        length = self.length
+        if start < 0 or start + count > length:
+            raise IndexError(f"範囲 {start}..{start + count} が要素数 {length} を超えています")
+        
+        if self.name == 'normal':
+            if start != 0 or count != length:
+                raise ValueError("法線は全頂点分をまとめて書き込む必要があります")
+            _set_custom_normals(self.mesh, values.reshape(length, 3))
+            return count
+        
+        if count == length:
+            buffer = values
+        else:
+            buffer = np.empty(length * self.components, dtype=self.dtype)
+            self.collection.foreach_get(self.prop, buffer)
+            buffer[start * self.components:(start + count) * self.components] = values
+        self.collection.foreach_set(self.prop, buffer)
+        return count
+
+def _clamp_range(start, count, length):
+    """開始位置と要素数を [0, length] に収める"""
+    start = max(0, min(int(start or 0), length))
+    stop = length if count is None else max(start, min(start + int(count), length))
+    return start, stop
+
+def _set_custom_normals(mesh, normals):
+    """頂点法線をカスタム分割法線として設定"""
+    if hasattr(mesh, 'use_auto_smooth'):
+        # Blender 4.0以前はカスタム法線に自動スムーズが必要
+        mesh.use_auto_smooth = True
+    mesh.normals_split_custom_set_from_vertices(normals)
+
+def _is_uv_attribute(mesh, name):
+    """属性名がUVレイヤー（'uv' / 'uv:<レイヤー名>' / 既存UVレイヤー名）を指すか"""
+    if name == 'uv' or name.startswith('uv:'):
+        return True
+    return any(layer.name == name for layer in mesh.uv_layers)
+
+def attribute_dtype(data_type):
+    """属性のデータ型に対応するNumPyデータ型（不明な場合はfloat32）"""
+    layout = ATTRIBUTE_LAYOUTS.get(data_type)
+    return np.dtype(layout[2]) if layout else np.dtype(np.float32)
+
+def mesh_attribute_dtype(obj_name, attribute, data_type=None):
+    """書き込み先の属性のNumPyデータ型
+    
+    属性が存在しない場合は作成時のデータ型（data_type）を使う。
+    
+    Args:
+        obj_name: 対象オブジェクト名
+        attribute: 属性名（MeshAttributeAccessorを参照）
+        data_type: 属性が存在しない場合のデータ型
+    
+    Returns:
+        np.dtype: 属性値のデータ型
+    """
+    try:
+        return np.dtype(MeshAttributeAccessor(_get_mesh(obj_name), attribute).dtype)
+    except (KeyError, ValueError):
+        return attribute_dtype(data_type)
+
+def _get_mesh(obj_name):
+    """メッシュオブジェクトのデータを取得"""
+    obj = bpy.data.objects.get(obj_name)
+    if obj is None or obj.type != 'MESH':
+        raise KeyError(f"メッシュオブジェクト '{obj_name}' が見つかりません")
+    return obj.data
+
+def list_mesh_attributes(obj_name):
+    """メッシュで読み書きできる属性の一覧
+    
+    Args:
+        obj_name: 対象オブジェクト名
+    
+    Returns:
+        list: 属性メタデータのリスト
+    """
+    mesh = _get_mesh(obj_name)
+    names = ['co', 'normal']
+    names.extend(f"uv:{layer.name}" for layer in mesh.uv_layers)
+    names.extend(attr.name for attr in mesh.attributes
+                 if attr.data_type in ATTRIBUTE_LAYOUTS and attr.name != 'position'
+                 and not attr.name.startswith('.'))
+    
+    result = []
+    for name in names:
+        try:
+            result.append(MeshAttributeAccessor(mesh, name).info())
+        except (KeyError, ValueError):
+            continue
+    return result
+
+def read_mesh_attribute(obj_name, attribute, start=0, count=None):
+    """メッシュ属性を一括で読み込む
+    
+    Args:
+        obj_name: 対象オブジェクト名
+        attribute: 属性名（MeshAttributeAccessorを参照）
+        start: 開始要素インデックス
+        count: 要素数（Noneで末尾まで）
+    
+    Returns:
+        dict: 属性メタデータと 'values'（NumPy配列）
+    """
+    start_time = time.time()
+    accessor = MeshAttributeAccessor(_get_mesh(obj_name), attribute)
+    values = accessor.read(start, count)
+    
+    result = accessor.info()
+    result.update({
+        'start': _clamp_range(start, count, accessor.length)[0],
+        'count': len(values),
+        'values': values,
+        'processing_time_ms': (time.time() - start_time) * 1000
+    })
+    logger.debug(f"属性読み込み: {obj_name}.{attribute}, {len(values)}要素, "
+                 f"処理時間: {time.time() - start_time:.4f}秒")
+    return result
+
+def write_mesh_attribute(obj_name, attribute, values, start=0, domain=None, data_type=None):
+    """メッシュ属性を一括で書き込む
+    
+    Args:
+        obj_name: 対象オブジェクト名
+        attribute: 属性名（MeshAttributeAccessorを参照）
+        values: 書き込む値（フラットまたは (N, components)）
+        start: 開始要素インデックス
+        domain: 名前付き属性が存在しない場合に作成するドメイン
+        data_type: 名前付き属性が存在しない場合に作成するデータ型
+    
+    Returns:
+        dict: 書き込み結果
+    """
+    start_time = time.time()
+    mesh = _get_mesh(obj_name)
+    
+    created = False
+    if (domain and data_type and attribute not in ('co', 'position', 'normal')
+            and not _is_uv_attribute(mesh, attribute) and attribute not in mesh.attributes):
+        mesh.attributes.new(attribute, data_type, domain)
+        created = True
+    
+    accessor = MeshAttributeAccessor(mesh, attribute)
+    count = accessor.write(values, start)
+    mesh.update()
+    mesh_analysis_cache.invalidate(mesh)
+    
+    processing_time = time.time() - start_time
+    logger.info(f"属性書き込み完了: {obj_name}.{attribute}, {count}要素, 処理時間: {processing_time:.4f}秒")
+    result = accessor.info()
+    result.update({
+        'success': True,
+        'created': created,
+        'start': start,
+        'count': count,
+        'processing_time_ms': processing_time * 1000
+    })
+    return result
@@ -9,7 +9,9 @@ import bpy
 import time
 import logging
 import json
-from collections import defaultdict
+
+from .scene_hierarchy_index import scene_hierarchy_index
+from .material_fingerprint_index import material_fingerprint_index
 
 logger = logging.getLogger("blender_graphql_mcp.pandas_optimizers")
 
@@ -205,6 +207,9 @@ def batch_object_properties(query_params=None):
 def material_analysis():
     """マテリアル情報の高速分析
     
+    ノード統計・重複検出はマテリアルフィンガープリントインデックスから取得するため、
+    変更のないマテリアルのノードツリーは走査しない。
+    
     Returns:
         dict: マテリアル分析結果
     """
@@ -212,6 +217,7 @@ def material_analysis():
     try:
         # マテリアルデータ収集
         materials_data = []
+        node_counts = material_fingerprint_index.get_node_counts()
         
         for mat in bpy.data.materials:
             mat_data = {
@@ -227,26 +233,15 @@ def material_analysis():
                 'roughness': float(mat.roughness),
                 'users': mat.users,
                 'node_tree_type': mat.node_tree.type if mat.node_tree else None,
-                'node_count': len(mat.node_tree.nodes) if mat.node_tree else 0
+                'node_count': node_counts.get(mat.name, 0)
             }
             materials_data.append(mat_data)
         
         # DataFrameに変換
         df = pd.DataFrame(materials_data)
         
-        # マテリアルノード統計
-        node_stats = defaultdict(int)
-        input_output_stats = defaultdict(int)
-        
-        for mat in bpy.data.materials:
-            if mat.node_tree and mat.use_nodes:
-                for node in mat.node_tree.nodes:
-                    node_stats[node.type] += 1
-                    
-                    # 入出力ソケット数も記録
-                    n_inputs = len(node.inputs)
-                    n_outputs = len(node.outputs)
-                    input_output_stats[f"{node.type}_{n_inputs}in_{n_outputs}out"] += 1
+        # マテリアルノード統計（インデックスで差分更新済み）
+        node_statistics = material_fingerprint_index.get_node_statistics()
         
         # 結果を生成
         result = {
@@ -260,7 +255,9 @@ def material_analysis():
             },
             'blend_methods': df['blend_method'].value_counts().to_dict(),
             'shadow_methods': df['shadow_method'].value_counts().to_dict(),
-            'node_statistics': dict(node_stats),
+            'node_statistics': node_statistics['node_types'],
+            'node_io_statistics': node_statistics['node_io'],
+            'duplicate_materials': material_fingerprint_index.find_duplicates(),
             'materials': df.to_dict('records'),
             'processing_time_ms': (time.time() - start_time) * 1000
         }
@@ -275,51 +272,19 @@ def material_analysis():
 def scene_hierarchy_analysis():
     """シーンの階層構造の高速分析
     
+    親子関係と深さはシーン階層インデックスから取得するため、
+    オブジェクトごとに親を辿る処理は行わない。
+    
     Returns:
         dict: 階層構造分析結果
     """
     start_time = time.time()
     try:
-        # オブジェクト情報収集
-        objects_data = []
-        
-        for obj in bpy.data.objects:
-            parent_name = obj.parent.name if obj.parent else None
-            children_names = [child.name for child in obj.children]
-            
-            obj_data = {
-                'name': obj.name,
-                'type': obj.type,
-                'parent': parent_name,
-                'children_count': len(children_names),
-                'collection_names': [coll.name for coll in obj.users_collection],
-                'visible': obj.visible_get(),
-                'depth': 0  # 後で計算
-            }
-            objects_data.append(obj_data)
-        
-        # DataFrameに変換
-        df = pd.DataFrame(objects_data)
-        
-        # 階層の深さを計算
-        # 親→子の関係辞書を作成
-        parent_dict = df.set_index('name')['parent'].to_dict()
-        
-        # 各オブジェクトの階層深さを計算
-        for i, row in df.iterrows():
-            depth = 0
-            current = row['name']
-            
-            # 親を辿って深さを計算
-            while parent_dict.get(current) is not None:
-                depth += 1
-                current = parent_dict[current]
-                
-                # 循環参照の防止
-                if depth > 100:  # 安全策
-                    break
-                    
-            df.at[i, 'depth'] = depth
+        # オブジェクト情報収集（深さは階層インデックスで管理）
+        df = pd.DataFrame(
+            scene_hierarchy_index.get_records(),
+            columns=['name', 'type', 'parent', 'children_count', 'collection_names', 'depth']
+        )
         
         # コレクション情報を収集
         collections_data = []
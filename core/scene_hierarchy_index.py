@@ -0,0 +1,356 @@
+"""
+シーン階層インデックス
+親子関係・深さ・ルート・コレクション所属を保持し、
+親の変更時は影響するサブツリーのみを更新します
+"""
+
+import logging
+import threading
+from collections import deque
+from typing import Any, Dict, Iterable, List, Optional, Set
+
+import bpy
+from bpy.app.handlers import persistent
+
+logger = logging.getLogger("unified_mcp.scene_hierarchy_index")
+
+
+class SceneHierarchyIndex:
+    """
+    オブジェクト階層のインデックス
+
+    初回（または無効化後）の参照時に全オブジェクトを1回走査し、ルートからの
+    BFSで深さとルートを求める。以降はdepsgraphの更新通知と参照時の親の照合で
+    親が変わったオブジェクトのサブツリーだけを付け替えるため、階層クエリは
+    全体の再構築や祖先の辿り直しをせずに応答できる。
+    """
+
+    def __init__(self):
+        self._lock = threading.RLock()
+        self._dirty = True
+        self._handlers_registered = False
+
+        self.parent: Dict[str, Optional[str]] = {}
+        self.children: Dict[str, Dict[str, None]] = {}   # 挿入順を保つため値なしのdictを使用
+        self.depth: Dict[str, int] = {}
+        self.root: Dict[str, str] = {}
+        self.types: Dict[str, str] = {}
+        self.object_collections: Dict[str, List[str]] = {}
+        self.collection_objects: Dict[str, Set[str]] = {}
+
+        self.full_rebuilds = 0
+        self.incremental_updates = 0
+
+    # ------------------------------------------------------------------
+    # 構築と更新
+    # ------------------------------------------------------------------
+
+    def invalidate(self):
+        """次回の参照時に全体を再構築する"""
+        with self._lock:
+            self._dirty = True
+
+    def ensure_current(self):
+        """
+        インデックスを最新の状態にする
+
+        depsgraphの更新通知はタスクの終了後にしか届かないため、同じタスク内の
+        親の変更・削除に備えて参照のたびにライブのobj.parentと照合し、
+        食い違ったオブジェクトのサブツリーだけを付け替える。
+        """
+        self._ensure_handlers()
+        with self._lock:
+            if self._dirty or len(self.parent) != len(bpy.data.objects):
+                self._rebuild()
+                return
+            for obj in bpy.data.objects:
+                name = obj.name
+                if name not in self.parent:
+                    # 削除と追加・名前変更が同じタスク内で行われた
+                    self._rebuild()
+                    return
+                live_parent = obj.parent.name if obj.parent else None
+                if live_parent != self.parent[name]:
+                    self._reparent(name, live_parent)
+            for collection in bpy.data.collections:
+                if len(collection.objects) != len(self.collection_objects.get(collection.name, ())):
+                    self._update_collection(collection)
+
+    def _rebuild(self):
+        """全オブジェクトを走査して再構築（ロック内で呼び出す）"""
+        parent = {}
+        children = {}
+        types = {}
+        object_collections = {}
+        collection_objects = {}
+
+        for obj in bpy.data.objects:
+            name = obj.name
+            parent[name] = obj.parent.name if obj.parent else None
+            children.setdefault(name, {})
+            types[name] = obj.type
+            colls = [coll.name for coll in obj.users_collection]
+            object_collections[name] = colls
+            for coll_name in colls:
+                collection_objects.setdefault(coll_name, set()).add(name)
+
+        for name, parent_name in parent.items():
+            if parent_name is not None:
+                children.setdefault(parent_name, {})[name] = None
+
+        self.parent = parent
+        self.children = children
+        self.types = types
+        self.object_collections = object_collections
+        self.collection_objects = collection_objects
+        self.depth = {}
+        self.root = {}
+
+        for name, parent_name in parent.items():
+            if parent_name is None or parent_name not in parent:
+                self._assign_depths(name, 0, name)
+
+        # 循環参照などでルートから到達できないオブジェクト
+        for name in parent:
+            if name not in self.depth:
+                self._assign_depths(name, 0, name)
+
+        self._dirty = False
+        self.full_rebuilds += 1
+
+    def _assign_depths(self, start: str, depth: int, root: str):
+        """startを起点にBFSでサブツリーの深さとルートを設定（ロック内で呼び出す）"""
+        queue = deque([(start, depth)])
+        visited = set()
+        while queue:
+            name, current_depth = queue.popleft()
+            if name in visited:
+                continue
+            visited.add(name)
+            self.depth[name] = current_depth
+            self.root[name] = root
+            for child in self.children.get(name, ()):
+                queue.append((child, current_depth + 1))
+
+    def _reparent(self, name: str, new_parent: Optional[str]):
+        """オブジェクトの親を付け替え、サブツリーの深さとルートを更新（ロック内で呼び出す）"""
+        old_parent = self.parent.get(name)
+        if old_parent is not None:
+            self.children.get(old_parent, {}).pop(name, None)
+        if new_parent is not None:
+            self.children.setdefault(new_parent, {})[name] = None
+        self.parent[name] = new_parent
+
+        if new_parent is None or new_parent not in self.depth:
+            self._assign_depths(name, 0, name)
+        else:
+            self._assign_depths(name, self.depth[new_parent] + 1, self.root[new_parent])
+        self.incremental_updates += 1
+
+    def _update_collection(self, collection):
+        """コレクションの所属オブジェクトを更新（ロック内で呼び出す）"""
+        coll_name = collection.name
+        members = {obj.name for obj in collection.objects}
+        previous = self.collection_objects.get(coll_name, set())
+
+        for name in previous - members:
+            colls = self.object_collections.get(name)
+            if colls and coll_name in colls:
+                colls.remove(coll_name)
+        for name in members - previous:
+            self.object_collections.setdefault(name, []).append(coll_name)
+
+        self.collection_objects[coll_name] = members
+
+    def apply_depsgraph_updates(self, updates: Iterable[Any]):
+        """
+        depsgraphの更新をインデックスに反映
+
+        Args:
+            updates: depsgraph.updates
+        """
+        with self._lock:
+            if self._dirty:
+                return
+            for update in updates:
+                datablock = update.id.original
+                if isinstance(datablock, bpy.types.Object):
+                    name = datablock.name
+                    if name not in self.parent:
+                        # 追加・名前変更されたオブジェクト
+                        self._dirty = True
+                        return
+                    new_parent = datablock.parent.name if datablock.parent else None
+                    if new_parent != self.parent[name]:
+                        self._reparent(name, new_parent)
+                elif isinstance(datablock, bpy.types.Collection):
+                    self._update_collection(datablock)
+
+    # ------------------------------------------------------------------
+    # クエリ
+    # ------------------------------------------------------------------
+
+    def get_node(self, name: str) -> Optional[Dict[str, Any]]:
+        """
+        オブジェクトの階層情報を取得
+
+        Args:
+            name: オブジェクト名
+
+        Returns:
+            親・子・深さ・ルート・コレクション（存在しない場合はNone）
+        """
+        self.ensure_current()
+        with self._lock:
+            if name not in self.parent:
+                return None
+            return {
+                'name': name,
+                'type': self.types.get(name),
+                'parent': self.parent[name],
+                'children': list(self.children.get(name, ())),
+                'depth': self.depth.get(name, 0),
+                'root': self.root.get(name, name),
+                'collections': list(self.object_collections.get(name, ()))
+            }
+
+    def get_subtree(self, name: str, include_root: bool = True) -> List[str]:
+        """
+        オブジェクトの子孫を深さ優先（親が先）の順で取得
+
+        Args:
+            name: 起点のオブジェクト名
+            include_root: 起点自身を含めるか
+
+        Returns:
+            オブジェクト名のリスト
+        """
+        self.ensure_current()
+        with self._lock:
+            if name not in self.parent:
+                return []
+            result = []
+            stack = [name]
+            visited = set()
+            while stack:
+                current = stack.pop()
+                if current in visited:
+                    continue
+                visited.add(current)
+                result.append(current)
+                stack.extend(reversed(list(self.children.get(current, ()))))
+            return result if include_root else result[1:]
+
+    def get_ancestors(self, name: str) -> List[str]:
+        """
+        親からルートまでのオブジェクト名を取得
+
+        Args:
+            name: オブジェクト名
+
+        Returns:
+            近い順の祖先のリスト
+        """
+        self.ensure_current()
+        with self._lock:
+            ancestors = []
+            current = self.parent.get(name)
+            while current is not None and current not in ancestors:
+                ancestors.append(current)
+                current = self.parent.get(current)
+            return ancestors
+
+    def get_collection_objects(self, collection_name: str) -> List[str]:
+        """
+        コレクションに直接リンクされたオブジェクト名を取得
+
+        Args:
+            collection_name: コレクション名
+
+        Returns:
+            オブジェクト名のリスト
+        """
+        self.ensure_current()
+        with self._lock:
+            return sorted(self.collection_objects.get(collection_name, ()))
+
+    def get_records(self) -> List[Dict[str, Any]]:
+        """
+        全オブジェクトの階層情報をレコードのリストで取得
+
+        Returns:
+            name / type / parent / children_count / collection_names / depth のリスト
+        """
+        self.ensure_current()
+        with self._lock:
+            return [
+                {
+                    'name': name,
+                    'type': self.types[name],
+                    'parent': parent_name,
+                    'children_count': len(self.children.get(name, ())),
+                    'collection_names': list(self.object_collections.get(name, ())),
+                    'depth': self.depth.get(name, 0)
+                }
+                for name, parent_name in self.parent.items()
+            ]
+
+    def get_stats(self) -> Dict[str, Any]:
+        """インデックスの統計情報を取得"""
+        with self._lock:
+            return {
+                'objects': len(self.parent),
+                'dirty': self._dirty,
+                'full_rebuilds': self.full_rebuilds,
+                'incremental_updates': self.incremental_updates
+            }
+
+    # ------------------------------------------------------------------
+    # ハンドラ
+    # ------------------------------------------------------------------
+
+    def _ensure_handlers(self):
+        """depsgraph・ファイル読み込みハンドラを初回使用時に登録"""
+        if self._handlers_registered:
+            return
+        handlers = bpy.app.handlers
+        if _on_depsgraph_update not in handlers.depsgraph_update_post:
+            handlers.depsgraph_update_post.append(_on_depsgraph_update)
+        if _on_load_post not in handlers.load_post:
+            handlers.load_post.append(_on_load_post)
+        self._handlers_registered = True
+
+    def unregister_handlers(self):
+        """登録したハンドラを削除し、インデックスを無効化"""
+        handlers = bpy.app.handlers
+        if _on_depsgraph_update in handlers.depsgraph_update_post:
+            handlers.depsgraph_update_post.remove(_on_depsgraph_update)
+        if _on_load_post in handlers.load_post:
+            handlers.load_post.remove(_on_load_post)
+        self._handlers_registered = False
+        self.invalidate()
+
+
+# グローバルインスタンス
+scene_hierarchy_index = SceneHierarchyIndex()
+
+
+@persistent
+def _on_depsgraph_update(scene, depsgraph):
+    """親の変更・コレクションの変更をインデックスに反映"""
+    try:
+        scene_hierarchy_index.apply_depsgraph_updates(depsgraph.updates)
+    except Exception as e:
+        logger.debug(f"階層インデックスの更新に失敗したため再構築します: {e}")
+        scene_hierarchy_index.invalidate()
+
+
+@persistent
+def _on_load_post(*args):
+    """ファイル読み込み時はすべて再構築"""
+    scene_hierarchy_index.invalidate()
+
+
+def get_scene_hierarchy_index() -> SceneHierarchyIndex:
+    """シーン階層インデックスのインスタンスを取得"""
+    return scene_hierarchy_index
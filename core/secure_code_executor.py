@@ -18,6 +18,21 @@ except ImportError as e:
     SAFE_EXECUTOR_LOADED = False
     logger.warning(f"安全なスクリプト実行システムをロードできませんでした: {str(e)}")
 
+# 共有の実行器（検証・コンパイル結果のキャッシュと安全な名前空間のテンプレートを再利用）
+_executor = None
+
+def get_safe_executor():
+    """
+    共有のSafeScriptExecutorを取得
+    
+    Returns:
+        SafeScriptExecutor: 実行器
+    """
+    global _executor
+    if _executor is None:
+        _executor = SafeScriptExecutor(max_execution_time=5.0)
+    return _executor
+
 def execute_code_safely(code: str, script_name: str = "<inline_code>") -> Dict[str, Any]:
     """
     Pythonコードを安全に実行
@@ -38,8 +53,8 @@ def execute_code_safely(code: str, script_name: str = "<inline_code>") -> Dict[s
             }
         }
     
-    # 安全なスクリプト実行システムを初期化
-    executor = SafeScriptExecutor(max_execution_time=5.0)
+    # 共有の安全なスクリプト実行システムを取得
+    executor = get_safe_executor()
     
     # コードを安全に実行
     result = executor.execute_script(code, script_name)
@@ -0,0 +1,276 @@
+"""
+メインスレッドタスクのサンプリングプロファイラ
+閾値を超えて実行中のタスクのスタックを定期的に採取し、
+タスク名ごとにflamegraph互換のcollapsed stack形式で集計します
+"""
+
+import os
+import sys
+import time
+import threading
+import logging
+from collections import OrderedDict
+from typing import Any, Callable, Dict, List, Optional
+
+logger = logging.getLogger("unified_mcp.task_profiler")
+
+# デフォルト設定（環境変数で上書き可能）
+PROFILER_ENABLED = os.environ.get('MCP_TASK_PROFILER', '0').lower() in ('1', 'true', 'yes')
+DEFAULT_THRESHOLD_MS = float(os.environ.get('MCP_TASK_PROFILER_THRESHOLD_MS', '100'))
+DEFAULT_INTERVAL_MS = float(os.environ.get('MCP_TASK_PROFILER_INTERVAL_MS', '5'))
+
+# メモリ上限
+MAX_TASK_PROFILES = 200        # 保持するタスク名の数（超えたら最も古いものを破棄）
+MAX_STACKS_PER_TASK = 1000     # タスクごとに保持する異なるスタックの数
+MAX_STACK_DEPTH = 64           # 1スタックあたりのフレーム数
+
+# 上限を超えたスタックをまとめるキー
+TRUNCATED_STACK = "[truncated]"
+
+
+def _frame_label(frame) -> str:
+    """フレームをcollapsed stack用のラベルに変換（行番号は関数の先頭行で固定）"""
+    code = frame.f_code
+    label = f"{code.co_name} ({os.path.basename(code.co_filename)}:{code.co_firstlineno})"
+    return label.replace(';', ':')
+
+
+class TaskProfiler:
+    """
+    メインスレッドタスクのサンプリングプロファイラ
+
+    run() で実行したタスクが threshold_ms を超えている間、サンプラースレッドが
+    interval_ms ごとにそのスレッドのスタックを採取する。閾値未満で終わるタスクは
+    開始・終了時刻の記録のみで、スタック採取のコストはかからない。
+    """
+
+    def __init__(self):
+        self.enabled = False
+        self.threshold_ms = DEFAULT_THRESHOLD_MS
+        self.interval_ms = DEFAULT_INTERVAL_MS
+
+        self._lock = threading.Lock()
+        self._profiles: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+        self._current: Optional[tuple] = None  # (タスク名, 開始時刻, スレッドID)
+        self._task_started = threading.Event()
+        self._sampler: Optional[threading.Thread] = None
+        self._run_code = TaskProfiler.run.__code__
+
+        if PROFILER_ENABLED:
+            self.configure(enabled=True)
+
+    def configure(self, enabled: Optional[bool] = None, threshold_ms: Optional[float] = None,
+                  interval_ms: Optional[float] = None) -> Dict[str, Any]:
+        """
+        プロファイラの設定を実行時に変更
+
+        Args:
+            enabled: 有効/無効
+            threshold_ms: スタック採取を始めるタスクの経過時間（ミリ秒）
+            interval_ms: サンプリング間隔（ミリ秒）
+
+        Returns:
+            現在の設定
+        """
+        if threshold_ms is not None:
+            self.threshold_ms = max(0.0, float(threshold_ms))
+        if interval_ms is not None:
+            self.interval_ms = max(1.0, float(interval_ms))
+        if enabled is not None and enabled != self.enabled:
+            self.enabled = enabled
+            if enabled:
+                self._start_sampler()
+            else:
+                # 待機中のサンプラーを起こして終了させる
+                self._task_started.set()
+            logger.info(f"タスクプロファイラを{'有効' if enabled else '無効'}にしました")
+        return self.get_config()
+
+    def get_config(self) -> Dict[str, Any]:
+        """現在の設定を取得"""
+        return {
+            'enabled': self.enabled,
+            'threshold_ms': self.threshold_ms,
+            'interval_ms': self.interval_ms,
+            'max_tasks': MAX_TASK_PROFILES,
+            'max_stacks_per_task': MAX_STACKS_PER_TASK
+        }
+
+    def _start_sampler(self):
+        """サンプラースレッドを起動"""
+        if self._sampler is not None and self._sampler.is_alive():
+            return
+        self._task_started.clear()
+        self._sampler = threading.Thread(target=self._sample_loop, daemon=True, name="mcp_task_profiler")
+        self._sampler.start()
+
+    def run(self, name: str, func: Callable, *args, **kwargs) -> Any:
+        """
+        タスクを実行し、閾値を超えた場合はスタックを採取する
+
+        Args:
+            name: タスク名（コマンド名・関数名）
+            func: 実行する関数
+            *args, **kwargs: 関数に渡す引数
+
+        Returns:
+            関数の戻り値
+        """
+        if not self.enabled:
+            return func(*args, **kwargs)
+
+        start_time = time.perf_counter()
+        self._current = (name, start_time, threading.get_ident())
+        self._task_started.set()
+        try:
+            return func(*args, **kwargs)
+        finally:
+            self._current = None
+            self._task_started.clear()
+            elapsed_ms = (time.perf_counter() - start_time) * 1000
+            if elapsed_ms >= self.threshold_ms:
+                self._record_run(name, elapsed_ms)
+
+    def _sample_loop(self):
+        """実行中のタスクが閾値を超えている間、スタックを採取する"""
+        while self.enabled:
+            self._task_started.wait()
+            if not self.enabled:
+                break
+
+            current = self._current
+            if current is None:
+                # タスクの終了とイベントのクリアが入れ違った場合
+                time.sleep(self.interval_ms / 1000.0)
+                continue
+
+            name, start_time, thread_id = current
+            wait = self.threshold_ms / 1000.0 - (time.perf_counter() - start_time)
+            if wait > 0:
+                time.sleep(min(wait, self.interval_ms / 1000.0))
+                continue
+
+            frame = sys._current_frames().get(thread_id)
+            if frame is not None and self._current is current:
+                self._record_sample(name, self._collapse(frame))
+            time.sleep(self.interval_ms / 1000.0)
+
+    def _collapse(self, frame) -> str:
+        """run()より内側のフレームをルートから順に';'で連結"""
+        labels: List[str] = []
+        while frame is not None and frame.f_code is not self._run_code:
+            labels.append(_frame_label(frame))
+            frame = frame.f_back
+        if len(labels) > MAX_STACK_DEPTH:
+            # 葉に近いフレームを優先して残す
+            labels = labels[:MAX_STACK_DEPTH - 1] + ["..."]
+        labels.reverse()
+        return ';'.join(labels)
+
+    def _get_profile(self, name: str) -> Dict[str, Any]:
+        """タスク名のプロファイルを取得（ロック内で呼び出す）"""
+        profile = self._profiles.get(name)
+        if profile is None:
+            profile = self._profiles[name] = {
+                'stacks': {},
+                'samples': 0,
+                'slow_runs': 0,
+                'total_ms': 0.0,
+                'max_ms': 0.0,
+                'last_run': 0.0
+            }
+            while len(self._profiles) > MAX_TASK_PROFILES:
+                self._profiles.popitem(last=False)
+        else:
+            self._profiles.move_to_end(name)
+        return profile
+
+    def _record_sample(self, name: str, stack: str):
+        """スタックのサンプルを記録"""
+        with self._lock:
+            profile = self._get_profile(name)
+            stacks = profile['stacks']
+            if stack not in stacks and len(stacks) >= MAX_STACKS_PER_TASK:
+                stack = TRUNCATED_STACK
+            stacks[stack] = stacks.get(stack, 0) + 1
+            profile['samples'] += 1
+
+    def _record_run(self, name: str, elapsed_ms: float):
+        """閾値を超えたタスクの実行を記録"""
+        with self._lock:
+            profile = self._get_profile(name)
+            profile['slow_runs'] += 1
+            profile['total_ms'] += elapsed_ms
+            profile['max_ms'] = max(profile['max_ms'], elapsed_ms)
+            profile['last_run'] = time.time()
+
+    def get_collapsed(self, name: Optional[str] = None) -> str:
+        """
+        collapsed stack形式で出力（flamegraph.pl / speedscope で読み込み可能）
+
+        各行は「タスク名;フレーム;...;フレーム サンプル数」。
+
+        Args:
+            name: 指定時はそのタスクのみ
+
+        Returns:
+            collapsed stackテキスト
+        """
+        with self._lock:
+            items = [(task, dict(profile['stacks'])) for task, profile in self._profiles.items()
+                     if name is None or task == name]
+
+        lines = []
+        for task, stacks in items:
+            root = task.replace(';', ':')
+            for stack, count in stacks.items():
+                lines.append(f"{root};{stack} {count}" if stack else f"{root} {count}")
+        return '\n'.join(lines) + ('\n' if lines else '')
+
+    def get_summary(self, top: int = 5) -> Dict[str, Any]:
+        """
+        タスクごとの集計を取得
+
+        Args:
+            top: タスクごとに返す上位スタック数
+
+        Returns:
+            設定とタスクごとの統計（遅い実行回数・最大時間・上位スタック）
+        """
+        with self._lock:
+            tasks = {}
+            for task, profile in self._profiles.items():
+                top_stacks = sorted(profile['stacks'].items(), key=lambda item: item[1], reverse=True)[:top]
+                tasks[task] = {
+                    'samples': profile['samples'],
+                    'slow_runs': profile['slow_runs'],
+                    'avg_ms': profile['total_ms'] / profile['slow_runs'] if profile['slow_runs'] else 0.0,
+                    'max_ms': profile['max_ms'],
+                    'last_run': profile['last_run'],
+                    'top_stacks': [{'stack': stack, 'samples': count} for stack, count in top_stacks]
+                }
+
+        current = self._current
+        return {
+            'config': self.get_config(),
+            'current_task': {
+                'name': current[0],
+                'elapsed_ms': (time.perf_counter() - current[1]) * 1000
+            } if current else None,
+            'tasks': tasks
+        }
+
+    def reset(self):
+        """採取したプロファイルをクリア"""
+        with self._lock:
+            self._profiles.clear()
+        logger.info("タスクプロファイルをクリアしました")
+
+
+# グローバルインスタンス
+task_profiler = TaskProfiler()
+
+
+def get_task_profiler() -> TaskProfiler:
+    """タスクプロファイラのインスタンスを取得"""
+    return task_profiler
@@ -9,12 +9,16 @@ import time
 import uuid
 import json
 import logging
+from collections import deque
 from typing import Dict, Any, List, Callable, Optional, Union
 from enum import Enum
 
 # ロギング設定
 logger = logging.getLogger('unified_mcp.task_queue')
 
+# 差分取得用に保持する変更履歴の件数（超えた場合は全件を返す）
+TASK_CHANGE_LOG_SIZE = 2000
+
 # タスク状態の定義
 class TaskStatus(Enum):
     PENDING = "pending"     # キューに入っているが未実行
@@ -106,6 +110,13 @@ class TaskQueue:
         self.running = False
         self.task_handlers = {}  # タスクタイプ -> ハンドラー関数
         
+        # ステータスごとのタスク数（状態遷移のたびに更新）
+        self.status_counts = {status: 0 for status in TaskStatus}
+        
+        # 変更履歴（連番, タスクID, 削除されたか）
+        self.change_seq = 0
+        self._change_log = deque(maxlen=TASK_CHANGE_LOG_SIZE)
+        
         logger.info(f"タスクキューを初期化しました（ワーカー数: {num_workers}）")
     
     def register_task_handler(self, task_type: str, handler: Callable) -> None:
@@ -116,6 +127,68 @@ class TaskQueue:
             self.task_handlers[task_type] = handler
             logger.info(f"タスクハンドラー '{task_type}' を登録しました")
     
+    def _set_status(self, task: Task, status: TaskStatus) -> None:
+        """タスクの状態を更新し、ステータス別のカウンタを維持（ロック内で呼び出す）"""
+        if task.status == status:
+            return
+        if task.id in self.tasks:
+            self.status_counts[task.status] -= 1
+            self.status_counts[status] += 1
+        task.status = status
+        self._record_change(task.id)
+    
+    def _record_change(self, task_id: str, removed: bool = False) -> None:
+        """タスクの変更を履歴に記録（ロック内で呼び出す）"""
+        self.change_seq += 1
+        self._change_log.append((self.change_seq, task_id, removed))
+    
+    def get_status_counts(self) -> Dict[str, int]:
+        """
+        ステータスごとのタスク数を取得（タスクを走査しない）
+        
+        Returns:
+            ステータス値 -> タスク数
+        """
+        with self.lock:
+            return {status.value: count for status, count in self.status_counts.items()}
+    
+    def get_changes(self, since: int = 0) -> Dict[str, Any]:
+        """
+        指定した連番以降に変更されたタスクを取得
+        
+        Args:
+            since: 前回取得時の連番（0で全件）
+            
+        Returns:
+            seq: 現在の連番
+            full: 履歴が足りず全件を返した場合はTrue
+            tasks: 変更・追加されたタスク情報のリスト
+            removed: 削除されたタスクIDのリスト
+        """
+        with self.lock:
+            oldest = self._change_log[0][0] if self._change_log else self.change_seq + 1
+            if since <= 0 or since < oldest - 1:
+                tasks = sorted((task.to_dict() for task in self.tasks.values()),
+                               key=lambda x: x["created_at"], reverse=True)
+                return {"seq": self.change_seq, "full": True, "tasks": tasks, "removed": []}
+            
+            # 新しい順に辿り、タスクごとに最新の状態のみを返す
+            seen = set()
+            tasks = []
+            removed = []
+            for seq, task_id, was_removed in reversed(self._change_log):
+                if seq <= since:
+                    break
+                if task_id in seen:
+                    continue
+                seen.add(task_id)
+                task = self.tasks.get(task_id)
+                if was_removed or task is None:
+                    removed.append(task_id)
+                else:
+                    tasks.append(task.to_dict())
+            return {"seq": self.change_seq, "full": False, "tasks": tasks, "removed": removed}
+    
     def add_task(self, task: Task) -> str:
         """
         タスクをキューに追加
@@ -129,6 +202,8 @@ class TaskQueue:
         with self.lock:
             # タスクを登録
             self.tasks[task.id] = task
+            self.status_counts[task.status] += 1
+            self._record_change(task.id)
             
             # キューに追加（優先度の高いものが先に処理されるよう負の値）
             self.task_queue.put((-task.priority, task.id))
@@ -220,7 +295,7 @@ class TaskQueue:
                 return False
             
             # ペンディング状態のタスクをキャンセル
-            task.status = TaskStatus.CANCELLED
+            self._set_status(task, TaskStatus.CANCELLED)
             task.message = "タスクがキャンセルされました"
             logger.info(f"タスク '{task.name}' (ID: {task.id})をキャンセルしました")
             return True
@@ -248,7 +323,9 @@ class TaskQueue:
             
             # 削除実行
             for task_id in to_remove:
+                self.status_counts[self.tasks[task_id].status] -= 1
                 del self.tasks[task_id]
+                self._record_change(task_id, removed=True)
             
             logger.info(f"{len(to_remove)}個の古いタスクをクリアしました")
             return len(to_remove)
@@ -341,7 +418,7 @@ class TaskQueue:
                 return
             
             # タスク状態を実行中に更新
-            task.status = TaskStatus.RUNNING
+            self._set_status(task, TaskStatus.RUNNING)
             task.started_at = time.time()
             task.message = "タスクを実行中..."
             task.progress = 0.0
@@ -350,7 +427,7 @@ class TaskQueue:
         handler = self.task_handlers.get(task.type)
         if not handler:
             with self.lock:
-                task.status = TaskStatus.FAILED
+                self._set_status(task, TaskStatus.FAILED)
                 task.completed_at = time.time()
                 task.error = f"タスクタイプ '{task.type}' のハンドラーが登録されていません"
                 task.message = "タスク実行に失敗しました: ハンドラーが見つかりません"
@@ -363,6 +440,7 @@ class TaskQueue:
                 with self.lock:
                     if task.status == TaskStatus.RUNNING:
                         task.update_progress(progress, message)
+                        self._record_change(task.id)
             
             # タスク実行
             logger.info(f"タスク '{task.name}' (ID: {task.id}, タイプ: {task.type}) の実行を開始")
@@ -371,7 +449,7 @@ class TaskQueue:
             # 成功結果を記録
             with self.lock:
                 if task.status == TaskStatus.RUNNING:  # 実行中の場合のみ更新（キャンセルされた場合は更新しない）
-                    task.status = TaskStatus.COMPLETED
+                    self._set_status(task, TaskStatus.COMPLETED)
                     task.completed_at = time.time()
                     task.progress = 1.0
                     task.result = result
@@ -392,7 +470,7 @@ class TaskQueue:
             # エラーを記録
             with self.lock:
                 if task.status == TaskStatus.RUNNING:  # 実行中の場合のみ更新
-                    task.status = TaskStatus.FAILED
+                    self._set_status(task, TaskStatus.FAILED)
                     task.completed_at = time.time()
                     task.error = str(e)
                     task.message = f"タスク実行中にエラーが発生: {str(e)}"
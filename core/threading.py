@@ -12,6 +12,8 @@ import traceback
 import bpy
 from typing import Any, Callable, Dict, Tuple, Optional, List, Union
 
+from .task_profiler import task_profiler
+
 logger = logging.getLogger("unified_mcp.threading")
 
 # キューとロックの一元管理
@@ -250,6 +252,10 @@ def execute_in_main_thread(func: Callable, *args, **kwargs) -> Any:
                     # 完了ログを出力（削除後に行うことで競合を避ける）
                     logger.debug(f"タスク {func_name} ({task_id[:8]}) を完了しました。実行時間: {elapsed:.2f}秒")
 
+def _task_name(func: Callable) -> str:
+    """プロファイル集計用のタスク名"""
+    return getattr(func, '__qualname__', None) or getattr(func, '__name__', None) or str(func)
+
 def process_main_thread_queue():
     """
     メインスレッドキューから関数を取り出して実行する
@@ -274,8 +280,11 @@ def process_main_thread_queue():
             # キャンセルされていない場合のみ実行
             if not skip_task:
                 try:
-                    # 関数を実行
-                    result = func(*args, **kwargs)
+                    # 関数を実行（プロファイラ有効時は遅いタスクのスタックを採取）
+                    if task_profiler.enabled:
+                        result = task_profiler.run(_task_name(func), func, *args, **kwargs)
+                    else:
+                        result = func(*args, **kwargs)
 
                     # 結果を保存
                     with _main_thread_lock:
@@ -301,7 +310,8 @@ def process_main_thread_queue():
 
             # 長時間の処理を検知してログに出力
             if processed == 1 and time.time() - start_time > 0.1:
-                logger.warning(f"タスク処理に時間がかかっています: {time.time() - start_time:.3f}秒 (関数: {func.__name__ if hasattr(func, '__name__') else str(func)})")
+                hint = "" if task_profiler.enabled else "（MCP_TASK_PROFILER=1 でスタックを採取できます）"
+                logger.warning(f"タスク処理に時間がかかっています: {time.time() - start_time:.3f}秒 (関数: {func.__name__ if hasattr(func, '__name__') else str(func)}){hint}")
 
         except queue.Empty:
             break
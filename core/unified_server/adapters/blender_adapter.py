@@ -122,6 +122,132 @@ class BlenderAdapter:
         
         return _get_object()
     
+    def get_mesh_vertices(self, name: str, space: str = "LOCAL") -> Optional[Any]:
+        """
+        Read all vertex positions of a mesh object in one foreach_get call.
+        
+        Args:
+            name: Object name
+            space: "LOCAL" for mesh coordinates, "WORLD" to apply the object's matrix
+        
+        Returns:
+            float32 NumPy array of shape (N, 3), or None if the object is not a mesh
+        """
+        if not self.blender_available:
+            return None
+        
+        import numpy as np
+        
+        @self.execute_in_main_thread
+        def _get_mesh_vertices():
+            obj = bpy.data.objects.get(name)
+            if obj is None or obj.type != 'MESH':
+                return None
+            
+            mesh = obj.data
+            coords = np.empty(len(mesh.vertices) * 3, dtype=np.float32)
+            mesh.vertices.foreach_get("co", coords)
+            coords = coords.reshape(-1, 3)
+            
+            if space.upper() == "WORLD":
+                matrix = np.array(obj.matrix_world, dtype=np.float32)
+                coords = coords @ matrix[:3, :3].T + matrix[:3, 3]
+            return coords
+        
+        return _get_mesh_vertices()
+    
+    def list_mesh_attributes(self, name: str) -> Optional[List[Dict[str, Any]]]:
+        """
+        List the attributes of a mesh object that can be read and written in bulk.
+        
+        Args:
+            name: Object name
+        
+        Returns:
+            List of attribute metadata, or None if the object is not a mesh
+        """
+        if not self.blender_available:
+            return None
+        
+        from ...numpy_optimizers import list_mesh_attributes
+        
+        @self.execute_in_main_thread
+        def _list_mesh_attributes():
+            try:
+                return list_mesh_attributes(name)
+            except KeyError:
+                return None
+        
+        return _list_mesh_attributes()
+    
+    def read_mesh_attribute(self, name: str, attribute: str, start: int = 0,
+                            count: Optional[int] = None) -> Dict[str, Any]:
+        """
+        Read a mesh attribute with a single foreach_get on the main thread.
+        
+        Args:
+            name: Object name
+            attribute: Attribute name (co, normal, uv, uv:<layer>, or a named attribute)
+            start: First element index
+            count: Number of elements (None for all remaining)
+        
+        Returns:
+            Attribute metadata with the NumPy array under "values"
+        
+        Raises:
+            KeyError: If the object or attribute does not exist
+        """
+        if not self.blender_available:
+            raise KeyError("Blender not available")
+        
+        from ...numpy_optimizers import read_mesh_attribute
+        return self.execute_in_main_thread(read_mesh_attribute)(name, attribute, start, count)
+    
+    def mesh_attribute_dtype(self, name: str, attribute: str,
+                             data_type: Optional[str] = None) -> Any:
+        """
+        Get the NumPy dtype of the attribute a write would target.
+        
+        Args:
+            name: Object name
+            attribute: Attribute name
+            data_type: Data type used when the named attribute does not exist yet
+        
+        Returns:
+            NumPy dtype of the attribute values, or None when Blender is not available
+        """
+        if not self.blender_available:
+            return None
+        
+        from ...numpy_optimizers import mesh_attribute_dtype
+        return self.execute_in_main_thread(mesh_attribute_dtype)(name, attribute, data_type)
+    
+    def write_mesh_attribute(self, name: str, attribute: str, values: Any, start: int = 0,
+                             domain: Optional[str] = None, data_type: Optional[str] = None) -> Dict[str, Any]:
+        """
+        Write a mesh attribute with a single foreach_set on the main thread.
+        
+        Args:
+            name: Object name
+            attribute: Attribute name
+            values: Values to write (flat or (N, components))
+            start: First element index
+            domain: Domain used when creating a missing named attribute
+            data_type: Data type used when creating a missing named attribute
+        
+        Returns:
+            Write result
+        
+        Raises:
+            KeyError: If the object or attribute does not exist
+            ValueError, IndexError: If the values do not fit the attribute
+        """
+        if not self.blender_available:
+            raise KeyError("Blender not available")
+        
+        from ...numpy_optimizers import write_mesh_attribute
+        return self.execute_in_main_thread(write_mesh_attribute)(name, attribute, values, start, domain, data_type)
+    
     def get_scene(self, name: Optional[str] = None) -> Optional[Any]:
         """
         Get a Blender scene by name or the active scene if name is None.
@@ -15,6 +15,17 @@ from ..utils.logging import get_logger
 # Import Blender adapter
 from .blender_adapter import blender_adapter, in_blender_thread
 
+# Shared metrics registry
+try:
+    from ....utils.metrics import get_metrics_registry
+    METRICS_AVAILABLE = True
+except (ImportError, ValueError):
+    try:
+        from utils.metrics import get_metrics_registry
+        METRICS_AVAILABLE = True
+    except ImportError:
+        METRICS_AVAILABLE = False
+
 # Type variable for function return type
 T = TypeVar('T')
 
@@ -310,11 +321,12 @@ class CommandRegistry:
             # Get command function
             func = command["func"]
             
-            # Execute in main thread if required
-            if command["in_main_thread"] and blender_adapter.blender_available:
-                result = blender_adapter.execute_in_main_thread(func)(**params)
+            # Execute (in main thread if required) and record its latency
+            if METRICS_AVAILABLE:
+                with get_metrics_registry().timer("command", command_name):
+                    result = self._invoke(command, func, params)
             else:
-                result = func(**params)
+                result = self._invoke(command, func, params)
             
             # Return result
             return result
@@ -333,6 +345,13 @@ class CommandRegistry:
             # Raise command execution error
             raise CommandExecError(f"Error executing command '{command_name}': {e}", error_details)
     
+    @staticmethod
+    def _invoke(command: Dict[str, Any], func: Callable, params: Dict[str, Any]) -> Any:
+        """Call a command function, on the main thread if the command requires it."""
+        if command["in_main_thread"] and blender_adapter.blender_available:
+            return blender_adapter.execute_in_main_thread(func)(**params)
+        return func(**params)
+    
     def execute_batch(self, commands: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
         """
         Execute a batch of commands.
@@ -0,0 +1,460 @@
+"""
+Scene change event broker for UnifiedServer.
+Collects depsgraph updates on Blender's main thread, coalesces them per datablock
+and fans debounced change batches out to subscribed clients.
+"""
+
+import time
+import asyncio
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
+
+# Import utilities
+from ..utils.logging import get_logger
+
+# Get logger
+logger = get_logger("scene_events")
+
+# Check if we're running in Blender environment
+try:
+    import bpy
+    from bpy.app.handlers import persistent
+    IS_BLENDER_AVAILABLE = True
+except ImportError:
+    IS_BLENDER_AVAILABLE = False
+
+    def persistent(func):
+        return func
+
+# Default debounce window: updates arriving within it are merged into one batch
+DEFAULT_DEBOUNCE = 0.1
+
+# Default number of pending datablock changes kept per subscriber before it is told to resync
+DEFAULT_MAX_PENDING = 1000
+
+# Key identifying a datablock: (id type, name)
+DatablockKey = Tuple[str, str]
+
+
+class SceneSubscriber:
+    """
+    Per-client change queue.
+
+    Pending changes are kept coalesced per datablock, so a slow client never holds more
+    than one entry per datablock. If the number of distinct pending datablocks exceeds
+    max_pending, the queue collapses into a single resync event and the client is
+    expected to refetch the scene.
+    """
+
+    def __init__(self, loop: asyncio.AbstractEventLoop,
+                 types: Optional[Iterable[str]] = None,
+                 names: Optional[Iterable[str]] = None,
+                 max_pending: int = DEFAULT_MAX_PENDING):
+        """
+        Initialize the subscriber.
+
+        Args:
+            loop: Event loop the client is served from
+            types: Datablock types to receive (e.g. OBJECT, MESH). None for all
+            names: Datablock names to receive. None for all
+            max_pending: Maximum distinct pending datablocks before resync
+        """
+        self.loop = loop
+        self.types: Optional[Set[str]] = {t.upper() for t in types} if types else None
+        self.names: Optional[Set[str]] = set(names) if names else None
+        self.max_pending = max_pending
+
+        self._pending: "OrderedDict[DatablockKey, Dict[str, Any]]" = OrderedDict()
+        self._resync = False
+        self._lock = threading.Lock()
+        self._ready = asyncio.Event()
+
+        # Statistics
+        self.delivered_batches = 0
+        self.coalesced = 0
+        self.resyncs = 0
+
+    def accepts(self, change: Dict[str, Any]) -> bool:
+        """Check whether a change matches this subscriber's filters."""
+        if self.types is not None and change["type"] not in self.types:
+            return False
+        if self.names is not None and change["name"] not in self.names:
+            return False
+        return True
+
+    def offer(self, changes: List[Dict[str, Any]]) -> None:
+        """
+        Queue changes for the client. Safe to call from any thread.
+
+        Args:
+            changes: Change records produced by the broker
+        """
+        queued = False
+        with self._lock:
+            for change in changes:
+                if not self.accepts(change):
+                    continue
+                queued = True
+                if self._resync:
+                    continue
+
+                key = (change["type"], change["name"])
+                existing = self._pending.get(key)
+                if existing is None:
+                    self._pending[key] = dict(change, changes=list(change["changes"]))
+                else:
+                    self._merge(existing, change)
+                    self.coalesced += 1
+
+            if len(self._pending) > self.max_pending:
+                # Client is too far behind for individual changes to be useful
+                self._pending.clear()
+                self._resync = True
+                self.resyncs += 1
+
+        if queued:
+            self.loop.call_soon_threadsafe(self._ready.set)
+
+    @staticmethod
+    def _merge(existing: Dict[str, Any], change: Dict[str, Any]) -> None:
+        """Merge a newer change for the same datablock into a pending one."""
+        if change["action"] == "removed":
+            existing["action"] = "removed"
+            existing["changes"] = []
+        elif existing["action"] == "removed":
+            # Removed and re-created within the same window
+            existing["action"] = change["action"]
+            existing["changes"] = list(change["changes"])
+        else:
+            for kind in change["changes"]:
+                if kind not in existing["changes"]:
+                    existing["changes"].append(kind)
+        existing["timestamp"] = change["timestamp"]
+
+    async def next_batch(self, timeout: Optional[float] = None) -> Optional[Dict[str, Any]]:
+        """
+        Wait for the next batch of changes.
+
+        Args:
+            timeout: Maximum time to wait in seconds
+
+        Returns:
+            A change batch, a resync event, or None on timeout
+        """
+        try:
+            await asyncio.wait_for(self._ready.wait(), timeout)
+        except asyncio.TimeoutError:
+            return None
+
+        with self._lock:
+            self._ready.clear()
+            if self._resync:
+                self._resync = False
+                self.delivered_batches += 1
+                return {"event": "resync", "timestamp": time.time()}
+            changes = list(self._pending.values())
+            self._pending.clear()
+
+        if not changes:
+            return None
+        self.delivered_batches += 1
+        return {"event": "scene_changes", "timestamp": time.time(), "changes": changes}
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get queue statistics for this subscriber."""
+        with self._lock:
+            pending = len(self._pending)
+        return {
+            "types": sorted(self.types) if self.types else None,
+            "names": sorted(self.names) if self.names else None,
+            "pending": pending,
+            "delivered_batches": self.delivered_batches,
+            "coalesced": self.coalesced,
+            "resyncs": self.resyncs,
+        }
+
+
+class SceneEventBroker:
+    """
+    Collects depsgraph updates and publishes coalesced change batches.
+
+    The depsgraph handler only records which datablocks changed; the batch is built
+    once per debounce window from a Blender timer, so bursts of updates (e.g. dragging
+    an object) cost one flush instead of one event per redraw.
+    """
+
+    _instance = None  # Singleton instance
+
+    @classmethod
+    def get_instance(cls) -> 'SceneEventBroker':
+        """Get singleton instance of the broker."""
+        if cls._instance is None:
+            cls._instance = cls()
+        return cls._instance
+
+    def __init__(self, debounce: float = DEFAULT_DEBOUNCE):
+        """
+        Initialize the broker.
+
+        Args:
+            debounce: Debounce window in seconds
+        """
+        self.debounce = debounce
+        self.subscribers: List[SceneSubscriber] = []
+        self.sequence = 0
+
+        self._pending: "OrderedDict[DatablockKey, Set[str]]" = OrderedDict()
+        self._flush_scheduled = False
+        self._known_objects: Optional[Set[str]] = None
+        self._snapshot_pending = False
+        self._installed = False
+        self._lock = threading.Lock()
+
+        # Statistics
+        self.updates_received = 0
+        self.batches_published = 0
+
+    # Handler management
+    # ==================
+
+    def install(self) -> bool:
+        """
+        Install the depsgraph handler. Must be called from Blender's main thread.
+
+        Returns:
+            True if the handler is installed
+        """
+        if not IS_BLENDER_AVAILABLE:
+            logger.warning("Blender not available, scene change events are disabled")
+            return False
+        if self._installed:
+            return True
+
+        if _depsgraph_update_handler not in bpy.app.handlers.depsgraph_update_post:
+            bpy.app.handlers.depsgraph_update_post.append(_depsgraph_update_handler)
+        self._known_objects = set(bpy.data.objects.keys())
+        self._installed = True
+        logger.info("Installed depsgraph handler for scene change events")
+        return True
+
+    def uninstall(self) -> None:
+        """Remove the depsgraph handler and pending timer."""
+        if not IS_BLENDER_AVAILABLE or not self._installed:
+            return
+
+        if _depsgraph_update_handler in bpy.app.handlers.depsgraph_update_post:
+            bpy.app.handlers.depsgraph_update_post.remove(_depsgraph_update_handler)
+        for timer in (self._flush_timer, self._snapshot_timer):
+            if bpy.app.timers.is_registered(timer):
+                bpy.app.timers.unregister(timer)
+
+        with self._lock:
+            self._pending.clear()
+            self._flush_scheduled = False
+        self._snapshot_pending = False
+        self._installed = False
+        logger.info("Removed depsgraph handler for scene change events")
+
+    # Subscriptions
+    # =============
+
+    def subscribe(self, loop: asyncio.AbstractEventLoop,
+                  types: Optional[Iterable[str]] = None,
+                  names: Optional[Iterable[str]] = None,
+                  max_pending: int = DEFAULT_MAX_PENDING) -> SceneSubscriber:
+        """
+        Register a new subscriber.
+
+        Args:
+            loop: Event loop the client is served from
+            types: Datablock types to receive
+            names: Datablock names to receive
+            max_pending: Maximum distinct pending datablocks before resync
+
+        Returns:
+            The subscriber
+        """
+        subscriber = SceneSubscriber(loop, types, names, max_pending)
+        with self._lock:
+            self.subscribers.append(subscriber)
+            first = len(self.subscribers) == 1
+        if first:
+            # Membership is not tracked without subscribers, so the snapshot is stale
+            self._request_snapshot()
+        logger.debug(f"Scene subscriber added ({len(self.subscribers)} active)")
+        return subscriber
+
+    def unsubscribe(self, subscriber: SceneSubscriber) -> None:
+        """Remove a subscriber."""
+        with self._lock:
+            if subscriber in self.subscribers:
+                self.subscribers.remove(subscriber)
+        logger.debug(f"Scene subscriber removed ({len(self.subscribers)} active)")
+
+    def _request_snapshot(self) -> None:
+        """Schedule a fresh snapshot of the known objects on Blender's main thread."""
+        if not IS_BLENDER_AVAILABLE or not self._installed:
+            return
+        self._snapshot_pending = True
+        bpy.app.timers.register(self._snapshot_timer)
+
+    def _snapshot_timer(self) -> None:
+        """Blender timer callback; returning None unregisters the timer."""
+        self._take_snapshot()
+        return None
+
+    def _take_snapshot(self) -> None:
+        """Retake the known-object snapshot if one was requested (main thread only)."""
+        if self._snapshot_pending:
+            self._known_objects = set(bpy.data.objects.keys())
+            self._snapshot_pending = False
+
+    # Change collection (main thread)
+    # ===============================
+
+    def record_update(self, depsgraph) -> None:
+        """
+        Record the datablocks touched by a depsgraph update.
+
+        Args:
+            depsgraph: Depsgraph passed to depsgraph_update_post
+        """
+        if not self.subscribers:
+            return
+        # The depsgraph update may run before the snapshot timer
+        self._take_snapshot()
+
+        changes = []
+        for update in depsgraph.updates:
+            # Updates reference evaluated copies, which share the original's name
+            datablock = update.id
+            kinds = []
+            if update.is_updated_geometry:
+                kinds.append("geometry")
+            if update.is_updated_transform:
+                kinds.append("transform")
+            if update.is_updated_shading:
+                kinds.append("shading")
+            changes.append((datablock.bl_rna.identifier.upper(), datablock.name, kinds))
+
+        self.notify(changes)
+
+    def notify(self, changes: Iterable[Tuple[str, str, Iterable[str]]]) -> None:
+        """
+        Queue datablock changes for the next flush.
+
+        Args:
+            changes: (type, name, change kinds) tuples
+        """
+        schedule = False
+        with self._lock:
+            for id_type, name, kinds in changes:
+                self._pending.setdefault((id_type, name), set()).update(kinds)
+                self.updates_received += 1
+            if self._pending and not self._flush_scheduled:
+                self._flush_scheduled = True
+                schedule = True
+
+        if schedule:
+            if IS_BLENDER_AVAILABLE and self._installed:
+                bpy.app.timers.register(self._flush_timer, first_interval=self.debounce)
+            else:
+                threading.Timer(self.debounce, self.flush).start()
+
+    def _flush_timer(self) -> None:
+        """Blender timer callback; returning None unregisters the timer."""
+        self.flush()
+        return None
+
+    def flush(self) -> Optional[Dict[str, Any]]:
+        """
+        Publish pending changes to all subscribers.
+
+        Returns:
+            The published batch, or None if nothing was pending
+        """
+        with self._lock:
+            pending = self._pending
+            self._pending = OrderedDict()
+            self._flush_scheduled = False
+            subscribers = list(self.subscribers)
+
+        now = time.time()
+        membership = self._object_membership_changes(pending, now)
+        # Objects created in this window are reported as added, not updated
+        added = {change["name"] for change in membership if change["action"] == "added"}
+        changes = [
+            {"type": id_type, "name": name, "action": "updated",
+             "changes": sorted(kinds), "timestamp": now}
+            for (id_type, name), kinds in pending.items()
+            if not (id_type == "OBJECT" and name in added)
+        ]
+        changes.extend(membership)
+
+        if not changes:
+            return None
+
+        self.sequence += 1
+        self.batches_published += 1
+        for subscriber in subscribers:
+            subscriber.offer(changes)
+        return {"sequence": self.sequence, "changes": changes}
+
+    def _object_membership_changes(self, pending: Dict[DatablockKey, Set[str]],
+                                   now: float) -> List[Dict[str, Any]]:
+        """
+        Detect added and removed objects, which depsgraph updates do not report directly.
+        The full name set is only rebuilt when the object count or an unknown name suggests
+        membership changed.
+        """
+        if not IS_BLENDER_AVAILABLE or self._known_objects is None:
+            return []
+
+        objects = bpy.data.objects
+        known = self._known_objects
+        touched_unknown = any(id_type == "OBJECT" and name not in known for id_type, name in pending)
+        if len(objects) == len(known) and not touched_unknown:
+            return []
+
+        current = set(objects.keys())
+        self._known_objects = current
+        changes = [
+            {"type": "OBJECT", "name": name, "action": "added", "changes": [], "timestamp": now}
+            for name in sorted(current - known)
+        ]
+        changes.extend(
+            {"type": "OBJECT", "name": name, "action": "removed", "changes": [], "timestamp": now}
+            for name in sorted(known - current)
+        )
+        return changes
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get broker statistics."""
+        with self._lock:
+            subscribers = list(self.subscribers)
+            pending = len(self._pending)
+        return {
+            "installed": self._installed,
+            "debounce": self.debounce,
+            "sequence": self.sequence,
+            "updates_received": self.updates_received,
+            "batches_published": self.batches_published,
+            "pending": pending,
+            "subscribers": [subscriber.get_stats() for subscriber in subscribers],
+        }
+
+
+@persistent
+def _depsgraph_update_handler(scene, depsgraph=None):
+    """depsgraph_update_post handler forwarding updates to the broker."""
+    if depsgraph is None:
+        return
+    try:
+        SceneEventBroker.get_instance().record_update(depsgraph)
+    except Exception as e:
+        logger.error(f"Error recording depsgraph update: {e}")
+
+
+# Global broker instance
+scene_event_broker = SceneEventBroker.get_instance()
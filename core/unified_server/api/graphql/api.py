@@ -19,10 +19,41 @@ try:
 except ImportError:
     GRAPHQL_AVAILABLE = False
 
+# Task queue used to run over-budget queries outside the request path
+try:
+    from ....task_queue import get_task_queue
+    TASK_QUEUE_AVAILABLE = True
+except ImportError:
+    TASK_QUEUE_AVAILABLE = False
+
+# Main-thread dispatch: resolvers read bpy data, which is only safe on Blender's main thread
+try:
+    from ....threading import execute_in_main_thread
+    MAIN_THREAD_DISPATCH_AVAILABLE = True
+except ImportError:
+    MAIN_THREAD_DISPATCH_AVAILABLE = False
+
+# Task type for GraphQL queries deferred by admission control
+DEFERRED_QUERY_TASK_TYPE = "graphql_query"
+
+# Seconds a deferred query may run on the main thread before the task fails
+DEFERRED_QUERY_TIMEOUT = float(os.environ.get("MCP_DEFERRED_QUERY_TIMEOUT", "300"))
+
 # Import FastAPI types
 from fastapi import Request, Response, HTTPException, status
 from fastapi.responses import JSONResponse, HTMLResponse
 
+# Fast JSON encoding (streams results containing large lists)
+try:
+    from .....utils.json_responses import json_response
+    JSON_RESPONSES_AVAILABLE = True
+except (ImportError, ValueError):
+    try:
+        from utils.json_responses import json_response
+        JSON_RESPONSES_AVAILABLE = True
+    except ImportError:
+        JSON_RESPONSES_AVAILABLE = False
+
 # Import base API class
 from ..base import APISubsystem, register_api
 
@@ -50,6 +81,7 @@ class GraphQLAPI(APISubsystem):
         # GraphQL components
         self.schema = None
         self.resolvers = {}
+        self.cost_analyzer = None
         
         # Check GraphQL availability
         self.graphql_available = GRAPHQL_AVAILABLE
@@ -70,6 +102,9 @@ class GraphQLAPI(APISubsystem):
             self.logger.error("Failed to load GraphQL schema, cannot set up GraphQL API")
             return
         
+        # Set up query cost analysis and the task handler for deferred queries
+        self._setup_admission_control()
+        
         # Set up endpoints
         self._setup_endpoints()
         
@@ -105,6 +140,11 @@ class GraphQLAPI(APISubsystem):
                 "method": "POST",
                 "description": "GraphQL endpoint for executing queries and mutations"
             },
+            {
+                "path": "/graphql/tasks/{task_id}",
+                "method": "GET",
+                "description": "Status and result of a query deferred by admission control"
+            },
             {
                 "path": "/graphiql",
                 "method": "GET",
@@ -114,13 +154,21 @@ class GraphQLAPI(APISubsystem):
         
         return routes
     
-    async def execute_query(self, query: str, variables: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+    async def execute_query(self, query: str, variables: Optional[Dict[str, Any]] = None,
+                            operation_name: Optional[str] = None,
+                            allow_async: bool = True) -> Dict[str, Any]:
         """
         Execute a GraphQL query.
         
+        The query is first checked against the depth and cost budget. Queries over the
+        hard budget are rejected; expensive read-only queries are queued on the TaskQueue
+        and a task reference is returned instead of data.
+        
         Args:
             query: GraphQL query string
             variables: Optional variables for the query
+            operation_name: Optional name of the operation to execute
+            allow_async: Whether over-budget queries may be deferred instead of rejected
             
         Returns:
             Query result as a dictionary
@@ -138,12 +186,43 @@ class GraphQLAPI(APISubsystem):
             self.logger.error(f"Error validating GraphQL query: {e}")
             return {"errors": [{"message": f"Query validation error: {str(e)}"}]}
         
-        # Execute query
+        # Admission control
+        admission = self._admit_query(query, variables, operation_name, allow_async)
+        if admission["decision"] == "reject":
+            return {"errors": [{
+                "message": admission["reason"],
+                "extensions": {
+                    "code": "QUERY_TOO_COMPLEX",
+                    "cost": admission["cost"],
+                    "depth": admission["depth"],
+                    "limits": admission["limits"],
+                    "expensive_fields": admission["field_costs"],
+                }
+            }]}
+        if admission["decision"] == "defer":
+            return self._defer_query(query, variables, operation_name, admission)
+        
+        return self._execute_sync(query, variables, operation_name)
+    
+    def _execute_sync(self, query: str, variables: Optional[Dict[str, Any]] = None,
+                      operation_name: Optional[str] = None) -> Dict[str, Any]:
+        """
+        Execute a GraphQL query synchronously against the loaded schema.
+        
+        Args:
+            query: GraphQL query string
+            variables: Optional variables for the query
+            operation_name: Optional name of the operation to execute
+            
+        Returns:
+            Query result as a dictionary
+        """
         try:
             result = graphql_sync(
                 schema=self.schema,
                 source=query,
-                variable_values=variables or {}
+                variable_values=variables or {},
+                operation_name=operation_name
             )
             
             # Convert result to serializable dictionary
@@ -155,6 +234,85 @@ class GraphQLAPI(APISubsystem):
             self.logger.error(f"Error executing GraphQL query: {e}")
             return {"errors": [{"message": f"Query execution error: {str(e)}"}]}
     
+    def _setup_admission_control(self) -> None:
+        """Create the query cost analyzer and register the deferred query task handler."""
+        try:
+            self.cost_analyzer = importlib.import_module("tools.query_cost").get_cost_analyzer()
+        except ImportError:
+            self.logger.warning("Query cost analysis not available, queries will not be budgeted")
+            self.cost_analyzer = None
+            return
+        
+        if TASK_QUEUE_AVAILABLE:
+            get_task_queue().register_task_handler(DEFERRED_QUERY_TASK_TYPE, self._run_deferred_query)
+        
+        limits = self.cost_analyzer.get_stats()["limits"]
+        self.logger.info(
+            f"Query admission control enabled (max depth {limits['max_depth']}, "
+            f"max cost {limits['max_cost']:.0f}, async above {limits['async_cost']:.0f})"
+        )
+    
+    def _admit_query(self, query: str, variables: Optional[Dict[str, Any]],
+                     operation_name: Optional[str], allow_async: bool) -> Dict[str, Any]:
+        """
+        Check a query against the cost budget.
+        
+        Returns:
+            Admission result with a "decision" of accept, defer or reject
+        """
+        if self.cost_analyzer is None:
+            return {"decision": "accept"}
+        
+        return self.cost_analyzer.admit(
+            query, variables, operation_name, schema=self.schema,
+            allow_async=allow_async and TASK_QUEUE_AVAILABLE
+        )
+    
+    def _defer_query(self, query: str, variables: Optional[Dict[str, Any]],
+                     operation_name: Optional[str], admission: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Queue an expensive query on the TaskQueue and return a reference to the task.
+        
+        Returns:
+            Response with null data and the task id in extensions
+        """
+        queue = get_task_queue()
+        task_id = queue.create_and_add_task(
+            DEFERRED_QUERY_TASK_TYPE,
+            {"query": query, "variables": variables or {}, "operation_name": operation_name},
+            # Cheaper deferred queries run first
+            priority=-int(admission["cost"] // max(self.cost_analyzer.async_cost, 1)),
+            name=f"GraphQL {admission.get('operation_name') or 'query'} (cost {admission['cost']:.0f})"
+        )
+        
+        return {
+            "data": None,
+            "extensions": {
+                "deferred": {
+                    "task_id": task_id,
+                    "status_url": f"/graphql/tasks/{task_id}",
+                    "reason": admission["reason"],
+                    "cost": admission["cost"],
+                    "depth": admission["depth"],
+                }
+            }
+        }
+    
+    def _run_deferred_query(self, params: Dict[str, Any], progress_callback) -> Dict[str, Any]:
+        """
+        TaskQueue handler that executes a deferred GraphQL query.
+        
+        The worker thread only waits: the query itself runs on Blender's main thread.
+        """
+        progress_callback(0.1, "Executing deferred GraphQL query")
+        args = (params["query"], params.get("variables"), params.get("operation_name"))
+        if MAIN_THREAD_DISPATCH_AVAILABLE:
+            result = execute_in_main_thread(self._execute_sync, *args, _timeout=DEFERRED_QUERY_TIMEOUT)
+        else:
+            result = self._execute_sync(*args)
+        progress_callback(1.0, "Deferred GraphQL query completed")
+        return result
+    
     def _load_schema(self) -> bool:
         """
         Load GraphQL schema from existing schema modules in the project.
@@ -163,6 +321,19 @@ class GraphQLAPI(APISubsystem):
         Returns:
             True if schema was loaded successfully, False otherwise
         """
+        try:
+            # Reuse the project's schema: the builder memoizes it per process and
+            # restores it from the on-disk SDL/resolver cache when sources are unchanged
+            builder_module = importlib.import_module("tools.schema_builder")
+            schema = builder_module.build_schema()
+            if schema is not None:
+                self.schema = schema
+                self._log_schema_load_stats()
+                return True
+            self.logger.warning("Project schema could not be built or is incomplete; falling back")
+        except ImportError:
+            self.logger.warning("Failed to import schema builder from project's tools.schema_builder module")
+        
         try:
             # Try to import schema from the main project
             schema_module = importlib.import_module("tools.definitions")
@@ -221,6 +392,23 @@ class GraphQLAPI(APISubsystem):
             self.logger.error(f"Failed to create minimal GraphQL schema: {e}")
             return False
     
+    def _log_schema_load_stats(self) -> None:
+        """Log how the schema was obtained (warm cache load or cold build) and its timing."""
+        try:
+            stats = importlib.import_module("tools.schema_cache").get_schema_cache_stats()
+        except ImportError:
+            return
+        
+        if not stats:
+            self.logger.info("Loaded GraphQL schema from project's tools.schema_builder module")
+        elif stats.get("source") == "cache":
+            self.logger.info(
+                f"Loaded GraphQL schema from cache in {stats['load_ms']:.1f}ms "
+                f"(cold build took {stats.get('cold_build_ms') or 0:.1f}ms)"
+            )
+        else:
+            self.logger.info(f"Built GraphQL schema in {stats['cold_build_ms']:.1f}ms")
+    
     def _load_resolvers(self) -> None:
         """
         Load GraphQL resolvers from existing resolver modules in the project.
@@ -243,6 +431,7 @@ class GraphQLAPI(APISubsystem):
                 data = await request.json()
                 query = data.get("query")
                 variables = data.get("variables")
+                operation_name = data.get("operationName")
                 
                 if not query:
                     return JSONResponse(
@@ -251,7 +440,11 @@ class GraphQLAPI(APISubsystem):
                     )
                 
                 # Execute query
-                result = await self.execute_query(query, variables)
+                result = await self.execute_query(query, variables, operation_name)
+                if "extensions" in result and "deferred" in result["extensions"]:
+                    return JSONResponse(status_code=202, content=result)
+                if JSON_RESPONSES_AVAILABLE:
+                    return json_response(result, stream_threshold=self.server.config.json_stream_threshold)
                 return JSONResponse(content=result)
             except Exception as e:
                 self.logger.error(f"Error handling GraphQL request: {e}")
@@ -260,6 +453,25 @@ class GraphQLAPI(APISubsystem):
                     content={"errors": [{"message": f"Internal server error: {str(e)}"}]}
                 )
         
+        # Deferred query status
+        @self.app.get("/graphql/tasks/{task_id}", response_class=JSONResponse)
+        async def graphql_task_status(task_id: str):
+            if not TASK_QUEUE_AVAILABLE:
+                raise HTTPException(status_code=404, detail="Task queue is not available")
+            
+            task = get_task_queue().get_task(task_id)
+            if not task or task["type"] != DEFERRED_QUERY_TASK_TYPE:
+                raise HTTPException(status_code=404, detail=f"Deferred query {task_id} not found")
+            
+            return JSONResponse(content={
+                "task_id": task_id,
+                "status": task["status"],
+                "progress": task["progress"],
+                "message": task["message"],
+                "result": task["result"],
+                "error": task["error"],
+            })
+        
         # GraphiQL interface
         @self.app.get("/graphiql", response_class=HTMLResponse)
         async def graphiql_interface():
@@ -3,11 +3,13 @@ REST API subsystem for UnifiedServer.
 Provides REST API functionality with command registry integration.
 """
 
+import io
+import json
 from typing import Any, Dict, List, Optional, Set, Tuple, Union, Type
 
 # Import FastAPI types
 from fastapi import APIRouter, Depends, HTTPException, status, Request, Response
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, StreamingResponse
 from pydantic import BaseModel, Field
 
 # Import base API class
@@ -15,6 +17,29 @@ from ..base import APISubsystem, register_api
 
 # Import utilities
 from ...utils.logging import get_logger
+from ...adapters.blender_adapter import blender_adapter
+
+# Binary array transport (NPY / raw little-endian buffers)
+try:
+    from .....utils import array_codec
+    ARRAY_CODEC_AVAILABLE = True
+except (ImportError, ValueError):
+    try:
+        from utils import array_codec
+        ARRAY_CODEC_AVAILABLE = True
+    except ImportError:
+        ARRAY_CODEC_AVAILABLE = False
+
+# Fast JSON encoding (NumPy arrays are encoded without tolist())
+try:
+    from .....utils import json_responses
+    JSON_RESPONSES_AVAILABLE = True
+except (ImportError, ValueError):
+    try:
+        from utils import json_responses
+        JSON_RESPONSES_AVAILABLE = True
+    except ImportError:
+        JSON_RESPONSES_AVAILABLE = False
 
 # Try to import Pydantic v2 compatibility
 try:
@@ -353,6 +378,125 @@ class RestAPI(APISubsystem):
                     detail=str(e)
                 )
         
+        # Get mesh vertices (JSON or binary)
+        @self.router.get("/objects/{object_name}/vertices")
+        async def get_object_vertices(object_name: str, request: Request,
+                                      space: str = "LOCAL", format: Optional[str] = None):
+            """
+            Get all vertex positions of a mesh object.
+            
+            Send `Accept: application/x-npy` (or `?format=npy|binary`) to receive a NPY
+            file or a raw little-endian float32 buffer instead of nested JSON lists.
+            
+            Args:
+                object_name: Object name
+                space: LOCAL or WORLD
+                format: Optional explicit response format (json, npy, npz, binary)
+                
+            Returns:
+                Vertex positions
+            """
+            vertices = blender_adapter.get_mesh_vertices(object_name, space)
+            if vertices is None:
+                raise HTTPException(
+                    status_code=status.HTTP_404_NOT_FOUND,
+                    detail=f"Mesh object '{object_name}' not found"
+                )
+            
+            return self._array_response(request, {"vertices": vertices}, format,
+                                        {"object": object_name, "space": space.upper(),
+                                         "count": len(vertices)})
+        
+        # List mesh attributes
+        @self.router.get("/objects/{object_name}/attributes")
+        async def get_object_attributes(object_name: str):
+            """
+            List the mesh attributes that can be read and written in bulk.
+            
+            Args:
+                object_name: Object name
+                
+            Returns:
+                Attribute metadata (name, domain, data_type, components, length)
+            """
+            attributes = blender_adapter.list_mesh_attributes(object_name)
+            if attributes is None:
+                raise HTTPException(
+                    status_code=status.HTTP_404_NOT_FOUND,
+                    detail=f"Mesh object '{object_name}' not found"
+                )
+            return {"object": object_name, "attributes": attributes}
+        
+        # Read a mesh attribute (JSON or binary, streamed for large meshes)
+        @self.router.get("/objects/{object_name}/attributes/{attribute}")
+        async def get_object_attribute(object_name: str, attribute: str, request: Request,
+                                       start: int = 0, count: Optional[int] = None,
+                                       format: Optional[str] = None):
+            """
+            Read a mesh attribute, optionally sliced by element range.
+            
+            Attributes: co, normal, uv, uv:<layer> or any named attribute.
+            Responses above the configured size are streamed in chunks.
+            
+            Args:
+                object_name: Object name
+                attribute: Attribute name
+                start: First element index
+                count: Number of elements
+                format: Optional explicit response format (json, npy, binary)
+                
+            Returns:
+                Attribute values
+            """
+            try:
+                data = blender_adapter.read_mesh_attribute(object_name, attribute, start, count)
+            except (KeyError, ValueError) as e:
+                raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e))
+            
+            values = data.pop("values")
+            data.pop("processing_time_ms", None)
+            if len(values) > self.config.mesh_stream_threshold:
+                return self._stream_array_response(request, attribute, values, format, data)
+            return self._array_response(request, {"values": values}, format, data)
+        
+        # Write a mesh attribute
+        @self.router.put("/objects/{object_name}/attributes/{attribute}")
+        async def put_object_attribute(object_name: str, attribute: str, request: Request,
+                                       start: int = 0, domain: Optional[str] = None,
+                                       data_type: Optional[str] = None):
+            """
+            Replace a mesh attribute, or a range of it starting at `start`.
+            
+            The body is JSON (`{"values": [...]}` with numbers or a base64 string), a raw
+            little-endian buffer (application/octet-stream) or a NPY file (application/x-npy).
+            Base64 and raw buffers use the attribute's own data type (int32 for INT
+            attributes, float32 for FLOAT ones). Missing named attributes are created when
+            `domain` and `data_type` are given.
+            
+            Args:
+                object_name: Object name
+                attribute: Attribute name
+                start: First element index
+                domain: Domain for a new named attribute (POINT, EDGE, FACE, CORNER)
+                data_type: Data type for a new named attribute (FLOAT, FLOAT_VECTOR, ...)
+                
+            Returns:
+                Write result
+            """
+            dtype = blender_adapter.mesh_attribute_dtype(object_name, attribute, data_type)
+            try:
+                values = await self._read_array_body(request, dtype)
+            except ValueError as e:
+                raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+            
+            try:
+                return blender_adapter.write_mesh_attribute(object_name, attribute, values,
+                                                            start, domain, data_type)
+            except KeyError as e:
+                raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e))
+            except (ValueError, IndexError) as e:
+                raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+        
         # Create object
         @self.router.post("/objects")
         async def create_object(request: CreateObjectRequest):
@@ -410,6 +554,134 @@ class RestAPI(APISubsystem):
                     detail=str(e)
                 )
     
+    def _array_response(self, request: Request, arrays: Dict[str, Any],
+                        format: Optional[str] = None,
+                        metadata: Optional[Dict[str, Any]] = None) -> Response:
+        """
+        Build a response for array-valued data, honouring the requested media type.
+        
+        Args:
+            request: Incoming request (its Accept header selects the format)
+            arrays: Name -> NumPy array
+            format: Optional explicit format overriding the Accept header
+            metadata: Extra JSON fields (JSON) or X-Array-Meta-* headers (binary)
+            
+        Returns:
+            JSON response with flat lists, or a binary NPY/NPZ/octet-stream response
+        """
+        metadata = metadata or {}
+        media_type = "application/json"
+        if ARRAY_CODEC_AVAILABLE:
+            media_type = array_codec.negotiate_media_type(request.headers.get("accept"), format)
+        
+        if media_type == "application/json":
+            content = dict(metadata)
+            if JSON_RESPONSES_AVAILABLE:
+                content.update(arrays)
+                return json_responses.FastJSONResponse(content=content)
+            for name, array in arrays.items():
+                content[name] = array.tolist()
+            return JSONResponse(content=content)
+        
+        body, headers = array_codec.encode_arrays(arrays, media_type)
+        for key, value in metadata.items():
+            headers[f"X-Array-Meta-{key.replace('_', '-').title()}"] = str(value)
+        return Response(content=body, media_type=media_type, headers=headers)
+    
+    def _stream_array_response(self, request: Request, name: str, values: Any,
+                               format: Optional[str] = None,
+                               metadata: Optional[Dict[str, Any]] = None) -> StreamingResponse:
+        """
+        Stream a large array in chunks instead of building the whole body in memory.
+        
+        Args:
+            request: Incoming request (its Accept header selects the format)
+            name: Array name
+            values: NumPy array
+            format: Optional explicit format overriding the Accept header
+            metadata: Extra JSON fields (JSON) or X-Array-Meta-* headers (binary)
+            
+        Returns:
+            Streaming JSON, NPY or raw octet-stream response
+        """
+        import numpy as np
+        
+        metadata = metadata or {}
+        chunk = self.config.mesh_stream_chunk_size
+        media_type = "application/json"
+        if ARRAY_CODEC_AVAILABLE:
+            media_type = array_codec.negotiate_media_type(request.headers.get("accept"), format)
+        
+        if media_type == "application/json":
+            flat = values.reshape(len(values), -1)
+            
+            def json_chunks():
+                yield json.dumps({**metadata, "values": []})[:-2]
+                for offset in range(0, len(flat), chunk):
+                    text = json.dumps(flat[offset:offset + chunk].ravel().tolist())[1:-1]
+                    yield ("," if offset else "") + text
+                yield "]}"
+            
+            return StreamingResponse(json_chunks(), media_type=media_type)
+        
+        # NPY and raw buffers share the same little-endian payload
+        array = np.ascontiguousarray(values, dtype=values.dtype.newbyteorder("<"))
+        headers = {
+            "X-Array-Name": name,
+            "X-Array-Shape": ",".join(str(dim) for dim in array.shape),
+            "X-Array-Dtype": array.dtype.str,
+        }
+        for key, value in metadata.items():
+            headers[f"X-Array-Meta-{key.replace('_', '-').title()}"] = str(value)
+        
+        def binary_chunks():
+            if media_type == array_codec.MEDIA_TYPE_NPY:
+                header = io.BytesIO()
+                np.lib.format.write_array_header_1_0(header, np.lib.format.header_data_from_array_1_0(array))
+                yield header.getvalue()
+            for offset in range(0, len(array), chunk):
+                yield array[offset:offset + chunk].tobytes()
+        
+        if media_type == array_codec.MEDIA_TYPE_NPZ:
+            media_type = array_codec.MEDIA_TYPE_NPY
+        return StreamingResponse(binary_chunks(), media_type=media_type, headers=headers)
+    
+    async def _read_array_body(self, request: Request, dtype: Any = None) -> Any:
+        """
+        Decode an array from a JSON, raw little-endian or NPY request body.
+        
+        Args:
+            request: Incoming request
+            dtype: NumPy dtype of the target data (float32 when None)
+            
+        Returns:
+            NumPy array or list of numbers
+        """
+        content_type = request.headers.get("content-type", "application/json").split(";")[0].strip()
+        body = await request.body()
+        
+        if content_type == "application/json":
+            payload = json.loads(body or b"{}")
+            values = payload.get("values") if isinstance(payload, dict) else payload
+            if values is None:
+                raise ValueError("Request body must contain 'values'")
+            if not ARRAY_CODEC_AVAILABLE:
+                return values
+            return array_codec.decode_array(values, dtype or array_codec.FLOAT32_LE)
+        
+        if not ARRAY_CODEC_AVAILABLE:
+            raise ValueError(f"Unsupported content type: {content_type}")
+        if content_type == array_codec.MEDIA_TYPE_NPY:
+            return array_codec.from_npy_bytes(body)
+        if content_type == array_codec.MEDIA_TYPE_OCTET_STREAM:
+            import numpy as np
+            wire_dtype = np.dtype(dtype or array_codec.FLOAT32_LE).newbyteorder("<")
+            if len(body) % wire_dtype.itemsize:
+                raise ValueError(f"Binary body length must be a multiple of {wire_dtype.itemsize} "
+                                 f"({wire_dtype.name})")
+            return np.frombuffer(body, dtype=wire_dtype)
+        raise ValueError(f"Unsupported content type: {content_type}")
+    
     def _setup_scene_routes(self) -> None:
         """Set up scene-related routes."""
         # Get scene info
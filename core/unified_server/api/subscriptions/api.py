@@ -0,0 +1,148 @@
+"""
+Subscription API subsystem for UnifiedServer.
+Pushes scene change events to clients over Server-Sent Events and WebSocket,
+replacing polling of the scene and object endpoints.
+"""
+
+import json
+import asyncio
+from typing import Any, Dict, List, Optional
+
+# Import FastAPI types
+from fastapi import Request, WebSocket, WebSocketDisconnect
+from fastapi.responses import JSONResponse, StreamingResponse
+
+# Import base API class
+from ..base import APISubsystem, register_api
+
+# Import adapters
+from ...adapters.scene_events import SceneEventBroker, SceneSubscriber
+
+# Import utilities
+from ...utils.logging import get_logger
+
+# Interval between SSE keep-alive comments and WebSocket pings, in seconds
+KEEPALIVE_INTERVAL = 15.0
+
+
+def _split_param(value: Optional[str]) -> Optional[List[str]]:
+    """Split a comma separated query parameter."""
+    if not value:
+        return None
+    return [item.strip() for item in value.split(",") if item.strip()]
+
+
+@register_api("subscriptions")
+class SubscriptionAPI(APISubsystem):
+    """
+    Scene change subscription implementation for UnifiedServer.
+    Streams debounced, per-datablock change batches from the depsgraph to clients.
+    """
+
+    def __init__(self, server):
+        """
+        Initialize the subscription API subsystem.
+
+        Args:
+            server: The UnifiedServer instance
+        """
+        super().__init__(server)
+        self.logger = get_logger("subscription_api")
+
+        # Event broker
+        self.broker = SceneEventBroker.get_instance()
+        self.broker.debounce = self.config.subscription_debounce
+
+    def setup(self) -> None:
+        """
+        Set up the subscription routes and install the depsgraph handler.
+        """
+        self.broker.install()
+        self._setup_endpoints()
+        self.logger.info(f"Subscription API set up (debounce {self.broker.debounce * 1000:.0f}ms)")
+
+    def cleanup(self) -> None:
+        """Clean up resources when server is stopping."""
+        self.logger.debug("Cleaning up subscription API")
+        self.broker.uninstall()
+
+    def get_routes(self) -> List[Dict[str, Any]]:
+        """
+        Get information about available routes.
+
+        Returns:
+            List of route information dictionaries
+        """
+        return [
+            {
+                "path": "/events/scene",
+                "method": "GET",
+                "description": "Server-Sent Events stream of scene changes (filters: types, names)"
+            },
+            {
+                "path": "/ws/scene",
+                "method": "WEBSOCKET",
+                "description": "WebSocket stream of scene changes (filters: types, names)"
+            },
+            {
+                "path": "/events/stats",
+                "method": "GET",
+                "description": "Subscription broker and per-client queue statistics"
+            }
+        ]
+
+    def _subscribe(self, types: Optional[str], names: Optional[str]) -> SceneSubscriber:
+        """Register a subscriber bound to the current event loop."""
+        return self.broker.subscribe(
+            asyncio.get_running_loop(),
+            types=_split_param(types),
+            names=_split_param(names),
+            max_pending=self.config.subscription_max_pending
+        )
+
+    def _setup_endpoints(self) -> None:
+        """Set up subscription endpoints for the FastAPI application."""
+        # Server-Sent Events stream
+        @self.app.get("/events/scene")
+        async def scene_events(request: Request, types: Optional[str] = None, names: Optional[str] = None):
+            subscriber = self._subscribe(types, names)
+
+            async def stream():
+                try:
+                    yield "retry: 3000\n\n"
+                    while not await request.is_disconnected():
+                        batch = await subscriber.next_batch(KEEPALIVE_INTERVAL)
+                        if batch is None:
+                            yield ": keep-alive\n\n"
+                            continue
+                        yield f"event: {batch['event']}\ndata: {json.dumps(batch)}\n\n"
+                finally:
+                    self.broker.unsubscribe(subscriber)
+
+            return StreamingResponse(
+                stream(),
+                media_type="text/event-stream",
+                headers={"Cache-Control": "no-cache, no-transform", "X-Accel-Buffering": "no"}
+            )
+
+        # WebSocket stream
+        @self.app.websocket("/ws/scene")
+        async def scene_websocket(websocket: WebSocket, types: Optional[str] = None, names: Optional[str] = None):
+            await websocket.accept()
+            subscriber = self._subscribe(types, names)
+            try:
+                while True:
+                    batch = await subscriber.next_batch(KEEPALIVE_INTERVAL)
+                    if batch is None:
+                        await websocket.send_json({"event": "ping"})
+                        continue
+                    await websocket.send_json(batch)
+            except WebSocketDisconnect:
+                self.logger.debug("Scene subscription WebSocket disconnected")
+            finally:
+                self.broker.unsubscribe(subscriber)
+
+        # Broker statistics
+        @self.app.get("/events/stats", response_class=JSONResponse)
+        async def subscription_stats():
+            return self.broker.get_stats()
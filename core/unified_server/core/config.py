@@ -39,6 +39,15 @@ class ServerConfig:
         self.enable_admin: bool = kwargs.get('enable_admin', False)
         self.enable_docs: bool = kwargs.get('enable_docs', True)
         self.enable_graphiql: bool = kwargs.get('enable_graphiql', True)
+        self.enable_subscriptions: bool = kwargs.get('enable_subscriptions', True)
+        self.enable_metrics: bool = kwargs.get('enable_metrics', True)
+        
+        # Subscription settings
+        self.subscription_debounce: float = kwargs.get('subscription_debounce', 0.1)
+        self.subscription_max_pending: int = kwargs.get('subscription_max_pending', 1000)
+        
+        # Metrics settings (fraction of calls whose latency is measured; call counts are always exact)
+        self.metrics_sample_rate: float = kwargs.get('metrics_sample_rate', 1.0)
         
         # Security settings
         self.enable_cors: bool = kwargs.get('enable_cors', True)
@@ -46,6 +55,15 @@ class ServerConfig:
         self.cors_methods: List[str] = kwargs.get('cors_methods', ["*"])
         self.cors_headers: List[str] = kwargs.get('cors_headers', ["*"])
         
+        # Response encoding settings (JSON lists at least this long are streamed)
+        self.enable_compression: bool = kwargs.get('enable_compression', True)
+        self.compression_min_size: int = kwargs.get('compression_min_size', 1024)
+        self.json_stream_threshold: int = kwargs.get('json_stream_threshold', 1000)
+        
+        # Bulk geometry transfer settings (in attribute elements)
+        self.mesh_stream_threshold: int = kwargs.get('mesh_stream_threshold', 262144)
+        self.mesh_stream_chunk_size: int = kwargs.get('mesh_stream_chunk_size', 65536)
+        
         # Advanced settings
         self.auto_find_port: bool = kwargs.get('auto_find_port', True)
         self.max_port_attempts: int = kwargs.get('max_port_attempts', 10)
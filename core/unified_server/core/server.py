@@ -28,11 +28,40 @@ try:
 except ImportError:
     DOCS_AVAILABLE = False
 
+# Shared metrics registry
+try:
+    from ....utils.metrics import get_metrics_registry
+    METRICS_AVAILABLE = True
+except (ImportError, ValueError):
+    try:
+        from utils.metrics import get_metrics_registry
+        METRICS_AVAILABLE = True
+    except ImportError:
+        METRICS_AVAILABLE = False
+
+# Main-thread task profiler
+try:
+    from ...task_profiler import task_profiler
+    TASK_PROFILER_AVAILABLE = True
+except (ImportError, ValueError):
+    TASK_PROFILER_AVAILABLE = False
+
+# Fast JSON encoding and response compression
+try:
+    from ....utils.json_responses import FastJSONResponse, CompressionMiddleware
+    JSON_RESPONSES_AVAILABLE = True
+except (ImportError, ValueError):
+    try:
+        from utils.json_responses import FastJSONResponse, CompressionMiddleware
+        JSON_RESPONSES_AVAILABLE = True
+    except ImportError:
+        JSON_RESPONSES_AVAILABLE = False
+
 # Try to import FastAPI
 try:
     from fastapi import FastAPI, Request, Response, status
     from fastapi.middleware.cors import CORSMiddleware
-    from fastapi.responses import JSONResponse, HTMLResponse
+    from fastapi.responses import JSONResponse, HTMLResponse, PlainTextResponse
     import uvicorn
     FASTAPI_AVAILABLE = True
 except ImportError:
@@ -111,19 +140,32 @@ class UnifiedServer:
             title=self.config.api_title,
             description=self.config.api_description,
             version=self.config.api_version,
-            docs_url="/docs" if self.config.enable_docs else None
+            docs_url="/docs" if self.config.enable_docs else None,
+            default_response_class=FastJSONResponse if JSON_RESPONSES_AVAILABLE else JSONResponse
         )
 
         # Set up CORS if enabled
         if self.config.enable_cors:
             self._setup_cors()
 
+        # Negotiate gzip/brotli per request
+        if self.config.enable_compression and JSON_RESPONSES_AVAILABLE:
+            self.app.add_middleware(CompressionMiddleware, minimum_size=self.config.compression_min_size)
+
         # Set up error handlers
         self._setup_error_handlers()
 
+        # Set up request metrics and the /metrics endpoint
+        if self.config.enable_metrics and METRICS_AVAILABLE:
+            self._setup_metrics()
+
         # Set up base routes
         self._setup_base_routes()
 
+        # Set up main-thread task profiler routes
+        if TASK_PROFILER_AVAILABLE:
+            self._setup_profiler_routes()
+
         # Initialize and set up API subsystems
         if not self._setup_api_subsystems():
             self.logger.error("Failed to initialize server: API subsystem setup failed")
@@ -362,6 +404,69 @@ class UnifiedServer:
                 content={"detail": str(exc), "type": type(exc).__name__}
             )
     
+    def _setup_metrics(self) -> None:
+        """Record per-endpoint latency and expose the shared metrics registry."""
+        registry = get_metrics_registry()
+        registry.set_sample_rate(self.config.metrics_sample_rate)
+        
+        @self.app.middleware("http")
+        async def record_endpoint_latency(request: Request, call_next):
+            if not registry.should_sample():
+                response = await call_next(request)
+                registry.count("endpoint", self._endpoint_name(request))
+                return response
+            
+            start_time = time.perf_counter()
+            response = await call_next(request)
+            # Streaming responses are measured up to the start of the body
+            registry.observe("endpoint", self._endpoint_name(request), (time.perf_counter() - start_time) * 1000)
+            return response
+        
+        @self.app.get("/metrics")
+        async def get_metrics(request: Request, format: Optional[str] = None):
+            """Export metrics in Prometheus text format, or as JSON with ?format=json."""
+            accept = request.headers.get("accept", "")
+            if format == "json" or (format is None and "application/json" in accept):
+                return JSONResponse(registry.snapshot())
+            return PlainTextResponse(registry.to_prometheus(), media_type="text/plain; version=0.0.4")
+        
+        self.logger.debug(f"Metrics set up (sample rate {registry.sample_rate})")
+    
+    def _setup_profiler_routes(self) -> None:
+        """Expose the main-thread task profiler (opt-in, toggleable at runtime)."""
+        @self.app.get("/profiler", response_class=JSONResponse)
+        async def get_profiler(top: int = 5):
+            """Get profiler settings and per-task slow-run statistics with top stacks."""
+            return task_profiler.get_summary(top)
+        
+        @self.app.get("/profiler/collapsed")
+        async def get_profiler_collapsed(task: Optional[str] = None):
+            """Export sampled stacks in collapsed format for flamegraph.pl or speedscope."""
+            return PlainTextResponse(task_profiler.get_collapsed(task))
+        
+        @self.app.post("/profiler", response_class=JSONResponse)
+        async def configure_profiler(request: Request):
+            """Enable or disable the profiler and change its threshold and sampling interval."""
+            settings = await request.json()
+            return task_profiler.configure(
+                enabled=settings.get("enabled"),
+                threshold_ms=settings.get("threshold_ms"),
+                interval_ms=settings.get("interval_ms")
+            )
+        
+        @self.app.delete("/profiler", response_class=JSONResponse)
+        async def reset_profiler():
+            """Discard collected profiles."""
+            task_profiler.reset()
+            return {"success": True}
+    
+    @staticmethod
+    def _endpoint_name(request: "Request") -> str:
+        """Name an endpoint by method and route template so path parameters do not create new series."""
+        route = request.scope.get("route")
+        path = getattr(route, "path", None) or "unmatched"
+        return f"{request.method} {path}"
+    
     def _setup_base_routes(self) -> None:
         """Set up base routes for the FastAPI application."""
         @self.app.get("/", response_class=JSONResponse)
@@ -436,8 +541,19 @@ class UnifiedServer:
         elif self.config.enable_rest:
             self.logger.warning("REST API enabled but not available")
         
+        # Subscription API setup (optional, does not count towards required APIs)
+        if self.config.enable_subscriptions and "subscriptions" in available_apis:
+            subscription_api_class = APIRegistry.get("subscriptions")
+            try:
+                subscription_api = subscription_api_class(self)
+                subscription_api.setup()
+                self.apis["subscriptions"] = subscription_api
+                self.logger.info("Subscription API subsystem set up successfully")
+            except Exception as e:
+                self.logger.error(f"Error setting up subscription API: {e}", exc_info=True)
+        
         # Check if at least one API was set up
-        if not self.apis:
+        if not set(self.apis) - {"subscriptions"}:
             self.logger.error("No API subsystems were set up")
             return False
         
@@ -0,0 +1,411 @@
+"""
+Precomputed documentation bundle for the unified server.
+Caches generated API documentation per API version, keyed by fingerprints of
+the route registry, GraphQL schema and server configuration, and serves the
+results as pre-compressed assets with ETags.
+"""
+
+import os
+import gzip
+import json
+import hashlib
+import logging
+import datetime
+import threading
+from typing import Dict, Any, Optional, Tuple, Union
+
+from fastapi import Request
+from fastapi.responses import Response
+
+# Import version manager
+from ..api.version_manager import APIVersion, VersionManager
+
+try:
+    from graphql import print_schema
+    PRINT_SCHEMA_AVAILABLE = True
+except ImportError:
+    PRINT_SCHEMA_AVAILABLE = False
+
+# Logger
+logger = logging.getLogger("unified_server.docs.docs_bundle")
+
+# Bodies smaller than this are not worth compressing
+GZIP_MIN_SIZE = int(os.environ.get("MCP_DOCS_GZIP_MIN_SIZE", "1024"))
+
+# Section name -> inputs the section is rendered from (unknown sections depend on all inputs)
+SECTION_INPUTS = {
+    "overview": ("address",),
+    "versions": ("versions", "date"),
+    "rest_endpoints": ("routes",),
+    "graphql_operations": ("graphql",),
+    "models": ("routes", "graphql"),
+    "authentication": ("auth",),
+    "examples": (),
+}
+
+
+def _digest(value: Any) -> str:
+    """Return a stable hex digest of a repr-able value."""
+    return hashlib.sha256(repr(value).encode("utf-8")).hexdigest()
+
+
+class DocAsset:
+    """
+    A generated document held in memory with its compressed form and ETag.
+    """
+
+    __slots__ = ("body", "gzip_body", "etag", "media_type", "fingerprint", "generated_at")
+
+    def __init__(self, body: bytes, media_type: str, fingerprint: str):
+        """
+        Initialize the asset and precompute its compressed body and ETag.
+
+        Args:
+            body: Encoded document body
+            media_type: Content type of the document
+            fingerprint: Fingerprint of the inputs the document was built from
+        """
+        self.body = body
+        self.media_type = media_type
+        self.fingerprint = fingerprint
+        self.etag = f'"{hashlib.sha256(body).hexdigest()[:32]}"'
+        self.generated_at = datetime.datetime.now()
+
+        self.gzip_body = None
+        if len(body) >= GZIP_MIN_SIZE:
+            # mtime=0 keeps the compressed bytes identical across rebuilds
+            compressed = gzip.compress(body, compresslevel=9, mtime=0)
+            if len(compressed) < len(body):
+                self.gzip_body = compressed
+
+    def to_response(self, request: Request) -> Response:
+        """
+        Build a response for the asset, honouring If-None-Match and Accept-Encoding.
+
+        Args:
+            request: Request object
+
+        Returns:
+            304 response if the client copy is current, otherwise the (compressed) body
+        """
+        headers = {
+            "ETag": self.etag,
+            "Cache-Control": "no-cache",
+            "Vary": "Accept-Encoding",
+        }
+
+        if _etag_matches(request.headers.get("if-none-match"), self.etag):
+            return Response(status_code=304, headers=headers)
+
+        if self.gzip_body is not None and "gzip" in request.headers.get("accept-encoding", ""):
+            headers["Content-Encoding"] = "gzip"
+            return Response(content=self.gzip_body, media_type=self.media_type, headers=headers)
+
+        return Response(content=self.body, media_type=self.media_type, headers=headers)
+
+
+def _etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """Check an If-None-Match header against an ETag (weak comparison)."""
+    if not if_none_match:
+        return False
+    for candidate in if_none_match.split(","):
+        candidate = candidate.strip()
+        if candidate == "*":
+            return True
+        if candidate.startswith("W/"):
+            candidate = candidate[2:]
+        if candidate == etag:
+            return True
+    return False
+
+
+class DocsBundle:
+    """
+    Per-version cache of generated documentation.
+
+    Each HTML section is stored with the fingerprint of the inputs it is
+    rendered from, so a change to the route registry only re-renders the
+    sections that describe routes. Full pages and JSON documents are kept as
+    DocAsset instances and rebuilt only when their fingerprint changes.
+    """
+
+    def __init__(self, server):
+        """
+        Initialize the documentation bundle.
+
+        Args:
+            server: The UnifiedServer instance
+        """
+        self.server = server
+        self.version_manager = VersionManager.get_instance()
+        self._lock = threading.RLock()
+
+        self._sections: Dict[Tuple[str, str], Tuple[str, str]] = {}
+        self._assets: Dict[Tuple[str, str], DocAsset] = {}
+        self._schema_digest: Optional[Tuple[Any, str]] = None
+
+        self._html_generator = None
+        self._openapi_generator = None
+        self._graphql_generator = None
+
+        self.section_builds = 0
+        self.asset_builds = 0
+        self.hits = 0
+
+    # ------------------------------------------------------------------
+    # Generators
+    # ------------------------------------------------------------------
+
+    @property
+    def html_generator(self):
+        """Lazily created HTML generator."""
+        if self._html_generator is None:
+            from .html_generator import HTMLGenerator
+            self._html_generator = HTMLGenerator(self.server)
+        return self._html_generator
+
+    @property
+    def openapi_generator(self):
+        """Lazily created OpenAPI generator."""
+        if self._openapi_generator is None:
+            from .schema_generator import OpenAPIGenerator
+            self._openapi_generator = OpenAPIGenerator(self.server)
+        return self._openapi_generator
+
+    @property
+    def graphql_generator(self):
+        """Lazily created GraphQL schema documentation generator."""
+        if self._graphql_generator is None:
+            from .schema_generator import GraphQLSchemaDocGenerator
+            self._graphql_generator = GraphQLSchemaDocGenerator(self.server)
+        return self._graphql_generator
+
+    # ------------------------------------------------------------------
+    # Fingerprints
+    # ------------------------------------------------------------------
+
+    def resolve_version(self, version: Union[str, APIVersion, None]) -> Optional[APIVersion]:
+        """
+        Resolve a version string to a supported API version.
+
+        Args:
+            version: Version string, APIVersion or None for the current version
+
+        Returns:
+            The supported APIVersion, or None if the version is not supported
+        """
+        if version is None:
+            return self.version_manager.current_version
+        if isinstance(version, str):
+            try:
+                version = APIVersion(version)
+            except ValueError:
+                return None
+        if version not in self.version_manager.supported_versions:
+            return None
+        return version
+
+    def _routes_fingerprint(self) -> str:
+        """Fingerprint of the REST routes and their version ranges."""
+        rest_api = self.server.apis.get("rest")
+        router = getattr(rest_api, "router", None) if rest_api is not None else None
+        if not router:
+            return _digest(None)
+
+        routes = []
+        for route in router.routes:
+            endpoint = getattr(route, "endpoint", None)
+            routes.append((
+                getattr(route, "path", None),
+                tuple(sorted(getattr(route, "methods", None) or ())),
+                getattr(endpoint, "__qualname__", None),
+                getattr(endpoint, "__doc__", None),
+                repr(getattr(endpoint, "_endpoint_version_info", None)),
+            ))
+        return _digest(routes)
+
+    def _graphql_fingerprint(self) -> str:
+        """Fingerprint of the GraphQL schema (memoized per schema object)."""
+        graphql_api = self.server.apis.get("graphql")
+        schema = getattr(graphql_api, "schema", None) if graphql_api is not None else None
+        if schema is None:
+            return _digest(None)
+
+        # Schemas are immutable once built, so the digest only changes when the object does
+        cached = self._schema_digest
+        if cached is not None and cached[0] is schema:
+            return cached[1]
+
+        if PRINT_SCHEMA_AVAILABLE:
+            signature = print_schema(schema)
+        else:
+            signature = sorted(
+                (name, sorted(getattr(type_obj, "fields", None) or ()))
+                for name, type_obj in schema.type_map.items()
+            )
+        digest = _digest(signature)
+        self._schema_digest = (schema, digest)
+        return digest
+
+    def _input_fingerprints(self) -> Dict[str, str]:
+        """Fingerprints of every input a documentation section can depend on."""
+        config = self.server.config
+        return {
+            "address": _digest((config.host, config.port)),
+            "versions": _digest((
+                str(self.version_manager.current_version),
+                [str(v) for v in self.version_manager.supported_versions],
+            )),
+            # The versions table is dated relative to today
+            "date": datetime.date.today().isoformat(),
+            "routes": self._routes_fingerprint(),
+            "graphql": self._graphql_fingerprint(),
+            "auth": _digest((config.enable_auth, config.api_title, config.api_description)),
+        }
+
+    # ------------------------------------------------------------------
+    # Assets
+    # ------------------------------------------------------------------
+
+    def get_html_doc(self, version: Union[str, APIVersion, None] = None) -> Optional[DocAsset]:
+        """
+        Get the HTML documentation page for a version, rebuilding stale sections.
+
+        Args:
+            version: API version (None for the current version)
+
+        Returns:
+            The page asset, or None if the version is not supported
+        """
+        api_version = self.resolve_version(version)
+        if api_version is None:
+            return None
+
+        version_str = str(api_version)
+        inputs = self._input_fingerprints()
+
+        with self._lock:
+            sections = []
+            section_fingerprints = []
+            for name in self.html_generator.SECTIONS:
+                keys = SECTION_INPUTS.get(name, tuple(inputs))
+                fingerprint = _digest((version_str, [inputs[key] for key in keys]))
+                cached = self._sections.get((version_str, name))
+                if cached is None or cached[0] != fingerprint:
+                    content = self.html_generator.generate_section(name, api_version)
+                    cached = (fingerprint, content)
+                    self._sections[(version_str, name)] = cached
+                    self.section_builds += 1
+                sections.append(cached[1])
+                section_fingerprints.append(fingerprint)
+
+            page_fingerprint = _digest(section_fingerprints)
+            asset = self._assets.get((version_str, "html"))
+            if asset is not None and asset.fingerprint == page_fingerprint:
+                self.hits += 1
+                return asset
+
+            html = self.html_generator.render_page(api_version, "".join(sections))
+            return self._store(version_str, "html", html.encode("utf-8"),
+                               "text/html; charset=utf-8", page_fingerprint)
+
+    def get_openapi_doc(self, version: Union[str, APIVersion, None] = None) -> Optional[DocAsset]:
+        """
+        Get the OpenAPI schema document for a version.
+
+        Args:
+            version: API version (None for the current version)
+
+        Returns:
+            The JSON asset, or None if the version is not supported
+        """
+        api_version = self.resolve_version(version)
+        if api_version is None:
+            return None
+
+        inputs = self._input_fingerprints()
+        fingerprint = _digest((inputs["address"], inputs["routes"], inputs["auth"]))
+        return self._get_json_asset(
+            str(api_version), "openapi", fingerprint,
+            lambda: self.openapi_generator.generate_openapi_schema(api_version)
+        )
+
+    def get_graphql_doc(self, version: Union[str, APIVersion, None] = None) -> Optional[DocAsset]:
+        """
+        Get the GraphQL schema documentation for a version.
+
+        Args:
+            version: API version (None for the current version)
+
+        Returns:
+            The JSON asset, or None if the version is not supported
+        """
+        api_version = self.resolve_version(version)
+        if api_version is None:
+            return None
+
+        inputs = self._input_fingerprints()
+        fingerprint = _digest((inputs["graphql"], inputs["auth"]))
+        return self._get_json_asset(
+            str(api_version), "graphql", fingerprint,
+            lambda: self.graphql_generator.generate_schema_doc(api_version)
+        )
+
+    def _get_json_asset(self, version_str: str, kind: str, fingerprint: str, build) -> DocAsset:
+        """Return a cached JSON asset, rebuilding it if its fingerprint changed."""
+        with self._lock:
+            asset = self._assets.get((version_str, kind))
+            if asset is not None and asset.fingerprint == fingerprint:
+                self.hits += 1
+                return asset
+            body = json.dumps(build(), indent=2, ensure_ascii=False, default=str).encode("utf-8")
+            return self._store(version_str, kind, body, "application/json", fingerprint)
+
+    def _store(self, version_str: str, kind: str, body: bytes, media_type: str,
+               fingerprint: str) -> DocAsset:
+        """Store a rebuilt asset (called with the lock held)."""
+        asset = DocAsset(body, media_type, fingerprint)
+        self._assets[(version_str, kind)] = asset
+        self.asset_builds += 1
+        logger.debug(f"Rebuilt {kind} documentation for version {version_str} ({len(body)} bytes)")
+        return asset
+
+    def warm(self) -> None:
+        """Prebuild the documentation for all supported versions."""
+        for version in self.version_manager.supported_versions:
+            for getter in (self.get_html_doc, self.get_openapi_doc, self.get_graphql_doc):
+                try:
+                    getter(version)
+                except Exception as e:
+                    logger.error(f"Error prebuilding documentation for version {version}: {e}")
+
+    def invalidate(self) -> None:
+        """Drop all cached sections and assets."""
+        with self._lock:
+            self._sections.clear()
+            self._assets.clear()
+            self._schema_digest = None
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get cache statistics.
+
+        Returns:
+            Dictionary with cache statistics
+        """
+        with self._lock:
+            return {
+                "sections": len(self._sections),
+                "assets": {
+                    f"{version}/{kind}": {
+                        "etag": asset.etag,
+                        "size": len(asset.body),
+                        "gzip_size": len(asset.gzip_body) if asset.gzip_body is not None else None,
+                        "generated_at": asset.generated_at.isoformat(),
+                    }
+                    for (version, kind), asset in self._assets.items()
+                },
+                "section_builds": self.section_builds,
+                "asset_builds": self.asset_builds,
+                "hits": self.hits,
+            }
@@ -122,6 +122,9 @@ class DocumentationIntegrator:
             # Create static file handler
             self.docs_handler = APIDocsHandler(self.server, self.docs_dir)
             
+            # Prebuild the cached documentation served by the handler
+            self.docs_handler.docs_bundle.warm()
+            
             # Mount static files
             docs_url = "/api-docs"
             self.server.app.mount(
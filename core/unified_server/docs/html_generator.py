@@ -1490,7 +1490,7 @@ print(response.json())"""
             {
                 "title": "Get and update an object (Python)",
                 "language": "python",
-                "code": """import requests
+                "code": '''import requests
 
 url = "http://localhost:8000/graphql"
 headers = {
@@ -1531,7 +1531,7 @@ mutation {
 """
 
 response = requests.post(url, headers=headers, json={"query": mutation})
-print(response.json())"""
+print(response.json())'''
             }
         ]
         
@@ -1553,48 +1553,47 @@ print(response.json())"""
             graphql_examples=graphql_examples
         )
     
-    def generate_html_doc(self, api_version: Union[str, APIVersion] = None) -> str:
+    # Section name -> generator method, in page order
+    SECTIONS = {
+        "overview": "_generate_overview_section",
+        "versions": "_generate_versions_section",
+        "rest_endpoints": "_generate_rest_endpoints_section",
+        "graphql_operations": "_generate_graphql_operations_section",
+        "models": "_generate_models_section",
+        "authentication": "_generate_authentication_section",
+        "examples": "_generate_examples_section",
+    }
+    
+    def generate_section(self, name: str, api_version: APIVersion) -> str:
         """
-        Generate HTML documentation for the API.
+        Generate a single content section of the documentation.
         
         Args:
+            name: Section name (a key of SECTIONS)
             api_version: The API version to generate documentation for
             
         Returns:
-            HTML documentation
+            HTML content for the section
         """
-        if api_version is None:
-            api_version = self.current_version
-        elif isinstance(api_version, str):
-            api_version = APIVersion(api_version)
+        return getattr(self, self.SECTIONS[name])(api_version)
+    
+    def render_page(self, api_version: APIVersion, content: str) -> str:
+        """
+        Wrap generated section content in the page template.
         
+        Args:
+            api_version: The API version the content was generated for
+            content: Concatenated HTML content sections
+            
+        Returns:
+            HTML documentation
+        """
         # Title and header
         title = f"Blender GraphQL MCP API Documentation v{api_version}"
         header = f"Blender GraphQL MCP API v{api_version}"
         description = "Unified API for interacting with Blender through GraphQL and REST"
         
-        # Generate content sections
-        overview_section = self._generate_overview_section(api_version)
-        versions_section = self._generate_versions_section(api_version)
-        rest_endpoints_section = self._generate_rest_endpoints_section(api_version)
-        graphql_operations_section = self._generate_graphql_operations_section(api_version)
-        models_section = self._generate_models_section(api_version)
-        authentication_section = self._generate_authentication_section(api_version)
-        examples_section = self._generate_examples_section(api_version)
-        
-        # Combine content sections
-        content = (
-            overview_section +
-            versions_section +
-            rest_endpoints_section +
-            graphql_operations_section +
-            models_section +
-            authentication_section +
-            examples_section
-        )
-        
-        # Generate HTML
-        html = HTML_TEMPLATE.format(
+        return HTML_TEMPLATE.format(
             title=title,
             header=header,
             description=description,
@@ -1602,8 +1601,28 @@ print(response.json())"""
             content=content,
             generated_date=datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S")
         )
+    
+    def generate_html_doc(self, api_version: Union[str, APIVersion] = None) -> str:
+        """
+        Generate HTML documentation for the API.
+        
+        Args:
+            api_version: The API version to generate documentation for
+            
+        Returns:
+            HTML documentation
+        """
+        if api_version is None:
+            api_version = self.current_version
+        elif isinstance(api_version, str):
+            api_version = APIVersion(api_version)
+        
+        # Generate and combine content sections
+        content = "".join(
+            self.generate_section(name, api_version) for name in self.SECTIONS
+        )
         
-        return html
+        return self.render_page(api_version, content)
     
     def save_html_doc(self, output_dir: str, api_version: Union[str, APIVersion] = None) -> str:
         """
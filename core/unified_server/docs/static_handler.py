@@ -15,6 +15,7 @@ from fastapi.staticfiles import StaticFiles
 
 # Import version manager
 from ..api.version_manager import VersionManager
+from .docs_bundle import DocsBundle
 
 # Logger
 logger = logging.getLogger("unified_server.docs.static_handler")
@@ -38,6 +39,9 @@ class APIDocsHandler:
         self.docs_dir = docs_dir
         self.version_manager = VersionManager.get_instance()
         
+        # Cached, pre-compressed documentation
+        self.docs_bundle = DocsBundle(server)
+        
         # Create docs directory if it doesn't exist
         Path(docs_dir).mkdir(parents=True, exist_ok=True)
         
@@ -66,8 +70,19 @@ class APIDocsHandler:
                 "supported_versions": [str(v) for v in self.version_manager.supported_versions]
             }
         
+        # Documentation cache statistics
+        @self.router.get("/cache", response_class=JSONResponse)
+        async def get_docs_cache_stats():
+            """
+            Get statistics for the documentation cache.
+            
+            Returns:
+                JSON response with cached sections and assets
+            """
+            return self.docs_bundle.get_stats()
+        
         # Get documentation for a specific API version
-        @self.router.get("/v/{version}", response_class=HTMLResponse)
+        @self.router.get("/v/{version}")
         async def get_api_docs(version: str, request: Request):
             """
             Get API documentation for a specific version.
@@ -79,50 +94,94 @@ class APIDocsHandler:
             Returns:
                 HTML response with API documentation
             """
-            try:
-                # Check if the version exists
-                file_path = os.path.join(self.docs_dir, f"api_docs_{version}.html")
+            # Pre-generated HTML files (api_docs_<version>.html) are served as a fallback
+            fallback_path = os.path.join(self.docs_dir, f"api_docs_{version}.html")
+            return self._serve_asset(self.docs_bundle.get_html_doc, version, request, fallback_path)
+        
+        # Get the OpenAPI schema for a specific API version
+        @self.router.get("/v/{version}/openapi.json")
+        async def get_openapi_doc(version: str, request: Request):
+            """
+            Get the OpenAPI schema for a specific version.
+            
+            Args:
+                version: API version
+                request: Request object
                 
-                if not os.path.exists(file_path):
-                    # Check if we have the current version
-                    current_version = str(self.version_manager.current_version)
-                    current_file_path = os.path.join(self.docs_dir, f"api_docs_{current_version}.html")
-                    
-                    if not os.path.exists(current_file_path):
-                        # Generate documentation for the current version
-                        from .html_generator import HTMLGenerator
-                        generator = HTMLGenerator(self.server)
-                        generator.save_html_doc(self.docs_dir, current_version)
-                    
-                    if version != current_version:
-                        # Redirect to the current version
-                        return HTMLResponse(f"""
-                        <!DOCTYPE html>
-                        <html lang="en">
-                        <head>
-                            <meta charset="UTF-8">
-                            <meta name="viewport" content="width=device-width, initial-scale=1.0">
-                            <meta http-equiv="refresh" content="0;url=/docs/api/v/{current_version}">
-                            <title>Redirecting to current version</title>
-                        </head>
-                        <body>
-                            <p>Version {version} is not available. Redirecting to the current version {current_version}...</p>
-                            <p><a href="/docs/api/v/{current_version}">Click here if you are not redirected automatically</a></p>
-                        </body>
-                        </html>
-                        """)
+            Returns:
+                JSON response with the OpenAPI schema
+            """
+            return self._serve_asset(self.docs_bundle.get_openapi_doc, version, request)
+        
+        # Get the GraphQL schema documentation for a specific API version
+        @self.router.get("/v/{version}/graphql.json")
+        async def get_graphql_doc(version: str, request: Request):
+            """
+            Get the GraphQL schema documentation for a specific version.
+            
+            Args:
+                version: API version
+                request: Request object
                 
-                # Return the API documentation
-                return FileResponse(file_path)
-            except Exception as e:
+            Returns:
+                JSON response with the GraphQL schema documentation
+            """
+            return self._serve_asset(self.docs_bundle.get_graphql_doc, version, request)
+        
+        # Include the router in the app
+        self.app.include_router(self.router)
+    
+    def _serve_asset(self, getter, version: str, request: Request,
+                     fallback_path: Optional[str] = None):
+        """
+        Serve a cached documentation asset, redirecting unsupported versions.
+        
+        Args:
+            getter: DocsBundle method returning the asset for a version
+            version: API version
+            request: Request object
+            fallback_path: Pre-generated file served when the asset cannot be built
+            
+        Returns:
+            Response with the (possibly compressed) asset, the fallback file, or a redirect page
+        """
+        has_fallback = fallback_path is not None and os.path.exists(fallback_path)
+        try:
+            asset = getter(version)
+        except Exception as e:
+            if not has_fallback:
                 logger.error(f"Error getting API docs for version {version}: {e}")
                 raise HTTPException(
                     status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
                     detail=f"Error getting API docs for version {version}: {str(e)}"
                 )
+            logger.warning(f"Error building API docs for version {version}, "
+                           f"serving pre-generated file: {e}")
+            return FileResponse(fallback_path)
         
-        # Include the router in the app
-        self.app.include_router(self.router)
+        if asset is None:
+            if has_fallback:
+                return FileResponse(fallback_path)
+            
+            # Redirect to the current version
+            current_version = str(self.version_manager.current_version)
+            return HTMLResponse(f"""
+            <!DOCTYPE html>
+            <html lang="en">
+            <head>
+                <meta charset="UTF-8">
+                <meta name="viewport" content="width=device-width, initial-scale=1.0">
+                <meta http-equiv="refresh" content="0;url=/docs/api/v/{current_version}">
+                <title>Redirecting to current version</title>
+            </head>
+            <body>
+                <p>Version {version} is not available. Redirecting to the current version {current_version}...</p>
+                <p><a href="/docs/api/v/{current_version}">Click here if you are not redirected automatically</a></p>
+            </body>
+            </html>
+            """)
+        
+        return asset.to_response(request)
     
     def _setup_static_files(self) -> None:
         """Set up static files for documentation."""
@@ -231,6 +290,9 @@ class APIDocsHandler:
             # Generate documentation
             result = generate_documentation(self.server, self.docs_dir)
             
+            # Prebuild the served documentation
+            self.docs_bundle.warm()
+            
             logger.info(f"Generated API documentation: {result}")
             
             return result
@@ -7,11 +7,15 @@ import os
 import sys
 import logging
 import datetime
+from collections import deque
 from typing import Optional, Union, Dict, Any
 
 # Create a default logger
 logger = logging.getLogger("blender_mcp")
 
+# Maximum number of records kept by a LogCapture (oldest are dropped first)
+DEFAULT_CAPTURE_LIMIT = 1000
+
 
 def setup_logging(
     log_level: Union[str, int] = logging.INFO,
@@ -97,12 +101,14 @@ class LogCapture:
     """
     Context manager to capture logs for a specific operation.
     Useful for returning logs as part of API responses.
+    Only the most recent ``max_records`` messages are kept.
     """
     
-    def __init__(self, logger_name: Optional[str] = None, level: int = logging.INFO):
+    def __init__(self, logger_name: Optional[str] = None, level: int = logging.INFO,
+                 max_records: int = DEFAULT_CAPTURE_LIMIT):
         self.logger_name = logger_name
         self.level = level
-        self.captured_logs = []
+        self.captured_logs = deque(maxlen=max_records)
         self.handler = None
     
     def __enter__(self):
@@ -131,11 +137,11 @@ class LogCapture:
     
     def get_log_list(self) -> list:
         """Get captured logs as a list of strings."""
-        return self.captured_logs
+        return list(self.captured_logs)
 
 
 class CaptureHandler(logging.Handler):
-    """Handler to capture log messages in a list."""
+    """Handler to capture log messages in a list or bounded deque."""
     
     def __init__(self, log_list):
         super().__init__()
@@ -13,6 +13,13 @@ from typing import Any, Callable, Optional, TypeVar, cast, Dict, List, Tuple
 # Import logger
 from .logging import get_logger
 
+# Optional sampling profiler for slow main-thread tasks
+try:
+    from ...task_profiler import task_profiler
+    TASK_PROFILER_AVAILABLE = True
+except (ImportError, ValueError):
+    TASK_PROFILER_AVAILABLE = False
+
 logger = get_logger("threading")
 
 # Type variable for function return type
@@ -156,6 +163,11 @@ def is_in_main_thread() -> bool:
     return threading.current_thread() is _main_thread
 
 
+def _task_name(func: Callable) -> str:
+    """Name used to aggregate profiles (partials and callable instances have no __qualname__)."""
+    return getattr(func, '__qualname__', None) or getattr(func, '__name__', None) or str(func)
+
+
 def execute_in_main_thread(func: Callable[..., T]) -> Callable[..., T]:
     """
     Decorator to ensure a function is executed in the main Blender thread.
@@ -184,7 +196,10 @@ def execute_in_main_thread(func: Callable[..., T]) -> Callable[..., T]:
         # Define task to run in main thread
         def main_thread_task():
             try:
-                result_container["result"] = func(*args, **kwargs)
+                if TASK_PROFILER_AVAILABLE and task_profiler.enabled:
+                    result_container["result"] = task_profiler.run(_task_name(func), func, *args, **kwargs)
+                else:
+                    result_container["result"] = func(*args, **kwargs)
             except Exception as e:
                 result_container["exception"] = e
             finally:
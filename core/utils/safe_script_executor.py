@@ -8,11 +8,17 @@ import ast
 import sys
 import logging
 import time
+import hashlib
+import threading
 import traceback
+from collections import OrderedDict
 from typing import Dict, Any, Optional, List, Set
 
 logger = logging.getLogger(__name__)
 
+# 検証結果とコンパイル済みコードを保持するスクリプト数
+SCRIPT_CACHE_SIZE = 256
+
 class ScriptSecurityError(Exception):
     """スクリプト安全性チェックの失敗を示す例外"""
     pass
@@ -57,22 +63,37 @@ class ScriptValidator:
         Returns:
             bool: コードが安全であればTrue
         """
+        return self.parse_and_validate(code)[0]
+    
+    def parse_and_validate(self, code: str, filename: str = "<unknown>"):
+        """
+        コードを解析して安全性を検証し、検証済みのASTを返す
+        
+        返されたASTはそのままcompile()に渡せるため、再解析が不要になる。
+        
+        Args:
+            code: 検証するPythonコード
+            filename: 構文エラー表示用のファイル名
+            
+        Returns:
+            (安全であればTrue, AST（構文エラー時はNone）)
+        """
         self.errors = []
         self.warnings = []
         self.imported_modules = set()
         
         try:
             # コードをASTに解析
-            tree = ast.parse(code)
+            tree = ast.parse(code, filename)
             
             # 危険な構文要素のチェック
             self._check_node(tree)
             
-            return len(self.errors) == 0
+            return len(self.errors) == 0, tree
             
         except SyntaxError as e:
             self.errors.append(f"構文エラー: {str(e)}")
-            return False
+            return False, None
     
     def _check_node(self, node, parent_node=None):
         """ASTノードをチェック"""
@@ -163,6 +184,119 @@ class ScriptValidator:
                     self.errors.append(f"ファイル操作 'bpy.ops.wm.{attrs[3]}' はセキュリティ上の理由で許可されていません")
 
 
+class CompiledScriptCache:
+    """
+    スクリプトの検証結果とコンパイル済みコードのキャッシュ
+    
+    ソースのハッシュをキーにLRUで保持するため、同じスクリプトの再実行では
+    AST解析・検証・コンパイルがハッシュ計算と辞書検索だけになる。
+    """
+    
+    def __init__(self, max_size: int = SCRIPT_CACHE_SIZE):
+        self.max_size = max_size
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+    
+    @staticmethod
+    def make_key(script_code: str, script_name: str) -> str:
+        """ソースとスクリプト名からキャッシュキーを作成（コードオブジェクトはファイル名を含む）"""
+        digest = hashlib.sha256(script_code.encode('utf-8', 'surrogatepass')).hexdigest()
+        return f"{digest}:{script_name}"
+    
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """エントリを取得（見つからなければNone）"""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry
+    
+    def put(self, key: str, entry: Dict[str, Any]):
+        """エントリを追加し、上限を超えたら最も古いものを破棄"""
+        with self._lock:
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+    
+    def clear(self):
+        """キャッシュをクリア"""
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+    
+    def get_stats(self) -> Dict[str, Any]:
+        """キャッシュ統計を取得"""
+        with self._lock:
+            total = self.hits + self.misses
+            return {
+                "size": len(self._entries),
+                "max_size": self.max_size,
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": self.hits / total if total else 0.0
+            }
+
+
+# 全実行器で共有するキャッシュ
+script_cache = CompiledScriptCache()
+
+
+# Blenderモジュール（読み取り専用アクセス）
+class SafeBlenderAccess:
+    """安全なBlenderアクセスクラス"""
+    def __init__(self):
+        self.context = bpy.context
+        self.data = bpy.data
+        self.ops = SafeBlenderOps()
+
+        # その他の必要なBlender APIにアクセス
+        self.utils = bpy.utils
+        self.app = SafeBlenderApp()
+        self.types = bpy.types
+
+    def __getattr__(self, name):
+        if name not in {'context', 'data', 'ops', 'utils', 'app', 'types'}:
+            raise AttributeError(f"Access to bpy.{name} is restricted")
+        return getattr(bpy, name)
+
+class SafeBlenderOps:
+    """安全なBlender操作クラス"""
+    def __init__(self):
+        # 許可された操作のみを公開
+        self.object = bpy.ops.object
+        self.mesh = bpy.ops.mesh
+        self.material = bpy.ops.material
+        self.view3d = bpy.ops.view3d
+        self.transform = bpy.ops.transform
+        self.sculpt = bpy.ops.sculpt
+
+        # 禁止された操作
+        # wm（ファイル操作）など
+
+    def __getattr__(self, name):
+        if name not in {'object', 'mesh', 'material', 'view3d', 'transform', 'sculpt'}:
+            raise AttributeError(f"Access to bpy.ops.{name} may be restricted for security reasons")
+        return getattr(bpy.ops, name)
+
+class SafeBlenderApp:
+    """安全なBlenderアプリケーションクラス"""
+    def __init__(self):
+        self.version = bpy.app.version
+        self.version_string = bpy.app.version_string
+
+    def __getattr__(self, name):
+        if name not in {'version', 'version_string'}:
+            raise AttributeError(f"Access to bpy.app.{name} is restricted")
+        return getattr(bpy.app, name)
+
+
 class SafeScriptExecutor:
     """
     安全なスクリプト実行クラス
@@ -171,6 +305,9 @@ class SafeScriptExecutor:
     安全性が確認できた場合にのみ制限された環境で実行します。
     """
     
+    # 安全なグローバル名前空間のテンプレート（全インスタンスで共有）
+    _safe_globals_template = None
+    
     def __init__(self, max_execution_time: float = 5.0):
         """
         初期化
@@ -180,6 +317,7 @@ class SafeScriptExecutor:
         """
         self.validator = ScriptValidator()
         self.max_execution_time = max_execution_time
+        self.cache = script_cache
     
     def execute_script(self, script_code: str, script_name: str = "<script>") -> Dict[str, Any]:
         """
@@ -192,15 +330,17 @@ class SafeScriptExecutor:
         Returns:
             Dict: 実行結果
         """
-        # スクリプトの安全性をチェック
-        if not self.validator.validate(script_code):
-            errors = self.validator.errors
+        # スクリプトの安全性をチェック（検証済みならキャッシュから取得）
+        entry, cache_hit = self._get_compiled(script_code, script_name)
+        if not entry["valid"]:
+            errors = entry["errors"]
             return {
                 "success": False,
                 "error": f"Security validation failed: {errors[0] if errors else 'Unknown error'}",
                 "details": {
-                    "errors": errors,
-                    "warnings": self.validator.warnings
+                    "errors": list(errors),
+                    "warnings": list(entry["warnings"]),
+                    "cache_hit": cache_hit
                 }
             }
         
@@ -212,8 +352,8 @@ class SafeScriptExecutor:
             # 実行時間を計測
             start_time = time.time()
             
-            # コンパイルと実行
-            compiled_code = compile(script_code, script_name, 'exec')
+            # コンパイル済みコードを実行
+            compiled_code = entry["code"]
             
             # 実行のタイムアウト監視関数
             def check_timeout():
@@ -240,7 +380,8 @@ class SafeScriptExecutor:
                 "result": result,
                 "details": {
                     "execution_time": execution_time,
-                    "script_name": script_name
+                    "script_name": script_name,
+                    "cache_hit": cache_hit
                 }
             }
             
@@ -296,10 +437,66 @@ class SafeScriptExecutor:
                 }
             }
     
+    def _get_compiled(self, script_code: str, script_name: str):
+        """
+        検証結果とコンパイル済みコードを取得
+        
+        Args:
+            script_code: Pythonコード
+            script_name: スクリプト名
+            
+        Returns:
+            (キャッシュエントリ, キャッシュヒットならTrue)
+        """
+        key = self.cache.make_key(script_code, script_name)
+        entry = self.cache.get(key)
+        if entry is not None:
+            return entry, True
+        
+        # エラー・警告は検証器に蓄積されるため、呼び出し元同士で共有しないよう毎回作成
+        validator = ScriptValidator()
+        valid, tree = validator.parse_and_validate(script_code, script_name)
+        entry = {
+            "valid": valid,
+            "errors": tuple(validator.errors),
+            "warnings": tuple(validator.warnings),
+            "code": None
+        }
+        if valid:
+            try:
+                # 検証済みのASTをコンパイル（再解析しない）
+                entry["code"] = compile(tree, script_name, 'exec')
+            except (SyntaxError, ValueError) as e:
+                entry["valid"] = False
+                entry["errors"] = (f"構文エラー: {str(e)}",)
+        
+        self.cache.put(key, entry)
+        return entry, False
+    
     def _create_safe_globals(self) -> Dict[str, Any]:
         """
         安全なグローバル名前空間を作成
         
+        テンプレートは初回に一度だけ構築し、実行ごとに浅いコピーを返す。
+        組み込み関数の辞書とbpyプロキシは実行間で状態が漏れないよう実行ごとに複製する。
+        
+        Returns:
+            Dict: 安全なグローバル名前空間
+        """
+        template = SafeScriptExecutor._safe_globals_template
+        if template is None:
+            template = self._build_safe_globals()
+            SafeScriptExecutor._safe_globals_template = template
+        
+        safe_globals = dict(template)
+        safe_globals['__builtins__'] = dict(template['__builtins__'])
+        safe_globals['bpy'] = SafeBlenderAccess()
+        return safe_globals
+    
+    def _build_safe_globals(self) -> Dict[str, Any]:
+        """
+        安全なグローバル名前空間のテンプレートを構築
+        
         Returns:
             Dict: 安全なグローバル名前空間
         """
@@ -311,54 +508,6 @@ class SafeScriptExecutor:
             if name not in self.validator.FORBIDDEN_BUILTINS and not name.startswith('__'):
                 safe_builtins[name] = getattr(builtins, name)
         
-        # Blenderモジュール（読み取り専用アクセス）
-        class SafeBlenderAccess:
-            """安全なBlenderアクセスクラス"""
-            def __init__(self):
-                self.context = bpy.context
-                self.data = bpy.data
-                self.ops = SafeBlenderOps()
-                
-                # その他の必要なBlender APIにアクセス
-                self.utils = bpy.utils
-                self.app = SafeBlenderApp()
-                self.types = bpy.types
-            
-            def __getattr__(self, name):
-                if name not in {'context', 'data', 'ops', 'utils', 'app', 'types'}:
-                    raise AttributeError(f"Access to bpy.{name} is restricted")
-                return getattr(bpy, name)
-        
-        class SafeBlenderOps:
-            """安全なBlender操作クラス"""
-            def __init__(self):
-                # 許可された操作のみを公開
-                self.object = bpy.ops.object
-                self.mesh = bpy.ops.mesh
-                self.material = bpy.ops.material
-                self.view3d = bpy.ops.view3d
-                self.transform = bpy.ops.transform
-                self.sculpt = bpy.ops.sculpt
-                
-                # 禁止された操作
-                # wm（ファイル操作）など
-            
-            def __getattr__(self, name):
-                if name not in {'object', 'mesh', 'material', 'view3d', 'transform', 'sculpt'}:
-                    raise AttributeError(f"Access to bpy.ops.{name} may be restricted for security reasons")
-                return getattr(bpy.ops, name)
-        
-        class SafeBlenderApp:
-            """安全なBlenderアプリケーションクラス"""
-            def __init__(self):
-                self.version = bpy.app.version
-                self.version_string = bpy.app.version_string
-            
-            def __getattr__(self, name):
-                if name not in {'version', 'version_string'}:
-                    raise AttributeError(f"Access to bpy.app.{name} is restricted")
-                return getattr(bpy.app, name)
-        
         # 安全なグローバル名前空間を構築
         safe_globals = {
             '__builtins__': safe_builtins,
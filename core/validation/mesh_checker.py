@@ -4,22 +4,104 @@
 特にブーリアン操作などの複雑な操作前後の検証に使用
 """
 
+import time
 import bpy
 import bmesh
 from typing import Dict, List, Any, Optional, Tuple, Set
 
+from ..mesh_analysis_cache import cached_mesh_analysis
+
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
+# 重複頂点とみなす座標の丸め桁数
+DUPLICATE_PRECISION = 6
+
+# これより短いエッジを問題とする（0.1mm）
+SHORT_EDGE_LENGTH = 0.0001
+
+
+def analyze_mesh_buffers(coords, edge_verts, loop_totals, loop_edges) -> Dict[str, Any]:
+    """
+    メッシュのバッファ配列から基本統計と問題の件数を求める
+    
+    BMeshの要素ごとのループの代わりに配列演算で同じ判定を行う。
+    - 重複頂点: 丸めた座標の行をnp.uniqueで一意化
+    - 孤立頂点: エッジが参照する頂点のbincount
+    - 短いエッジ: 端点の差のノルム
+    - 非マニフォールドエッジ: ループのエッジ参照のbincount（面数が2以外）
+    
+    Args:
+        coords: 頂点座標 (V, 3)
+        edge_verts: エッジの頂点インデックス (E, 2)
+        loop_totals: 面ごとの頂点数 (F,)
+        loop_edges: ループごとのエッジインデックス (L,)
+        
+    Returns:
+        基本統計と問題ごとの件数
+    """
+    vert_count = len(coords)
+    edge_count = len(edge_verts)
+    
+    stats = {
+        "vertices": vert_count,
+        "edges": edge_count,
+        "faces": len(loop_totals),
+        "tris": int(np.count_nonzero(loop_totals == 3)),
+        "quads": int(np.count_nonzero(loop_totals == 4)),
+        "ngons": int(np.count_nonzero(loop_totals > 4))
+    }
+    
+    # 各エッジに接続する面の数（ちょうど2ならマニフォールド）
+    faces_per_edge = np.bincount(loop_edges, minlength=edge_count)
+    non_manifold_edges = int(np.count_nonzero(faces_per_edge != 2))
+    
+    # 重複頂点（+0.0で-0.0を0.0に揃えてからバイト列として比較）
+    duplicate_verts = 0
+    if vert_count:
+        keys = np.round(coords.astype(np.float64), DUPLICATE_PRECISION) + 0.0
+        keys = np.ascontiguousarray(keys).view(np.dtype((np.void, keys.dtype.itemsize * 3))).ravel()
+        duplicate_verts = vert_count - len(np.unique(keys))
+    
+    # 孤立頂点
+    isolated_verts = vert_count
+    short_edges = 0
+    if edge_count:
+        edges_per_vert = np.bincount(edge_verts.ravel(), minlength=vert_count)
+        isolated_verts = int(np.count_nonzero(edges_per_vert == 0))
+        
+        # 短いエッジ
+        vectors = coords[edge_verts[:, 1]] - coords[edge_verts[:, 0]]
+        lengths = np.sqrt(np.einsum('ij,ij->i', vectors, vectors))
+        short_edges = int(np.count_nonzero(lengths < SHORT_EDGE_LENGTH))
+    
+    return {
+        "stats": stats,
+        "non_manifold_edges": non_manifold_edges,
+        "duplicate_vertices": duplicate_verts,
+        "isolated_vertices": isolated_verts,
+        "short_edges": short_edges
+    }
+
+
 class MeshChecker:
     """
     メッシュの品質をチェックし、問題を診断するクラス
     """
     
     @classmethod
-    def check_mesh(cls, obj_name: str) -> Dict[str, Any]:
+    def check_mesh(cls, obj_name: str, use_numpy: Optional[bool] = None,
+                   use_cache: bool = True) -> Dict[str, Any]:
         """
         メッシュの品質をチェック
         
         Args:
             obj_name: チェックするメッシュオブジェクト名
+            use_numpy: NumPyカーネルを使用するか（Noneの場合は利用可能なら使用）
+            use_cache: ジオメトリが変わっていなければ前回の解析結果を再利用するか
             
         Returns:
             チェック結果
@@ -40,15 +122,150 @@ class MeshChecker:
             "is_manifold": False
         }
         
-        # BMeshを使用してメッシュ分析
+        if use_numpy is None:
+            use_numpy = NUMPY_AVAILABLE
+        
         mesh = obj.data
+        analyze = cls._analyze_mesh_arrays if use_numpy else cls._analyze_mesh_bmesh
+        
+        try:
+            if use_cache:
+                counts = cached_mesh_analysis("check_mesh", mesh, lambda: analyze(mesh))
+            else:
+                counts = analyze(mesh)
+            cls._build_report(result, counts)
+        except Exception as e:
+            result["valid"] = False
+            result["error"] = str(e)
+        
+        return result
+    
+    @classmethod
+    def _build_report(cls, result: Dict[str, Any], counts: Dict[str, Any]) -> None:
+        """
+        解析結果の件数から問題リストと総合評価を組み立てる
+        
+        Args:
+            result: check_meshの結果辞書（更新される）
+            counts: 基本統計と問題ごとの件数
+        """
+        result["stats"] = counts["stats"]
+        
+        # 非マニフォールドエッジ
+        non_manifold = counts["non_manifold_edges"]
+        if non_manifold:
+            result["issues"].append({
+                "type": "non_manifold_edges",
+                "count": non_manifold,
+                "description": f"{non_manifold}個の非マニフォールドエッジがあります",
+                "severity": "high",
+                "affects_boolean": True
+            })
+        
+        # 重複頂点
+        duplicates = counts["duplicate_vertices"]
+        if duplicates:
+            result["issues"].append({
+                "type": "duplicate_vertices",
+                "count": duplicates,
+                "description": f"{duplicates}個の重複頂点があります",
+                "severity": "medium",
+                "affects_boolean": True
+            })
+        
+        # 孤立頂点
+        isolated = counts["isolated_vertices"]
+        if isolated:
+            result["issues"].append({
+                "type": "isolated_vertices",
+                "count": isolated,
+                "description": f"{isolated}個の孤立頂点があります",
+                "severity": "low",
+                "affects_boolean": False
+            })
+        
+        # 短いエッジ
+        short_edges = counts["short_edges"]
+        if short_edges:
+            result["issues"].append({
+                "type": "short_edges",
+                "count": short_edges,
+                "description": f"{short_edges}個の極端に短いエッジがあります",
+                "severity": "medium",
+                "affects_boolean": True
+            })
+        
+        # 自己交差のチェック（簡易版）
+        # 完全な自己交差チェックは計算コストが高いため、簡易的な実装
+        # 詳細なチェックが必要な場合は別の方法が必要
+        
+        # 全体的な評価
+        result["is_manifold"] = non_manifold == 0
+        result["boolean_ready"] = result["is_manifold"] and not duplicates and not short_edges
+        
+        # 問題の総合評価
+        if result["issues"]:
+            # 重大度に基づいて問題を評価
+            severity_scores = {"high": 10, "medium": 5, "low": 1}
+            total_score = sum(severity_scores[issue["severity"]] for issue in result["issues"])
+            
+            if total_score >= 20:
+                result["quality"] = "poor"
+            elif total_score >= 10:
+                result["quality"] = "fair"
+            else:
+                result["quality"] = "good"
+        else:
+            result["quality"] = "excellent"
+    
+    @classmethod
+    def _analyze_mesh_arrays(cls, mesh) -> Dict[str, Any]:
+        """
+        foreach_getで取得したバッファをNumPyで一括解析
+        
+        Args:
+            mesh: メッシュデータ
+            
+        Returns:
+            基本統計と問題ごとの件数
+        """
+        vert_count = len(mesh.vertices)
+        edge_count = len(mesh.edges)
+        face_count = len(mesh.polygons)
+        
+        coords = np.empty(vert_count * 3, dtype=np.float32)
+        mesh.vertices.foreach_get("co", coords)
+        
+        edge_verts = np.empty(edge_count * 2, dtype=np.int32)
+        mesh.edges.foreach_get("vertices", edge_verts)
+        
+        loop_totals = np.empty(face_count, dtype=np.int32)
+        mesh.polygons.foreach_get("loop_total", loop_totals)
+        
+        loop_edges = np.empty(len(mesh.loops), dtype=np.int32)
+        mesh.loops.foreach_get("edge_index", loop_edges)
+        
+        return analyze_mesh_buffers(coords.reshape(-1, 3), edge_verts.reshape(-1, 2),
+                                    loop_totals, loop_edges)
+    
+    @classmethod
+    def _analyze_mesh_bmesh(cls, mesh) -> Dict[str, Any]:
+        """
+        BMeshを使用して要素ごとに解析（NumPyが使用できない場合のフォールバック）
+        
+        Args:
+            mesh: メッシュデータ
+            
+        Returns:
+            基本統計と問題ごとの件数
+        """
         bm = bmesh.new()
         
         try:
             bm.from_mesh(mesh)
             
             # 基本統計情報
-            result["stats"] = {
+            stats = {
                 "vertices": len(bm.verts),
                 "edges": len(bm.edges),
                 "faces": len(bm.faces),
@@ -58,94 +275,70 @@ class MeshChecker:
             }
             
             # 非マニフォールドエッジのチェック
-            non_manifold_edges = [edge for edge in bm.edges if not edge.is_manifold]
-            if non_manifold_edges:
-                result["issues"].append({
-                    "type": "non_manifold_edges",
-                    "count": len(non_manifold_edges),
-                    "description": f"{len(non_manifold_edges)}個の非マニフォールドエッジがあります",
-                    "severity": "high",
-                    "affects_boolean": True
-                })
+            non_manifold_edges = sum(1 for edge in bm.edges if not edge.is_manifold)
             
             # 重複頂点のチェック
-            # BMeshには直接重複頂点を検出する方法がないため、簡易的なチェックを実装
-            vertex_locations = {}
-            duplicate_verts = []
+            # BMeshには直接重複頂点を検出する方法がないため、丸めた座標で判定
+            vertex_locations = set()
+            duplicate_verts = 0
             
             for vert in bm.verts:
-                # 頂点座標を丸めてキーとして使用
-                loc_key = tuple(round(c, 6) for c in vert.co)
+                loc_key = tuple(round(c, DUPLICATE_PRECISION) for c in vert.co)
                 if loc_key in vertex_locations:
-                    duplicate_verts.append(vert)
+                    duplicate_verts += 1
                 else:
-                    vertex_locations[loc_key] = vert
-            
-            if duplicate_verts:
-                result["issues"].append({
-                    "type": "duplicate_vertices",
-                    "count": len(duplicate_verts),
-                    "description": f"{len(duplicate_verts)}個の重複頂点があります",
-                    "severity": "medium",
-                    "affects_boolean": True
-                })
+                    vertex_locations.add(loc_key)
             
             # 孤立頂点のチェック
-            isolated_verts = [v for v in bm.verts if not v.link_edges]
-            if isolated_verts:
-                result["issues"].append({
-                    "type": "isolated_vertices",
-                    "count": len(isolated_verts),
-                    "description": f"{len(isolated_verts)}個の孤立頂点があります",
-                    "severity": "low",
-                    "affects_boolean": False
-                })
+            isolated_verts = sum(1 for v in bm.verts if not v.link_edges)
             
             # 短いエッジのチェック
-            short_edges = []
-            for edge in bm.edges:
-                length = edge.calc_length()
-                if length < 0.0001:  # 0.1mm未満の非常に短いエッジ
-                    short_edges.append(edge)
-            
-            if short_edges:
-                result["issues"].append({
-                    "type": "short_edges",
-                    "count": len(short_edges),
-                    "description": f"{len(short_edges)}個の極端に短いエッジがあります",
-                    "severity": "medium",
-                    "affects_boolean": True
-                })
-            
-            # 自己交差のチェック（簡易版）
-            # 完全な自己交差チェックは計算コストが高いため、簡易的な実装
-            # 詳細なチェックが必要な場合は別の方法が必要
+            short_edges = sum(1 for edge in bm.edges if edge.calc_length() < SHORT_EDGE_LENGTH)
             
-            # 全体的な評価
-            result["is_manifold"] = all(edge.is_manifold for edge in bm.edges)
-            result["boolean_ready"] = result["is_manifold"] and not duplicate_verts and not short_edges
-            
-            # 問題の総合評価
-            if result["issues"]:
-                # 重大度に基づいて問題を評価
-                severity_scores = {"high": 10, "medium": 5, "low": 1}
-                total_score = sum(severity_scores[issue["severity"]] for issue in result["issues"])
-                
-                if total_score >= 20:
-                    result["quality"] = "poor"
-                elif total_score >= 10:
-                    result["quality"] = "fair"
-                else:
-                    result["quality"] = "good"
-            else:
-                result["quality"] = "excellent"
-            
-        except Exception as e:
-            result["valid"] = False
-            result["error"] = str(e)
+            return {
+                "stats": stats,
+                "non_manifold_edges": non_manifold_edges,
+                "duplicate_vertices": duplicate_verts,
+                "isolated_vertices": isolated_verts,
+                "short_edges": short_edges
+            }
         finally:
             bm.free()
+    
+    @classmethod
+    def benchmark_check_mesh(cls, obj_name: str, repeat: int = 3) -> Dict[str, Any]:
+        """
+        NumPyカーネルとBMesh版のcheck_meshを比較計測
         
+        Args:
+            obj_name: 計測するメッシュオブジェクト名
+            repeat: 計測回数（最小値を採用）
+            
+        Returns:
+            各実装の処理時間（ミリ秒）と結果の一致
+        """
+        timings = {}
+        reports = {}
+        
+        for name, use_numpy in (("bmesh", False), ("numpy", True)):
+            if use_numpy and not NUMPY_AVAILABLE:
+                continue
+            best = None
+            for _ in range(max(1, repeat)):
+                start_time = time.perf_counter()
+                reports[name] = cls.check_mesh(obj_name, use_numpy=use_numpy, use_cache=False)
+                elapsed = (time.perf_counter() - start_time) * 1000
+                best = elapsed if best is None else min(best, elapsed)
+            timings[name] = round(best, 3)
+        
+        result = {
+            "object": obj_name,
+            "vertices": reports["bmesh"].get("stats", {}).get("vertices", 0),
+            "timings_ms": timings,
+        }
+        if "numpy" in reports:
+            result["speedup"] = round(timings["bmesh"] / timings["numpy"], 2) if timings["numpy"] else None
+            result["reports_match"] = reports["bmesh"] == reports["numpy"]
         return result
     
     @classmethod
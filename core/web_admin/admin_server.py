@@ -5,16 +5,16 @@
 
 import os
 import json
+import asyncio
 import threading
 import time
 import logging
 from typing import Dict, Any, List, Optional, Union
-from datetime import datetime
 
 # FastAPIをインポート
 try:
     from fastapi import FastAPI, HTTPException, Request, WebSocket, WebSocketDisconnect
-    from fastapi.responses import HTMLResponse, JSONResponse, FileResponse
+    from fastapi.responses import HTMLResponse, JSONResponse, FileResponse, PlainTextResponse
     from fastapi.staticfiles import StaticFiles
     from fastapi.templating import Jinja2Templates
     from pydantic import BaseModel
@@ -26,9 +26,40 @@ except ImportError:
 # タスクキューをインポート
 from ..task_queue import get_task_queue, TaskStatus, Task, initialize_task_queue
 
+# ディスクキャッシュをインポート
+try:
+    from ...utils.disk_cache import get_disk_cache
+    DISK_CACHE_AVAILABLE = True
+except ImportError:
+    DISK_CACHE_AVAILABLE = False
+
+# ログリングバッファをインポート
+try:
+    from ...utils.log_buffer import get_log_buffer
+    LOG_BUFFER_AVAILABLE = True
+except ImportError:
+    LOG_BUFFER_AVAILABLE = False
+
+# 起動時インポート計測をインポート
+try:
+    from ...utils.lazy_loader import profiler as import_profiler
+    IMPORT_PROFILER_AVAILABLE = True
+except ImportError:
+    IMPORT_PROFILER_AVAILABLE = False
+
+# メインスレッドタスクプロファイラをインポート
+try:
+    from ..task_profiler import task_profiler
+    TASK_PROFILER_AVAILABLE = True
+except ImportError:
+    TASK_PROFILER_AVAILABLE = False
+
 # ロギング設定
 logger = logging.getLogger('unified_mcp.web_admin')
 
+# 接続中のクライアントへ差分をプッシュする間隔（秒）
+ADMIN_PUSH_INTERVAL = float(os.environ.get('MCP_ADMIN_PUSH_INTERVAL', '1.0'))
+
 class AdminServer:
     """
     管理用WebサーバークラスA
@@ -50,6 +81,18 @@ class AdminServer:
         self.running = False
         self.connected_websockets = []  # WebSocket接続を管理
         
+        # 差分プッシュの状態（前回送信したシステム情報とタスク変更の連番）
+        self._last_system_info = None
+        self._task_change_seq = 0
+        self._push_task = None
+        
+        # ライブテール中のクライアント（WebSocket -> フィルタとカーソル）
+        self._log_tail = {}
+        
+        # ログの記録を開始（以降のログを管理パネルから参照できる）
+        if LOG_BUFFER_AVAILABLE:
+            get_log_buffer()
+        
         # 現在のディレクトリからテンプレートパスを取得
         current_dir = os.path.dirname(os.path.abspath(__file__))
         self.templates_dir = os.path.join(current_dir, 'templates')
@@ -64,13 +107,26 @@ class AdminServer:
         # 必要なファイルが存在しない場合は作成
         self._ensure_template_files()
     
+    def _write_asset(self, path: str, content: str):
+        """
+        埋め込みのテンプレート・静的ファイルを書き出す
+
+        既存のファイルが埋め込みの内容と異なる場合（アップグレード後など）も上書きし、
+        サーバーとクライアントのメッセージ形式を一致させる。
+        """
+        if os.path.exists(path):
+            with open(path, 'r', encoding='utf-8') as f:
+                if f.read() == content:
+                    return
+        with open(path, 'w', encoding='utf-8') as f:
+            f.write(content)
+        logger.debug(f"管理パネルのファイルを更新しました: {path}")
+
     def _ensure_template_files(self):
-        """必要なテンプレートファイルを作成"""
+        """必要なテンプレートファイルを作成（埋め込みの内容と異なる場合は更新）"""
         # インデックスHTMLテンプレート
         index_html = os.path.join(self.templates_dir, 'index.html')
-        if not os.path.exists(index_html):
-            with open(index_html, 'w', encoding='utf-8') as f:
-                f.write("""<!DOCTYPE html>
+        self._write_asset(index_html, """<!DOCTYPE html>
 <html lang="ja">
 <head>
     <meta charset="UTF-8">
@@ -89,6 +145,7 @@ class AdminServer:
             <button class="tab-btn" data-tab="tasks">タスク管理</button>
             <button class="tab-btn" data-tab="graphql">GraphQL</button>
             <button class="tab-btn" data-tab="logs">ログ</button>
+            <button class="tab-btn" data-tab="profiler">プロファイラ</button>
             <button class="tab-btn" data-tab="settings">設定</button>
         </div>
         
@@ -219,6 +276,9 @@ class AdminServer:
                         <option value="warning">警告以上</option>
                         <option value="error">エラーのみ</option>
                     </select>
+                    <input type="text" id="log-search" placeholder="検索">
+                    <label><input type="checkbox" id="log-tail"> ライブ</label>
+                    <button id="older-logs" disabled>さらに古いログ</button>
                 </div>
                 
                 <div class="log-viewer">
@@ -226,6 +286,39 @@ class AdminServer:
                 </div>
             </div>
             
+            <!-- プロファイラタブ -->
+            <div id="profiler" class="tab-pane">
+                <h2>メインスレッドプロファイラ</h2>
+                
+                <div class="log-controls">
+                    <label><input type="checkbox" id="profiler-enabled"> 有効</label>
+                    <label>閾値(ms): <input type="number" id="profiler-threshold" value="100" min="0" style="width: 80px;"></label>
+                    <label>間隔(ms): <input type="number" id="profiler-interval" value="5" min="1" style="width: 80px;"></label>
+                    <button id="apply-profiler">適用</button>
+                    <button id="refresh-profiler">更新</button>
+                    <button id="reset-profiler">クリア</button>
+                    <a href="/api/profiler/collapsed" target="_blank">collapsed stacks</a>
+                </div>
+                
+                <table class="tasks-table">
+                    <thead>
+                        <tr>
+                            <th>タスク</th>
+                            <th>遅い実行</th>
+                            <th>平均(ms)</th>
+                            <th>最大(ms)</th>
+                            <th>サンプル</th>
+                        </tr>
+                    </thead>
+                    <tbody id="profiler-table-body">
+                    </tbody>
+                </table>
+                
+                <div class="log-viewer">
+                    <pre id="profiler-stacks"></pre>
+                </div>
+            </div>
+            
             <!-- 設定タブ -->
             <div id="settings" class="tab-pane">
                 <h2>システム設定</h2>
@@ -277,9 +370,7 @@ class AdminServer:
         
         # CSSファイル
         css_file = os.path.join(self.static_dir, 'styles.css')
-        if not os.path.exists(css_file):
-            with open(css_file, 'w', encoding='utf-8') as f:
-                f.write("""/* ベース設定 */
+        self._write_asset(css_file, """/* ベース設定 */
 :root {
     --primary-color: #3498db;
     --secondary-color: #2ecc71;
@@ -620,15 +711,20 @@ pre {
         
         # JavaScriptファイル
         js_file = os.path.join(self.static_dir, 'scripts.js')
-        if not os.path.exists(js_file):
-            with open(js_file, 'w', encoding='utf-8') as f:
-                f.write("""// 管理パネルメインJS
+        self._write_asset(js_file, """// 管理パネルメインJS
 
 // WebSocket接続
 let socket;
 let reconnectInterval = 1000; // リコネクト間隔（ミリ秒）
 let isConnected = false;
 
+// サーバーから受信した状態（差分を適用して保持）
+let systemInfo = {};
+const taskMap = new Map();
+
+// 古いログを読み込むためのカーソル
+let logCursor = null;
+
 // 初期化関数
 function initAdminPanel() {
     // タブ切り替え
@@ -642,6 +738,7 @@ function initAdminPanel() {
     initializeTasksTab();
     initializeGraphQLTab();
     initializeLogsTab();
+    initializeProfilerTab();
     initializeSettingsTab();
 }
 
@@ -686,17 +783,31 @@ function connectWebSocket() {
         // 受信したデータの種類に応じて処理
         switch(data.type) {
             case 'system_info':
-                updateSystemInfo(data.data);
+                systemInfo = data.data;
+                updateSystemInfo(systemInfo);
+                break;
+            case 'system_delta':
+                Object.assign(systemInfo, data.data);
+                updateSystemInfo(systemInfo);
                 break;
             case 'task_update':
                 updateTaskInfo(data.data);
                 break;
+            case 'task_delta':
+                applyTaskDelta(data.data);
+                break;
             case 'log_entry':
                 addLogEntry(data.data);
                 break;
+            case 'log_batch':
+                renderLogBatch(data.data);
+                break;
             case 'activity':
                 addActivityLog(data.data.message);
                 break;
+            case 'profiler':
+                updateProfilerInfo(data.data);
+                break;
             default:
                 console.log('未知のメッセージタイプ:', data.type);
         }
@@ -735,11 +846,9 @@ function requestInitialData() {
         action: 'get_tasks'
     }));
     
-    // ログリクエスト
-    socket.send(JSON.stringify({
-        action: 'get_logs',
-        limit: 100
-    }));
+    // ログリクエスト（再接続時はライブテールも再開）
+    requestLogs(false);
+    updateLogTail();
 }
 
 // システム情報の更新
@@ -770,54 +879,84 @@ function updateSystemInfo(data) {
     document.getElementById('worker-threads').value = data.worker_threads;
 }
 
-// タスク情報の更新
+// タスク行の生成
+function createTaskRow(task) {
+    const row = document.createElement('tr');
+    row.setAttribute('data-id', task.id);
+    row.innerHTML = `
+        <td>${task.id.substring(0, 8)}...</td>
+        <td>${task.name}</td>
+        <td>${task.type}</td>
+        <td><span class="status ${task.status}">${task.status}</span></td>
+        <td>
+            <div class="progress-bar">
+                <div class="progress" style="width: ${task.progress * 100}%;">${Math.round(task.progress * 100)}%</div>
+            </div>
+        </td>
+        <td>${formatDateTime(task.created_at)}</td>
+        <td>
+            <button class="view-task" data-id="${task.id}">詳細</button>
+            ${task.status === 'pending' ? `<button class="cancel-task" data-id="${task.id}">キャンセル</button>` : ''}
+        </td>
+    `;
+    return row;
+}
+
+// 表示対象のステータスを取得
+function getActiveTaskFilters() {
+    return Array.from(document.querySelectorAll('.task-filter:checked'))
+        .map(checkbox => checkbox.getAttribute('data-status'));
+}
+
+// タスク情報の更新（全件）
 function updateTaskInfo(tasks) {
+    taskMap.clear();
+    tasks.forEach(task => taskMap.set(task.id, task));
+    renderTaskList();
+}
+
+// タスク一覧の再描画
+function renderTaskList() {
     const tasksList = document.getElementById('tasks-list');
+    const activeFilters = getActiveTaskFilters();
     
     // 既存のタスクリストをクリア
     tasksList.innerHTML = '';
     
-    // フィルター設定を取得
-    const activeFilters = Array.from(document.querySelectorAll('.task-filter:checked'))
-        .map(checkbox => checkbox.getAttribute('data-status'));
-    
-    // タスクをフィルタリングしてリストに追加
-    tasks.filter(task => activeFilters.includes(task.status))
-        .forEach(task => {
-            const row = document.createElement('tr');
-            row.innerHTML = `
-                <td>${task.id.substring(0, 8)}...</td>
-                <td>${task.name}</td>
-                <td>${task.type}</td>
-                <td><span class="status ${task.status}">${task.status}</span></td>
-                <td>
-                    <div class="progress-bar">
-                        <div class="progress" style="width: ${task.progress * 100}%;">${Math.round(task.progress * 100)}%</div>
-                    </div>
-                </td>
-                <td>${formatDateTime(task.created_at)}</td>
-                <td>
-                    <button class="view-task" data-id="${task.id}">詳細</button>
-                    ${task.status === 'pending' ? `<button class="cancel-task" data-id="${task.id}">キャンセル</button>` : ''}
-                </td>
-            `;
-            tasksList.appendChild(row);
-        });
+    // タスクをフィルタリングしてリストに追加（作成日時の新しい順）
+    Array.from(taskMap.values())
+        .filter(task => activeFilters.includes(task.status))
+        .sort((a, b) => b.created_at - a.created_at)
+        .forEach(task => tasksList.appendChild(createTaskRow(task)));
+}
+
+// タスクの差分を適用（変更された行のみ更新）
+function applyTaskDelta(delta) {
+    const tasksList = document.getElementById('tasks-list');
+    const activeFilters = getActiveTaskFilters();
     
-    // タスク詳細表示ボタンのイベントリスナー
-    document.querySelectorAll('.view-task').forEach(button => {
-        button.addEventListener('click', () => {
-            const taskId = button.getAttribute('data-id');
-            showTaskDetails(taskId, tasks.find(t => t.id === taskId));
-        });
+    delta.removed.forEach(taskId => {
+        taskMap.delete(taskId);
+        const row = tasksList.querySelector(`tr[data-id="${taskId}"]`);
+        if (row) row.remove();
     });
     
-    // タスクキャンセルボタンのイベントリスナー
-    document.querySelectorAll('.cancel-task').forEach(button => {
-        button.addEventListener('click', () => {
-            const taskId = button.getAttribute('data-id');
-            cancelTask(taskId);
-        });
+    delta.tasks.forEach(task => {
+        const isNew = !taskMap.has(task.id);
+        taskMap.set(task.id, task);
+        
+        const row = tasksList.querySelector(`tr[data-id="${task.id}"]`);
+        if (!activeFilters.includes(task.status)) {
+            if (row) row.remove();
+        } else if (row) {
+            row.replaceWith(createTaskRow(task));
+        } else if (isNew) {
+            // 新しいタスクは先頭に追加
+            tasksList.insertBefore(createTaskRow(task), tasksList.firstChild);
+        } else {
+            // フィルターで非表示だったタスクが表示対象になった場合は並び順ごと再描画
+            renderTaskList();
+        }
     });
 }
 
@@ -892,12 +1031,13 @@ function createTestTask() {
 }
 
 // ログエントリを追加
-function addLogEntry(logEntry) {
+function addLogEntry(logEntry, prepend = false) {
     const logContent = document.getElementById('log-content');
     
     // ログレベルに基づいてCSSクラスを追加
     let logClass = '';
     switch (logEntry.level) {
+        case 'CRITICAL':
         case 'ERROR':
             logClass = 'log-error';
             break;
@@ -911,14 +1051,29 @@ function addLogEntry(logEntry) {
             logClass = 'log-debug';
     }
     
-    // 新しいログを追加
+    // 新しいログを追加（メッセージはHTMLとして解釈しない）
     const logLine = document.createElement('div');
     logLine.className = `log-line ${logClass}`;
-    logLine.innerHTML = `<span class="log-time">${logEntry.time}</span> <span class="log-level">[${logEntry.level}]</span> <span class="log-message">${logEntry.message}</span>`;
+    [
+        ['log-time', logEntry.time],
+        ['log-level', `[${logEntry.level}]`],
+        ['log-logger', logEntry.logger || ''],
+        ['log-message', logEntry.message]
+    ].forEach(([className, text]) => {
+        const span = document.createElement('span');
+        span.className = className;
+        span.textContent = text;
+        logLine.appendChild(span);
+        logLine.appendChild(document.createTextNode(' '));
+    });
     
-    logContent.appendChild(logLine);
+    if (prepend) {
+        logContent.insertBefore(logLine, logContent.firstChild);
+        return;
+    }
     
     // 一番下にスクロール
+    logContent.appendChild(logLine);
     logContent.scrollTop = logContent.scrollHeight;
 }
 
@@ -950,14 +1105,7 @@ function addActivityLog(message) {
 
 // ダッシュボードの初期化
 function initializeDashboard() {
-    // 自動更新タイマー
-    setInterval(() => {
-        if (isConnected) {
-            socket.send(JSON.stringify({
-                action: 'get_system_info'
-            }));
-        }
-    }, 5000); // 5秒ごとに更新
+    // システム情報はサーバーから差分がプッシュされるためポーリングしない
 }
 
 // タスク管理タブの初期化
@@ -983,26 +1131,22 @@ function initializeTasksTab() {
     // テストタスク作成ボタン
     document.getElementById('create-test-task').addEventListener('click', createTestTask);
     
-    // タスクフィルターの変更イベント
+    // タスクフィルターの変更イベント（保持しているタスクデータで再描画）
     document.querySelectorAll('.task-filter').forEach(checkbox => {
-        checkbox.addEventListener('change', () => {
-            // タスクリストを更新（現在のタスクデータを使用）
-            if (isConnected) {
-                socket.send(JSON.stringify({
-                    action: 'get_tasks'
-                }));
-            }
-        });
+        checkbox.addEventListener('change', renderTaskList);
     });
     
-    // 定期的にタスクリストを更新
-    setInterval(() => {
-        if (document.querySelector('#tasks.active') && isConnected) {
-            socket.send(JSON.stringify({
-                action: 'get_tasks'
-            }));
+    // 詳細・キャンセルボタン（行の差し替えに追従するためイベント委譲）
+    document.getElementById('tasks-list').addEventListener('click', (event) => {
+        const taskId = event.target.getAttribute('data-id');
+        if (event.target.classList.contains('view-task')) {
+            showTaskDetails(taskId, taskMap.get(taskId));
+        } else if (event.target.classList.contains('cancel-task')) {
+            cancelTask(taskId);
         }
-    }, 3000); // 3秒ごとに更新
+    });
+    
+    // タスク一覧はサーバーから差分がプッシュされるためポーリングしない
 }
 
 // GraphQLタブの初期化
@@ -1146,37 +1290,141 @@ function initializeGraphQLTab() {
 // ログタブの初期化
 function initializeLogsTab() {
     // ログ更新ボタン
-    document.getElementById('refresh-logs').addEventListener('click', () => {
-        if (isConnected) {
-            const level = document.getElementById('log-level').value;
-            
-            socket.send(JSON.stringify({
-                action: 'get_logs',
-                limit: 100,
-                level: level === 'all' ? null : level
-            }));
-        }
-    });
+    document.getElementById('refresh-logs').addEventListener('click', () => requestLogs(false));
     
     // ログクリアボタン
     document.getElementById('clear-logs').addEventListener('click', () => {
         document.getElementById('log-content').innerHTML = '';
     });
     
-    // ログレベル変更
+    // さらに古いログを読み込む
+    document.getElementById('older-logs').addEventListener('click', () => requestLogs(true));
+    
+    // ログレベル・検索条件の変更
     document.getElementById('log-level').addEventListener('change', () => {
+        requestLogs(false);
+        updateLogTail();
+    });
+    document.getElementById('log-search').addEventListener('change', () => {
+        requestLogs(false);
+        updateLogTail();
+    });
+    
+    // ライブテールの切り替え
+    document.getElementById('log-tail').addEventListener('change', updateLogTail);
+}
+
+// 現在のログ検索条件
+function getLogFilters() {
+    const level = document.getElementById('log-level').value;
+    const search = document.getElementById('log-search').value;
+    return {
+        level: level === 'all' ? null : level,
+        search: search || null
+    };
+}
+
+// ログをリクエスト（olderがtrueなら表示中より古いログ）
+function requestLogs(older) {
+    if (!isConnected) return;
+    
+    const request = Object.assign({ action: 'get_logs', limit: 100 }, getLogFilters());
+    if (older) {
+        if (logCursor === null) return;
+        request.before = logCursor;
+    }
+    socket.send(JSON.stringify(request));
+}
+
+// ライブテールの開始・停止をサーバーに通知
+function updateLogTail() {
+    if (!isConnected) return;
+    
+    socket.send(JSON.stringify(Object.assign({
+        action: 'tail_logs',
+        enabled: document.getElementById('log-tail').checked
+    }, getLogFilters())));
+}
+
+// 受信したログをまとめて表示
+function renderLogBatch(batch) {
+    const logContent = document.getElementById('log-content');
+    
+    if (batch.tail) {
+        batch.entries.forEach(entry => addLogEntry(entry));
+        return;
+    }
+    
+    if (batch.older) {
+        // 古いログは先頭に追加
+        batch.entries.slice().reverse().forEach(entry => addLogEntry(entry, true));
+    } else {
+        logContent.innerHTML = '';
+        batch.entries.forEach(entry => addLogEntry(entry));
+    }
+    
+    logCursor = batch.next_cursor;
+    document.getElementById('older-logs').disabled = logCursor === null;
+}
+
+// プロファイラタブの初期化
+function initializeProfilerTab() {
+    document.getElementById('apply-profiler').addEventListener('click', () => {
+        if (!isConnected) return;
+        
+        socket.send(JSON.stringify({
+            action: 'set_profiler',
+            enabled: document.getElementById('profiler-enabled').checked,
+            threshold_ms: parseFloat(document.getElementById('profiler-threshold').value),
+            interval_ms: parseFloat(document.getElementById('profiler-interval').value)
+        }));
+    });
+    
+    document.getElementById('refresh-profiler').addEventListener('click', () => {
         if (isConnected) {
-            const level = document.getElementById('log-level').value;
-            
-            socket.send(JSON.stringify({
-                action: 'get_logs',
-                limit: 100,
-                level: level === 'all' ? null : level
-            }));
+            socket.send(JSON.stringify({ action: 'get_profiler' }));
+        }
+    });
+    
+    document.getElementById('reset-profiler').addEventListener('click', () => {
+        if (isConnected) {
+            socket.send(JSON.stringify({ action: 'reset_profiler' }));
         }
     });
 }
 
+// プロファイラ情報の更新
+function updateProfilerInfo(data) {
+    if (!data.available) {
+        document.getElementById('profiler-stacks').textContent = 'プロファイラは利用できません';
+        return;
+    }
+    
+    document.getElementById('profiler-enabled').checked = data.config.enabled;
+    document.getElementById('profiler-threshold').value = data.config.threshold_ms;
+    document.getElementById('profiler-interval').value = data.config.interval_ms;
+    
+    const tableBody = document.getElementById('profiler-table-body');
+    tableBody.innerHTML = '';
+    
+    Object.entries(data.tasks).forEach(([name, task]) => {
+        const row = document.createElement('tr');
+        [name, task.slow_runs, task.avg_ms.toFixed(1), task.max_ms.toFixed(1), task.samples].forEach(value => {
+            const cell = document.createElement('td');
+            cell.textContent = value;
+            row.appendChild(cell);
+        });
+        
+        // 行クリックで上位スタックを表示
+        row.addEventListener('click', () => {
+            document.getElementById('profiler-stacks').textContent = task.top_stacks
+                .map(entry => `${entry.samples}\t${entry.stack.split(';').join('\n\t  ')}`)
+                .join('\n\n');
+        });
+        tableBody.appendChild(row);
+    });
+}
+
 // 設定タブの初期化
 function initializeSettingsTab() {
     // 設定保存ボタン
@@ -1293,12 +1541,73 @@ document.addEventListener('DOMContentLoaded', initAdminPanel);
         # 接続されたWebSocketを管理
         self.connected_websockets = []
         
+        # 差分プッシュループを開始
+        @self.app.on_event("startup")
+        async def start_push_loop():
+            self._push_task = asyncio.ensure_future(self._push_updates_loop())
+        
         # ルートエンドポイント
         @self.app.get("/", response_class=HTMLResponse)
         async def get_admin_panel(request: Request):
             """管理パネルのトップページを返す"""
             return templates.TemplateResponse("index.html", {"request": request})
         
+        # ディスクキャッシュ統計エンドポイント
+        @self.app.get("/api/cache")
+        async def get_cache_info(limit: int = 20):
+            """ディスクキャッシュの統計と最近のエントリを返す"""
+            return JSONResponse(self.get_cache_info(limit))
+        
+        # 起動時間プロファイルエンドポイント
+        @self.app.get("/api/startup-profile")
+        async def get_startup_profile():
+            """遅延ロードによるモジュールごとの起動時間削減量を返す"""
+            if not IMPORT_PROFILER_AVAILABLE:
+                return JSONResponse({"available": False})
+            return JSONResponse(dict(import_profiler.get_report(), available=True))
+        
+        # ログ検索エンドポイント
+        @self.app.get("/api/logs")
+        async def get_logs(limit: int = 100, level: Optional[str] = None, logger_name: Optional[str] = None,
+                           search: Optional[str] = None, before: Optional[int] = None,
+                           after: Optional[int] = None):
+            """リングバッファのログをカーソル指定で返す"""
+            return JSONResponse(self.get_logs(limit, level, logger_name, search, before, after))
+        
+        # メインスレッドプロファイラエンドポイント
+        @self.app.get("/api/profiler")
+        async def get_profiler(top: int = 5):
+            """遅いメインスレッドタスクの統計と上位スタックを返す"""
+            return JSONResponse(self.get_profiler_info(top))
+        
+        @self.app.post("/api/profiler")
+        async def configure_profiler(request: Request):
+            """プロファイラの有効・無効、閾値、サンプリング間隔を変更"""
+            if not TASK_PROFILER_AVAILABLE:
+                raise HTTPException(status_code=404, detail="Task profiler is not available")
+            settings = await request.json()
+            task_profiler.configure(
+                enabled=settings.get("enabled"),
+                threshold_ms=settings.get("threshold_ms"),
+                interval_ms=settings.get("interval_ms")
+            )
+            return JSONResponse(self.get_profiler_info())
+        
+        @self.app.delete("/api/profiler")
+        async def reset_profiler():
+            """収集したプロファイルを破棄"""
+            if not TASK_PROFILER_AVAILABLE:
+                raise HTTPException(status_code=404, detail="Task profiler is not available")
+            task_profiler.reset()
+            return JSONResponse(self.get_profiler_info())
+        
+        @self.app.get("/api/profiler/collapsed")
+        async def get_profiler_collapsed(task: Optional[str] = None):
+            """flamegraph互換のcollapsed stackを返す"""
+            if not TASK_PROFILER_AVAILABLE:
+                raise HTTPException(status_code=404, detail="Task profiler is not available")
+            return PlainTextResponse(task_profiler.get_collapsed(task))
+        
         # WebSocketエンドポイント
         @self.app.websocket("/ws")
         async def websocket_endpoint(websocket: WebSocket):
@@ -1323,6 +1632,7 @@ document.addEventListener('DOMContentLoaded', initAdminPanel);
                 # 切断時の処理
                 if websocket in self.connected_websockets:
                     self.connected_websockets.remove(websocket)
+                self._log_tail.pop(websocket, None)
                 logger.info("WebSocket接続が切断されました")
     
     async def process_websocket_message(self, websocket: WebSocket, message: str):
@@ -1403,16 +1713,48 @@ document.addEventListener('DOMContentLoaded', initAdminPanel);
                 }))
                 
             elif action == "get_logs":
-                # ログを取得して送信
-                limit = data.get("limit", 100)
-                level = data.get("level")
-                logs = self.get_logs(limit, level)
+                # ログを取得してまとめて送信（beforeを指定すると続きの古いログ）
+                logs = self.get_logs(
+                    data.get("limit", 100),
+                    data.get("level"),
+                    data.get("logger"),
+                    data.get("search"),
+                    data.get("before")
+                )
+                logs["older"] = data.get("before") is not None
+                await websocket.send_text(json.dumps({
+                    "type": "log_batch",
+                    "data": logs
+                }))
                 
-                for log in logs:
-                    await websocket.send_text(json.dumps({
-                        "type": "log_entry",
-                        "data": log
-                    }))
+            elif action == "tail_logs":
+                # ライブテールの開始・停止（開始時点以降のログをプッシュ）
+                if data.get("enabled", True) and LOG_BUFFER_AVAILABLE:
+                    self._log_tail[websocket] = {
+                        "level": data.get("level"),
+                        "logger": data.get("logger"),
+                        "search": data.get("search"),
+                        "cursor": get_log_buffer().latest_seq
+                    }
+                else:
+                    self._log_tail.pop(websocket, None)
+                
+            elif action == "get_cache_stats":
+                # ディスクキャッシュ統計を取得して送信
+                await websocket.send_text(json.dumps({
+                    "type": "cache_stats",
+                    "data": self.get_cache_info(data.get("limit", 20))
+                }))
+                
+            elif action == "clear_cache":
+                # ディスクキャッシュをクリア
+                count = self.clear_disk_cache(data.get("pattern"))
+                await websocket.send_text(json.dumps({
+                    "type": "activity",
+                    "data": {
+                        "message": f"{count}個のキャッシュファイルを削除しました"
+                    }
+                }))
                 
             # 設定関連のアクション
             elif action == "save_settings":
@@ -1434,6 +1776,22 @@ document.addEventListener('DOMContentLoaded', initAdminPanel);
                     "data": system_info
                 }))
                 
+            elif action in ("get_profiler", "set_profiler", "reset_profiler"):
+                # プロファイラの設定変更・クリア
+                if TASK_PROFILER_AVAILABLE and action == "set_profiler":
+                    task_profiler.configure(
+                        enabled=data.get("enabled"),
+                        threshold_ms=data.get("threshold_ms"),
+                        interval_ms=data.get("interval_ms")
+                    )
+                elif TASK_PROFILER_AVAILABLE and action == "reset_profiler":
+                    task_profiler.reset()
+                
+                await websocket.send_text(json.dumps({
+                    "type": "profiler",
+                    "data": self.get_profiler_info()
+                }))
+                
             elif action == "restart_server":
                 # サーバーを再起動
                 success = self.restart_server()
@@ -1502,52 +1860,129 @@ document.addEventListener('DOMContentLoaded', initAdminPanel);
             import traceback
             logger.debug(traceback.format_exc())
     
+    async def broadcast(self, message: Dict[str, Any]):
+        """
+        全接続クライアントにメッセージを送信
+        
+        メッセージは1回だけシリアライズし、全クライアントへ並行して送信する。
+        送信に失敗したクライアントは切断済みとして除外する。
+        """
+        if not self.connected_websockets:
+            return
+        
+        text = json.dumps(message)
+        websockets = list(self.connected_websockets)
+        results = await asyncio.gather(
+            *(websocket.send_text(text) for websocket in websockets),
+            return_exceptions=True
+        )
+        
+        # 切断されたWebSocketを削除
+        for websocket, result in zip(websockets, results):
+            if isinstance(result, Exception):
+                self._drop_websocket(websocket)
+    
+    def _drop_websocket(self, websocket):
+        """切断されたWebSocketを管理対象から外す"""
+        if websocket in self.connected_websockets:
+            self.connected_websockets.remove(websocket)
+        self._log_tail.pop(websocket, None)
+    
+    async def push_log_tail(self):
+        """
+        ライブテール中のクライアントに新しいログを送信
+        
+        フィルタとカーソルが同じクライアントはまとめて1回だけ検索・シリアライズする。
+        """
+        if not self._log_tail or not LOG_BUFFER_AVAILABLE:
+            return
+        
+        log_buffer = get_log_buffer()
+        latest = log_buffer.latest_seq
+        
+        groups = {}
+        for websocket, tail in list(self._log_tail.items()):
+            if tail["cursor"] >= latest:
+                continue
+            key = (tail["level"], tail["logger"], tail["search"], tail["cursor"])
+            groups.setdefault(key, []).append(websocket)
+        
+        for (level, logger_name, search, cursor), websockets in groups.items():
+            logs = log_buffer.query(limit=500, level=level, logger_name=logger_name,
+                                    search=search, after=cursor)
+            for websocket in websockets:
+                if websocket in self._log_tail:
+                    self._log_tail[websocket]["cursor"] = logs["next_cursor"]
+            if not logs["entries"]:
+                continue
+            
+            logs["tail"] = True
+            text = json.dumps({"type": "log_batch", "data": logs})
+            results = await asyncio.gather(
+                *(websocket.send_text(text) for websocket in websockets),
+                return_exceptions=True
+            )
+            for websocket, result in zip(websockets, results):
+                if isinstance(result, Exception):
+                    self._drop_websocket(websocket)
+    
     async def broadcast_system_update(self):
-        """全接続クライアントにシステム更新を通知"""
+        """全接続クライアントにシステム情報の変更点のみを通知"""
         if not self.connected_websockets:
             return
         
-        # システム情報を取得
         system_info = self.get_system_info()
+        previous = self._last_system_info
+        self._last_system_info = system_info
         
-        # 全クライアントに送信
-        disconnected = []
-        for websocket in self.connected_websockets:
-            try:
-                await websocket.send_text(json.dumps({
-                    "type": "system_info",
-                    "data": system_info
-                }))
-            except Exception:
-                # 切断されたWebSocketを記録
-                disconnected.append(websocket)
+        if previous is None:
+            await self.broadcast({"type": "system_info", "data": system_info})
+            return
         
-        # 切断されたWebSocketを削除
-        for websocket in disconnected:
-            if websocket in self.connected_websockets:
-                self.connected_websockets.remove(websocket)
+        delta = {key: value for key, value in system_info.items() if previous.get(key) != value}
+        if delta:
+            await self.broadcast({"type": "system_delta", "data": delta})
     
-    async def broadcast_task_update(self, task):
-        """全接続クライアントにタスク更新を通知"""
+    async def broadcast_task_update(self, task=None):
+        """
+        全接続クライアントにタスクの変更点のみを通知
+        
+        Args:
+            task: 指定時はそのタスクのみを送信（Noneの場合は前回以降の変更をまとめて送信）
+        """
         if not self.connected_websockets:
             return
         
-        # タスク情報を送信
-        disconnected = []
-        for websocket in self.connected_websockets:
-            try:
-                await websocket.send_text(json.dumps({
-                    "type": "task_update",
-                    "data": [task.to_dict()]
-                }))
-            except Exception:
-                # 切断されたWebSocketを記録
-                disconnected.append(websocket)
+        if task is not None:
+            await self.broadcast({"type": "task_delta", "data": {"tasks": [task.to_dict()], "removed": []}})
+            return
         
-        # 切断されたWebSocketを削除
-        for websocket in disconnected:
-            if websocket in self.connected_websockets:
-                self.connected_websockets.remove(websocket)
+        changes = get_task_queue().get_changes(self._task_change_seq)
+        self._task_change_seq = changes["seq"]
+        
+        if changes["full"]:
+            await self.broadcast({"type": "task_update", "data": changes["tasks"]})
+        elif changes["tasks"] or changes["removed"]:
+            await self.broadcast({
+                "type": "task_delta",
+                "data": {"tasks": changes["tasks"], "removed": changes["removed"]}
+            })
+    
+    async def _push_updates_loop(self):
+        """接続中のクライアントにタスクとシステム情報の差分を定期的にプッシュ"""
+        while True:
+            await asyncio.sleep(ADMIN_PUSH_INTERVAL)
+            if not self.connected_websockets:
+                # 再接続時は全件から送り直す
+                self._last_system_info = None
+                self._task_change_seq = 0
+                continue
+            try:
+                await self.broadcast_task_update()
+                await self.broadcast_system_update()
+                await self.push_log_tail()
+            except Exception as e:
+                logger.error(f"差分プッシュエラー: {str(e)}")
     
     def get_system_info(self):
         """システム情報を取得"""
@@ -1573,11 +2008,11 @@ document.addEventListener('DOMContentLoaded', initAdminPanel);
         server_start_time = getattr(server, 'start_time', time.time())
         server_uptime = time.time() - server_start_time
         
-        # タスク統計
-        tasks = task_queue.get_all_tasks()
-        completed_tasks = sum(1 for t in tasks if t["status"] == TaskStatus.COMPLETED.value)
-        pending_tasks = sum(1 for t in tasks if t["status"] == TaskStatus.PENDING.value)
-        running_tasks = sum(1 for t in tasks if t["status"] == TaskStatus.RUNNING.value)
+        # タスク統計（キューが維持するカウンタを参照）
+        status_counts = task_queue.get_status_counts()
+        completed_tasks = status_counts[TaskStatus.COMPLETED.value]
+        pending_tasks = status_counts[TaskStatus.PENDING.value]
+        running_tasks = status_counts[TaskStatus.RUNNING.value]
         
         return {
             "server_running": server.is_running() if server else False,
@@ -1590,9 +2025,32 @@ document.addEventListener('DOMContentLoaded', initAdminPanel);
             "pending_tasks": pending_tasks,
             "running_tasks": running_tasks,
             "memory_used": memory_used,
-            "memory_total": memory_total
+            "memory_total": memory_total,
+            "disk_cache": self.get_cache_info(0).get("stats")
         }
     
+    def get_cache_info(self, limit=20):
+        """ディスクキャッシュの統計情報を取得"""
+        if not DISK_CACHE_AVAILABLE:
+            return {"available": False, "stats": None, "entries": []}
+        
+        try:
+            cache = get_disk_cache()
+            return {
+                "available": True,
+                "stats": cache.get_stats(),
+                "entries": cache.list_entries(limit) if limit else []
+            }
+        except Exception as e:
+            logger.error(f"キャッシュ統計取得エラー: {str(e)}")
+            return {"available": False, "stats": None, "entries": [], "error": str(e)}
+    
+    def clear_disk_cache(self, pattern=None):
+        """ディスクキャッシュをクリア"""
+        if not DISK_CACHE_AVAILABLE:
+            return 0
+        return get_disk_cache().clear(pattern)
+    
     def get_tasks(self):
         """全タスク情報を取得"""
         task_queue = get_task_queue()
@@ -1654,23 +2112,30 @@ document.addEventListener('DOMContentLoaded', initAdminPanel);
         
         return task_id
     
-    def get_logs(self, limit=100, level=None):
-        """ログエントリを取得"""
-        # 本来はログファイルから読み取るべきだが、簡易実装として
-        # ダミーのログエントリを返す
-        logs = []
-        for i in range(limit):
-            log_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-            log_level = "INFO"
-            log_message = f"サンプルログエントリ #{i+1}"
-            
-            logs.append({
-                "time": log_time,
-                "level": log_level,
-                "message": log_message
-            })
+    def get_profiler_info(self, top=5):
+        """メインスレッドプロファイラの設定と集計を取得"""
+        if not TASK_PROFILER_AVAILABLE:
+            return {"available": False}
+        return dict(task_profiler.get_summary(top), available=True)
+    
+    def get_logs(self, limit=100, level=None, logger_name=None, search=None, before=None, after=None):
+        """
+        ログリングバッファからログを取得
         
-        return logs
+        Args:
+            limit: 最大件数
+            level: 最小レベル（info / warning / error など）
+            logger_name: ロガー名（子ロガーを含む）
+            search: メッセージの検索文字列
+            before: この連番より古いログ（ページング用カーソル）
+            after: この連番より新しいログ（テール用カーソル）
+            
+        Returns:
+            entries / next_cursor / latest を含む辞書
+        """
+        if not LOG_BUFFER_AVAILABLE:
+            return {"entries": [], "next_cursor": None, "latest": 0}
+        return get_log_buffer().query(limit, level, logger_name, search, before, after)
     
     def save_settings(self, settings):
         """設定を保存"""
@@ -1696,6 +2161,14 @@ document.addEventListener('DOMContentLoaded', initAdminPanel);
                     task_queue.stop()
                     task_queue.start()
             
+            # ディスクキャッシュ上限の更新
+            if DISK_CACHE_AVAILABLE and ("cache_max_bytes" in settings or "cache_max_age" in settings):
+                from ...utils.disk_cache import configure_disk_cache
+                configure_disk_cache(
+                    max_bytes=int(settings["cache_max_bytes"]) if "cache_max_bytes" in settings else None,
+                    max_age=float(settings["cache_max_age"]) if "cache_max_age" in settings else None
+                )
+            
             return True
         except Exception as e:
             logger.error(f"設定保存エラー: {str(e)}")
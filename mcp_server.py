@@ -6,12 +6,43 @@ LLMとBlenderをつなぐMCPサーバーの実装
 import asyncio
 import json
 import logging
-from typing import Dict, Any
+import os
+import random
+import time
+from collections import deque
+from typing import Dict, Any, Optional
 from mcp.server import Server, Tool
 from mcp.types import Resource, Prompt
 
 logger = logging.getLogger(__name__)
 
+# Blenderへの接続プール設定
+HTTP_POOL_SIZE = int(os.environ.get('MCP_HTTP_POOL_SIZE', '8'))
+HTTP_KEEPALIVE_TIMEOUT = float(os.environ.get('MCP_HTTP_KEEPALIVE', '60'))
+HTTP_REQUEST_TIMEOUT = float(os.environ.get('MCP_HTTP_TIMEOUT', '60'))
+
+# Blenderがビジーな場合のリトライ設定
+HTTP_MAX_RETRIES = int(os.environ.get('MCP_HTTP_RETRIES', '3'))
+HTTP_RETRY_BACKOFF = float(os.environ.get('MCP_HTTP_BACKOFF', '0.2'))
+HTTP_RETRY_MAX_DELAY = 5.0
+RETRY_STATUS_CODES = (429, 502, 503, 504)
+# ミューテーションは処理前に拒否されたことが確実な応答のみリトライ
+# （502/504はBlender側で実行済みの可能性がある）
+MUTATION_RETRY_STATUS_CODES = (429, 503)
+
+# レイテンシ統計に保持するサンプル数
+LATENCY_SAMPLES = 1000
+
+
+class BlenderBusyError(Exception):
+    """Blenderが一時的に応答できない（リトライ対象）"""
+    
+    def __init__(self, status: int, retry_after: Optional[float] = None):
+        super().__init__(f"Blender is busy (HTTP {status})")
+        self.status = status
+        self.retry_after = retry_after
+
+
 class BlenderMCPServer(Server):
     """
     MCPサーバー実装
@@ -22,6 +53,122 @@ class BlenderMCPServer(Server):
         super().__init__("blender-mcp")
         self.blender_url = "http://localhost:8000/graphql"
         
+        # 全ツール呼び出しで共有するHTTPセッション（keep-alive接続をプール）
+        self._session = None
+        self._session_lock = asyncio.Lock()
+        
+        # リクエストのレイテンシ統計
+        self._latencies = deque(maxlen=LATENCY_SAMPLES)
+        self._metrics = {
+            'requests': 0,
+            'errors': 0,
+            'retries': 0,
+            'total_time_ms': 0.0,
+            'max_time_ms': 0.0,
+        }
+    
+    async def _get_session(self):
+        """共有セッションを取得（初回呼び出し時に作成）"""
+        if self._session is not None and not self._session.closed:
+            return self._session
+        
+        async with self._session_lock:
+            if self._session is None or self._session.closed:
+                import aiohttp
+                connector = aiohttp.TCPConnector(
+                    limit=HTTP_POOL_SIZE,
+                    keepalive_timeout=HTTP_KEEPALIVE_TIMEOUT
+                )
+                self._session = aiohttp.ClientSession(
+                    connector=connector,
+                    timeout=aiohttp.ClientTimeout(total=HTTP_REQUEST_TIMEOUT)
+                )
+        return self._session
+    
+    async def close(self):
+        """共有セッションを閉じる"""
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
+    
+    def _record_latency(self, elapsed_ms: float, success: bool):
+        """リクエストのレイテンシを記録"""
+        self._latencies.append(elapsed_ms)
+        self._metrics['requests'] += 1
+        self._metrics['total_time_ms'] += elapsed_ms
+        self._metrics['max_time_ms'] = max(self._metrics['max_time_ms'], elapsed_ms)
+        if not success:
+            self._metrics['errors'] += 1
+    
+    def get_metrics(self) -> Dict[str, Any]:
+        """Blenderへのリクエストのレイテンシ統計を取得"""
+        metrics = dict(self._metrics)
+        samples = sorted(self._latencies)
+        if samples:
+            metrics['avg_time_ms'] = metrics['total_time_ms'] / metrics['requests']
+            metrics['p50_time_ms'] = samples[len(samples) // 2]
+            metrics['p95_time_ms'] = samples[min(len(samples) - 1, int(len(samples) * 0.95))]
+        
+        if self._session is not None and not self._session.closed:
+            connector = self._session.connector
+            metrics['pool_size'] = connector.limit
+        return metrics
+    
+    async def _post_graphql(self, payload: Dict[str, Any], idempotent: bool = True) -> Dict[str, Any]:
+        """
+        GraphQLリクエストをBlenderに送信
+        
+        共有セッションを使うため、並行するツール呼び出しはプール内の
+        keep-alive接続を再利用する。接続失敗やビジー応答（429/5xx）は
+        指数バックオフでリトライする。
+        
+        Args:
+            payload: GraphQLリクエスト本文
+            idempotent: Falseの場合、送信済みの可能性がある失敗（切断・タイムアウト・
+                502/504）は二重実行を避けるためリトライせず、429/503と接続失敗のみリトライする
+            
+        Returns:
+            GraphQLレスポンス
+        """
+        import aiohttp
+        
+        attempt = 0
+        while True:
+            start_time = time.perf_counter()
+            try:
+                session = await self._get_session()
+                async with session.post(self.blender_url, json=payload) as response:
+                    if response.status in RETRY_STATUS_CODES:
+                        retry_after = response.headers.get('Retry-After')
+                        raise BlenderBusyError(
+                            response.status,
+                            float(retry_after) if retry_after and retry_after.isdigit() else None
+                        )
+                    result = await response.json()
+                self._record_latency((time.perf_counter() - start_time) * 1000, True)
+                return result
+            except (BlenderBusyError, aiohttp.ClientConnectionError, asyncio.TimeoutError) as e:
+                self._record_latency((time.perf_counter() - start_time) * 1000, False)
+                if idempotent:
+                    retryable = True
+                elif isinstance(e, BlenderBusyError):
+                    retryable = e.status in MUTATION_RETRY_STATUS_CODES
+                else:
+                    retryable = isinstance(e, aiohttp.ClientConnectorError)
+                if not retryable or attempt >= HTTP_MAX_RETRIES:
+                    logger.error(f"Blenderへのリクエストに失敗しました（{attempt + 1}回試行）: {e}")
+                    raise
+                
+                delay = min(HTTP_RETRY_MAX_DELAY, HTTP_RETRY_BACKOFF * (2 ** attempt))
+                if isinstance(e, BlenderBusyError) and e.retry_after is not None:
+                    delay = min(HTTP_RETRY_MAX_DELAY, e.retry_after)
+                delay *= random.uniform(0.8, 1.2)
+                
+                attempt += 1
+                self._metrics['retries'] += 1
+                logger.warning(f"Blenderへのリクエストをリトライします（{attempt}/{HTTP_MAX_RETRIES}、{delay:.2f}秒後）: {e}")
+                await asyncio.sleep(delay)
+        
     async def list_tools(self) -> list[Tool]:
         """利用可能なツールのリスト"""
         return [
@@ -79,17 +226,11 @@ class BlenderMCPServer(Server):
         """
         
         # Blenderに送信
-        import aiohttp
-        async with aiohttp.ClientSession() as session:
-            async with session.post(
-                self.blender_url,
-                json={
-                    "query": query,
-                    "variables": {"cmd": command}
-                }
-            ) as response:
-                result = await response.json()
-                
+        result = await self._post_graphql({
+            "query": query,
+            "variables": {"cmd": command}
+        }, idempotent=False)
+        
         # 結果を返す
         execution_result = result.get("data", {}).get("executeNaturalCommand", {})
         
@@ -120,13 +261,7 @@ class BlenderMCPServer(Server):
         """
         
         # Blenderに送信
-        import aiohttp
-        async with aiohttp.ClientSession() as session:
-            async with session.post(
-                self.blender_url,
-                json={"query": query}
-            ) as response:
-                result = await response.json()
+        result = await self._post_graphql({"query": query})
         
         return result.get("data", {}).get("sceneContext", {})
     
@@ -138,6 +273,12 @@ class BlenderMCPServer(Server):
                 name="Current Scene",
                 description="現在のBlenderシーン情報",
                 mime_type="application/json"
+            ),
+            Resource(
+                uri="blender://bridge/metrics",
+                name="Bridge Metrics",
+                description="Blenderへのリクエストのレイテンシ統計",
+                mime_type="application/json"
             )
         ]
     
@@ -146,6 +287,8 @@ class BlenderMCPServer(Server):
         if uri == "blender://scene":
             state = await self.get_blender_state()
             return json.dumps(state, indent=2)
+        elif uri == "blender://bridge/metrics":
+            return json.dumps(self.get_metrics(), indent=2)
         else:
             raise ValueError(f"Unknown resource: {uri}")
     
@@ -169,13 +312,16 @@ async def main():
     server = BlenderMCPServer()
     
     # MCPプロトコルで通信開始
-    async with asyncio.create_server(
-        lambda: server.handle_connection(),
-        'localhost',
-        3000
-    ) as server_instance:
-        logger.info("MCP Server running on localhost:3000")
-        await server_instance.serve_forever()
+    try:
+        async with asyncio.create_server(
+            lambda: server.handle_connection(),
+            'localhost',
+            3000
+        ) as server_instance:
+            logger.info("MCP Server running on localhost:3000")
+            await server_instance.serve_forever()
+    finally:
+        await server.close()
 
 if __name__ == "__main__":
     logging.basicConfig(level=logging.INFO)
@@ -1,40 +1,54 @@
 """
 Unified MCP GraphQL Module
 GraphQL APIとクエリ処理を提供
+
+サブモジュールとGraphQLライブラリはアドオン起動時にはインポートせず、
+最初に必要になった時点でロードする（utils.lazy_loaderを参照）。
 """
 
-import importlib
+import sys
 import logging
+import importlib.util
 
 # ロガー設定
 logger = logging.getLogger('unified_mcp.graphql')
 
-# GraphQLライブラリをチェック
+try:
+    from ..utils.lazy_loader import make_module_getattr, profiled_import, profiler
+except (ImportError, ValueError):
+    # トップレベルパッケージとして読み込まれた場合
+    from utils.lazy_loader import make_module_getattr, profiled_import, profiler
+
+# GraphQLライブラリをチェック（インポートせずにメタデータのみ確認）
 GRAPHQL_AVAILABLE = False
 GRAPHQL_VERSION = None
 REQUIRED_VERSION = (3, 0, 0)
 
-try:
-    import tools
-    
-    # バージョンの取得と互換性チェック
+
+def _check_graphql_version():
+    """graphql-coreをインポートせずにバージョンを確認"""
+    global GRAPHQL_AVAILABLE, GRAPHQL_VERSION
+
+    if importlib.util.find_spec('graphql') is None:
+        logger.warning("GraphQLライブラリが見つかりません")
+        logger.info("インストール方法: cd /Applications/Blender.app/Contents/Resources/4.4/python/bin && ./python3.11 -m pip install graphql-core>=3.0.0")
+        return
+
     try:
-        version_str = getattr(graphql, '__version__', '0.0.0')
+        try:
+            from importlib.metadata import version as package_version
+        except ImportError:
+            # Python 3.7
+            from importlib_metadata import version as package_version
+        version_str = package_version('graphql-core')
+
         # 数字以外の文字を取り除いてバージョン文字列をクリーンアップ
         import re
-        version_clean = re.sub(r'[^0-9\.]', '', version_str)
-        version_parts = version_clean.split('.')
-        
-        # バージョン番号を整数リストに変換
-        GRAPHQL_VERSION = tuple(
-            int(part) for part in version_parts[:3] if part.isdigit()
-        )
-        
-        # 足りない箇所は0で埋める
+        version_parts = re.sub(r'[^0-9\.]', '', version_str).split('.')
+        GRAPHQL_VERSION = tuple(int(part) for part in version_parts[:3] if part.isdigit())
         while len(GRAPHQL_VERSION) < 3:
             GRAPHQL_VERSION = GRAPHQL_VERSION + (0,)
-        
-        # バージョンチェック
+
         if GRAPHQL_VERSION >= REQUIRED_VERSION:
             GRAPHQL_AVAILABLE = True
             logger.info(f"GraphQLライブラリが利用可能です (バージョン: {version_str})")
@@ -47,101 +61,49 @@ try:
         GRAPHQL_AVAILABLE = True
         logger.info("GraphQLバージョン確認に失敗しましたが、使用を試みます")
 
-except ImportError as e:
-    logger.warning(f"GraphQLライブラリが見つかりません: {e}")
-    logger.info("インストール方法: cd /Applications/Blender.app/Contents/Resources/4.4/python/bin && ./python3.11 -m pip install graphql-core>=3.0.0")
-
-# 循環参照を避けるための順序付きインポート
-# まずschemaを読み込み、次にresolversを読み込みます
-MODULES_LOADED = False
-
-if "schema" in locals():
-    # 循環参照を避けるための順序付きリロード
-    importlib.reload(schema)  # まずスキーマをリロード
-    importlib.reload(resolver)  # 次にリゾルバーをリロード
-    importlib.reload(hole_penetration)  # ホール調査モジュールをリロード
-    importlib.reload(api)  # APIは最後にリロード（他に依存するため）
-else:
-    try:
-        # 循環参照を避けるための順序付き初期読み込み
-        logger.info("GraphQLモジュールを順序付きで読み込みます...")
-        from . import schema
-        logger.info("schemaモジュールを読み込みました")
-        
-        from . import resolver
-        logger.info("resolverモジュールを読み込みました")
-        
-        from . import hole_penetration
-        logger.info("hole_penetrationモジュールを読み込みました")
-        
-        from . import api
-        logger.info("apiモジュールを読み込みました")
-        
-        MODULES_LOADED = True
-    except ImportError as e:
-        MODULES_LOADED = False
-        logger.error(f"GraphQLモジュールインポートエラー: {e}")
-        import traceback
-        logger.debug(traceback.format_exc())
-
-# APIをエクスポート
-if GRAPHQL_AVAILABLE and MODULES_LOADED:
-    try:
-        from .api import (
-            query_blender,
-            set_spatial_relationship,
-            create_smart_object,
-            enhanced_boolean_operation
-        )
-        API_FUNCTIONS_LOADED = True
-    except ImportError as e:
-        API_FUNCTIONS_LOADED = False
-        logger.error(f"GraphQL API関数のインポートエラー: {e}")
-else:
-    API_FUNCTIONS_LOADED = False
-    if not GRAPHQL_AVAILABLE:
-        logger.warning("GraphQLライブラリがないため、API関数をインポートできません")
-
-API_REGISTERED = False
+
+_check_graphql_version()
+
+# 初回アクセス時にロードするサブモジュール（属性名 -> モジュール名）
+LAZY_SUBMODULES = {
+    'schema_registry': '.schema_registry',
+    'schema_builder': '.schema_builder',
+    'optimizer': '.optimizer',
+    'optimized_resolver': '.optimized_resolver',
+    'resolvers_vrm_extension': '.resolvers_vrm_extension',
+    'schema_vrm_extension': '.schema_vrm_extension',
+    'handlers': '.handlers',
+    'mcp_standard_server': '.mcp_standard_server',
+    'mcp_server_manager': '.mcp_server_manager',
+}
+
+
+def _resolve_lazy_attribute(name):
+    """サブモジュール以外の属性（GraphQL型）を解決"""
+    # 既存のスキーマモジュールは`from tools import GraphQLSchema`の形でGraphQL型を参照する
+    if GRAPHQL_AVAILABLE and not name.startswith('__'):
+        graphql = profiled_import('graphql', trigger=name)
+        if hasattr(graphql, name):
+            value = getattr(graphql, name)
+            setattr(sys.modules[__name__], name, value)
+            return value
+
+    raise AttributeError(f"module '{__name__}' has no attribute '{name}'")
+
+
+__getattr__ = make_module_getattr(__name__, LAZY_SUBMODULES, _resolve_lazy_attribute)
+
 
 def register():
-    """GraphQLモジュールの登録"""
-    global API_REGISTERED
-    
+    """GraphQLモジュールの登録（スキーマ・リゾルバは初回リクエスト時にschema_builderでロード）"""
     if GRAPHQL_AVAILABLE:
-        try:
-            # リゾルバ関数のエイリアスを読み込み
-            from . import resolvers_alias
-            
-            # API登録
-            from . import api
-            api.register()
-            API_REGISTERED = True
-            logger.info("GraphQL APIを登録しました")
-        except Exception as e:
-            logger.error(f"GraphQLモジュールの登録エラー: {e}")
-            logger.error(traceback.format_exc())
-            API_REGISTERED = False
+        logger.info("GraphQLモジュールを遅延ロード用に登録しました")
     else:
-        logger.warning("GraphQLライブラリが利用できないため、API登録をスキップします")
-        API_REGISTERED = False
+        logger.warning("GraphQLライブラリが利用できないため、スキーマは提供されません")
         logger.info("インストール方法: cd /Applications/Blender.app/Contents/Resources/4.4/python/bin && ./python3.11 -m pip install graphql-core")
 
+
 def unregister():
     """GraphQLモジュールの登録解除"""
     logger.info("GraphQLモジュールを登録解除しています...")
-    
-    # 登録されていれば登録解除
-    if MODULES_LOADED:
-        try:
-            hole_penetration.unregister()
-            api.unregister()
-            resolver.unregister()
-            schema.unregister()
-            logger.info("GraphQLモジュールの登録解除が完了しました")
-        except Exception as e:
-            logger.error(f"GraphQLモジュール登録解除エラー: {e}")
-            import traceback
-            logger.debug(traceback.format_exc())
-    else:
-        logger.info("GraphQLモジュールは登録されていません")
\ No newline at end of file
+    profiler.save()
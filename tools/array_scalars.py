@@ -0,0 +1,190 @@
+"""
+Blender GraphQL MCP - バイナリ配列スカラー
+数値配列をbase64エンコードしたリトルエンディアンのバッファとして送受信するGraphQLスカラー
+"""
+
+import logging
+from typing import Any, Dict, Optional
+
+import numpy as np
+
+try:
+    from ..utils.array_codec import encode_base64, decode_float32, FLOAT32_LE
+except (ImportError, ValueError):
+    from utils.array_codec import encode_base64, decode_float32, FLOAT32_LE
+
+from graphql import GraphQLScalarType, GraphQLError
+from graphql.language import StringValueNode, ListValueNode, FloatValueNode, IntValueNode, BooleanValueNode
+
+logger = logging.getLogger("blender_graphql_mcp.tools.array_scalars")
+
+# Float32Array版フィールドの接尾辞（location → location_packed）
+PACKED_SUFFIX = '_packed'
+
+
+def serialize_float32_array(value: Any) -> str:
+    """
+    配列をbase64文字列に変換（出力）
+
+    Args:
+        value: NumPy配列または数値のシーケンス（多次元は平坦化）
+
+    Returns:
+        リトルエンディアンfloat32バッファのbase64文字列
+    """
+    if isinstance(value, str):
+        # エンコード済み
+        return value
+    return encode_base64(value, FLOAT32_LE)
+
+
+def parse_float32_array_value(value: Any):
+    """
+    変数で渡された値を配列に変換（入力）
+
+    base64文字列と数値リストの両方を受け付ける。
+
+    Args:
+        value: base64文字列または数値リスト
+
+    Returns:
+        float32のNumPy配列
+    """
+    try:
+        return decode_float32(value)
+    except Exception as e:
+        raise GraphQLError(f"Float32Arrayとして解釈できません: {e}")
+
+
+def parse_float32_array_literal(value_node, variables: Optional[Dict[str, Any]] = None):
+    """
+    クエリ内のリテラルを配列に変換（入力）
+
+    Args:
+        value_node: 文字列リテラル（base64）または数値のリストリテラル
+
+    Returns:
+        float32のNumPy配列
+    """
+    if isinstance(value_node, StringValueNode):
+        return parse_float32_array_value(value_node.value)
+    if isinstance(value_node, ListValueNode):
+        values = []
+        for item in value_node.values:
+            if not isinstance(item, (FloatValueNode, IntValueNode)):
+                raise GraphQLError("Float32Arrayのリストには数値のみ指定できます")
+            values.append(float(item.value))
+        return parse_float32_array_value(values)
+    raise GraphQLError("Float32Arrayにはbase64文字列または数値のリストを指定してください")
+
+
+Float32ArrayScalar = GraphQLScalarType(
+    name='Float32Array',
+    description='リトルエンディアンfloat32配列のbase64エンコード。入力では数値のリストも受け付ける',
+    serialize=serialize_float32_array,
+    parse_value=parse_float32_array_value,
+    parse_literal=parse_float32_array_literal
+)
+
+
+def serialize_numeric_array(value: Any):
+    """
+    NumericArrayの出力（base64文字列はそのまま、配列は数値リスト）
+    """
+    if isinstance(value, str) or value is None:
+        return value
+    return np.asarray(value).ravel().tolist()
+
+
+def parse_numeric_array_value(value: Any):
+    """
+    変数で渡された値を検証（入力）
+
+    データ型は書き込み先の属性が決まってから適用するため、値は変換せずに返す。
+    整数の精度を保つため、float32への変換は行わない。
+
+    Args:
+        value: base64文字列または数値リスト
+
+    Returns:
+        base64文字列または数値リスト
+    """
+    if isinstance(value, str):
+        return value
+    if isinstance(value, (list, tuple)) and all(isinstance(item, (int, float, bool)) for item in value):
+        return list(value)
+    raise GraphQLError("NumericArrayにはbase64文字列または数値のリストを指定してください")
+
+
+def parse_numeric_array_literal(value_node, variables: Optional[Dict[str, Any]] = None):
+    """
+    クエリ内のリテラルを検証（入力）
+
+    Args:
+        value_node: 文字列リテラル（base64）または数値・真偽値のリストリテラル
+
+    Returns:
+        base64文字列または数値リスト（整数リテラルはintのまま）
+    """
+    if isinstance(value_node, StringValueNode):
+        return value_node.value
+    if isinstance(value_node, ListValueNode):
+        values = []
+        for item in value_node.values:
+            if isinstance(item, IntValueNode):
+                values.append(int(item.value))
+            elif isinstance(item, FloatValueNode):
+                values.append(float(item.value))
+            elif isinstance(item, BooleanValueNode):
+                values.append(item.value)
+            else:
+                raise GraphQLError("NumericArrayのリストには数値のみ指定できます")
+        return values
+    raise GraphQLError("NumericArrayにはbase64文字列または数値のリストを指定してください")
+
+
+NumericArrayScalar = GraphQLScalarType(
+    name='NumericArray',
+    description=('書き込み先のデータ型で解釈する数値配列。base64はそのデータ型（INTはint32、'
+                 'FLOATはfloat32）のリトルエンディアンバッファ。数値のリストも受け付ける'),
+    serialize=serialize_numeric_array,
+    parse_value=parse_numeric_array_value,
+    parse_literal=parse_numeric_array_literal
+)
+
+
+def resolve_array_field(result, info):
+    """
+    結果辞書に格納したNumPy配列を平坦な数値リストとして返すフィールドリゾルバ
+
+    フィールド名と同じキーの値を返す。配列はリゾルバ側でNumPyのまま保持し、
+    このフィールドが選択された場合のみリストに変換する。
+
+    Args:
+        result: 親フィールドの結果辞書
+        info: GraphQLの実行情報
+
+    Returns:
+        数値のリスト
+    """
+    value = result.get(info.field_name) if isinstance(result, dict) else None
+    if value is None or isinstance(value, list):
+        return value
+    return value.ravel().tolist()
+
+
+def resolve_packed_array_field(result, info):
+    """
+    結果辞書に格納したNumPy配列をそのまま返すFloat32Arrayフィールドのリゾルバ
+
+    フィールド名から "_packed" を除いたキーの値を返す（location_packed → location）。
+
+    Args:
+        result: 親フィールドの結果辞書
+        info: GraphQLの実行情報
+
+    Returns:
+        NumPy配列（Float32Arrayのserializeでbase64に変換される）
+    """
+    key = info.field_name[:-len(PACKED_SUFFIX)] if info.field_name.endswith(PACKED_SUFFIX) else info.field_name
+    return result.get(key) if isinstance(result, dict) else None
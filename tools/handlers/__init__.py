@@ -297,6 +297,9 @@ def assign_material(obj, info, objectName, materialName):
 def textures(obj, info):
     return material_resolver.get_textures(obj, info)
 
+def materials_using_texture(obj, info, imageName):
+    return material_resolver.get_materials_using_texture(obj, info, imageName)
+
 def add_texture(obj, info, materialName, texturePath, textureType='color'):
     return material_resolver.add_texture(obj, info, materialName, texturePath, textureType)
 
@@ -455,6 +458,7 @@ resolve_boolean_operation = boolean_operation
 resolve_create_material = create_material
 resolve_assign_material = assign_material
 resolve_textures = textures
+resolve_materials_using_texture = materials_using_texture
 resolve_add_texture = add_texture
 resolve_create_camera = create_camera
 resolve_update_camera = update_camera
@@ -36,9 +36,16 @@ class ImprovedMCPResolvers:
     
     # クエリリゾルバー
     @with_error_handling
-    def resolve_scene_context(self, root, info) -> Dict[str, Any]:
-        """現在のシーンコンテキストを返す"""
-        context = self.context_manager.get_complete_context()
+    def resolve_scene_context(self, root, info, fields: Optional[List[str]] = None,
+                              limit: Optional[int] = None, cursor: Optional[str] = None) -> Dict[str, Any]:
+        """現在のシーンコンテキストを返す
+        
+        Args:
+            fields: 取得するフィールド（Noneで全セクション）
+            limit: selectedObjectsの1ページの件数（Noneで全件）
+            cursor: 前回のnextCursor
+        """
+        context = self.context_manager.get_complete_context(fields, limit, cursor)
         formatted_context = self._format_scene_context(context)
         
         return create_success_result(
@@ -262,7 +269,8 @@ class ImprovedMCPResolvers:
             "objectCount": scene.get("object_count", 0),
             "selectedObjects": self._format_objects(context.get("selected_objects", [])),
             "activeObject": self._format_object(context.get("active_object")),
-            "mode": context.get("mode", "")
+            "mode": context.get("mode", ""),
+            "nextCursor": context.get("page_info", {}).get("selected_objects", {}).get("next_cursor")
         }
     
     def _format_objects(self, objects: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
@@ -411,8 +419,8 @@ def get_improved_mcp_resolvers() -> ImprovedMCPResolvers:
     return _improved_mcp_resolvers
 
 # リゾルバー関数（GraphQLスキーマから呼び出される）
-def resolve_scene_context(root, info):
-    return get_improved_mcp_resolvers().resolve_scene_context(root, info)
+def resolve_scene_context(root, info, fields=None, limit=None, cursor=None):
+    return get_improved_mcp_resolvers().resolve_scene_context(root, info, fields, limit, cursor)
 
 def resolve_selected_objects(root, info):
     return get_improved_mcp_resolvers().resolve_selected_objects(root, info)
@@ -7,6 +7,10 @@ import os
 import logging
 from typing import Dict, List, Any, Optional, Union
 from .base import ResolverBase, handle_exceptions, ensure_material_exists, ensure_object_exists
+try:
+    from ...core.material_fingerprint_index import material_fingerprint_index
+except (ImportError, ValueError):
+    from core.material_fingerprint_index import material_fingerprint_index
 
 class MaterialResolver(ResolverBase):
     """マテリアル関連のGraphQLリゾルバクラス"""
@@ -77,42 +81,8 @@ class MaterialResolver(ResolverBase):
         Returns:
             List[Dict]: テクスチャ情報のリスト
         """
-        textures = []
-        
-        if not material.use_nodes or not material.node_tree:
-            return textures
-        
-        # テクスチャノードを検索
-        for node in material.node_tree.nodes:
-            if node.type == 'TEX_IMAGE' and node.image:
-                texture_type = "unknown"
-                
-                # テクスチャタイプを推測
-                for link in material.node_tree.links:
-                    if link.from_node == node:
-                        input_name = link.to_socket.name.lower()
-                        if "color" in input_name or "base" in input_name:
-                            texture_type = "color"
-                        elif "normal" in input_name:
-                            texture_type = "normal"
-                        elif "rough" in input_name:
-                            texture_type = "roughness"
-                        elif "metal" in input_name:
-                            texture_type = "metallic"
-                        elif "spec" in input_name:
-                            texture_type = "specular"
-                        elif "bump" in input_name or "displace" in input_name:
-                            texture_type = "bump"
-                        break
-                
-                textures.append({
-                    'name': node.image.name,
-                    'type': texture_type,
-                    'path': node.image.filepath,
-                    'resolution': [node.image.size[0], node.image.size[1]]
-                })
-        
-        return textures
+        # ノードツリーの解析結果はマテリアルフィンガープリントインデックスにキャッシュされる
+        return material_fingerprint_index.get_textures(material.name)
     
     @handle_exceptions
     def get_all(self, obj, info) -> List[Dict[str, Any]]:
@@ -178,6 +148,9 @@ class MaterialResolver(ResolverBase):
                 principled.inputs['Metallic'].default_value = metallic
                 principled.inputs['Roughness'].default_value = roughness
         
+        # 依存グラフの更新を待たずに解析し直す
+        material_fingerprint_index.invalidate(material.name)
+        
         return self.success_response(
             f"マテリアル '{material.name}' を作成しました",
             {'material': self._get_material_data(material)}
@@ -250,6 +223,22 @@ class MaterialResolver(ResolverBase):
         
         return textures
     
+    @handle_exceptions
+    def get_materials_using_texture(self, obj, info, imageName: str) -> List[str]:
+        """
+        指定した画像テクスチャを使用するマテリアル名を取得
+        
+        Args:
+            obj: GraphQLのルートオブジェクト
+            info: GraphQLの実行情報
+            imageName: 画像名
+            
+        Returns:
+            List[str]: マテリアル名のリスト
+        """
+        self.logger.debug(f"materialsUsingTexture リゾルバが呼び出されました: imageName={imageName}")
+        return material_fingerprint_index.get_materials_using_image(imageName)
+    
     @handle_exceptions
     def add_texture(self, obj, info, materialName: str, texturePath: str, textureType: str = 'color') -> Dict[str, Any]:
         """
@@ -335,6 +324,9 @@ class MaterialResolver(ResolverBase):
             links.new(tex_node.outputs['Color'], bump.inputs['Height'])
             links.new(bump.outputs['Normal'], principled.inputs['Normal'])
         
+        # 依存グラフの更新を待たずに解析し直す
+        material_fingerprint_index.invalidate(material.name)
+        
         return self.success_response(
             f"テクスチャ '{img_name}' をマテリアル '{materialName}' に追加しました",
             {'material': self._get_material_data(material)}
@@ -6,8 +6,12 @@ JSON-RPC 2.0 compliant MCP server that connects Blender to Language Models
 import asyncio
 import json
 import logging
+import os
+import time
 import uuid
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, Any, List, Optional, Union, Callable
+from urllib.parse import parse_qs
 import traceback
 import aiohttp
 from aiohttp import web
@@ -16,9 +20,30 @@ from aiohttp import web
 from Blender_GraphQL_MCP.tools.handlers.improved_mcp import get_improved_mcp_resolvers
 from Blender_GraphQL_MCP.core.blender_mcp import get_blender_mcp
 from Blender_GraphQL_MCP.core.blender_context import get_context_manager
+from Blender_GraphQL_MCP.core.threading import execute_in_main_thread
 
 logger = logging.getLogger('blender_graphql_mcp.tools.mcp_standard_server')
 
+# Maximum number of batch entries executing at the same time
+BATCH_CONCURRENCY = max(1, int(os.environ.get('MCP_BATCH_CONCURRENCY', '4')))
+
+# Methods that do not modify the scene and need not wait for earlier mutations in a batch
+READ_ONLY_METHODS = frozenset([
+    'tools/list',
+    'resources/list',
+    'resources/templates/list',
+    'resources/read',
+    'prompts/list',
+    'prompts/get',
+    'complete',
+    'context/get',
+])
+
+# Tools that only read the scene
+READ_ONLY_TOOLS = frozenset([
+    'scene.capturePreview',
+])
+
 # Standard JSON-RPC 2.0 error codes
 class ErrorCodes:
     PARSE_ERROR = -32700
@@ -78,6 +103,12 @@ class MCPStandardServer:
         self.client_capabilities = {}
         self.runner = None
         self.site = None
+        
+        # Batch execution: entries run on Blender's main thread, worker threads only wait for them
+        self.batch_concurrency = BATCH_CONCURRENCY
+        self._batch_executor = None
+        self._batch_semaphore = None
+        self._mutation_lock = None
     
     async def start(self):
         """Start the MCP server"""
@@ -94,6 +125,9 @@ class MCPStandardServer:
             await self.site.stop()
         if self.runner:
             await self.runner.cleanup()
+        if self._batch_executor:
+            self._batch_executor.shutdown(wait=False)
+            self._batch_executor = None
         self.running = False
         logger.info("MCP Standard Server stopped")
     
@@ -113,8 +147,19 @@ class MCPStandardServer:
             
             # Check if it's a batch request
             if isinstance(body, list):
-                responses = [await self.process_single_request(req) for req in body]
-                return web.json_response(responses)
+                if not body:
+                    return web.json_response(self.make_error_response(
+                        None, ErrorCodes.INVALID_REQUEST, "Empty batch request"
+                    ))
+                
+                start_time = time.perf_counter()
+                responses = await self.process_batch_request(body)
+                headers = {'X-Batch-Duration-Ms': f"{(time.perf_counter() - start_time) * 1000:.2f}"}
+                
+                # A batch of notifications only gets no response body
+                if not responses:
+                    return web.Response(status=204, headers=headers)
+                return web.json_response(responses, headers=headers)
             else:
                 response = await self.process_single_request(body)
                 return web.json_response(response)
@@ -132,12 +177,119 @@ class MCPStandardServer:
                 None, ErrorCodes.INTERNAL_ERROR, f"Internal error: {str(e)}"
             ))
     
+    def is_read_only_request(self, request: Any) -> bool:
+        """Return True if the request does not modify the scene"""
+        if not isinstance(request, dict):
+            # Invalid entries only produce an error response
+            return True
+        
+        method = request.get('method')
+        if method == 'tools/call':
+            params = request.get('params') or {}
+            return isinstance(params, dict) and params.get('name') in READ_ONLY_TOOLS
+        # Unknown methods are ordered like mutations
+        return method in READ_ONLY_METHODS
+    
+    def _get_batch_primitives(self):
+        """Create the batch executor and synchronization primitives inside the server loop"""
+        if self._batch_executor is None:
+            self._batch_executor = ThreadPoolExecutor(
+                max_workers=self.batch_concurrency, thread_name_prefix='mcp-batch'
+            )
+        if self._batch_semaphore is None:
+            self._batch_semaphore = asyncio.Semaphore(self.batch_concurrency)
+            self._mutation_lock = asyncio.Lock()
+        return self._batch_executor, self._batch_semaphore, self._mutation_lock
+    
+    async def process_batch_request(self, requests: List[Any]) -> List[Dict[str, Any]]:
+        """
+        Process a JSON-RPC batch concurrently
+        
+        Every entry is handed to Blender's main-thread queue, since handlers
+        touch bpy. Worker threads (at most batch_concurrency) wait for the
+        results so the server loop stays free. Calls that modify the scene,
+        and unknown methods, are queued one after another in batch order;
+        read-only calls are queued as soon as a worker is free and do not
+        wait for mutations that precede them in the batch.
+        
+        Args:
+            requests: Batch entries
+            
+        Returns:
+            Responses in batch order, without notifications
+        """
+        executor, semaphore, mutation_lock = self._get_batch_primitives()
+        loop = asyncio.get_running_loop()
+        
+        async def run_read_only(request):
+            async with semaphore:
+                return await loop.run_in_executor(executor, self._run_on_main_thread, request, True)
+        
+        async def run_mutation(request, previous):
+            if previous is not None:
+                await asyncio.wait([previous])
+            async with mutation_lock:
+                async with semaphore:
+                    return await loop.run_in_executor(executor, self._run_on_main_thread, request, False)
+        
+        tasks = []
+        previous_mutation = None
+        for request in requests:
+            if self.is_read_only_request(request):
+                task = asyncio.ensure_future(run_read_only(request))
+            else:
+                task = asyncio.ensure_future(run_mutation(request, previous_mutation))
+                previous_mutation = task
+            tasks.append(task)
+        
+        results = await asyncio.gather(*tasks, return_exceptions=True)
+        
+        responses = []
+        for request, result in zip(requests, results):
+            if isinstance(result, Exception):
+                logger.error(f"Error processing batch entry: {str(result)}")
+                request_id = request.get('id') if isinstance(request, dict) else None
+                result = self.make_error_response(
+                    request_id, ErrorCodes.INTERNAL_ERROR, f"Internal error: {str(result)}"
+                )
+            if result is not None:
+                responses.append(result)
+        return responses
+    
+    def _run_on_main_thread(self, request: Any, read_only: bool) -> Optional[Dict[str, Any]]:
+        """Process a batch entry on Blender's main thread, blocking the calling worker"""
+        # The queue treats a None result as pending, so notifications travel in a tuple
+        (response,) = execute_in_main_thread(self._process_blocking, request, read_only)
+        return response
+    
+    def _process_blocking(self, request: Any, read_only: bool) -> tuple:
+        """Drive the handler coroutine to completion on the current thread"""
+        return (asyncio.run(self._process_timed(request, read_only)),)
+    
+    async def _process_timed(self, request: Any, read_only: bool) -> Optional[Dict[str, Any]]:
+        """Process a batch entry and attach its timing to the response metadata"""
+        start_time = time.perf_counter()
+        response = await self.process_single_request(request)
+        if response is None:
+            return None
+        
+        meta = {
+            'durationMs': round((time.perf_counter() - start_time) * 1000, 3),
+            'readOnly': read_only
+        }
+        if isinstance(response.get('result'), dict):
+            response['result'] = {**response['result'], '_meta': meta}
+        elif 'error' in response:
+            data = response['error'].get('data')
+            response['error']['data'] = {**data, '_meta': meta} if isinstance(data, dict) else {'_meta': meta}
+        return response
+    
     async def process_single_request(self, request: Dict[str, Any]) -> Dict[str, Any]:
         """Process a single JSON-RPC request"""
         # Check if it's a valid JSON-RPC 2.0 request
         if not isinstance(request, dict) or request.get('jsonrpc') != '2.0':
             return self.make_error_response(
-                request.get('id'), ErrorCodes.INVALID_REQUEST,
+                request.get('id') if isinstance(request, dict) else None, ErrorCodes.INVALID_REQUEST,
                 "Invalid JSON-RPC 2.0 request"
             )
         
@@ -432,9 +584,19 @@ class MCPStandardServer:
         if not uri:
             raise ValueError("Resource URI is required")
         
+        # Context paging is passed as a query string, e.g. blender://scene/context?limit=50&cursor=Cube
+        uri, _, query = uri.partition('?')
+        query_params = parse_qs(query)
+        
         # Handle different resource types
         if uri == 'blender://scene/context':
-            context_result = self.resolvers.resolve_scene_context(None, None)
+            limit = query_params.get('limit', [None])[0]
+            context_result = self.resolvers.resolve_scene_context(
+                None, None,
+                query_params.get('fields'),
+                int(limit) if limit is not None else None,
+                query_params.get('cursor', [None])[0]
+            )
             return {'content': json.dumps(context_result, indent=2)}
             
         elif uri == 'blender://scene/selected':
@@ -646,9 +808,18 @@ class MCPStandardServer:
         }
     
     async def get_context(self, params: Dict[str, Any]) -> Dict[str, Any]:
-        """Get the current Blender context"""
+        """
+        Get the current Blender context
+        
+        Optional params: fields (context sections such as "scene" or
+        "selected_objects.location"), limit (selected objects per page, all
+        when omitted) and cursor (nextCursor of the previous page).
+        """
         # This is a convenience method that wraps the standard context query
-        result = self.resolvers.resolve_scene_context(None, None)
+        params = params or {}
+        result = self.resolvers.resolve_scene_context(
+            None, None, params.get('fields'), params.get('limit'), params.get('cursor')
+        )
         return result
     
     # Tool implementation methods
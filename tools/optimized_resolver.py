@@ -16,7 +16,14 @@ from ..core.numpy_optimizers import (
     fast_mesh_analysis,
     find_nearest_objects,
     fast_raycast,
-    batch_vertex_colors
+    batch_raycast,
+    grid_ray_pattern,
+    hemisphere_ray_pattern,
+    batch_vertex_colors,
+    list_mesh_attributes,
+    read_mesh_attribute,
+    write_mesh_attribute,
+    mesh_attribute_dtype
 )
 from ..core.pandas_optimizers import (
     batch_object_properties,
@@ -25,6 +32,8 @@ from ..core.pandas_optimizers import (
     BatchProcessor
 )
 from ..core.query_cache import GraphQLQueryCache
+from ..utils.array_codec import decode_array
+from ..utils.metrics import get_metrics_registry
 
 logger = logging.getLogger("blender_graphql_mcp.optimized_resolver")
 
@@ -37,10 +46,17 @@ class OptimizedResolver:
     def __init__(self):
         self.dataframes = {}
         self.cache = query_cache
-        self.performance_stats = {
-            'total_queries': 0,
-            'cached_queries': 0,
-            'avg_response_time': 0
+        self.metrics = get_metrics_registry()
+    
+    @property
+    def performance_stats(self) -> Dict[str, Any]:
+        """objectsクエリの統計（共有メトリクスレジストリから集計）"""
+        latency = self.metrics.get_latency("resolver", "objects")
+        return {
+            'total_queries': latency['count'],
+            'cached_queries': int(self.metrics.snapshot()['counters'].get('cached_queries', 0)),
+            'avg_response_time': latency['avg_ms'] / 1000.0,
+            'p95_response_time': latency['p95_ms'] / 1000.0
         }
     
     def prepare_dataframes(self):
@@ -99,6 +115,7 @@ class OptimizedResolver:
         cached_result = self.cache.get(cache_key, {})
         if cached_result:
             logger.debug(f"objectsクエリのキャッシュヒット: {time.time() - start_time:.4f}秒")
+            self.metrics.inc("cached_queries")
             return cached_result
         
         # キャッシュされたDataFrameがなければ準備
@@ -141,11 +158,7 @@ class OptimizedResolver:
         logger.info(f"objectsクエリ実行: {len(result)}件, 処理時間: {processing_time:.4f}秒")
         
         # パフォーマンス統計を更新
-        self.performance_stats['total_queries'] += 1
-        self.performance_stats['avg_response_time'] = (
-            (self.performance_stats['avg_response_time'] * (self.performance_stats['total_queries'] - 1)) 
-            + processing_time
-        ) / self.performance_stats['total_queries']
+        self.metrics.observe("resolver", "objects", processing_time * 1000)
         
         return result
     
@@ -289,6 +302,112 @@ class OptimizedResolver:
         
         return result
     
+    def resolve_batch_raycast(self, info, origins=None, directions=None, max_distance=100.0,
+                              object_names=None, grid=None, hemisphere=None):
+        """複数のレイを一括でキャスト
+        
+        Args:
+            info: GraphQLの解決情報
+            origins: レイの開始点（フラットな [x, y, z, ...]）
+            directions: レイの方向（フラットな配列、3要素なら全レイ共通）
+            max_distance: 最大検索距離
+            object_names: 対象オブジェクト名のリスト
+            grid: 格子パターン {center, size, resolution, height, direction}
+            hemisphere: 半球パターン {origin, count, up}
+        
+        Returns:
+            dict: パックされたヒット情報（配列はNumPy配列）
+        """
+        start_time = time.time()
+        
+        try:
+            if grid:
+                origins, directions = grid_ray_pattern(
+                    grid['center'], grid['size'], grid['resolution'],
+                    grid.get('height', 100.0), grid.get('direction') or (0.0, 0.0, -1.0)
+                )
+            elif hemisphere:
+                origins, directions = hemisphere_ray_pattern(
+                    hemisphere['origin'], hemisphere['count'], hemisphere.get('up') or (0.0, 0.0, 1.0)
+                )
+            elif origins is None or directions is None:
+                return {'ray_count': 0, 'hit_count': 0, 'error': 'origins/directions またはパターンを指定してください'}
+            
+            result = batch_raycast(origins, directions, max_distance, object_names)
+        except Exception as e:
+            logger.error(f"バッチレイキャスト中にエラー発生: {str(e)}")
+            return {'ray_count': 0, 'hit_count': 0, 'error': str(e)}
+        
+        processing_time = time.time() - start_time
+        logger.info(f"batchRaycastクエリ実行: {result['ray_count']}レイ, 処理時間: {processing_time:.4f}秒")
+        
+        # 配列はNumPyのまま返し、選択されたフィールド（リスト / Float32Array）の形式で変換する
+        result['processing_time_ms'] = processing_time * 1000
+        return result
+    
+    def resolve_mesh_attributes(self, info, object_name):
+        """メッシュで読み書きできる属性の一覧を取得
+        
+        Args:
+            info: GraphQLの解決情報
+            object_name: 対象オブジェクト名
+        
+        Returns:
+            list: 属性メタデータのリスト
+        """
+        try:
+            return list_mesh_attributes(object_name)
+        except KeyError as e:
+            logger.warning(str(e))
+            return []
+    
+    def resolve_mesh_attribute(self, info, object_name, attribute, start=0, count=None):
+        """メッシュ属性を一括で読み込む
+        
+        Args:
+            info: GraphQLの解決情報
+            object_name: 対象オブジェクト名
+            attribute: 属性名（co, normal, uv, uv:<名前>, 名前付き属性）
+            start: 開始要素インデックス
+            count: 要素数（Noneで末尾まで）
+        
+        Returns:
+            dict: 属性メタデータと値（NumPy配列）
+        """
+        try:
+            return read_mesh_attribute(object_name, attribute, start, count)
+        except (KeyError, ValueError) as e:
+            logger.warning(f"属性読み込みエラー: {str(e)}")
+            return {'name': attribute, 'error': str(e)}
+    
+    def resolve_set_mesh_attribute(self, info, object_name, attribute, values, start=0,
+                                   domain=None, data_type=None):
+        """メッシュ属性を一括で書き込む
+        
+        Args:
+            info: GraphQLの解決情報
+            object_name: 対象オブジェクト名
+            attribute: 属性名
+            values: 書き込む値（base64文字列または数値リスト）
+            start: 開始要素インデックス
+            domain: 新規作成時のドメイン
+            data_type: 新規作成時のデータ型
+        
+        Returns:
+            dict: 書き込み結果
+        """
+        try:
+            # 整数属性の精度を保つため、書き込み先のデータ型でデコード
+            values = decode_array(values, mesh_attribute_dtype(object_name, attribute, data_type))
+            result = write_mesh_attribute(object_name, attribute, values, start, domain, data_type)
+        except (KeyError, ValueError, IndexError, OverflowError) as e:
+            logger.warning(f"属性書き込みエラー: {str(e)}")
+            return {'success': False, 'name': attribute, 'error': str(e)}
+        
+        # ジオメトリが変わったのでキャッシュを無効化
+        self.cache.invalidate_type("Mesh")
+        return result
+    
     def resolve_transform_vertices(self, info, object_name, transform_matrix):
         """オブジェクトの頂点を変換
         
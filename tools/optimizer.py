@@ -5,8 +5,14 @@ GraphQLクエリとリゾルバの最適化ユーティリティ
 import logging
 import time
 import functools
+import threading
 from typing import Dict, Any, Callable, List, Optional, TypeVar, cast
 
+try:
+    from ..utils.metrics import get_metrics_registry
+except (ImportError, ValueError):
+    from utils.metrics import get_metrics_registry
+
 logger = logging.getLogger("blender_graphql_mcp.tools.optimizer")
 
 # 型変数
@@ -172,12 +178,14 @@ def cache_query(ttl_seconds: int = 60):
     
     return decorator
 
-# パフォーマンスメトリクス
-_performance_counters = {
-    "total_queries": 0,
-    "slow_queries": 0,   # 500ms以上のクエリ
-    "very_slow_queries": 0,  # 1000ms以上のクエリ
-    "total_execution_time": 0.0,
+# パフォーマンスメトリクス（回数・レイテンシは共有メトリクスレジストリに記録）
+METRICS_SUBSYSTEM = "resolver"
+SLOW_QUERY_MS = 500
+VERY_SLOW_QUERY_MS = 1000
+
+# ピーク時のクエリ（更新はまれなのでロックで保護）
+_peak_lock = threading.Lock()
+_peak_query = {
     "peak_execution_time": 0.0,
     "peak_query": ""
 }
@@ -189,12 +197,29 @@ def get_performance_metrics() -> Dict[str, Any]:
     Returns:
         パフォーマンスメトリクスの詳細情報
     """
-    metrics = dict(_performance_counters)
+    snapshot = get_metrics_registry().snapshot(METRICS_SUBSYSTEM)
+    resolvers = snapshot["latency"].get(METRICS_SUBSYSTEM, {})
+    label = f"subsystem={METRICS_SUBSYSTEM}"
+    counters = snapshot["counters"]
+    
+    total_queries = sum(stats["count"] for stats in resolvers.values())
+    sampled_queries = sum(stats["sampled"] for stats in resolvers.values())
+    total_execution_time = sum(stats["sum_ms"] for stats in resolvers.values())
+    
+    with _peak_lock:
+        metrics = dict(_peak_query)
+    metrics.update({
+        "total_queries": total_queries,
+        "slow_queries": int(counters.get("slow_queries", {}).get(label, 0)),
+        "very_slow_queries": int(counters.get("very_slow_queries", {}).get(label, 0)),
+        "total_execution_time": total_execution_time,
+        "resolvers": resolvers
+    })
     
     # 平均実行時間を計算
-    if metrics["total_queries"] > 0:
-        metrics["avg_execution_time"] = metrics["total_execution_time"] / metrics["total_queries"]
-        metrics["slow_query_percent"] = (metrics["slow_queries"] / metrics["total_queries"]) * 100
+    if total_queries > 0:
+        metrics["avg_execution_time"] = total_execution_time / sampled_queries if sampled_queries else 0.0
+        metrics["slow_query_percent"] = (metrics["slow_queries"] / total_queries) * 100
     else:
         metrics["avg_execution_time"] = 0.0
         metrics["slow_query_percent"] = 0.0
@@ -206,15 +231,10 @@ def get_performance_metrics() -> Dict[str, Any]:
 
 def reset_performance_metrics():
     """パフォーマンスメトリクスをリセット"""
-    global _performance_counters
-    _performance_counters = {
-        "total_queries": 0,
-        "slow_queries": 0,
-        "very_slow_queries": 0,
-        "total_execution_time": 0.0,
-        "peak_execution_time": 0.0,
-        "peak_query": ""
-    }
+    get_metrics_registry().reset(METRICS_SUBSYSTEM)
+    with _peak_lock:
+        _peak_query["peak_execution_time"] = 0.0
+        _peak_query["peak_query"] = ""
     logger.info("パフォーマンスメトリクスをリセットしました")
 
 # 以前のパフォーマンス測定関数を拡張
@@ -228,10 +248,10 @@ def measure_performance(func: F) -> F:
     Returns:
         デコレートされた関数
     """
+    registry = get_metrics_registry()
+    
     @functools.wraps(func)
     def wrapper(*args, **kwargs):
-        global _performance_counters
-        
         start_time = time.perf_counter()
         result = func(*args, **kwargs)
         end_time = time.perf_counter()
@@ -240,42 +260,43 @@ def measure_performance(func: F) -> F:
         execution_time_ms = (end_time - start_time) * 1000
         
         # パフォーマンスメトリクスを更新
-        _performance_counters["total_queries"] += 1
-        _performance_counters["total_execution_time"] += execution_time_ms
+        registry.observe(METRICS_SUBSYSTEM, func.__name__, execution_time_ms)
         
         # 遅いクエリをカウント
-        if execution_time_ms >= 1000:
-            _performance_counters["very_slow_queries"] += 1
+        if execution_time_ms >= VERY_SLOW_QUERY_MS:
+            registry.inc("very_slow_queries", subsystem=METRICS_SUBSYSTEM)
             logger.warning(f"非常に遅いクエリ検出: {func.__name__}, {execution_time_ms:.2f}ms")
-        elif execution_time_ms >= 500:
-            _performance_counters["slow_queries"] += 1
+        elif execution_time_ms >= SLOW_QUERY_MS:
+            registry.inc("slow_queries", subsystem=METRICS_SUBSYSTEM)
             logger.info(f"遅いクエリ検出: {func.__name__}, {execution_time_ms:.2f}ms")
         
         # ピーク時間の更新
-        if execution_time_ms > _performance_counters["peak_execution_time"]:
-            _performance_counters["peak_execution_time"] = execution_time_ms
+        if execution_time_ms > _peak_query["peak_execution_time"]:
             # クエリの先頭100文字だけを記録
             query_sample = "?"
             if len(args) > 0 and isinstance(args[0], str):
                 query_sample = args[0][:100] + "..." if len(args[0]) > 100 else args[0]
-            _performance_counters["peak_query"] = query_sample
+            with _peak_lock:
+                if execution_time_ms > _peak_query["peak_execution_time"]:
+                    _peak_query["peak_execution_time"] = execution_time_ms
+                    _peak_query["peak_query"] = query_sample
         
         # 実行時間をログ記録
         logger.debug(f"{func.__name__} の実行時間: {execution_time_ms:.2f} ms")
         
-        # 結果がdictで特定の条件を満たす場合、パフォーマンス情報を追加
+        # 結果がdictの場合、パフォーマンス情報を追加
         if isinstance(result, dict):
-            # 新しいdictを作成（元のdictは変更しない）
-            result_with_perf = dict(result)
-            # 拡張情報がない場合は作成
-            if "extensions" not in result_with_perf:
-                result_with_perf["extensions"] = {}
-            # パフォーマンス情報を追加
-            result_with_perf["extensions"]["performance"] = {
-                "executionMs": round(execution_time_ms, 2),
-                "cached": getattr(result, "_cached", False) if hasattr(result, "_cached") else False
+            # 元のdict（キャッシュされている場合がある）は変更せず、トップレベルとextensionsだけを複製
+            return {
+                **result,
+                "extensions": {
+                    **(result.get("extensions") or {}),
+                    "performance": {
+                        "executionMs": round(execution_time_ms, 2),
+                        "cached": getattr(result, "_cached", False)
+                    }
+                }
             }
-            return result_with_perf
         
         return result
     
@@ -347,11 +368,27 @@ def analyze_query(query_string: str) -> Dict[str, Any]:
     potential_expensive_fields = ["vertices", "faces", "edges", "materials", "modifiers"]
     for field in potential_expensive_fields:
         if field in query_string:
-            hints.append(f""{field}" フィールドは処理が重い場合があります。必要なフィールドのみをリクエストしてください。")
+            hints.append(f"「{field}」フィールドは処理が重い場合があります。必要なフィールドのみをリクエストしてください。")
     
-    # 結果を返す
-    return {
+    result = {
         "query_length": len(query_string),
         "nesting_level": nesting_level,
         "optimization_hints": hints
-    }
\ No newline at end of file
+    }
+    
+    # 静的コストモデルによる見積もり
+    try:
+        from .query_cost import get_cost_analyzer
+        admission = get_cost_analyzer().admit(query_string, record=False)
+        if admission.get("cost") is not None:
+            result["estimated_cost"] = admission["cost"]
+            result["depth"] = admission["depth"]
+            result["admission"] = admission["decision"]
+            result["expensive_fields"] = admission["field_costs"]
+            if admission["decision"] != "accept":
+                hints.append(admission["reason"])
+    except Exception as e:
+        logger.debug(f"クエリコストを見積もれません: {e}")
+    
+    # 結果を返す
+    return result
\ No newline at end of file
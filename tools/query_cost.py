@@ -0,0 +1,538 @@
+"""
+GraphQLクエリのコスト分析とアドミッション制御
+解析済みドキュメントから静的にコストと深さを見積もり、予算を超えるクエリを拒否または非同期化する
+"""
+
+import os
+import time
+import logging
+import threading
+import weakref
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+try:
+    import bpy
+    from bpy.app.handlers import persistent
+    BPY_AVAILABLE = True
+except ImportError:
+    BPY_AVAILABLE = False
+
+    def persistent(func):
+        return func
+
+logger = logging.getLogger("blender_graphql_mcp.tools.query_cost")
+
+# デフォルトの制限（環境変数で上書き可能）
+DEFAULT_MAX_DEPTH = int(os.environ.get('MCP_QUERY_MAX_DEPTH', '10'))
+DEFAULT_MAX_COST = float(os.environ.get('MCP_QUERY_MAX_COST', '5000000'))
+DEFAULT_ASYNC_COST = float(os.environ.get('MCP_QUERY_ASYNC_COST', '50000'))
+
+# サイズ不明なリストフィールドの推定要素数
+DEFAULT_LIST_SIZE = 10
+
+# シーン統計の再計算間隔（秒）。depsgraph更新が続く間もこの間隔でまとめて再収集する
+SCENE_STATS_TTL = 2.0
+
+# リストの要素数を制限する引数名
+PAGINATION_ARGUMENTS = ('limit', 'first', 'last', 'count', 'max_results', 'maxResults')
+
+# フィールド名 -> シーン統計のキー（要素数の推定に使用）
+# 親がリスト（複数オブジェクト）の場合は平均値、単一オブジェクトの場合は最大値を使う
+FIELD_SIZE_STATS = {
+    'objects': 'objects',
+    'allObjects': 'objects',
+    'all_objects': 'objects',
+    'children': 'objects',
+    'selectedObjects': 'objects',
+    'selected_objects': 'objects',
+    'meshes': 'meshes',
+    'materials': 'materials',
+    'vertices': 'vertices',
+    'verts': 'vertices',
+    'vertexPositions': 'vertices',
+    'vertex_positions': 'vertices',
+    'normals': 'vertices',
+    'edges': 'edges',
+    'faces': 'polygons',
+    'polygons': 'polygons',
+    'loops': 'loops',
+    'uvs': 'loops',
+    'modifiers': 'modifiers',
+    'collections': 'collections',
+}
+
+# フィールドごとの重み（1要素あたりのコスト、デフォルトは1）
+FIELD_WEIGHTS = {
+    'vertices': 2.0,
+    'normals': 2.0,
+    'faces': 3.0,
+    'polygons': 3.0,
+    'modifiers': 5.0,
+    'boundingBox': 5.0,
+    'bounding_box': 5.0,
+}
+
+
+def _collect_blender_scene_stats() -> Dict[str, Dict[str, float]]:
+    """
+    bpy.dataからシーン統計を収集（データブロック数のみを読むため軽量）
+    bpyを読むためメインスレッドから呼ぶこと
+
+    Returns:
+        統計キー -> {'total', 'avg', 'max'}
+    """
+    stats: Dict[str, Dict[str, float]] = {}
+
+    def summarize(key: str, counts: List[int]) -> None:
+        total = float(sum(counts))
+        stats[key] = {
+            'total': total,
+            'avg': total / len(counts) if counts else 0.0,
+            'max': float(max(counts)) if counts else 0.0,
+        }
+
+    # データブロック数は親の数によらず同じ値を使う
+    for key, collection in (('objects', bpy.data.objects), ('meshes', bpy.data.meshes),
+                            ('materials', bpy.data.materials), ('collections', bpy.data.collections)):
+        count = float(len(collection))
+        stats[key] = {'total': count, 'avg': count, 'max': count}
+
+    meshes = list(bpy.data.meshes)
+    summarize('vertices', [len(m.vertices) for m in meshes])
+    summarize('edges', [len(m.edges) for m in meshes])
+    summarize('polygons', [len(m.polygons) for m in meshes])
+    summarize('loops', [len(m.loops) for m in meshes])
+    summarize('modifiers', [len(o.modifiers) for o in bpy.data.objects])
+    return stats
+
+
+class QueryCostAnalyzer:
+    """
+    GraphQLドキュメントの静的コストモデル
+
+    各フィールドのコストは「推定要素数 ×（重み + 子フィールドのコスト）」で計算する。
+    リストフィールドの要素数はオブジェクト数・頂点数などのシーン統計から推定し、
+    limit/first等の引数があればその値で上限を設ける。
+
+    既定の統計収集はbpyを読むため、リクエストスレッドでは実行しない。
+    メインスレッドのdepsgraphハンドラで再収集したキャッシュを参照する。
+    """
+
+    def __init__(self,
+                 max_depth: int = DEFAULT_MAX_DEPTH,
+                 max_cost: float = DEFAULT_MAX_COST,
+                 async_cost: float = DEFAULT_ASYNC_COST,
+                 stats_provider: Optional[Callable[[], Dict[str, Dict[str, float]]]] = None):
+        """
+        Args:
+            max_depth: 許可する最大ネスト深さ
+            max_cost: 許可する最大コスト（超えると拒否）
+            async_cost: これを超えるクエリは非同期タスクとして実行
+            stats_provider: シーン統計を返す関数（デフォルトはメインスレッドでbpy.dataから収集）
+        """
+        self.max_depth = max_depth
+        self.max_cost = max_cost
+        self.async_cost = async_cost
+        self.stats_provider = stats_provider or _collect_blender_scene_stats
+        self._stats: Dict[str, Dict[str, float]] = {}
+        self._stats_time = 0.0
+        # 既定の収集関数はメインスレッドのハンドラ経由でのみ呼ぶ
+        self._collect_on_main_thread = stats_provider is None
+        self._refresh_pending = False
+        self._handlers_requested = False
+        self.lock = threading.Lock()
+        self.counters = {'accepted': 0, 'deferred': 0, 'rejected': 0}
+
+    # ---------------------------------------------------------
+    # シーン統計
+    # ---------------------------------------------------------
+
+    def get_scene_stats(self) -> Dict[str, Dict[str, float]]:
+        """
+        シーン統計を取得
+
+        既定の収集関数ではメインスレッドで収集済みのキャッシュを返す（未収集の間は空）。
+        独自の収集関数はTTL付きで呼び出し元のスレッドで実行する。
+        """
+        if self._collect_on_main_thread:
+            self._ensure_handlers()
+            with self.lock:
+                return self._stats
+
+        now = time.time()
+        with self.lock:
+            if now - self._stats_time < SCENE_STATS_TTL:
+                return self._stats
+        return self.refresh_scene_stats()
+
+    def refresh_scene_stats(self) -> Dict[str, Dict[str, float]]:
+        """シーン統計を再収集（既定の収集関数の場合はメインスレッドから呼ぶ）"""
+        try:
+            stats = self.stats_provider()
+        except Exception as e:
+            logger.debug(f"シーン統計を取得できません。デフォルト値を使用します: {e}")
+            stats = {}
+        with self.lock:
+            self._stats = stats
+            self._stats_time = time.time()
+            self._refresh_pending = False
+        return stats
+
+    def schedule_scene_stats_refresh(self) -> None:
+        """メインスレッドでの再収集をタイマーに予約（SCENE_STATS_TTL秒に1回までにまとめる）"""
+        if not BPY_AVAILABLE:
+            return
+        with self.lock:
+            if self._refresh_pending:
+                return
+            self._refresh_pending = True
+            delay = max(0.0, SCENE_STATS_TTL - (time.time() - self._stats_time))
+        bpy.app.timers.register(self._refresh_timer, first_interval=delay)
+
+    def _refresh_timer(self):
+        """メインスレッドでハンドラを登録し、シーン統計を再収集（一度だけ実行）"""
+        _register_handlers(self)
+        self.refresh_scene_stats()
+        return None
+
+    def _ensure_handlers(self) -> None:
+        """初回使用時にハンドラ登録と最初の収集をメインスレッドに予約"""
+        if self._handlers_requested or not BPY_AVAILABLE:
+            return
+        self._handlers_requested = True
+        self.schedule_scene_stats_refresh()
+
+    def invalidate_scene_stats(self) -> None:
+        """シーン統計のキャッシュを破棄"""
+        with self.lock:
+            self._stats_time = 0.0
+        if self._collect_on_main_thread:
+            self.schedule_scene_stats_refresh()
+
+    def _estimate_list_size(self, field_name: str, parent_multiplicity: float) -> float:
+        """リストフィールドの要素数を推定"""
+        stat_key = FIELD_SIZE_STATS.get(field_name)
+        if stat_key is None:
+            return DEFAULT_LIST_SIZE
+        stat = self.get_scene_stats().get(stat_key)
+        if not stat:
+            return DEFAULT_LIST_SIZE
+        # 複数の親に渡って展開される場合は平均、単一の親なら最悪値
+        value = stat['avg'] if parent_multiplicity > 1 else stat['max']
+        return max(value, 1.0)
+
+    # ---------------------------------------------------------
+    # ドキュメント解析
+    # ---------------------------------------------------------
+
+    def analyze(self, query: str, variables: Optional[Dict[str, Any]] = None,
+                operation_name: Optional[str] = None, schema: Any = None) -> Dict[str, Any]:
+        """
+        クエリのコストと深さを静的に計算
+
+        Args:
+            query: GraphQLクエリ文字列
+            variables: クエリ変数（limit等の引数評価に使用）
+            operation_name: 実行するオペレーション名
+            schema: GraphQLSchema（指定時は型情報からリストを判定）
+
+        Returns:
+            分析結果（cost, depth, operation, fields）
+        """
+        from graphql import parse
+        from graphql.language import OperationDefinitionNode, FragmentDefinitionNode
+
+        document = parse(query)
+        fragments = {d.name.value: d for d in document.definitions if isinstance(d, FragmentDefinitionNode)}
+        operations = [d for d in document.definitions if isinstance(d, OperationDefinitionNode)]
+
+        if operation_name:
+            operations = [op for op in operations if op.name and op.name.value == operation_name]
+        if not operations:
+            raise ValueError("実行するオペレーションが見つかりません")
+        operation = operations[0]
+        op_type = operation.operation.value
+
+        root_type = None
+        if schema is not None:
+            root_type = {
+                'query': schema.query_type,
+                'mutation': schema.mutation_type,
+                'subscription': schema.subscription_type,
+            }.get(op_type)
+
+        context = {
+            'schema': schema,
+            'fragments': fragments,
+            'variables': variables or {},
+            'field_costs': {},
+        }
+        cost, depth = self._selection_cost(operation.selection_set, root_type, context,
+                                           parent_multiplicity=1.0, depth=1, path='')
+        field_costs = context['field_costs']
+
+        return {
+            'operation': op_type,
+            'operation_name': operation.name.value if operation.name else None,
+            'cost': cost,
+            'depth': depth,
+            'field_costs': dict(sorted(field_costs.items(), key=lambda item: -item[1])[:10]),
+        }
+
+    def _selection_cost(self, selection_set, parent_type, context: Dict[str, Any],
+                        parent_multiplicity: float, depth: int, path: str,
+                        visited_fragments: Tuple[str, ...] = ()) -> Tuple[float, int]:
+        """選択セットのコストと最大深さを計算"""
+        from graphql.language import FieldNode, FragmentSpreadNode, InlineFragmentNode
+
+        if selection_set is None:
+            return 0.0, depth - 1
+
+        total = 0.0
+        max_depth = depth
+        for selection in selection_set.selections:
+            if isinstance(selection, FieldNode):
+                cost, field_depth = self._field_cost(
+                    selection, parent_type, context, parent_multiplicity, depth, path, visited_fragments
+                )
+            elif isinstance(selection, FragmentSpreadNode):
+                name = selection.name.value
+                fragment = context['fragments'].get(name)
+                if fragment is None or name in visited_fragments:
+                    continue
+                cost, field_depth = self._selection_cost(
+                    fragment.selection_set, self._type_condition(fragment, parent_type, context['schema']),
+                    context, parent_multiplicity, depth, path, visited_fragments + (name,)
+                )
+            elif isinstance(selection, InlineFragmentNode):
+                cost, field_depth = self._selection_cost(
+                    selection.selection_set, self._type_condition(selection, parent_type, context['schema']),
+                    context, parent_multiplicity, depth, path, visited_fragments
+                )
+            else:
+                continue
+            total += cost
+            max_depth = max(max_depth, field_depth)
+        return total, max_depth
+
+    def _field_cost(self, node, parent_type, context: Dict[str, Any],
+                    parent_multiplicity: float, depth: int, path: str,
+                    visited_fragments: Tuple[str, ...]) -> Tuple[float, int]:
+        """フィールドのコストと最大深さを計算"""
+        field_name = node.name.value
+        if field_name.startswith('__'):
+            # イントロスペクションは軽量として扱う
+            return 1.0, depth
+
+        field_type, is_list = self._field_type(parent_type, field_name)
+        if is_list is None:
+            # スキーマ情報がない場合は既知の集合フィールドをリストとみなす
+            is_list = field_name in FIELD_SIZE_STATS
+
+        multiplicity = 1.0
+        if is_list:
+            multiplicity = self._estimate_list_size(field_name, parent_multiplicity)
+            limit = self._pagination_limit(node, context['variables'])
+            if limit is not None:
+                multiplicity = min(multiplicity, float(limit))
+
+        weight = FIELD_WEIGHTS.get(field_name, 1.0)
+        field_path = f"{path}.{field_name}" if path else field_name
+        child_cost, child_depth = self._selection_cost(
+            node.selection_set, field_type, context,
+            parent_multiplicity * multiplicity, depth + 1, field_path, visited_fragments
+        )
+        cost = multiplicity * (weight + child_cost)
+        # 親リストの展開分も含めたクエリ全体への寄与を記録
+        field_costs = context['field_costs']
+        field_costs[field_path] = field_costs.get(field_path, 0.0) + cost * parent_multiplicity
+        return cost, max(depth, child_depth)
+
+    @staticmethod
+    def _field_type(parent_type, field_name: str):
+        """スキーマから(名前付き型, リストかどうか)を取得。スキーマがなければ(None, None)"""
+        if parent_type is None:
+            return None, None
+        from graphql import GraphQLNonNull, GraphQLList, get_named_type
+
+        fields = getattr(parent_type, 'fields', None)
+        if not fields or field_name not in fields:
+            return None, None
+        gql_type = fields[field_name].type
+        if isinstance(gql_type, GraphQLNonNull):
+            gql_type = gql_type.of_type
+        return get_named_type(gql_type), isinstance(gql_type, GraphQLList)
+
+    @staticmethod
+    def _type_condition(fragment, parent_type, schema):
+        """フラグメントの型条件を解決（スキーマがない場合は親の型を維持）"""
+        if schema is None or fragment.type_condition is None:
+            return parent_type
+        return schema.get_type(fragment.type_condition.name.value) or parent_type
+
+    @staticmethod
+    def _pagination_limit(node, variables: Dict[str, Any]) -> Optional[int]:
+        """limit/first等の引数値を取得"""
+        from graphql.language import IntValueNode, VariableNode
+
+        for argument in node.arguments or ():
+            if argument.name.value not in PAGINATION_ARGUMENTS:
+                continue
+            value = argument.value
+            if isinstance(value, IntValueNode):
+                return max(int(value.value), 0)
+            if isinstance(value, VariableNode):
+                var_value = variables.get(value.name.value)
+                if isinstance(var_value, int):
+                    return max(var_value, 0)
+        return None
+
+    # ---------------------------------------------------------
+    # アドミッション制御
+    # ---------------------------------------------------------
+
+    def admit(self, query: str, variables: Optional[Dict[str, Any]] = None,
+              operation_name: Optional[str] = None, schema: Any = None,
+              allow_async: bool = True, record: bool = True) -> Dict[str, Any]:
+        """
+        クエリを予算と照合して実行方法を決定
+
+        Args:
+            query: GraphQLクエリ文字列
+            variables: クエリ変数
+            operation_name: オペレーション名
+            schema: GraphQLSchema
+            allow_async: 予算超過時に非同期タスク化を許可するか
+            record: アドミッション統計に記録するか（見積もりのみの場合はFalse）
+
+        Returns:
+            分析結果に'decision'（accept / defer / reject）と'reason'を加えた辞書
+        """
+        try:
+            analysis = self.analyze(query, variables, operation_name, schema)
+        except Exception as e:
+            # 構文エラー等は通常の検証に任せる
+            return {'decision': 'accept', 'reason': f"コスト分析をスキップしました: {e}", 'cost': None, 'depth': None}
+
+        analysis['limits'] = {
+            'max_depth': self.max_depth,
+            'max_cost': self.max_cost,
+            'async_cost': self.async_cost,
+        }
+
+        if analysis['depth'] > self.max_depth:
+            analysis['decision'] = 'reject'
+            analysis['reason'] = f"クエリの深さ {analysis['depth']} が上限 {self.max_depth} を超えています"
+        elif analysis['cost'] > self.max_cost:
+            analysis['decision'] = 'reject'
+            analysis['reason'] = (f"クエリの推定コスト {analysis['cost']:.0f} が上限 {self.max_cost:.0f} を超えています。"
+                                  f"limit/first引数で取得件数を制限してください")
+        elif analysis['cost'] > self.async_cost and analysis['operation'] == 'query':
+            if allow_async:
+                analysis['decision'] = 'defer'
+                analysis['reason'] = (f"クエリの推定コスト {analysis['cost']:.0f} が対話的実行の上限 "
+                                      f"{self.async_cost:.0f} を超えるため非同期タスクとして実行します")
+            else:
+                analysis['decision'] = 'reject'
+                analysis['reason'] = (f"クエリの推定コスト {analysis['cost']:.0f} が対話的実行の上限 "
+                                      f"{self.async_cost:.0f} を超えています")
+        else:
+            analysis['decision'] = 'accept'
+            analysis['reason'] = None
+
+        if not record:
+            return analysis
+        with self.lock:
+            self.counters[{'accept': 'accepted', 'defer': 'deferred', 'reject': 'rejected'}[analysis['decision']]] += 1
+        if analysis['decision'] != 'accept':
+            logger.info(f"クエリアドミッション: {analysis['decision']} - {analysis['reason']}")
+        return analysis
+
+    def get_stats(self) -> Dict[str, Any]:
+        """アドミッション統計を取得"""
+        with self.lock:
+            return {
+                'counters': dict(self.counters),
+                'limits': {
+                    'max_depth': self.max_depth,
+                    'max_cost': self.max_cost,
+                    'async_cost': self.async_cost,
+                },
+            }
+
+
+# メインスレッドでシーン統計を収集する分析器（depsgraph更新時に再収集を予約）
+_stats_subscribers: "weakref.WeakSet[QueryCostAnalyzer]" = weakref.WeakSet()
+
+
+def _register_handlers(analyzer: QueryCostAnalyzer) -> None:
+    """depsgraph・ファイル読み込みハンドラを登録（メインスレッドから呼ぶ）"""
+    _stats_subscribers.add(analyzer)
+    handlers = bpy.app.handlers
+    if _on_depsgraph_update not in handlers.depsgraph_update_post:
+        handlers.depsgraph_update_post.append(_on_depsgraph_update)
+    if _on_load_post not in handlers.load_post:
+        handlers.load_post.append(_on_load_post)
+
+
+def unregister_handlers() -> None:
+    """登録したハンドラを削除"""
+    if not BPY_AVAILABLE:
+        return
+    handlers = bpy.app.handlers
+    if _on_depsgraph_update in handlers.depsgraph_update_post:
+        handlers.depsgraph_update_post.remove(_on_depsgraph_update)
+    if _on_load_post in handlers.load_post:
+        handlers.load_post.remove(_on_load_post)
+    for analyzer in list(_stats_subscribers):
+        analyzer._handlers_requested = False
+    _stats_subscribers.clear()
+
+
+@persistent
+def _on_depsgraph_update(scene, depsgraph):
+    """シーンの更新後に統計の再収集を予約"""
+    for analyzer in list(_stats_subscribers):
+        analyzer.schedule_scene_stats_refresh()
+
+
+@persistent
+def _on_load_post(*args):
+    """ファイル読み込み直後に統計を再収集"""
+    for analyzer in list(_stats_subscribers):
+        analyzer.refresh_scene_stats()
+
+
+# グローバルインスタンス
+_analyzer_instance: Optional[QueryCostAnalyzer] = None
+
+
+def get_cost_analyzer() -> QueryCostAnalyzer:
+    """グローバルのコスト分析器を取得"""
+    global _analyzer_instance
+    if _analyzer_instance is None:
+        _analyzer_instance = QueryCostAnalyzer()
+    return _analyzer_instance
+
+
+def configure_limits(max_depth: Optional[int] = None, max_cost: Optional[float] = None,
+                     async_cost: Optional[float] = None) -> QueryCostAnalyzer:
+    """
+    クエリ予算を変更
+
+    Args:
+        max_depth: 最大深さ
+        max_cost: 最大コスト
+        async_cost: 非同期化するコスト
+
+    Returns:
+        コスト分析器
+    """
+    analyzer = get_cost_analyzer()
+    if max_depth is not None:
+        analyzer.max_depth = max_depth
+    if max_cost is not None:
+        analyzer.max_cost = max_cost
+    if async_cost is not None:
+        analyzer.async_cost = async_cost
+    return analyzer
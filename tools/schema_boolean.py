@@ -24,7 +24,19 @@ logger = logging.getLogger("blender_graphql_mcp.tools.definitions_boolean")
 # レジストリのインポート
 from .schema_registry import schema_registry
 # リゾルバモジュールのインポート
-import tools.resolver as RESOLVER_MODULE
+import tools.handlers as RESOLVER_MODULE
+
+def resolve_boolean_operation(obj, info, target_object, tool_object, operation, result_name=None):
+    """booleanOperationミューテーションのリゾルバ（ハンドラの引数名に変換）"""
+    result = RESOLVER_MODULE.resolve_boolean_operation(obj, info, operation, target_object, tool_object, result_name)
+    result.setdefault('target_object', target_object)
+    result.setdefault('tool_object', tool_object)
+    result.setdefault('operation', operation)
+    return result
+
+def resolve_enhanced_boolean_operation(obj, info, **kwargs):
+    """enhancedBooleanOperationミューテーションのリゾルバ"""
+    return RESOLVER_MODULE.resolve_enhanced_boolean_operation(obj, info, **kwargs)
 
 def register_boolean_schema():
     """ブーリアン操作のスキーマを登録"""
@@ -37,9 +49,9 @@ def register_boolean_schema():
     schema_registry.register_type('BooleanOperation', GraphQLEnumType(
         name='BooleanOperation',
         values={
-            'UNION': GraphQLEnumValue(description='結合操作'),
-            'DIFFERENCE': GraphQLEnumValue(description='差分操作'),
-            'INTERSECT': GraphQLEnumValue(description='交差操作')
+            'UNION': GraphQLEnumValue('UNION', description='結合操作'),
+            'DIFFERENCE': GraphQLEnumValue('DIFFERENCE', description='差分操作'),
+            'INTERSECT': GraphQLEnumValue('INTERSECT', description='交差操作')
         },
         description='ブーリアン操作の種類'
     ))
@@ -48,8 +60,8 @@ def register_boolean_schema():
     schema_registry.register_type('BooleanSolver', GraphQLEnumType(
         name='BooleanSolver',
         values={
-            'FAST': GraphQLEnumValue(description='高速ソルバー（精度低）'),
-            'EXACT': GraphQLEnumValue(description='正確なソルバー（精度高、処理時間長）')
+            'FAST': GraphQLEnumValue('FAST', description='高速ソルバー（精度低）'),
+            'EXACT': GraphQLEnumValue('EXACT', description='正確なソルバー（精度高、処理時間長）')
         },
         description='ブーリアン操作のソルバー'
     ))
@@ -73,40 +85,34 @@ def register_boolean_schema():
     # ブーリアンミューテーション
     # -----------------------------
     
-    # 基本ブーリアン操作
-    schema_registry.register_mutation('boolean.operation', GraphQLField(
+    # 基本ブーリアン操作（結果は新しいオブジェクトとして作成される）
+    schema_registry.register_mutation('booleanOperation', GraphQLField(
         schema_registry.get_type('BooleanOperationResult'),
         args={
             'target_object': GraphQLArgument(GraphQLNonNull(GraphQLString), description='ターゲットオブジェクト名'),
             'tool_object': GraphQLArgument(GraphQLNonNull(GraphQLString), description='ツールオブジェクト名'),
             'operation': GraphQLArgument(GraphQLNonNull(schema_registry.get_type('BooleanOperation')), 
                                         description='ブーリアン操作タイプ'),
-            'auto_repair': GraphQLArgument(GraphQLBoolean, description='操作前にメッシュを自動修復するか', 
-                                         default_value=True),
-            'validate_result': GraphQLArgument(GraphQLBoolean, description='操作後に結果を検証するか', 
-                                            default_value=True),
-            'delete_tool': GraphQLArgument(GraphQLBoolean, description='操作後にツールオブジェクトを削除するか', 
-                                        default_value=False),
-            'solver': GraphQLArgument(schema_registry.get_type('BooleanSolver'), description='使用するソルバー', 
-                                   default_value='EXACT')
+            'result_name': GraphQLArgument(GraphQLString, description='結果オブジェクト名（省略時は自動生成）')
         },
         description='メッシュのブーリアン操作を実行',
-        resolve=lambda obj, info, **kwargs: RESOLVER_MODULE.resolve_boolean_operation(obj, info, **kwargs)
+        resolve=resolve_boolean_operation
     ))
     
-    # 拡張ブーリアン操作
-    schema_registry.register_mutation('boolean.enhancedOperation', GraphQLField(
-        schema_registry.get_type('BooleanOperationResult'),
-        args={
-            'target_object': GraphQLArgument(GraphQLNonNull(GraphQLString), description='ターゲットオブジェクト名'),
-            'tool_object': GraphQLArgument(GraphQLNonNull(GraphQLString), description='ツールオブジェクト名'),
-            'operation': GraphQLArgument(GraphQLNonNull(schema_registry.get_type('BooleanOperation')), 
-                                       description='ブーリアン操作タイプ'),
-            'solver': GraphQLArgument(schema_registry.get_type('BooleanSolver'), description='使用するソルバー', 
-                                   default_value='EXACT')
-        },
-        description='高度なエラー処理と自動修復機能を持つブーリアン操作',
-        resolve=lambda obj, info, **kwargs: RESOLVER_MODULE.resolve_enhanced_boolean_operation(obj, info, **kwargs)
-    ))
+    # 拡張ブーリアン操作（リゾルバが実装されている場合のみ）
+    if hasattr(RESOLVER_MODULE, 'resolve_enhanced_boolean_operation'):
+        schema_registry.register_mutation('enhancedBooleanOperation', GraphQLField(
+            schema_registry.get_type('BooleanOperationResult'),
+            args={
+                'target_object': GraphQLArgument(GraphQLNonNull(GraphQLString), description='ターゲットオブジェクト名'),
+                'tool_object': GraphQLArgument(GraphQLNonNull(GraphQLString), description='ツールオブジェクト名'),
+                'operation': GraphQLArgument(GraphQLNonNull(schema_registry.get_type('BooleanOperation')), 
+                                           description='ブーリアン操作タイプ'),
+                'solver': GraphQLArgument(schema_registry.get_type('BooleanSolver'), description='使用するソルバー', 
+                                       default_value='EXACT')
+            },
+            description='高度なエラー処理と自動修復機能を持つブーリアン操作',
+            resolve=resolve_enhanced_boolean_operation
+        ))
     
     logger.info("ブーリアンスキーマを登録しました")
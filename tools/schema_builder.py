@@ -12,7 +12,93 @@ logger = logging.getLogger("blender_graphql_mcp.tools.definitions_builder")
 # レジストリのインポート
 from .schema_registry import schema_registry
 
-def build_schema() -> Optional[GraphQLSchema]:
+# ドメイン別スキーマコンポーネント（コンポーネント名, モジュール, 登録関数）
+# スキーマ構築時に初めてインポートされる（登録順に実体化）
+SCHEMA_COMPONENTS = (
+    ('base_types', '.schema_base', 'register_base_types'),
+    ('input_types', '.schema_inputs', 'register_input_types'),
+    ('mesh', '.schema_mesh', 'register_mesh_schema'),
+    ('boolean', '.schema_boolean', 'register_boolean_schema'),
+    ('geometry', '.schema_geometry', 'register_geometry_schema'),
+    ('material', '.schema_material', 'register_material_schema'),
+)
+
+# 構築したスキーマに必ず含まれるルートフィールド
+# （コンポーネントの実体化に失敗した不完全なスキーマを使用・キャッシュしないための確認）
+EXPECTED_ROOT_FIELDS = {
+    'query': ('meshData', 'batchRaycast', 'meshAttributes', 'materialsUsingTexture'),
+    'mutation': ('booleanOperation', 'setMeshAttribute'),
+}
+
+# プロセス内で構築済みのスキーマ
+_schema_instance: Optional[GraphQLSchema] = None
+
+def build_schema(use_cache: bool = True) -> Optional[GraphQLSchema]:
+    """
+    GraphQLスキーマを取得（構築済みならそれを返し、次にディスクキャッシュを試す）
+    
+    ソースが変更されていなければ、schema_cacheに保存されたSDLとリゾルバマップから
+    復元し、各登録関数の実行を省略する。
+    
+    Args:
+        use_cache: ディスクキャッシュを使用するかどうか
+        
+    Returns:
+        構築されたGraphQLスキーマ（エラー時はNone）
+    """
+    global _schema_instance
+    
+    if _schema_instance is not None:
+        return _schema_instance
+    
+    if use_cache:
+        from .schema_cache import get_or_build_schema, invalidate_schema_cache
+        schema = get_or_build_schema(build_schema_uncached)
+        if schema is not None and not check_schema(schema):
+            # キャッシュから復元したスキーマが不完全な場合は破棄
+            invalidate_schema_cache()
+            schema = None
+    else:
+        schema = build_schema_uncached()
+    
+    _schema_instance = schema
+    return _schema_instance
+
+def check_schema(schema: GraphQLSchema) -> bool:
+    """
+    スキーマが有効で、期待するルートフィールドを持つか確認
+    
+    Args:
+        schema: 確認するスキーマ
+        
+    Returns:
+        使用できる場合はTrue
+    """
+    from graphql import validate_schema
+    
+    errors = validate_schema(schema)
+    if errors:
+        logger.error(f"GraphQLスキーマが無効です: {'; '.join(error.message for error in errors[:5])}")
+        return False
+    
+    root_types = {'query': schema.query_type, 'mutation': schema.mutation_type}
+    missing = [
+        f"{operation}.{field_name}"
+        for operation, field_names in EXPECTED_ROOT_FIELDS.items()
+        for field_name in field_names
+        if root_types[operation] is None or field_name not in root_types[operation].fields
+    ]
+    if missing:
+        logger.error(f"GraphQLスキーマにルートフィールドがありません: {', '.join(missing)}")
+        return False
+    return True
+
+def reset_schema() -> None:
+    """プロセス内の構築済みスキーマを破棄（次回のbuild_schemaで再取得）"""
+    global _schema_instance
+    _schema_instance = None
+
+def build_schema_uncached() -> Optional[GraphQLSchema]:
     """
     新しい方法でGraphQLスキーマを構築
     
@@ -20,29 +106,16 @@ def build_schema() -> Optional[GraphQLSchema]:
         構築されたGraphQLスキーマ（エラー時はNone）
     """
     try:
-        # 各モジュールのスキーマ登録関数をインポート
-        from .schema_types import register_base_types
-        from .schema_mesh import register_mesh_schema
-        from .schema_boolean import register_boolean_schema
-        from .schema_llm_discovery import register_llm_discovery_schema
-        
-        # 基本型の登録
-        register_base_types()
-        logger.info("基本型定義を登録しました")
-        
-        # 各ドメイン別スキーマの登録
-        register_mesh_schema()
-        logger.info("メッシュスキーマを登録しました")
-        
-        register_boolean_schema()
-        logger.info("ブーリアンスキーマを登録しました")
-        
-        # LLM向け機能発見スキーマの登録
-        register_llm_discovery_schema()
-        logger.info("LLM向け機能発見スキーマを登録しました")
+        # 各ドメイン別スキーマをスタブとして登録（未登録の場合のみ）
+        # 実際のインポートと登録関数の実行はschema_registry.build_schema内で行われる
+        for component_name, module_name, func_name in SCHEMA_COMPONENTS:
+            schema_registry.register_lazy_component(component_name, module_name, func_name, package=__package__)
         
         # 最終的なスキーマ構築
         schema = schema_registry.build_schema()
+        if not check_schema(schema):
+            # 不完全なスキーマはキャッシュせず、呼び出し元のフォールバックに任せる
+            return None
         logger.info("GraphQLスキーマ構築完了")
         
         return schema
@@ -0,0 +1,386 @@
+"""
+Blender GraphQL MCP - スキーマキャッシュ
+構築済みGraphQLスキーマのSDLとリゾルバマップをディスクに保存し、起動を高速化
+"""
+
+import os
+import sys
+import glob
+import json
+import time
+import hashlib
+import logging
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+try:
+    from ..utils.disk_cache import get_disk_cache
+    from ..utils.lazy_loader import profiled_import
+except (ImportError, ValueError):
+    from utils.disk_cache import get_disk_cache
+    from utils.lazy_loader import profiled_import
+
+logger = logging.getLogger("blender_graphql_mcp.tools.schema_cache")
+
+# キャッシュ形式のバージョン（形式変更時に上げる）
+CACHE_FORMAT_VERSION = 1
+
+# スキーマに寄与するソースファイル（toolsディレクトリからの相対パターン）
+SCHEMA_SOURCE_PATTERNS = (
+    'schema_*.py',
+    'resolver*.py',
+    '*_resolver.py',
+    '*_resolvers.py',
+    'resolvers_*.py',
+    'handlers/*.py',
+    'operations/*.py',
+    'array_scalars.py',
+    'task_queue_schema.py',
+)
+
+# キャッシュを無効化する環境変数
+SCHEMA_CACHE_DISABLED = os.environ.get('MCP_SCHEMA_CACHE', '1').lower() in ('0', 'false', 'no')
+
+# 直近のスキーマ取得の計測結果
+last_load_stats: Dict[str, Any] = {}
+
+
+def _graphql_version() -> str:
+    """graphql-coreのバージョンを取得"""
+    try:
+        from importlib.metadata import version as package_version
+        return package_version('graphql-core')
+    except Exception:
+        return 'unknown'
+
+
+def compute_fingerprint(source_dir: Optional[str] = None,
+                        patterns: Tuple[str, ...] = SCHEMA_SOURCE_PATTERNS) -> str:
+    """
+    スキーマに寄与するモジュールのソースからフィンガープリントを計算
+
+    モジュールはインポートせず、ファイル内容のみをハッシュする。
+
+    Args:
+        source_dir: ソースディレクトリ（デフォルトはtoolsパッケージ）
+        patterns: 対象ファイルのglobパターン
+
+    Returns:
+        フィンガープリント（16進文字列）
+    """
+    source_dir = source_dir or os.path.dirname(os.path.abspath(__file__))
+    files = set()
+    for pattern in patterns:
+        files.update(glob.glob(os.path.join(source_dir, pattern)))
+
+    digest = hashlib.sha256()
+    digest.update(f"format={CACHE_FORMAT_VERSION};graphql={_graphql_version()}".encode('utf-8'))
+    for path in sorted(files):
+        digest.update(os.path.relpath(path, source_dir).encode('utf-8'))
+        with open(path, 'rb') as f:
+            digest.update(hashlib.sha256(f.read()).digest())
+    return digest.hexdigest()[:32]
+
+
+def _cache_key(fingerprint: str) -> str:
+    """キャッシュキーを生成"""
+    return f"graphql_schema_{fingerprint}.json"
+
+
+# ---------------------------------------------------------
+# 関数参照のシリアライズ
+# ---------------------------------------------------------
+
+def function_ref(func: Callable) -> Optional[str]:
+    """
+    関数をインポート可能な参照文字列（module:qualname）に変換
+
+    モジュールレベルの関数と、モジュールレベルのインスタンスのメソッドのみ対応する。
+    ラムダやクロージャはNoneを返す。
+
+    Args:
+        func: 関数
+
+    Returns:
+        参照文字列、変換できない場合はNone
+    """
+    module_name = getattr(func, '__module__', None)
+    qualname = getattr(func, '__qualname__', None)
+    if not module_name or not qualname or '<' in qualname:
+        return None
+
+    module = sys.modules.get(module_name)
+    if module is None:
+        return None
+
+    owner = getattr(func, '__self__', None)
+    if owner is not None and not isinstance(owner, type):
+        # モジュールレベルのインスタンスのバウンドメソッド
+        for name, value in vars(module).items():
+            if value is owner:
+                return f"{module_name}:{name}.{func.__name__}"
+        return None
+
+    target = module
+    for part in qualname.split('.'):
+        target = getattr(target, part, None)
+        if target is None:
+            return None
+    if target is func or getattr(target, '__func__', None) is getattr(func, '__func__', func):
+        return f"{module_name}:{qualname}"
+    return None
+
+
+def resolve_function_ref(ref: str) -> Callable:
+    """
+    参照文字列から関数を取得
+
+    Args:
+        ref: module:qualname形式の参照
+
+    Returns:
+        関数
+    """
+    module_name, qualname = ref.split(':', 1)
+    target = profiled_import(module_name, trigger='schema_cache')
+    for part in qualname.split('.'):
+        target = getattr(target, part)
+    return target
+
+
+# ---------------------------------------------------------
+# スキーマのシリアライズ
+# ---------------------------------------------------------
+
+def serialize_schema(schema: Any) -> Dict[str, Any]:
+    """
+    スキーマをSDLとリゾルバマップに変換
+
+    Args:
+        schema: GraphQLSchema
+
+    Returns:
+        シリアライズされたスキーマ。移植できない関数は'unportable'に列挙される
+    """
+    from graphql import (
+        print_schema, GraphQLObjectType, GraphQLScalarType, GraphQLEnumType,
+        specified_scalar_types
+    )
+
+    resolvers: Dict[str, str] = {}
+    scalars: Dict[str, Dict[str, str]] = {}
+    enums: Dict[str, Dict[str, Any]] = {}
+    unportable: List[str] = []
+
+    for type_name, gql_type in schema.type_map.items():
+        if type_name.startswith('__'):
+            continue
+
+        if isinstance(gql_type, GraphQLObjectType):
+            for field_name, field in gql_type.fields.items():
+                if field.resolve is None:
+                    continue
+                ref = function_ref(field.resolve)
+                if ref is None:
+                    unportable.append(f"{type_name}.{field_name}")
+                else:
+                    resolvers[f"{type_name}.{field_name}"] = ref
+
+        elif isinstance(gql_type, GraphQLScalarType) and type_name not in specified_scalar_types:
+            funcs = {}
+            for attr in ('serialize', 'parse_value', 'parse_literal'):
+                # デフォルト実装はSDLからの再構築で復元される
+                if attr not in vars(gql_type):
+                    continue
+                ref = function_ref(getattr(gql_type, attr))
+                if ref is None:
+                    unportable.append(f"{type_name}.{attr}")
+                else:
+                    funcs[attr] = ref
+            if funcs:
+                scalars[type_name] = funcs
+
+        elif isinstance(gql_type, GraphQLEnumType):
+            values = {}
+            for value_name, value in gql_type.values.items():
+                if value.value != value_name:
+                    try:
+                        json.dumps(value.value)
+                        values[value_name] = value.value
+                    except (TypeError, ValueError):
+                        unportable.append(f"{type_name}.{value_name}")
+            if values:
+                enums[type_name] = values
+
+    return {
+        'version': CACHE_FORMAT_VERSION,
+        'sdl': print_schema(schema),
+        'resolvers': resolvers,
+        'scalars': scalars,
+        'enums': enums,
+        'unportable': unportable,
+    }
+
+
+def deserialize_schema(data: Dict[str, Any]) -> Any:
+    """
+    SDLとリゾルバマップからスキーマを再構築
+
+    Args:
+        data: serialize_schemaの出力
+
+    Returns:
+        GraphQLSchema
+    """
+    from graphql import build_schema as build_schema_from_sdl
+
+    schema = build_schema_from_sdl(data['sdl'])
+
+    for path, ref in data.get('resolvers', {}).items():
+        type_name, field_name = path.split('.', 1)
+        schema.type_map[type_name].fields[field_name].resolve = resolve_function_ref(ref)
+
+    for type_name, funcs in data.get('scalars', {}).items():
+        scalar = schema.type_map[type_name]
+        for attr, ref in funcs.items():
+            setattr(scalar, attr, resolve_function_ref(ref))
+
+    for type_name, values in data.get('enums', {}).items():
+        enum_type = schema.type_map[type_name]
+        for value_name, value in values.items():
+            enum_type.values[value_name].value = value
+        # 値からの逆引きテーブルを再計算させる
+        enum_type.__dict__.pop('_value_lookup', None)
+
+    return schema
+
+
+# ---------------------------------------------------------
+# キャッシュ付きスキーマ取得
+# ---------------------------------------------------------
+
+def load_cached_schema(fingerprint: str) -> Tuple[Optional[Any], Optional[Dict[str, Any]]]:
+    """
+    キャッシュからスキーマを読み込む
+
+    Args:
+        fingerprint: ソースのフィンガープリント
+
+    Returns:
+        (スキーマ, キャッシュデータ)。キャッシュがない場合は(None, None)
+    """
+    raw = get_disk_cache().get(_cache_key(fingerprint))
+    if raw is None:
+        return None, None
+    try:
+        data = json.loads(raw.decode('utf-8'))
+        if data.get('version') != CACHE_FORMAT_VERSION:
+            return None, None
+        return deserialize_schema(data), data
+    except Exception as e:
+        logger.warning(f"スキーマキャッシュの読み込みに失敗しました。再構築します: {e}")
+        get_disk_cache().remove(_cache_key(fingerprint))
+        return None, None
+
+
+def save_schema(schema: Any, fingerprint: str, build_ms: float) -> bool:
+    """
+    スキーマをキャッシュに保存
+
+    Args:
+        schema: GraphQLSchema
+        fingerprint: ソースのフィンガープリント
+        build_ms: コールドビルドにかかった時間（ミリ秒）
+
+    Returns:
+        保存した場合はTrue
+    """
+    try:
+        data = serialize_schema(schema)
+    except Exception as e:
+        logger.warning(f"スキーマをシリアライズできません: {e}")
+        return False
+
+    if data['unportable']:
+        # ラムダ・クロージャのリゾルバはSDLから復元できないためキャッシュしない
+        logger.info(f"インポート可能な参照を持たないリゾルバがあるためスキーマをキャッシュしません: "
+                    f"{', '.join(data['unportable'][:10])}"
+                    f"{' ...' if len(data['unportable']) > 10 else ''}")
+        return False
+
+    data['fingerprint'] = fingerprint
+    data['build_ms'] = build_ms
+    data['created'] = time.time()
+    get_disk_cache().put(_cache_key(fingerprint), json.dumps(data))
+    logger.info(f"GraphQLスキーマをキャッシュしました ({len(data['sdl'])}バイト, "
+                f"リゾルバ {len(data['resolvers'])}個)")
+    return True
+
+
+def get_or_build_schema(builder: Callable[[], Any], source_dir: Optional[str] = None) -> Optional[Any]:
+    """
+    キャッシュがあればスキーマを読み込み、なければ構築してキャッシュする
+
+    Args:
+        builder: スキーマを構築する関数（キャッシュミス時のみ呼ばれる）
+        source_dir: フィンガープリント対象のソースディレクトリ
+
+    Returns:
+        GraphQLSchema（構築失敗時はNone）
+    """
+    global last_load_stats
+
+    start = time.perf_counter()
+    fingerprint = compute_fingerprint(source_dir)
+    fingerprint_ms = (time.perf_counter() - start) * 1000
+
+    if not SCHEMA_CACHE_DISABLED:
+        schema, data = load_cached_schema(fingerprint)
+        if schema is not None:
+            load_ms = (time.perf_counter() - start) * 1000
+            last_load_stats = {
+                'source': 'cache',
+                'fingerprint': fingerprint,
+                'fingerprint_ms': fingerprint_ms,
+                'load_ms': load_ms,
+                'cold_build_ms': data.get('build_ms'),
+                'saved_ms': (data.get('build_ms') or 0) - load_ms,
+            }
+            logger.info(f"GraphQLスキーマをキャッシュから読み込みました: {load_ms:.1f}ms "
+                        f"(コールドビルド {data.get('build_ms', 0):.1f}ms)")
+            return schema
+
+    build_start = time.perf_counter()
+    schema = builder()
+    build_ms = (time.perf_counter() - build_start) * 1000
+    if schema is None:
+        return None
+
+    cached = False
+    if not SCHEMA_CACHE_DISABLED:
+        cached = save_schema(schema, fingerprint, build_ms)
+
+    last_load_stats = {
+        'source': 'build',
+        'fingerprint': fingerprint,
+        'fingerprint_ms': fingerprint_ms,
+        'load_ms': (time.perf_counter() - start) * 1000,
+        'cold_build_ms': build_ms,
+        'cached': cached,
+    }
+    logger.info(f"GraphQLスキーマを構築しました: {build_ms:.1f}ms")
+    return schema
+
+
+def invalidate_schema_cache() -> int:
+    """
+    全てのスキーマキャッシュを削除
+
+    Returns:
+        削除されたエントリ数
+    """
+    return get_disk_cache().clear(r'graphql_schema_[0-9a-f]+\.json$')
+
+
+def get_schema_cache_stats() -> Dict[str, Any]:
+    """直近のスキーマ取得の計測結果を取得"""
+    return dict(last_load_stats)
@@ -0,0 +1,221 @@
+"""
+Blender GraphQL MCP - ジオメトリスキーマ拡張
+バッチレイキャストとメッシュ属性のGraphQLスキーマ定義（大きな配列はFloat32Arrayでも取得可能）
+"""
+
+import logging
+from tools import (
+    GraphQLObjectType,
+    GraphQLInputObjectType,
+    GraphQLInputField,
+    GraphQLString,
+    GraphQLInt,
+    GraphQLFloat,
+    GraphQLBoolean,
+    GraphQLList,
+    GraphQLNonNull,
+    GraphQLField,
+    GraphQLArgument
+)
+
+logger = logging.getLogger("blender_graphql_mcp.tools.definitions_geometry")
+
+# レジストリのインポート
+from .schema_registry import schema_registry
+# バイナリ配列スカラー
+from .array_scalars import (
+    Float32ArrayScalar, NumericArrayScalar, resolve_array_field, resolve_packed_array_field
+)
+
+def resolve_batch_raycast(obj, info, **kwargs):
+    """batchRaycastクエリのリゾルバ"""
+    from .optimized_resolver import get_resolver
+    return get_resolver().resolve_batch_raycast(info, **kwargs)
+
+def resolve_mesh_attributes(obj, info, object_name):
+    """meshAttributesクエリのリゾルバ"""
+    from .optimized_resolver import get_resolver
+    return get_resolver().resolve_mesh_attributes(info, object_name)
+
+def resolve_mesh_attribute(obj, info, **kwargs):
+    """meshAttributeクエリのリゾルバ"""
+    from .optimized_resolver import get_resolver
+    return get_resolver().resolve_mesh_attribute(info, **kwargs)
+
+def resolve_set_mesh_attribute(obj, info, **kwargs):
+    """setMeshAttributeミューテーションのリゾルバ"""
+    from .optimized_resolver import get_resolver
+    return get_resolver().resolve_set_mesh_attribute(info, **kwargs)
+
+def register_geometry_schema():
+    """ジオメトリ操作のスキーマを登録"""
+    
+    # -----------------------------
+    # レイパターン入力型
+    # -----------------------------
+    
+    schema_registry.register_type('RayGridInput', GraphQLInputObjectType(
+        name='RayGridInput',
+        fields={
+            'center': GraphQLInputField(GraphQLNonNull(GraphQLList(GraphQLFloat)), description='格子の中心'),
+            'size': GraphQLInputField(GraphQLNonNull(GraphQLList(GraphQLFloat)), description='格子のサイズ（X, Y）'),
+            'resolution': GraphQLInputField(GraphQLNonNull(GraphQLList(GraphQLInt)), description='格子の分割数（X, Y）'),
+            'height': GraphQLInputField(GraphQLFloat, default_value=100.0, description='レイの開始高さ'),
+            'direction': GraphQLInputField(GraphQLList(GraphQLFloat), description='レイの方向')
+        }
+    ))
+    
+    schema_registry.register_type('RayHemisphereInput', GraphQLInputObjectType(
+        name='RayHemisphereInput',
+        fields={
+            'origin': GraphQLInputField(GraphQLNonNull(GraphQLList(GraphQLFloat)), description='レイの開始点'),
+            'count': GraphQLInputField(GraphQLNonNull(GraphQLInt), description='レイの数'),
+            'up': GraphQLInputField(GraphQLList(GraphQLFloat), description='半球の上方向')
+        }
+    ))
+    
+    # -----------------------------
+    # バッチレイキャスト結果型
+    # -----------------------------
+    
+    # 配列はレイ順のフラットな配列、*_packedは同じ配列のFloat32Array
+    schema_registry.register_type('BatchRaycastResult', GraphQLObjectType(
+        name='BatchRaycastResult',
+        fields={
+            'ray_count': GraphQLField(GraphQLInt, description='レイの数'),
+            'hit_count': GraphQLField(GraphQLInt, description='ヒットしたレイの数'),
+            'objects': GraphQLField(GraphQLList(GraphQLString), description='object_indexに対応するオブジェクト名'),
+            'hit': GraphQLField(GraphQLList(GraphQLBoolean), resolve=resolve_array_field,
+                                description='レイごとのヒット有無'),
+            'object_index': GraphQLField(GraphQLList(GraphQLInt), resolve=resolve_array_field,
+                                         description='ヒットしたオブジェクトのインデックス（ヒットなしは-1）'),
+            'location': GraphQLField(GraphQLList(GraphQLFloat), resolve=resolve_array_field,
+                                     description='ヒット位置（x, y, z の繰り返し）'),
+            'normal': GraphQLField(GraphQLList(GraphQLFloat), resolve=resolve_array_field,
+                                   description='ヒット面の法線（x, y, z の繰り返し）'),
+            'distance': GraphQLField(GraphQLList(GraphQLFloat), resolve=resolve_array_field,
+                                     description='ヒットまでの距離'),
+            'location_packed': GraphQLField(Float32ArrayScalar, resolve=resolve_packed_array_field,
+                                            description='locationのFloat32Array'),
+            'normal_packed': GraphQLField(Float32ArrayScalar, resolve=resolve_packed_array_field,
+                                          description='normalのFloat32Array'),
+            'distance_packed': GraphQLField(Float32ArrayScalar, resolve=resolve_packed_array_field,
+                                            description='distanceのFloat32Array'),
+            'processing_time_ms': GraphQLField(GraphQLFloat, description='処理時間（ミリ秒）'),
+            'error': GraphQLField(GraphQLString, description='エラーメッセージ')
+        }
+    ))
+    
+    # -----------------------------
+    # メッシュ属性型（valuesは (count × components) のフラットな配列）
+    # -----------------------------
+    
+    schema_registry.register_type('MeshAttributeInfo', GraphQLObjectType(
+        name='MeshAttributeInfo',
+        fields={
+            'name': GraphQLField(GraphQLString, description='属性名'),
+            'domain': GraphQLField(GraphQLString, description='ドメイン（POINT, EDGE, FACE, CORNER）'),
+            'data_type': GraphQLField(GraphQLString, description='データ型'),
+            'components': GraphQLField(GraphQLInt, description='要素あたりの成分数'),
+            'length': GraphQLField(GraphQLInt, description='要素数')
+        }
+    ))
+    
+    schema_registry.register_type('MeshAttributeData', GraphQLObjectType(
+        name='MeshAttributeData',
+        fields={
+            'name': GraphQLField(GraphQLString, description='属性名'),
+            'domain': GraphQLField(GraphQLString, description='ドメイン'),
+            'data_type': GraphQLField(GraphQLString, description='データ型'),
+            'components': GraphQLField(GraphQLInt, description='要素あたりの成分数'),
+            'length': GraphQLField(GraphQLInt, description='要素数'),
+            'start': GraphQLField(GraphQLInt, description='開始要素インデックス'),
+            'count': GraphQLField(GraphQLInt, description='返した要素数'),
+            'values': GraphQLField(GraphQLList(GraphQLFloat), resolve=resolve_array_field,
+                                   description='属性値'),
+            'values_packed': GraphQLField(Float32ArrayScalar, resolve=resolve_packed_array_field,
+                                          description='valuesのFloat32Array'),
+            'processing_time_ms': GraphQLField(GraphQLFloat, description='処理時間（ミリ秒）'),
+            'error': GraphQLField(GraphQLString, description='エラーメッセージ')
+        }
+    ))
+    
+    schema_registry.register_type('MeshAttributeWriteResult', GraphQLObjectType(
+        name='MeshAttributeWriteResult',
+        fields={
+            'success': GraphQLField(GraphQLBoolean, description='成功したかどうか'),
+            'name': GraphQLField(GraphQLString, description='属性名'),
+            'domain': GraphQLField(GraphQLString, description='ドメイン'),
+            'data_type': GraphQLField(GraphQLString, description='データ型'),
+            'created': GraphQLField(GraphQLBoolean, description='属性を新規作成したかどうか'),
+            'start': GraphQLField(GraphQLInt, description='開始要素インデックス'),
+            'count': GraphQLField(GraphQLInt, description='書き込んだ要素数'),
+            'processing_time_ms': GraphQLField(GraphQLFloat, description='処理時間（ミリ秒）'),
+            'error': GraphQLField(GraphQLString, description='エラーメッセージ')
+        }
+    ))
+    
+    # -----------------------------
+    # ジオメトリクエリ
+    # -----------------------------
+    
+    # 複数レイの一括キャスト（origins/directionsはbase64または数値リスト）
+    schema_registry.register_query('batchRaycast', GraphQLField(
+        schema_registry.get_type('BatchRaycastResult'),
+        args={
+            'origins': GraphQLArgument(Float32ArrayScalar, description='レイの開始点（x, y, z の繰り返し）'),
+            'directions': GraphQLArgument(Float32ArrayScalar, description='レイの方向（3要素なら全レイ共通）'),
+            'max_distance': GraphQLArgument(GraphQLFloat, default_value=100.0, description='最大検索距離'),
+            'object_names': GraphQLArgument(GraphQLList(GraphQLString), description='対象オブジェクト名'),
+            'grid': GraphQLArgument(schema_registry.get_type('RayGridInput'), description='格子パターン'),
+            'hemisphere': GraphQLArgument(schema_registry.get_type('RayHemisphereInput'), description='半球パターン')
+        },
+        description='複数のレイをキャッシュしたBVHツリーに対して一括でキャスト',
+        resolve=resolve_batch_raycast
+    ))
+    
+    # 読み書きできるメッシュ属性の一覧
+    schema_registry.register_query('meshAttributes', GraphQLField(
+        GraphQLList(schema_registry.get_type('MeshAttributeInfo')),
+        args={
+            'object_name': GraphQLArgument(GraphQLNonNull(GraphQLString), description='対象オブジェクト名')
+        },
+        description='メッシュで一括読み書きできる属性の一覧',
+        resolve=resolve_mesh_attributes
+    ))
+    
+    # メッシュ属性の一括読み込み（範囲指定可）
+    schema_registry.register_query('meshAttribute', GraphQLField(
+        schema_registry.get_type('MeshAttributeData'),
+        args={
+            'object_name': GraphQLArgument(GraphQLNonNull(GraphQLString), description='対象オブジェクト名'),
+            'attribute': GraphQLArgument(GraphQLNonNull(GraphQLString),
+                                         description='属性名（co, normal, uv, uv:<レイヤー名>, 名前付き属性）'),
+            'start': GraphQLArgument(GraphQLInt, default_value=0, description='開始要素インデックス'),
+            'count': GraphQLArgument(GraphQLInt, description='要素数（省略時は末尾まで）')
+        },
+        description='メッシュ属性をforeach_getで一括読み込み',
+        resolve=resolve_mesh_attribute
+    ))
+    
+    # -----------------------------
+    # ジオメトリミューテーション
+    # -----------------------------
+    
+    # メッシュ属性の一括書き込み（範囲指定可、存在しない名前付き属性は作成）
+    schema_registry.register_mutation('setMeshAttribute', GraphQLField(
+        schema_registry.get_type('MeshAttributeWriteResult'),
+        args={
+            'object_name': GraphQLArgument(GraphQLNonNull(GraphQLString), description='対象オブジェクト名'),
+            'attribute': GraphQLArgument(GraphQLNonNull(GraphQLString), description='属性名'),
+            'values': GraphQLArgument(GraphQLNonNull(NumericArrayScalar),
+                                      description='書き込む値（属性のデータ型で解釈）'),
+            'start': GraphQLArgument(GraphQLInt, default_value=0, description='開始要素インデックス'),
+            'domain': GraphQLArgument(GraphQLString, description='新規作成時のドメイン'),
+            'data_type': GraphQLArgument(GraphQLString, description='新規作成時のデータ型')
+        },
+        description='メッシュ属性をforeach_setで一括書き込み',
+        resolve=resolve_set_mesh_attribute
+    ))
+    
+    logger.info("ジオメトリスキーマを登録しました")
@@ -162,7 +162,8 @@ scene_context_result_type = create_operation_result_type(
         "objectCount": GraphQLField(GraphQLInt, description="オブジェクト数"),
         "selectedObjects": GraphQLField(GraphQLList(object_info_type), description="選択されたオブジェクト"),
         "activeObject": GraphQLField(object_info_type, description="アクティブなオブジェクト"),
-        "mode": GraphQLField(GraphQLString, description="現在のモード")
+        "mode": GraphQLField(GraphQLString, description="現在のモード"),
+        "nextCursor": GraphQLField(GraphQLString, description="selectedObjectsの次ページのカーソル")
     }
 )
 
@@ -198,10 +199,19 @@ capture_preview_result_type = create_operation_result_type(
     }
 )
 
+# シーンコンテキストの取得範囲（フィールド選択とページ分割）
+scene_context_args = {
+    "fields": GraphQLArgument(GraphQLList(GraphQLString),
+                              description="取得するセクション（例: scene, selected_objects.location）"),
+    "limit": GraphQLArgument(GraphQLInt, description="selectedObjectsの1ページの件数（省略時は全件）"),
+    "cursor": GraphQLArgument(GraphQLString, description="前回のnextCursor")
+}
+
 # ドメイン.操作形式のフィールド名で定義されたクエリとミューテーション
 query_fields = {
     "scene.context": GraphQLField(
         scene_context_result_type,
+        args=scene_context_args,
         description="現在のシーンコンテキストを取得",
         resolve=resolve_scene_context
     ),
@@ -279,6 +289,7 @@ mutation_fields = {
 deprecated_query_fields = {
     "sceneContext": GraphQLField(
         scene_context_result_type,
+        args=scene_context_args,
         description="現在のシーンコンテキストを取得（非推奨: 代わりに scene.context を使用してください）",
         deprecation_reason="非推奨: 代わりに scene.context を使用してください",
         resolve=resolve_scene_context
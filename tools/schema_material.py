@@ -0,0 +1,44 @@
+"""
+Blender GraphQL MCP - マテリアルスキーマ拡張
+マテリアル・テクスチャ参照のGraphQLスキーマ定義
+"""
+
+import logging
+from tools import (
+    GraphQLString,
+    GraphQLList,
+    GraphQLNonNull,
+    GraphQLField,
+    GraphQLArgument
+)
+
+logger = logging.getLogger("blender_graphql_mcp.tools.definitions_material")
+
+# レジストリのインポート
+from .schema_registry import schema_registry
+# リゾルバモジュールのインポート
+import tools.handlers as RESOLVER_MODULE
+
+def resolve_materials_using_texture(obj, info, imageName):
+    """materialsUsingTextureクエリのリゾルバ"""
+    return RESOLVER_MODULE.resolve_materials_using_texture(obj, info, imageName)
+
+def register_material_schema():
+    """マテリアル操作のスキーマを登録"""
+    
+    # -----------------------------
+    # マテリアルクエリ
+    # -----------------------------
+    
+    # テクスチャを使用するマテリアルの逆引き（マテリアル指紋インデックスを使用）
+    if hasattr(RESOLVER_MODULE, 'resolve_materials_using_texture'):
+        schema_registry.register_query('materialsUsingTexture', GraphQLField(
+            GraphQLList(GraphQLString),
+            args={
+                'imageName': GraphQLArgument(GraphQLNonNull(GraphQLString), description='画像名')
+            },
+            description='指定した画像テクスチャを使用するマテリアル名',
+            resolve=resolve_materials_using_texture
+        ))
+    
+    logger.info("マテリアルスキーマを登録しました")
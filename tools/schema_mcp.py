@@ -82,7 +82,12 @@ SceneContextType = GraphQLObjectType(
         "objectCount": GraphQLField(GraphQLInt),
         "selectedObjects": GraphQLField(GraphQLList(ObjectInfoType)),
         "activeObject": GraphQLField(ObjectInfoType),
-        "mode": GraphQLField(GraphQLString)
+        "mode": GraphQLField(GraphQLString),
+        "nextCursor": GraphQLField(
+            GraphQLString,
+            resolve=lambda context, info:
+                context.get("page_info", {}).get("selected_objects", {}).get("next_cursor")
+        )
     }
 )
 
@@ -151,7 +156,13 @@ MCPQueryType = GraphQLObjectType(
     fields={
         "sceneContext": GraphQLField(
             SceneContextType,
-            resolve=lambda root, info: info.context["mcp"].context_manager.get_complete_context()
+            args={
+                "fields": GraphQLArgument(GraphQLList(GraphQLString)),
+                "limit": GraphQLArgument(GraphQLInt),
+                "cursor": GraphQLArgument(GraphQLString)
+            },
+            resolve=lambda root, info, fields=None, limit=None, cursor=None:
+                info.context["mcp"].context_manager.get_complete_context(fields, limit, cursor)
         ),
         "selectedObjects": GraphQLField(
             GraphQLList(ObjectInfoType),
@@ -22,7 +22,19 @@ logger = logging.getLogger("blender_graphql_mcp.tools.definitions_mesh")
 # レジストリのインポート
 from .schema_registry import schema_registry
 # リゾルバモジュールのインポート
-import tools.resolver as RESOLVER_MODULE
+import tools.handlers as RESOLVER_MODULE
+
+def resolve_mesh_data(obj, info, name):
+    """meshDataクエリのリゾルバ"""
+    return RESOLVER_MODULE.resolve_mesh_data(obj, info, name)
+
+def resolve_create_mesh(obj, info, **kwargs):
+    """createMeshミューテーションのリゾルバ"""
+    return RESOLVER_MODULE.resolve_create_mesh(obj, info, **kwargs)
+
+def resolve_edit_mesh_vertices(obj, info, **kwargs):
+    """editMeshVerticesミューテーションのリゾルバ"""
+    return RESOLVER_MODULE.resolve_edit_mesh_vertices(obj, info, **kwargs)
 
 def register_mesh_schema():
     """メッシュ操作のスキーマを登録"""
@@ -98,35 +110,39 @@ def register_mesh_schema():
             'name': GraphQLArgument(GraphQLNonNull(GraphQLString), description='メッシュ名')
         },
         description='指定したメッシュの詳細データを取得',
-        resolve=lambda obj, info, name: RESOLVER_MODULE.resolve_mesh_data(obj, info, name)
+        resolve=resolve_mesh_data
     ))
     
     # -----------------------------
     # メッシュミューテーション
     # -----------------------------
     
+    # リゾルバが実装されている操作のみ登録する
+    
     # メッシュ作成
-    schema_registry.register_mutation('mesh.create', GraphQLField(
-        schema_registry.get_type('MeshOperationResult'),
-        args={
-            'name': GraphQLArgument(GraphQLString, description='メッシュ名（省略時は自動生成）'),
-            'primitive_type': GraphQLArgument(GraphQLString, description='プリミティブタイプ（cube, sphere, plane等）'),
-            'params': GraphQLArgument(schema_registry.get_type('ParametersInput'), description='パラメータ')
-        },
-        description='新しいメッシュを作成',
-        resolve=lambda obj, info, **kwargs: RESOLVER_MODULE.resolve_create_mesh(obj, info, **kwargs)
-    ))
+    if hasattr(RESOLVER_MODULE, 'resolve_create_mesh'):
+        schema_registry.register_mutation('createMesh', GraphQLField(
+            schema_registry.get_type('MeshOperationResult'),
+            args={
+                'name': GraphQLArgument(GraphQLString, description='メッシュ名（省略時は自動生成）'),
+                'primitive_type': GraphQLArgument(GraphQLString, description='プリミティブタイプ（cube, sphere, plane等）'),
+                'params': GraphQLArgument(schema_registry.get_type('GeometryParamsInput'), description='パラメータ')
+            },
+            description='新しいメッシュを作成',
+            resolve=resolve_create_mesh
+        ))
     
     # 頂点編集
-    schema_registry.register_mutation('mesh.editVertices', GraphQLField(
-        schema_registry.get_type('MeshOperationResult'),
-        args={
-            'name': GraphQLArgument(GraphQLNonNull(GraphQLString), description='メッシュ名'),
-            'vertices': GraphQLArgument(GraphQLNonNull(GraphQLList(schema_registry.get_type('VectorInput'))), 
-                                       description='新しい頂点座標リスト')
-        },
-        description='メッシュの頂点を編集',
-        resolve=lambda obj, info, **kwargs: RESOLVER_MODULE.resolve_edit_mesh_vertices(obj, info, **kwargs)
-    ))
+    if hasattr(RESOLVER_MODULE, 'resolve_edit_mesh_vertices'):
+        schema_registry.register_mutation('editMeshVertices', GraphQLField(
+            schema_registry.get_type('MeshOperationResult'),
+            args={
+                'name': GraphQLArgument(GraphQLNonNull(GraphQLString), description='メッシュ名'),
+                'vertices': GraphQLArgument(GraphQLNonNull(GraphQLList(schema_registry.get_type('Vector3Input'))), 
+                                           description='新しい頂点座標リスト')
+            },
+            description='メッシュの頂点を編集',
+            resolve=resolve_edit_mesh_vertices
+        ))
     
     logger.info("メッシュスキーマを登録しました")
@@ -295,10 +295,13 @@ def extend_schema_with_optimized_operations(base_schema):
                 default_value='mean'
             )
         },
+        # color_dataを辞書に変換
         resolve=lambda obj, info, object_name, color_data, algorithm='mean':
-            # color_dataを辞書に変換
-            color_dict = {item['vertex_index']: item['color'] for item in color_data}
-            return resolver.resolve_set_vertex_colors(info, object_name, color_dict, algorithm)
+            resolver.resolve_set_vertex_colors(
+                info, object_name,
+                {item['vertex_index']: item['color'] for item in color_data},
+                algorithm
+            )
     )
     
     # 新しいクエリタイプとミューテーションタイプを作成
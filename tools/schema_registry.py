@@ -4,7 +4,7 @@ GraphQLスキーマコンポーネントの登録と管理を一元化
 """
 
 import logging
-from typing import Dict, Any, Optional, List, Set
+from typing import Dict, Any, Optional, List, Set, Tuple
 from tools import (
     GraphQLSchema,
     GraphQLObjectType,
@@ -12,6 +12,11 @@ from tools import (
     GraphQLField
 )
 
+try:
+    from ..utils.lazy_loader import profiled_import
+except (ImportError, ValueError):
+    from utils.lazy_loader import profiled_import
+
 logger = logging.getLogger("blender_graphql_mcp.tools.definitions_registry")
 
 class SchemaRegistry:
@@ -23,6 +28,8 @@ class SchemaRegistry:
         self.query_fields: Dict[str, GraphQLField] = {}
         self.mutation_fields: Dict[str, GraphQLField] = {}
         self.registered_components: Set[str] = set()
+        # 未ロードのコンポーネント: 名前 -> (モジュール, 登録関数名, パッケージ)
+        self.lazy_components: Dict[str, Tuple[str, str, Optional[str]]] = {}
         
     def register_type(self, name: str, type_def: GraphQLType) -> None:
         """型を登録
@@ -31,7 +38,7 @@ class SchemaRegistry:
             name: 型名
             type_def: GraphQL型定義
         """
-        if name in self.types:
+        if name in self.types and self.types[name] is not type_def:
             logger.warning(f"型 '{name}' は既に登録されています。上書きします。")
             
         self.types[name] = type_def
@@ -97,12 +104,54 @@ class SchemaRegistry:
         """
         return component_name in self.registered_components
         
+    def register_lazy_component(self, component_name: str, module_name: str,
+                                func_name: str, package: Optional[str] = None) -> bool:
+        """コンポーネントをスタブとして登録（モジュールはスキーマ構築時にインポート）
+        
+        Args:
+            component_name: コンポーネント名
+            module_name: 登録関数を持つモジュール名
+            func_name: 登録関数名
+            package: 相対インポートの基準パッケージ
+            
+        Returns:
+            新たに登録した場合はTrue
+        """
+        if component_name in self.registered_components or component_name in self.lazy_components:
+            return False
+            
+        self.lazy_components[component_name] = (module_name, func_name, package)
+        return True
+        
+    def materialize(self) -> int:
+        """スタブとして登録されたコンポーネントをロードして登録関数を実行
+        
+        Returns:
+            実体化したコンポーネント数
+        """
+        count = 0
+        for component_name, (module_name, func_name, package) in list(self.lazy_components.items()):
+            del self.lazy_components[component_name]
+            try:
+                module = profiled_import(module_name, package, f"schema:{component_name}")
+                getattr(module, func_name)()
+                self.registered_components.add(component_name)
+                count += 1
+                logger.info(f"スキーマコンポーネント '{component_name}' を実体化しました")
+            except Exception as e:
+                logger.error(f"スキーマコンポーネント '{component_name}' の実体化に失敗しました: {e}")
+        return count
+        
     def build_schema(self) -> GraphQLSchema:
         """登録されたコンポーネントからスキーマを構築
         
+        スタブとして登録されたコンポーネントはここで初めてロードされる。
+        
         Returns:
             構築されたGraphQLスキーマ
         """
+        self.materialize()
+        
         # クエリタイプの構築
         query_type = GraphQLObjectType(
             name='Query',
@@ -122,7 +171,7 @@ class SchemaRegistry:
         
         return GraphQLSchema(
             query=query_type,
-            mutation=mutation_type,
+            mutation=mutation_type if self.mutation_fields else None,
             types=list(self.types.values())
         )
 
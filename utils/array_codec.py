@@ -0,0 +1,216 @@
+"""
+Blender Unified MCP Array Codec
+数値配列をJSONリストの代わりにバイナリ（base64 / NPY）で転送するためのエンコード・デコード
+"""
+
+import io
+import base64
+import logging
+from typing import Any, Dict, Optional, Tuple, Union
+
+import numpy as np
+
+# モジュールレベルのロガー
+logger = logging.getLogger('unified_mcp.utils.array_codec')
+
+# 転送形式はすべてリトルエンディアン
+FLOAT32_LE = np.dtype('<f4')
+INT32_LE = np.dtype('<i4')
+
+# REST応答のメディアタイプ
+MEDIA_TYPE_NPY = 'application/x-npy'
+MEDIA_TYPE_NPZ = 'application/x-npz'
+MEDIA_TYPE_OCTET_STREAM = 'application/octet-stream'
+MEDIA_TYPE_JSON = 'application/json'
+
+BINARY_MEDIA_TYPES = (MEDIA_TYPE_NPY, MEDIA_TYPE_NPZ, MEDIA_TYPE_OCTET_STREAM)
+
+
+def as_float32(values: Any) -> np.ndarray:
+    """
+    値をリトルエンディアンfloat32の連続配列に変換
+
+    Args:
+        values: NumPy配列、数値のシーケンス、またはネストしたリスト
+
+    Returns:
+        float32配列（形状は維持）
+    """
+    return np.ascontiguousarray(values, dtype=FLOAT32_LE)
+
+
+def encode_base64(values: Any, dtype: np.dtype = FLOAT32_LE) -> str:
+    """
+    配列をbase64文字列にエンコード（形状は平坦化される）
+
+    Args:
+        values: 数値配列
+        dtype: 転送時のデータ型
+
+    Returns:
+        base64文字列
+    """
+    array = np.ascontiguousarray(values, dtype=dtype)
+    return base64.b64encode(array.tobytes()).decode('ascii')
+
+
+def decode_base64(value: Union[str, bytes], dtype: np.dtype = FLOAT32_LE,
+                  components: Optional[int] = None) -> np.ndarray:
+    """
+    base64文字列を配列にデコード
+
+    Args:
+        value: base64文字列
+        dtype: 転送時のデータ型
+        components: 指定時は (N, components) に整形
+
+    Returns:
+        ネイティブエンディアンの配列
+    """
+    raw = base64.b64decode(value, validate=True)
+    if len(raw) % dtype.itemsize:
+        raise ValueError(f"バッファ長 {len(raw)} が要素サイズ {dtype.itemsize} の倍数ではありません")
+    array = np.frombuffer(raw, dtype=dtype).astype(dtype.newbyteorder('='))
+    if components:
+        if len(array) % components:
+            raise ValueError(f"要素数 {len(array)} を {components} 成分に分割できません")
+        array = array.reshape(-1, components)
+    return array
+
+
+def decode_array(value: Any, dtype: np.dtype = FLOAT32_LE,
+                 components: Optional[int] = None) -> np.ndarray:
+    """
+    base64文字列または数値リストを指定データ型の配列に変換（入力形式を問わない）
+
+    Args:
+        value: base64文字列、数値リスト、またはNumPy配列
+        dtype: 配列のデータ型（base64はリトルエンディアンとして解釈）
+        components: 指定時は (N, components) に整形
+
+    Returns:
+        ネイティブエンディアンの配列
+    """
+    dtype = np.dtype(dtype)
+    if isinstance(value, (str, bytes)):
+        return decode_base64(value, dtype.newbyteorder('<'), components)
+    array = np.asarray(value, dtype=dtype.newbyteorder('='))
+    if components:
+        array = array.reshape(-1, components)
+    return array
+
+
+def decode_float32(value: Any, components: Optional[int] = None) -> np.ndarray:
+    """
+    base64文字列または数値リストをfloat32配列に変換（入力形式を問わない）
+
+    Args:
+        value: base64文字列、数値リスト、またはNumPy配列
+        components: 指定時は (N, components) に整形
+
+    Returns:
+        float32配列
+    """
+    return decode_array(value, FLOAT32_LE, components)
+
+
+def to_npy_bytes(array: Any) -> bytes:
+    """
+    配列をNPY形式のバイト列に変換（形状とデータ型を含む）
+
+    Args:
+        array: 数値配列
+
+    Returns:
+        NPYバイト列
+    """
+    buffer = io.BytesIO()
+    np.save(buffer, np.asarray(array), allow_pickle=False)
+    return buffer.getvalue()
+
+
+def to_npz_bytes(arrays: Dict[str, Any]) -> bytes:
+    """
+    複数の配列をNPZ形式（非圧縮）のバイト列に変換
+
+    Args:
+        arrays: 名前 -> 配列
+
+    Returns:
+        NPZバイト列
+    """
+    buffer = io.BytesIO()
+    np.savez(buffer, **{name: np.asarray(array) for name, array in arrays.items()})
+    return buffer.getvalue()
+
+
+def from_npy_bytes(data: bytes) -> np.ndarray:
+    """
+    NPY形式のバイト列を配列に変換
+
+    Args:
+        data: NPYバイト列
+
+    Returns:
+        配列
+    """
+    return np.load(io.BytesIO(data), allow_pickle=False)
+
+
+def negotiate_media_type(accept: Optional[str], format_param: Optional[str] = None) -> str:
+    """
+    AcceptヘッダーまたはformatパラメータからREST応答の形式を決定
+
+    Args:
+        accept: Acceptヘッダーの値
+        format_param: 明示的な形式指定（json / npy / npz / binary）
+
+    Returns:
+        メディアタイプ（デフォルトはJSON）
+    """
+    if format_param:
+        return {
+            'npy': MEDIA_TYPE_NPY,
+            'npz': MEDIA_TYPE_NPZ,
+            'binary': MEDIA_TYPE_OCTET_STREAM,
+            'octet-stream': MEDIA_TYPE_OCTET_STREAM,
+        }.get(format_param.lower(), MEDIA_TYPE_JSON)
+
+    if accept:
+        for part in accept.split(','):
+            media_type = part.split(';')[0].strip().lower()
+            if media_type in BINARY_MEDIA_TYPES or media_type == MEDIA_TYPE_JSON:
+                return media_type
+    return MEDIA_TYPE_JSON
+
+
+def encode_arrays(arrays: Dict[str, Any], media_type: str) -> Tuple[bytes, Dict[str, str]]:
+    """
+    配列をバイナリ応答の本文とヘッダーに変換
+
+    NPY / octet-streamは単一配列のみ、複数配列はNPZを使用する。
+    octet-streamは生のリトルエンディアンバッファで、形状とデータ型はヘッダーで返す。
+
+    Args:
+        arrays: 名前 -> 配列
+        media_type: BINARY_MEDIA_TYPESのいずれか
+
+    Returns:
+        (本文, 追加ヘッダー)
+    """
+    if media_type == MEDIA_TYPE_NPZ or len(arrays) != 1:
+        return to_npz_bytes(arrays), {'X-Array-Names': ','.join(arrays)}
+
+    name, array = next(iter(arrays.items()))
+    array = np.asarray(array)
+    headers = {
+        'X-Array-Name': name,
+        'X-Array-Shape': ','.join(str(dim) for dim in array.shape),
+    }
+    if media_type == MEDIA_TYPE_NPY:
+        return to_npy_bytes(array), headers
+
+    array = np.ascontiguousarray(array, dtype=array.dtype.newbyteorder('<'))
+    headers['X-Array-Dtype'] = array.dtype.str
+    return array.tobytes(), headers
+
@@ -0,0 +1,509 @@
+"""
+Blender Unified MCP Disk Cache
+サイズ・有効期限で管理されるディスクキャッシュ
+"""
+
+import os
+import re
+import json
+import time
+import uuid
+import hashlib
+import logging
+import threading
+from contextlib import contextmanager
+from typing import Any, Dict, List, Optional, Union
+
+from .fileutils import (
+    CACHE_DIR, normalize_path, ensure_directory, make_safe_filename, safe_delete
+)
+
+# モジュールレベルのロガー
+logger = logging.getLogger('unified_mcp.utils.disk_cache')
+
+# インデックスファイル名
+INDEX_FILENAME = '.cache_index.json'
+INDEX_VERSION = 1
+
+# デフォルトの上限（環境変数で上書き可能）
+DEFAULT_MAX_BYTES = int(os.environ.get('MCP_CACHE_MAX_BYTES', str(1024 * 1024 * 1024)))
+DEFAULT_MAX_AGE = float(os.environ.get('MCP_CACHE_MAX_AGE', str(7 * 24 * 60 * 60)))
+
+# アクセス時刻のみの更新でインデックスを書き出す最小間隔（秒）
+INDEX_FLUSH_INTERVAL = 5.0
+
+
+class DiskCache:
+    """
+    LRU方式で容量・有効期限を管理するディスクキャッシュ
+
+    エントリごとのサイズ・最終アクセス時刻・キーハッシュをインデックスファイルに記録し、
+    書き込みは一時ファイルからの置き換えで公開するため、読み取り側が書きかけの
+    ファイルを見ることはない。
+    """
+
+    def __init__(self, cache_dir: str = CACHE_DIR,
+                 max_bytes: int = DEFAULT_MAX_BYTES,
+                 max_age: Optional[float] = DEFAULT_MAX_AGE):
+        """
+        Args:
+            cache_dir: キャッシュディレクトリ
+            max_bytes: キャッシュ全体の最大バイト数
+            max_age: エントリの最大保持期間（秒、Noneで無期限）
+        """
+        self.cache_dir = normalize_path(cache_dir)
+        self.index_path = os.path.join(self.cache_dir, INDEX_FILENAME)
+        self.max_bytes = max_bytes
+        self.max_age = max_age
+        self.entries: Dict[str, Dict[str, Any]] = {}  # 相対パス -> エントリ情報
+        self.pending: Dict[str, str] = {}  # get_cache_pathで払い出し済み・未登録の相対パス -> キー
+        self.stats = {'hits': 0, 'misses': 0, 'writes': 0, 'evictions': 0, 'expired': 0}
+        self.lock = threading.RLock()
+        self._dirty = False
+        self._last_flush = 0.0
+        self._loaded = False
+
+    # ---------------------------------------------------------
+    # インデックス管理
+    # ---------------------------------------------------------
+
+    def _ensure_loaded(self) -> None:
+        """インデックスを遅延読み込みし、ディスク上の状態と同期する"""
+        if self._loaded:
+            return
+        ensure_directory(self.cache_dir)
+        try:
+            with open(self.index_path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            if data.get('version') == INDEX_VERSION:
+                self.entries = data.get('entries', {})
+        except FileNotFoundError:
+            pass
+        except Exception as e:
+            logger.warning(f"キャッシュインデックスの読み込みに失敗しました。再構築します: {e}")
+            self.entries = {}
+        self._loaded = True
+        self._reconcile()
+
+    def _reconcile(self) -> None:
+        """インデックスとディスク上のファイルを突き合わせる"""
+        on_disk = set()
+
+        for root, _, files in os.walk(self.cache_dir):
+            for filename in files:
+                if filename == INDEX_FILENAME or '.tmp-' in filename:
+                    continue
+                rel_path = os.path.relpath(os.path.join(root, filename), self.cache_dir)
+                on_disk.add(rel_path)
+                if rel_path not in self.entries:
+                    # インデックス外で書き込まれたファイルを取り込む
+                    self._record(self.pending.pop(rel_path, rel_path), rel_path)
+
+        # ファイルが消えたエントリを削除
+        for rel_path in [p for p in self.entries if p not in on_disk]:
+            del self.entries[rel_path]
+        self._dirty = True
+        self._flush(force=True)
+
+    def _flush(self, force: bool = False) -> None:
+        """インデックスをアトミックに書き出す"""
+        if not self._dirty:
+            return
+        now = time.time()
+        if not force and now - self._last_flush < INDEX_FLUSH_INTERVAL:
+            return
+
+        temp_path = f"{self.index_path}.tmp-{os.getpid()}-{uuid.uuid4().hex[:8]}"
+        try:
+            with open(temp_path, 'w', encoding='utf-8') as f:
+                json.dump({'version': INDEX_VERSION, 'entries': self.entries}, f)
+            os.replace(temp_path, self.index_path)
+            self._dirty = False
+            self._last_flush = now
+        except Exception as e:
+            logger.error(f"キャッシュインデックスの書き込みエラー: {e}")
+            if os.path.exists(temp_path):
+                safe_delete(temp_path, validate_path=False)
+
+    def _record(self, key: str, rel_path: str) -> Optional[Dict[str, Any]]:
+        """ディスク上のファイルをエントリとして登録"""
+        full_path = os.path.join(self.cache_dir, rel_path)
+        try:
+            st = os.stat(full_path)
+        except OSError:
+            return None
+        entry = {
+            'key': key,
+            'hash': self.key_hash(key),
+            'size': st.st_size,
+            'created': st.st_mtime,
+            'last_access': max(st.st_atime, st.st_mtime),
+        }
+        self.entries[rel_path] = entry
+        self._dirty = True
+        return entry
+
+    def _adopt_pending(self) -> None:
+        """払い出し済みパスに書き込まれたファイルを登録"""
+        for rel_path, key in list(self.pending.items()):
+            if os.path.exists(os.path.join(self.cache_dir, rel_path)):
+                self._record(key, rel_path)
+                del self.pending[rel_path]
+
+    # ---------------------------------------------------------
+    # パス・キー
+    # ---------------------------------------------------------
+
+    @staticmethod
+    def key_hash(key: str) -> str:
+        """キャッシュキーのハッシュを計算"""
+        return hashlib.sha1(key.encode('utf-8')).hexdigest()
+
+    def _relative_path(self, key: str) -> str:
+        """キャッシュキーから相対パスを生成"""
+        return make_safe_filename(key)
+
+    def path_for(self, key: str, create_dirs: bool = True) -> str:
+        """
+        キャッシュキーに対応するファイルパスを取得
+
+        呼び出し側がこのパスへ直接書き込んだファイルは、次回の上限チェック時に
+        インデックスへ取り込まれる。
+
+        Args:
+            key: キャッシュキー
+            create_dirs: ディレクトリを作成するかどうか
+
+        Returns:
+            キャッシュファイルのパス
+        """
+        rel_path = self._relative_path(key)
+        full_path = os.path.join(self.cache_dir, rel_path)
+        if create_dirs:
+            ensure_directory(os.path.dirname(full_path))
+
+        with self.lock:
+            self._ensure_loaded()
+            if rel_path in self.entries:
+                self._touch(rel_path)
+            else:
+                self.pending[rel_path] = key
+        return full_path
+
+    def _touch(self, rel_path: str) -> None:
+        """最終アクセス時刻を更新"""
+        self.entries[rel_path]['last_access'] = time.time()
+        self._dirty = True
+        self._flush()
+
+    # ---------------------------------------------------------
+    # 読み書き
+    # ---------------------------------------------------------
+
+    def contains(self, key: str) -> bool:
+        """キーがキャッシュに存在するか確認"""
+        with self.lock:
+            self._ensure_loaded()
+            entry = self.entries.get(self._relative_path(key))
+            return entry is not None and not self._is_expired(entry)
+
+    def get_path(self, key: str) -> Optional[str]:
+        """
+        キャッシュ済みファイルのパスを取得（アクセス時刻を更新）
+
+        Args:
+            key: キャッシュキー
+
+        Returns:
+            ファイルパス、存在しない場合はNone
+        """
+        rel_path = self._relative_path(key)
+        with self.lock:
+            self._ensure_loaded()
+            entry = self.entries.get(rel_path)
+            if entry is None:
+                self.stats['misses'] += 1
+                return None
+            if self._is_expired(entry):
+                self._remove_entry(rel_path)
+                self.stats['expired'] += 1
+                self.stats['misses'] += 1
+                self._flush()
+                return None
+
+            full_path = os.path.join(self.cache_dir, rel_path)
+            if not os.path.exists(full_path):
+                # 他プロセスにより削除された
+                del self.entries[rel_path]
+                self._dirty = True
+                self.stats['misses'] += 1
+                return None
+
+            self.stats['hits'] += 1
+            self._touch(rel_path)
+            return full_path
+
+    def get(self, key: str) -> Optional[bytes]:
+        """
+        キャッシュデータを読み込む
+
+        Args:
+            key: キャッシュキー
+
+        Returns:
+            データ、存在しない場合はNone
+        """
+        full_path = self.get_path(key)
+        if full_path is None:
+            return None
+        try:
+            with open(full_path, 'rb') as f:
+                return f.read()
+        except OSError:
+            # 読み込み直前に削除された場合
+            return None
+
+    @contextmanager
+    def publish(self, key: str):
+        """
+        キャッシュエントリをアトミックに書き込むコンテキストマネージャ
+
+        同一ディレクトリ内の一時ファイルに書き込み、完了後に置き換えるため、
+        並行する読み取り側は常に完全なファイルを見る。
+
+        Args:
+            key: キャッシュキー
+
+        Yields:
+            バイナリ書き込み用のファイルオブジェクト
+        """
+        rel_path = self._relative_path(key)
+        full_path = os.path.join(self.cache_dir, rel_path)
+        ensure_directory(os.path.dirname(full_path))
+        temp_path = f"{full_path}.tmp-{os.getpid()}-{uuid.uuid4().hex[:8]}"
+
+        file_obj = open(temp_path, 'wb')
+        try:
+            yield file_obj
+            file_obj.flush()
+            os.fsync(file_obj.fileno())
+            file_obj.close()
+            os.replace(temp_path, full_path)
+        except Exception:
+            file_obj.close()
+            if os.path.exists(temp_path):
+                safe_delete(temp_path, validate_path=False)
+            raise
+
+        with self.lock:
+            self._ensure_loaded()
+            self.pending.pop(rel_path, None)
+            self._record(key, rel_path)
+            self.stats['writes'] += 1
+            self._enforce_limits()
+            self._flush(force=True)
+
+    def put(self, key: str, data: Union[bytes, str], encoding: str = 'utf-8') -> str:
+        """
+        データをキャッシュに書き込む
+
+        Args:
+            key: キャッシュキー
+            data: 書き込むデータ
+            encoding: 文字列の場合のエンコーディング
+
+        Returns:
+            キャッシュファイルのパス
+        """
+        if isinstance(data, str):
+            data = data.encode(encoding)
+        with self.publish(key) as f:
+            f.write(data)
+        return os.path.join(self.cache_dir, self._relative_path(key))
+
+    def remove(self, key: str) -> bool:
+        """キャッシュエントリを削除"""
+        with self.lock:
+            self._ensure_loaded()
+            removed = self._remove_entry(self._relative_path(key))
+            self._flush(force=True)
+            return removed
+
+    def _remove_entry(self, rel_path: str) -> bool:
+        """エントリとファイルを削除（ロック取得済み前提）"""
+        entry = self.entries.pop(rel_path, None)
+        if entry is None:
+            return False
+        self._dirty = True
+        full_path = os.path.join(self.cache_dir, rel_path)
+        if os.path.exists(full_path):
+            # 読み取り中のファイルはPOSIXではハンドルが閉じるまで残る
+            return safe_delete(full_path, validate_path=False)
+        return True
+
+    # ---------------------------------------------------------
+    # 退避
+    # ---------------------------------------------------------
+
+    def _is_expired(self, entry: Dict[str, Any], now: Optional[float] = None) -> bool:
+        """エントリが有効期限切れか判定"""
+        if self.max_age is None:
+            return False
+        return (now or time.time()) - entry['last_access'] > self.max_age
+
+    def total_bytes(self) -> int:
+        """インデックス上の合計サイズを取得"""
+        return sum(entry['size'] for entry in self.entries.values())
+
+    def _enforce_limits(self) -> int:
+        """有効期限切れと容量超過のエントリを退避（ロック取得済み前提）"""
+        self._adopt_pending()
+        removed = 0
+
+        now = time.time()
+        for rel_path in [p for p, e in self.entries.items() if self._is_expired(e, now)]:
+            if self._remove_entry(rel_path):
+                removed += 1
+                self.stats['expired'] += 1
+
+        total = self.total_bytes()
+        if total > self.max_bytes:
+            # 最終アクセスが古い順に削除
+            for rel_path, entry in sorted(self.entries.items(), key=lambda item: item[1]['last_access']):
+                if total <= self.max_bytes:
+                    break
+                size = entry['size']
+                if self._remove_entry(rel_path):
+                    total -= size
+                    removed += 1
+                    self.stats['evictions'] += 1
+
+        if removed:
+            logger.debug(f"{removed}個のキャッシュエントリを退避しました")
+        return removed
+
+    def enforce_limits(self) -> int:
+        """
+        容量・有効期限の上限を適用
+
+        Returns:
+            削除されたエントリ数
+        """
+        with self.lock:
+            self._ensure_loaded()
+            removed = self._enforce_limits()
+            self._flush(force=True)
+            return removed
+
+    def clear(self, pattern: Optional[str] = None) -> int:
+        """
+        キャッシュエントリをクリア
+
+        Args:
+            pattern: 削除するファイルのパターン（正規表現、ファイルパスに対して照合）
+
+        Returns:
+            削除されたエントリ数
+        """
+        pattern_regex = re.compile(pattern) if pattern else None
+
+        with self.lock:
+            self._ensure_loaded()
+            # インデックス外のファイルも対象にするため、メモリ上のインデックス（未書き出しの
+            # last_accessを含む）を維持したままディスクと再同期する
+            self._adopt_pending()
+            self._reconcile()
+
+            count = 0
+            for rel_path in list(self.entries):
+                full_path = os.path.join(self.cache_dir, rel_path)
+                if pattern_regex and not pattern_regex.search(full_path):
+                    continue
+                if self._remove_entry(rel_path):
+                    count += 1
+
+            self._flush(force=True)
+            logger.debug(f"{count}個のキャッシュファイルを削除しました")
+            return count
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        キャッシュ統計情報を取得
+
+        Returns:
+            統計情報
+        """
+        with self.lock:
+            self._ensure_loaded()
+            self._adopt_pending()
+            lookups = self.stats['hits'] + self.stats['misses']
+            oldest = min((e['last_access'] for e in self.entries.values()), default=None)
+            stats = dict(self.stats)
+            stats.update({
+                'cache_dir': self.cache_dir,
+                'entries': len(self.entries),
+                'total_bytes': self.total_bytes(),
+                'max_bytes': self.max_bytes,
+                'max_age': self.max_age,
+                'usage': self.total_bytes() / self.max_bytes if self.max_bytes else 0.0,
+                'hit_rate': (self.stats['hits'] / lookups * 100) if lookups else 0.0,
+                'oldest_access': oldest,
+            })
+            return stats
+
+    def list_entries(self, limit: int = 100) -> List[Dict[str, Any]]:
+        """
+        最近アクセスされた順にエントリ一覧を取得
+
+        Args:
+            limit: 最大件数
+
+        Returns:
+            エントリ情報のリスト
+        """
+        with self.lock:
+            self._ensure_loaded()
+            items = sorted(self.entries.items(), key=lambda item: item[1]['last_access'], reverse=True)
+            return [dict(entry, path=rel_path) for rel_path, entry in items[:limit]]
+
+    def close(self) -> None:
+        """未書き出しのインデックスを保存"""
+        with self.lock:
+            if self._loaded:
+                self._flush(force=True)
+
+
+# グローバルキャッシュインスタンス
+_disk_cache_instance: Optional[DiskCache] = None
+_disk_cache_lock = threading.Lock()
+
+
+def get_disk_cache() -> DiskCache:
+    """グローバルのディスクキャッシュインスタンスを取得"""
+    global _disk_cache_instance
+    if _disk_cache_instance is None:
+        with _disk_cache_lock:
+            if _disk_cache_instance is None:
+                _disk_cache_instance = DiskCache()
+    return _disk_cache_instance
+
+
+def configure_disk_cache(max_bytes: Optional[int] = None, max_age: Optional[float] = None) -> DiskCache:
+    """
+    ディスクキャッシュの上限を変更して即座に適用
+
+    Args:
+        max_bytes: 最大バイト数
+        max_age: 最大保持期間（秒）
+
+    Returns:
+        ディスクキャッシュインスタンス
+    """
+    cache = get_disk_cache()
+    with cache.lock:
+        if max_bytes is not None:
+            cache.max_bytes = max_bytes
+        if max_age is not None:
+            cache.max_age = max_age
+    cache.enforce_limits()
+    return cache
@@ -0,0 +1,157 @@
+"""
+Blender Unified MCP Fast JSON
+orjsonが利用可能な場合はorjsonで、なければ標準jsonでエンコードし、
+NumPy・mathutilsの値をそのまま扱えるようにするJSONエンコーダ
+"""
+
+import os
+import json
+import logging
+from typing import Any, Iterator
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
+# モジュールレベルのロガー
+logger = logging.getLogger('unified_mcp.utils.fast_json')
+
+# この要素数以上のリストを含む応答はストリーミングで送信する
+STREAM_THRESHOLD = int(os.environ.get('MCP_JSON_STREAM_THRESHOLD', '1000'))
+
+# ストリーミング時に1チャンクにまとめる要素数
+STREAM_CHUNK_ITEMS = int(os.environ.get('MCP_JSON_STREAM_CHUNK_ITEMS', '500'))
+
+# ストリーミング判定で辿るネストの深さ
+_STREAM_SCAN_DEPTH = 4
+
+if ORJSON_AVAILABLE:
+    _ORJSON_OPTIONS = orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+
+
+def _default(obj: Any) -> Any:
+    """
+    JSONで表現できない値を変換
+
+    Args:
+        obj: 変換する値
+
+    Returns:
+        JSONで表現できる値
+    """
+    if NUMPY_AVAILABLE:
+        if isinstance(obj, np.ndarray):
+            return obj.tolist()
+        if isinstance(obj, np.generic):
+            return obj.item()
+    if isinstance(obj, (set, frozenset, tuple)):
+        return list(obj)
+    if hasattr(obj, 'isoformat'):
+        return obj.isoformat()
+    if hasattr(obj, 'dict') and callable(obj.dict):
+        # pydanticモデル
+        return obj.dict()
+    if hasattr(obj, '__iter__') and hasattr(obj, '__len__'):
+        # mathutils.Vector / Color / Euler / Quaternion / Matrix など
+        return list(obj)
+    return str(obj)
+
+
+def dumps(data: Any) -> bytes:
+    """
+    データをJSONバイト列にエンコード
+
+    Args:
+        data: エンコードするデータ
+
+    Returns:
+        UTF-8のJSONバイト列
+    """
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(data, default=_default, option=_ORJSON_OPTIONS)
+    return json.dumps(data, default=_default, ensure_ascii=False,
+                      separators=(',', ':')).encode('utf-8')
+
+
+def loads(data: Any) -> Any:
+    """
+    JSONをデコード
+
+    Args:
+        data: JSON文字列またはバイト列
+
+    Returns:
+        デコードしたデータ
+    """
+    if ORJSON_AVAILABLE:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def should_stream(data: Any, threshold: int = STREAM_THRESHOLD, depth: int = _STREAM_SCAN_DEPTH) -> bool:
+    """
+    データにストリーミングすべき大きなリストが含まれるかを判定
+
+    Args:
+        data: 判定するデータ
+        threshold: ストリーミングするリストの要素数
+        depth: 辿るネストの深さ
+
+    Returns:
+        threshold以上の要素を持つリストが含まれる場合True
+    """
+    if isinstance(data, (list, tuple)):
+        return len(data) >= threshold
+    if isinstance(data, dict) and depth > 0:
+        return any(should_stream(value, threshold, depth - 1) for value in data.values())
+    return False
+
+
+def _encode_key(key: Any) -> bytes:
+    """辞書のキーをエンコード（文字列以外のキーはdumpsと同じ規則で文字列化）"""
+    if isinstance(key, str):
+        return dumps(key)
+    # '{"key":0}' から '"key"' を取り出す
+    return dumps({key: 0})[1:-3]
+
+
+def iter_json(data: Any, chunk_items: int = STREAM_CHUNK_ITEMS) -> Iterator[bytes]:
+    """
+    データをJSONのチャンク列としてエンコード
+
+    大きなリストはchunk_items件ずつまとめてエンコードし、辞書は大きな
+    リストを含む場合のみキーごとに分割する。連結した結果はdumps(data)と
+    同じJSONになる。
+
+    Args:
+        data: エンコードするデータ
+        chunk_items: 1チャンクにまとめるリストの要素数
+
+    Yields:
+        JSONのバイト列の断片
+    """
+    chunk_items = max(1, chunk_items)
+
+    if isinstance(data, dict) and should_stream(data, chunk_items + 1):
+        separator = b'{'
+        for key, value in data.items():
+            yield separator + _encode_key(key) + b':'
+            yield from iter_json(value, chunk_items)
+            separator = b','
+        yield b'}'
+    elif isinstance(data, (list, tuple)) and len(data) > chunk_items:
+        for start in range(0, len(data), chunk_items):
+            chunk = dumps(list(data[start:start + chunk_items]))
+            # 前後の角括弧を外してつなぐ
+            yield (b'[' if start == 0 else b',') + chunk[1:-1]
+        yield b']'
+    else:
+        yield dumps(data)
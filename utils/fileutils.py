@@ -1127,6 +1127,9 @@ def get_cache_path(cache_key: str, create_dirs: bool = True) -> str:
     """
     キャッシュファイルのパスを取得
     
+    返されたパスに書き込まれたファイルはディスクキャッシュ（disk_cache.DiskCache）の
+    インデックスに取り込まれ、容量・有効期限の上限に従って退避される。
+    
     Args:
         cache_key: キャッシュキー（パスとして有効であること）
         create_dirs: ディレクトリを作成するかどうか
@@ -1134,17 +1137,8 @@ def get_cache_path(cache_key: str, create_dirs: bool = True) -> str:
     Returns:
         キャッシュファイルのパス
     """
-    # 安全なファイル名に変換
-    safe_key = make_safe_filename(cache_key)
-    
-    # キャッシュディレクトリパス
-    cache_path = os.path.join(CACHE_DIR, safe_key)
-    
-    if create_dirs:
-        # ディレクトリを作成
-        ensure_directory(os.path.dirname(cache_path))
-    
-    return cache_path
+    from .disk_cache import get_disk_cache
+    return get_disk_cache().path_for(cache_key, create_dirs=create_dirs)
 
 
 def clear_cache(pattern: Optional[str] = None) -> int:
@@ -1160,28 +1154,12 @@ def clear_cache(pattern: Optional[str] = None) -> int:
     if not os.path.exists(CACHE_DIR):
         return 0
     
-    count = 0
-    pattern_regex = re.compile(pattern) if pattern else None
-    
     try:
-        # キャッシュディレクトリ内のファイルを走査
-        for root, _, files in os.walk(CACHE_DIR):
-            for filename in files:
-                file_path = os.path.join(root, filename)
-                
-                # パターンフィルタリング
-                if pattern_regex and not pattern_regex.search(file_path):
-                    continue
-                
-                # ファイル削除
-                if safe_delete(file_path, validate_path=False):
-                    count += 1
-        
-        logger.debug(f"{count}個のキャッシュファイルを削除しました")
-        return count
+        from .disk_cache import get_disk_cache
+        return get_disk_cache().clear(pattern)
     except Exception as e:
         logger.error(f"キャッシュクリアエラー: {e}")
-        return count
+        return 0
 
 
 # ---------------------------------------------------------
@@ -1193,9 +1171,22 @@ def register():
     # キャッシュディレクトリの作成
     ensure_directory(CACHE_DIR)
     
+    # 前回セッションからの期限切れ・容量超過エントリを退避
+    try:
+        from .disk_cache import get_disk_cache
+        get_disk_cache().enforce_limits()
+    except Exception as e:
+        logger.warning(f"ディスクキャッシュの上限適用に失敗しました: {e}")
+    
     logger.info("ファイルユーティリティモジュールを登録しました")
 
 
 def unregister():
     """ファイルユーティリティモジュールの登録解除"""
+    try:
+        from .disk_cache import get_disk_cache
+        get_disk_cache().close()
+    except Exception as e:
+        logger.warning(f"ディスクキャッシュの終了処理に失敗しました: {e}")
+    
     logger.info("ファイルユーティリティモジュールを登録解除しました")
\ No newline at end of file
@@ -0,0 +1,312 @@
+"""
+Blender Unified MCP JSON Responses
+fast_jsonを使うJSON応答・大きなリストのストリーミング応答と、
+リクエストごとにbrotli/gzipを選択する圧縮ミドルウェア
+"""
+
+import os
+import gzip
+import time
+import zlib
+import random
+import logging
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.responses import JSONResponse, StreamingResponse
+
+from . import fast_json
+
+try:
+    import brotli
+    BROTLI_AVAILABLE = True
+except ImportError:
+    BROTLI_AVAILABLE = False
+
+# モジュールレベルのロガー
+logger = logging.getLogger('unified_mcp.utils.json_responses')
+
+# これより小さい応答は圧縮しない
+COMPRESSION_MIN_SIZE = int(os.environ.get('MCP_COMPRESSION_MIN_SIZE', '1024'))
+
+# 圧縮レベル（速度優先）
+GZIP_LEVEL = int(os.environ.get('MCP_GZIP_LEVEL', '6'))
+BROTLI_QUALITY = int(os.environ.get('MCP_BROTLI_QUALITY', '4'))
+
+# 圧縮対象のContent-Type
+COMPRESSIBLE_TYPES = ('application/json', 'text/', 'application/javascript',
+                      'application/graphql-response+json', 'image/svg+xml')
+
+# 圧縮しないContent-Type（イベントストリームは圧縮器でバッファされ配信が遅れる）
+UNCOMPRESSIBLE_TYPES = ('text/event-stream',)
+
+
+class FastJSONResponse(JSONResponse):
+    """fast_json（orjson / NumPy対応）でエンコードするJSON応答"""
+
+    def render(self, content: Any) -> bytes:
+        return fast_json.dumps(content)
+
+
+class StreamingJSONResponse(StreamingResponse):
+    """大きなリストをチャンクごとにエンコードして送信するJSON応答"""
+
+    def __init__(self, content: Any, status_code: int = 200, headers: Optional[Dict[str, str]] = None,
+                 chunk_items: int = fast_json.STREAM_CHUNK_ITEMS):
+        super().__init__(
+            fast_json.iter_json(content, chunk_items),
+            status_code=status_code,
+            headers=headers,
+            media_type='application/json'
+        )
+
+
+def json_response(content: Any, status_code: int = 200, headers: Optional[Dict[str, str]] = None,
+                  stream_threshold: int = fast_json.STREAM_THRESHOLD):
+    """
+    内容に応じてJSON応答を作成
+
+    FastAPIのjsonable_encoderを経由しないため、エンドポイントから直接返すと
+    辞書の再構築を省いてエンコードできる。
+
+    Args:
+        content: 応答の内容
+        status_code: HTTPステータスコード
+        headers: 追加のヘッダー
+        stream_threshold: この要素数以上のリストを含む場合はストリーミング
+
+    Returns:
+        FastJSONResponse または StreamingJSONResponse
+    """
+    if fast_json.should_stream(content, stream_threshold):
+        return StreamingJSONResponse(content, status_code=status_code, headers=headers)
+    return FastJSONResponse(content, status_code=status_code, headers=headers)
+
+
+def negotiate_encoding(accept_encoding: Optional[str]) -> Optional[str]:
+    """
+    Accept-Encodingから使用する圧縮形式を選択
+
+    Args:
+        accept_encoding: Accept-Encodingヘッダーの値
+
+    Returns:
+        'br' / 'gzip'（圧縮しない場合はNone）
+    """
+    if not accept_encoding:
+        return None
+
+    supported = ['br', 'gzip'] if BROTLI_AVAILABLE else ['gzip']
+    weights = {}
+    for part in accept_encoding.split(','):
+        coding, _, params = part.strip().partition(';')
+        coding = coding.strip().lower()
+        weight = 1.0
+        params = params.strip()
+        if params.startswith('q='):
+            try:
+                weight = float(params[2:])
+            except ValueError:
+                weight = 0.0
+        weights[coding] = weight
+
+    best = None
+    best_weight = 0.0
+    for coding in supported:
+        weight = weights.get(coding, weights.get('*', 0.0))
+        # 同じ重みならsupportedの順（brを優先）
+        if weight > best_weight:
+            best, best_weight = coding, weight
+    return best
+
+
+class _Compressor:
+    """gzip / brotli のストリーム圧縮器"""
+
+    def __init__(self, encoding: str):
+        self.encoding = encoding
+        if encoding == 'br':
+            self._compressor = brotli.Compressor(quality=BROTLI_QUALITY)
+        else:
+            self._compressor = zlib.compressobj(GZIP_LEVEL, zlib.DEFLATED, 16 + zlib.MAX_WBITS)
+
+    def compress(self, data: bytes) -> bytes:
+        """チャンクを圧縮し、受信側がすぐ展開できるようにフラッシュ"""
+        if self.encoding == 'br':
+            return self._compressor.process(data) + self._compressor.flush()
+        return self._compressor.compress(data) + self._compressor.flush(zlib.Z_SYNC_FLUSH)
+
+    def finish(self, data: bytes = b'') -> bytes:
+        """残りを圧縮してストリームを終了"""
+        if self.encoding == 'br':
+            return self._compressor.process(data) + self._compressor.finish()
+        return self._compressor.compress(data) + self._compressor.flush()
+
+
+class CompressionMiddleware:
+    """
+    リクエストごとにbrotli/gzipを選択して応答を圧縮するASGIミドルウェア
+
+    単一ボディの応答はまとめて圧縮し、ストリーミング応答はチャンクごとに
+    圧縮・フラッシュして送信する。既にContent-Encodingを持つ応答
+    （事前圧縮済みのドキュメントなど）、圧縮対象外の型、イベントストリーム、
+    Cache-Control: no-transformを指定した応答はそのまま通す。
+    """
+
+    def __init__(self, app, minimum_size: int = COMPRESSION_MIN_SIZE):
+        self.app = app
+        self.minimum_size = minimum_size
+
+    async def __call__(self, scope, receive, send):
+        if scope['type'] != 'http':
+            await self.app(scope, receive, send)
+            return
+
+        encoding = negotiate_encoding(Headers(scope=scope).get('accept-encoding'))
+        if encoding is None:
+            await self.app(scope, receive, send)
+            return
+
+        start_message = None
+        compressor = None
+        passthrough = False
+
+        async def send_compressed(message):
+            nonlocal start_message, compressor, passthrough
+
+            if message['type'] == 'http.response.start':
+                start_message = message
+                return
+            if message['type'] != 'http.response.body' or passthrough:
+                await send(message)
+                return
+
+            body = message.get('body', b'')
+            more_body = message.get('more_body', False)
+
+            if compressor is None:
+                headers = MutableHeaders(raw=start_message['headers'])
+                content_type = headers.get('content-type', '')
+                if ('content-encoding' in headers
+                        or not content_type.startswith(COMPRESSIBLE_TYPES)
+                        or content_type.startswith(UNCOMPRESSIBLE_TYPES)
+                        or 'no-transform' in headers.get('cache-control', '').lower()
+                        or (not more_body and len(body) < self.minimum_size)):
+                    passthrough = True
+                    await send(start_message)
+                    await send(message)
+                    return
+
+                compressor = _Compressor(encoding)
+                headers['Content-Encoding'] = encoding
+                headers.add_vary_header('Accept-Encoding')
+
+                if not more_body:
+                    body = compressor.finish(body)
+                    headers['Content-Length'] = str(len(body))
+                    await send(start_message)
+                    await send({'type': 'http.response.body', 'body': body})
+                    return
+
+                # ストリーミング応答は長さが決まらないためチャンク転送にする
+                if 'content-length' in headers:
+                    del headers['content-length']
+                await send(start_message)
+
+            body = compressor.compress(body) if more_body else compressor.finish(body)
+            await send({'type': 'http.response.body', 'body': body, 'more_body': more_body})
+
+        await self.app(scope, receive, send_compressed)
+
+
+def _synthetic_scene_objects(count: int, seed: int = 0) -> List[Dict[str, Any]]:
+    """/api/objects?detailed=true と同じ形の合成オブジェクトリストを生成"""
+    rng = random.Random(seed)
+    types = ['MESH', 'MESH', 'MESH', 'LIGHT', 'CAMERA', 'EMPTY', 'CURVE']
+    objects = []
+    for index in range(count):
+        obj_type = rng.choice(types)
+        obj = {
+            'name': f'{obj_type.title()}.{index:05d}',
+            'type': obj_type,
+            'location': [round(rng.uniform(-100, 100), 4) for _ in range(3)],
+            'dimensions': [round(rng.uniform(0.1, 10), 4) for _ in range(3)]
+        }
+        if obj_type == 'MESH':
+            obj.update({
+                'vertices': rng.randint(8, 200000),
+                'faces': rng.randint(6, 200000),
+                'materials': [f'Material.{rng.randint(0, 200):03d}' for _ in range(rng.randint(0, 3))]
+            })
+        objects.append(obj)
+    return objects
+
+
+def _best_time(func, repeat: int) -> Tuple[float, Any]:
+    """funcを繰り返し実行し、最短時間（ミリ秒）と結果を返す"""
+    best = None
+    result = None
+    for _ in range(max(1, repeat)):
+        start_time = time.perf_counter()
+        result = func()
+        elapsed = (time.perf_counter() - start_time) * 1000
+        best = elapsed if best is None else min(best, elapsed)
+    return round(best, 3), result
+
+
+def benchmark_json_responses(object_counts: Iterable[int] = (1000, 10000, 50000),
+                             repeat: int = 3, content: Optional[Any] = None) -> List[Dict[str, Any]]:
+    """
+    応答のエンコード・圧縮の時間とバイト数を比較計測
+
+    標準json（FastAPIの既定と同等）、fast_json、ストリーミング（最初のチャンク
+    までの時間）と、gzip / brotli圧縮後のサイズを計測する。
+
+    Args:
+        object_counts: 合成シーンのオブジェクト数
+        repeat: 計測回数（最小値を採用）
+        content: 計測する応答内容（指定した場合はobject_countsを無視）
+
+    Returns:
+        オブジェクト数ごとの計測結果のリスト
+    """
+    import json
+
+    if content is not None:
+        cases = [(None, content)]
+    else:
+        cases = [(count, {'status': 'success', 'message': 'Objects list',
+                          'data': {'count': count, 'objects': _synthetic_scene_objects(count)}})
+                 for count in object_counts]
+
+    results = []
+    for count, payload in cases:
+        stdlib_ms, stdlib_body = _best_time(
+            lambda: json.dumps(payload, ensure_ascii=False, allow_nan=False,
+                               separators=(',', ':')).encode('utf-8'),
+            repeat
+        )
+        fast_ms, fast_body = _best_time(lambda: fast_json.dumps(payload), repeat)
+        first_chunk_ms, _ = _best_time(lambda: next(fast_json.iter_json(payload)), repeat)
+        stream_ms, _ = _best_time(lambda: sum(len(chunk) for chunk in fast_json.iter_json(payload)), repeat)
+        gzip_ms, gzip_body = _best_time(lambda: gzip.compress(fast_body, GZIP_LEVEL), repeat)
+
+        result = {
+            'objects': count,
+            'orjson': fast_json.ORJSON_AVAILABLE,
+            'bytes': {'json': len(stdlib_body), 'fast_json': len(fast_body), 'gzip': len(gzip_body)},
+            'timings_ms': {
+                'json': stdlib_ms,
+                'fast_json': fast_ms,
+                'stream_first_chunk': first_chunk_ms,
+                'stream_total': stream_ms,
+                'gzip': gzip_ms
+            }
+        }
+        if BROTLI_AVAILABLE:
+            brotli_ms, brotli_body = _best_time(lambda: brotli.compress(fast_body, quality=BROTLI_QUALITY), repeat)
+            result['bytes']['brotli'] = len(brotli_body)
+            result['timings_ms']['brotli'] = brotli_ms
+        results.append(result)
+
+    return results
@@ -0,0 +1,380 @@
+"""
+Blender Unified MCP Lazy Loader
+重いモジュールの遅延インポートと起動時間プロファイリング
+"""
+
+import os
+import sys
+import time
+import types
+import logging
+import threading
+import importlib
+import importlib.util
+from typing import Any, Callable, Dict, List, Optional
+
+# モジュールレベルのロガー
+logger = logging.getLogger('unified_mcp.utils.lazy_loader')
+
+# 遅延ロードを無効化する環境変数（デバッグ用に全モジュールを即時ロード）
+EAGER_IMPORTS = os.environ.get('MCP_EAGER_IMPORTS', '0').lower() in ('1', 'true', 'yes')
+
+# 前回計測したインポート時間の保存先（キャッシュキー）
+PROFILE_CACHE_KEY = 'import_profile.json'
+
+
+class ImportProfiler:
+    """
+    モジュールのインポート時間を記録し、遅延ロードによる起動時間の削減量を集計する
+
+    起動完了（startup_complete）前のインポートは「起動時」、以降は「遅延」として記録する。
+    一度もロードされなかったモジュールは前回セッションの計測値を削減量の推定に使う。
+    """
+
+    def __init__(self):
+        self.records: Dict[str, Dict[str, Any]] = {}
+        self.deferred: Dict[str, str] = {}  # 遅延登録されたモジュール名 -> 用途
+        self.startup_started = time.perf_counter()
+        self.startup_finished: Optional[float] = None
+        self.previous: Dict[str, float] = {}
+        self.lock = threading.RLock()
+
+    @property
+    def in_startup(self) -> bool:
+        """起動処理中かどうか"""
+        return self.startup_finished is None
+
+    def register_deferred(self, module_name: str, purpose: str = "") -> None:
+        """遅延ロード対象のモジュールを記録"""
+        with self.lock:
+            self.deferred.setdefault(module_name, purpose)
+
+    def record(self, module_name: str, seconds: float, trigger: str = "") -> None:
+        """
+        インポート時間を記録
+
+        Args:
+            module_name: モジュール名
+            seconds: インポートにかかった時間（秒）
+            trigger: ロードのきっかけ（アクセスされた属性名など）
+        """
+        with self.lock:
+            if module_name in self.records:
+                return
+            self.records[module_name] = {
+                'seconds': seconds,
+                'phase': 'startup' if self.in_startup else 'deferred',
+                'trigger': trigger,
+                'loaded_at': time.time(),
+            }
+        logger.debug(f"モジュール '{module_name}' をロードしました ({seconds * 1000:.1f}ms, {trigger or '直接'})")
+
+    def startup_complete(self) -> float:
+        """
+        起動完了を記録
+
+        Returns:
+            起動にかかった時間（秒）
+        """
+        with self.lock:
+            if self.startup_finished is None:
+                self.startup_finished = time.perf_counter()
+                self._load_previous()
+            elapsed = self.startup_finished - self.startup_started
+        logger.info(f"アドオン起動完了: {elapsed * 1000:.1f}ms "
+                    f"(遅延モジュール {len(self.deferred)}個)")
+        return elapsed
+
+    def _load_previous(self) -> None:
+        """前回セッションの計測値を読み込む"""
+        try:
+            from .fileutils import get_cache_path, safe_read_json
+            path = get_cache_path(PROFILE_CACHE_KEY)
+            if os.path.exists(path):
+                self.previous = safe_read_json(path, default={}) or {}
+        except Exception as e:
+            logger.debug(f"前回のインポート計測値を読み込めません: {e}")
+
+    def save(self) -> None:
+        """計測値を次回セッション用に保存"""
+        with self.lock:
+            data = dict(self.previous)
+            data.update({name: rec['seconds'] for name, rec in self.records.items()})
+        try:
+            from .fileutils import get_cache_path, safe_write_json
+            safe_write_json(get_cache_path(PROFILE_CACHE_KEY), data)
+        except Exception as e:
+            logger.debug(f"インポート計測値を保存できません: {e}")
+
+    def get_report(self) -> Dict[str, Any]:
+        """
+        モジュールごとのインポート時間と削減量のレポートを取得
+
+        Returns:
+            レポート辞書
+        """
+        with self.lock:
+            modules: List[Dict[str, Any]] = []
+            total_saved = 0.0
+            startup_import = 0.0
+
+            names = set(self.records) | set(self.deferred)
+            for name in sorted(names):
+                rec = self.records.get(name)
+                entry = {
+                    'module': name,
+                    'purpose': self.deferred.get(name, ''),
+                    'deferred': name in self.deferred,
+                    'loaded': rec is not None,
+                    'phase': rec['phase'] if rec else None,
+                    'import_ms': rec['seconds'] * 1000 if rec else None,
+                    'trigger': rec['trigger'] if rec else None,
+                }
+                if rec and rec['phase'] == 'startup':
+                    startup_import += rec['seconds']
+                    entry['saved_ms'] = 0.0
+                elif rec:
+                    # 起動後に初めて必要になった
+                    entry['saved_ms'] = rec['seconds'] * 1000
+                    total_saved += rec['seconds']
+                elif name in self.previous:
+                    # 未ロード: 前回計測値から推定
+                    entry['saved_ms'] = self.previous[name] * 1000
+                    entry['estimated'] = True
+                    total_saved += self.previous[name]
+                else:
+                    entry['saved_ms'] = None
+                modules.append(entry)
+
+            startup_ms = None
+            if self.startup_finished is not None:
+                startup_ms = (self.startup_finished - self.startup_started) * 1000
+
+            return {
+                'startup_ms': startup_ms,
+                'startup_import_ms': startup_import * 1000,
+                'saved_ms': total_saved * 1000,
+                'modules': modules,
+            }
+
+    def log_report(self) -> None:
+        """レポートをログに出力"""
+        report = self.get_report()
+        logger.info(f"遅延ロードによる起動時間の削減: {report['saved_ms']:.1f}ms")
+        for entry in report['modules']:
+            if entry['saved_ms']:
+                state = 'ロード済み' if entry['loaded'] else '未ロード'
+                logger.info(f"  {entry['module']}: {entry['saved_ms']:.1f}ms ({state})")
+
+
+# グローバルプロファイラー
+profiler = ImportProfiler()
+
+
+def profiled_import(module_name: str, package: Optional[str] = None, trigger: str = "") -> types.ModuleType:
+    """
+    インポート時間を計測しながらモジュールをインポート
+
+    Args:
+        module_name: モジュール名（相対名の場合はpackageが必要）
+        package: 相対インポートの基準パッケージ
+        trigger: ロードのきっかけ
+
+    Returns:
+        インポートされたモジュール
+    """
+    full_name = importlib.util.resolve_name(module_name, package) if module_name.startswith('.') else module_name
+    already_loaded = full_name in sys.modules
+
+    start = time.perf_counter()
+    module = importlib.import_module(module_name, package)
+    if not already_loaded:
+        profiler.record(full_name, time.perf_counter() - start, trigger)
+    return module
+
+
+class LazyModule(types.ModuleType):
+    """
+    属性に初めてアクセスされた時点で実モジュールをインポートするプロキシ
+    """
+
+    def __init__(self, module_name: str, package: Optional[str] = None, purpose: str = ""):
+        full_name = importlib.util.resolve_name(module_name, package) if module_name.startswith('.') else module_name
+        super().__init__(full_name)
+        object.__setattr__(self, '_lazy_name', module_name)
+        object.__setattr__(self, '_lazy_package', package)
+        object.__setattr__(self, '_lazy_module', None)
+        object.__setattr__(self, '_lazy_lock', threading.Lock())
+        profiler.register_deferred(full_name, purpose)
+
+    def _load(self, trigger: str = "") -> types.ModuleType:
+        module = object.__getattribute__(self, '_lazy_module')
+        if module is not None:
+            return module
+        with object.__getattribute__(self, '_lazy_lock'):
+            module = object.__getattribute__(self, '_lazy_module')
+            if module is None:
+                module = profiled_import(
+                    object.__getattribute__(self, '_lazy_name'),
+                    object.__getattribute__(self, '_lazy_package'),
+                    trigger
+                )
+                object.__setattr__(self, '_lazy_module', module)
+        return module
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._load(name), name)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        setattr(self._load(name), name, value)
+
+    def __dir__(self):
+        return dir(self._load('__dir__'))
+
+    def __repr__(self) -> str:
+        state = 'loaded' if object.__getattribute__(self, '_lazy_module') is not None else 'not loaded'
+        return f"<lazy module '{self.__name__}' ({state})>"
+
+
+def lazy_import(module_name: str, package: Optional[str] = None, purpose: str = "") -> types.ModuleType:
+    """
+    モジュールを遅延インポート
+
+    Args:
+        module_name: モジュール名
+        package: 相対インポートの基準パッケージ
+        purpose: 用途（プロファイルレポート用）
+
+    Returns:
+        LazyModuleプロキシ（MCP_EAGER_IMPORTS=1の場合は実モジュール）
+    """
+    if EAGER_IMPORTS:
+        return profiled_import(module_name, package, 'eager')
+    return LazyModule(module_name, package, purpose)
+
+
+def is_loaded(module: Any) -> bool:
+    """
+    モジュールがロード済みか確認（ロードは発生させない）
+
+    Args:
+        module: LazyModuleまたは通常のモジュール
+
+    Returns:
+        ロード済みの場合はTrue
+    """
+    if isinstance(module, LazyModule):
+        return object.__getattribute__(module, '_lazy_module') is not None
+    return module is not None
+
+
+def make_module_getattr(package: str, submodules: Dict[str, str],
+                        fallback: Optional[Callable[[str], Any]] = None) -> Callable[[str], Any]:
+    """
+    パッケージの__getattr__（PEP 562）を生成し、サブモジュールを初回アクセス時にインポートする
+
+    Args:
+        package: パッケージ名（__name__）
+        submodules: 属性名 -> 相対モジュール名
+        fallback: サブモジュール以外の属性の解決関数
+
+    Returns:
+        __getattr__関数
+    """
+    for name, module_name in submodules.items():
+        profiler.register_deferred(importlib.util.resolve_name(module_name, package))
+
+    def __getattr__(name: str) -> Any:
+        if name in submodules:
+            module = profiled_import(submodules[name], package, name)
+            setattr(sys.modules[package], name, module)
+            return module
+        if fallback is not None:
+            return fallback(name)
+        raise AttributeError(f"module '{package}' has no attribute '{name}'")
+
+    return __getattr__
+
+
+class DeferredTask:
+    """
+    起動処理の外（メインスレッドのタイマー）で実行される処理の結果を保持する
+
+    bpyへのアクセスやsys.pathの変更を伴う処理を想定しているため、
+    バックグラウンドスレッドでは実行しない。
+    """
+
+    def __init__(self, name: str, func: Callable[[], Any]):
+        self.name = name
+        self.func = func
+        self.result: Any = None
+        self.error: Optional[BaseException] = None
+        self.duration: Optional[float] = None
+        self._done = threading.Event()
+        self._started = False
+        self._lock = threading.Lock()
+
+    def schedule(self, first_interval: float = 0.0) -> 'DeferredTask':
+        """bpy.app.timersでメインスレッドでの実行を予約"""
+        import bpy
+
+        def _timer():
+            self.run()
+            return None
+
+        bpy.app.timers.register(_timer, first_interval=first_interval)
+        return self
+
+    def run(self) -> None:
+        """呼び出し元のスレッドで実行（実行済み・実行中の場合は何もしない）"""
+        with self._lock:
+            if self._started:
+                return
+            self._started = True
+
+        start = time.perf_counter()
+        try:
+            self.result = self.func()
+        except BaseException as e:
+            self.error = e
+            logger.error(f"遅延処理 '{self.name}' でエラーが発生しました: {e}")
+        finally:
+            self.duration = time.perf_counter() - start
+            logger.info(f"遅延処理 '{self.name}' が完了しました ({self.duration * 1000:.1f}ms)")
+            self._done.set()
+
+    @property
+    def done(self) -> bool:
+        """完了しているかどうか"""
+        return self._done.is_set()
+
+    def wait(self, timeout: Optional[float] = None) -> Any:
+        """
+        完了を待って結果を返す
+
+        Args:
+            timeout: 最大待機時間（秒）
+
+        Returns:
+            処理結果（未完了またはエラーの場合はNone）
+        """
+        if not self._started:
+            # タイマーより先に必要になった場合は呼び出し元で実行
+            self.run()
+        self._done.wait(timeout)
+        return self.result if self.done and self.error is None else None
+
+
+def run_deferred(name: str, func: Callable[[], Any], first_interval: float = 0.1) -> DeferredTask:
+    """
+    処理を起動パスの外（register完了後のメインスレッドのタイマー）で実行
+
+    Args:
+        name: 処理名
+        func: 実行する関数
+        first_interval: 実行までの待機時間（秒）
+
+    Returns:
+        DeferredTask
+    """
+    return DeferredTask(name, func).schedule(first_interval)
@@ -0,0 +1,257 @@
+"""
+Blender Unified MCP Log Ring Buffer
+プロセス内のログを固定長のリングバッファに保持し、レベル・ロガー別に検索するためのロギングハンドラ
+"""
+
+import os
+import time
+import heapq
+import logging
+import threading
+from collections import deque
+from typing import Any, Deque, Dict, Iterable, Iterator, List, Optional, Tuple
+
+# モジュールレベルのロガー
+logger = logging.getLogger('unified_mcp.utils.log_buffer')
+
+# 保持するレコード数（超えたら古いものから上書き）
+DEFAULT_CAPACITY = int(os.environ.get('MCP_LOG_BUFFER_SIZE', '10000'))
+
+# 記録する最小レベル
+DEFAULT_LEVEL = os.environ.get('MCP_LOG_BUFFER_LEVEL', 'INFO').upper()
+
+# 1回のクエリで返す最大件数
+MAX_QUERY_LIMIT = 1000
+
+# レコードの内部表現のインデックス（seq, created, levelno, name, message）
+_SEQ, _CREATED, _LEVELNO, _NAME, _MESSAGE = range(5)
+
+# 例外情報の整形用
+_exc_formatter = logging.Formatter()
+
+
+def parse_level(level: Any) -> Optional[int]:
+    """
+    ログレベルの指定を数値に変換
+
+    Args:
+        level: レベル名（'info' / 'WARNING' など）、数値、またはNone
+
+    Returns:
+        レベルの数値（指定なし・'all'の場合はNone）
+    """
+    if level is None or level == '' or level == 'all':
+        return None
+    if isinstance(level, int):
+        return level
+    value = logging.getLevelName(str(level).upper())
+    return value if isinstance(value, int) else None
+
+
+class LogRingBuffer(logging.Handler):
+    """
+    固定長リングバッファに圧縮したログレコードを保持するハンドラ
+
+    レコードはタプル (seq, created, levelno, name, message) として保存し、
+    レベル・ロガーごとに連番のインデックスを持つ。上書きされるレコードは常に
+    各インデックスの先頭にあるため、インデックスの維持は O(1) で済む。
+    連番はカーソルとしてページングとライブテールに使用する。
+    """
+
+    def __init__(self, capacity: int = DEFAULT_CAPACITY, level: Any = DEFAULT_LEVEL):
+        super().__init__(parse_level(level) or logging.NOTSET)
+        self.capacity = max(1, capacity)
+        self._ring: List[Optional[Tuple]] = [None] * self.capacity
+        self._seq = 0
+        self._by_level: Dict[int, Deque[int]] = {}
+        self._by_logger: Dict[str, Deque[int]] = {}
+
+    @property
+    def latest_seq(self) -> int:
+        """最新のレコードの連番（まだない場合は0）"""
+        return self._seq
+
+    def emit(self, record: logging.LogRecord) -> None:
+        """レコードをリングバッファに追加（Handler.handleがロックを取得済み）"""
+        try:
+            message = record.getMessage()
+            if record.exc_info and not record.exc_text:
+                record.exc_text = _exc_formatter.formatException(record.exc_info)
+            if record.exc_text:
+                message = f"{message}\n{record.exc_text}"
+
+            self._seq += 1
+            seq = self._seq
+            slot = seq % self.capacity
+
+            # 上書きされる最古のレコードをインデックスから外す
+            old = self._ring[slot]
+            if old is not None:
+                self._by_level[old[_LEVELNO]].popleft()
+                by_logger = self._by_logger[old[_NAME]]
+                by_logger.popleft()
+                if not by_logger:
+                    del self._by_logger[old[_NAME]]
+
+            self._ring[slot] = (seq, record.created, record.levelno, record.name, message)
+
+            by_level = self._by_level.get(record.levelno)
+            if by_level is None:
+                by_level = self._by_level[record.levelno] = deque()
+            by_level.append(seq)
+
+            by_logger = self._by_logger.get(record.name)
+            if by_logger is None:
+                by_logger = self._by_logger[record.name] = deque()
+            by_logger.append(seq)
+        except Exception:
+            self.handleError(record)
+
+    def query(self, limit: int = 100, level: Any = None, logger_name: Optional[str] = None,
+              search: Optional[str] = None, before: Optional[int] = None,
+              after: Optional[int] = None) -> Dict[str, Any]:
+        """
+        ログを検索
+
+        beforeまたは指定なしの場合は新しい方から遡り、afterを指定した場合は
+        その連番より新しいレコードを古い順に返す（ライブテール用）。
+        いずれの場合もentriesは古い順に並ぶ。
+
+        Args:
+            limit: 最大件数
+            level: 最小レベル（'info' / 'warning' など）
+            logger_name: ロガー名（子ロガーを含む）
+            search: メッセージに含まれる文字列（大文字小文字を区別しない）
+            before: この連番より古いレコードを返す
+            after: この連番より新しいレコードを返す
+
+        Returns:
+            entries: レコードのリスト
+            next_cursor: 続きを取得するためのカーソル（beforeまたはafterに指定、なければNone）
+            latest: 最新の連番
+        """
+        limit = max(1, min(int(limit), MAX_QUERY_LIMIT))
+        min_level = parse_level(level)
+        forward = after is not None
+        needle = search.lower() if search else None
+
+        # インデックスとリングのスナップショットを取得し、走査はロックの外で行う
+        with self.lock:
+            latest = self._seq
+            ring = list(self._ring)
+            if logger_name:
+                prefix = logger_name + '.'
+                sources = [list(seqs) for name, seqs in self._by_logger.items()
+                           if name == logger_name or name.startswith(prefix)]
+            elif min_level is not None:
+                sources = [list(seqs) for levelno, seqs in self._by_level.items() if levelno >= min_level]
+            else:
+                sources = None
+
+        oldest = max(1, latest - self.capacity + 1)
+        if sources is None:
+            if forward:
+                candidates: Iterable[int] = range(max(after + 1, oldest), latest + 1)
+            else:
+                candidates = range(min(before - 1 if before else latest, latest), oldest - 1, -1)
+        else:
+            candidates = self._merge(sources, forward, after if forward else before)
+
+        entries = []
+        has_more = False
+        for seq in candidates:
+            record = ring[seq % self.capacity]
+            if record is None or record[_SEQ] != seq:
+                continue
+            if min_level is not None and record[_LEVELNO] < min_level:
+                continue
+            if needle and needle not in record[_MESSAGE].lower():
+                continue
+            if len(entries) == limit:
+                has_more = True
+                break
+            entries.append(record)
+
+        if not forward:
+            entries.reverse()
+
+        if forward:
+            # 取り切った場合は最新まで走査済みなので次回はlatestから
+            next_cursor = entries[-1][_SEQ] if has_more else max(after, latest)
+        else:
+            next_cursor = entries[0][_SEQ] if entries and has_more else None
+
+        return {
+            'entries': [self._to_dict(record) for record in entries],
+            'next_cursor': next_cursor,
+            'latest': latest
+        }
+
+    @staticmethod
+    def _merge(sources: List[List[int]], forward: bool, cursor: Optional[int]) -> Iterator[int]:
+        """インデックスの連番リストを1つの昇順または降順の列にまとめる"""
+        if forward:
+            return (seq for seq in heapq.merge(*sources) if seq > cursor)
+        merged = heapq.merge(*(reversed(seqs) for seqs in sources), reverse=True)
+        if cursor is None:
+            return merged
+        return (seq for seq in merged if seq < cursor)
+
+    @staticmethod
+    def _to_dict(record: Tuple) -> Dict[str, Any]:
+        """内部表現を応答用の辞書に変換"""
+        return {
+            'seq': record[_SEQ],
+            'time': time.strftime('%Y-%m-%d %H:%M:%S', time.localtime(record[_CREATED])),
+            'timestamp': record[_CREATED],
+            'level': logging.getLevelName(record[_LEVELNO]),
+            'logger': record[_NAME],
+            'message': record[_MESSAGE]
+        }
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        バッファの統計情報を取得
+
+        Returns:
+            容量・保持件数・レベル別件数・ロガー別件数
+        """
+        with self.lock:
+            return {
+                'capacity': self.capacity,
+                'size': min(self._seq, self.capacity),
+                'latest_seq': self._seq,
+                'level': logging.getLevelName(self.level),
+                'by_level': {logging.getLevelName(levelno): len(seqs)
+                             for levelno, seqs in self._by_level.items() if seqs},
+                'by_logger': {name: len(seqs) for name, seqs in self._by_logger.items()}
+            }
+
+    def clear(self) -> None:
+        """保持しているレコードを破棄（連番は継続）"""
+        with self.lock:
+            self._ring = [None] * self.capacity
+            self._by_level.clear()
+            self._by_logger.clear()
+
+
+# グローバルインスタンス
+_log_buffer: Optional[LogRingBuffer] = None
+_log_buffer_lock = threading.Lock()
+
+
+def get_log_buffer() -> LogRingBuffer:
+    """
+    共有ログバッファを取得（初回呼び出し時にルートロガーへ登録）
+
+    Returns:
+        LogRingBuffer: ログバッファ
+    """
+    global _log_buffer
+    if _log_buffer is None:
+        with _log_buffer_lock:
+            if _log_buffer is None:
+                _log_buffer = LogRingBuffer()
+                logging.getLogger().addHandler(_log_buffer)
+                logger.debug(f"ログバッファを登録しました（容量: {_log_buffer.capacity}）")
+    return _log_buffer
@@ -0,0 +1,424 @@
+"""
+Blender Unified MCP Metrics Registry
+リゾルバ・コマンド・エンドポイントの呼び出し回数とレイテンシを記録する共有メトリクスレジストリ
+"""
+
+import os
+import re
+import time
+import threading
+import functools
+import logging
+from typing import Dict, Any, Callable, List, Optional, Tuple, TypeVar, cast
+
+# 型ヒント用
+F = TypeVar('F', bound=Callable[..., Any])
+
+# モジュールレベルのロガー
+logger = logging.getLogger('unified_mcp.utils.metrics')
+
+# レイテンシを計測する呼び出しの割合（1.0 = 全呼び出し）。呼び出し回数は常に正確に数える
+DEFAULT_SAMPLE_RATE = float(os.environ.get('MCP_METRICS_SAMPLE_RATE', '1.0'))
+
+# ヒストグラムの精度: 2の累乗ごとに 2**SUB_BUCKET_BITS 個の線形バケット（相対誤差 約3%）
+SUB_BUCKET_BITS = 4
+SUB_BUCKET_COUNT = 1 << SUB_BUCKET_BITS
+
+# エクスポートするパーセンタイル
+QUANTILES = (0.5, 0.95, 0.99)
+
+# Prometheusのメトリクス名・ラベル名に使えない文字
+_INVALID_METRIC_CHARS = re.compile(r'[^a-zA-Z0-9_:]')
+_INVALID_LABEL_CHARS = re.compile(r'[^a-zA-Z0-9_]')
+
+# 系列の内部表現のインデックス
+_COUNT, _SAMPLED, _SUM, _MIN, _MAX, _BUCKETS = range(6)
+
+
+def _bucket_index(value_us: int) -> int:
+    """マイクロ秒の値をHDR形式（対数線形）のバケット番号に変換"""
+    if value_us < SUB_BUCKET_COUNT:
+        return value_us
+    shift = value_us.bit_length() - SUB_BUCKET_BITS - 1
+    return SUB_BUCKET_COUNT + shift * SUB_BUCKET_COUNT + ((value_us >> shift) - SUB_BUCKET_COUNT)
+
+
+def _bucket_value(index: int) -> float:
+    """バケット番号の代表値（バケット中央、マイクロ秒）"""
+    if index < SUB_BUCKET_COUNT:
+        return float(index)
+    shift, offset = divmod(index - SUB_BUCKET_COUNT, SUB_BUCKET_COUNT)
+    lower = (SUB_BUCKET_COUNT + offset) << shift
+    return lower + ((1 << shift) - 1) / 2.0
+
+
+class _Shard:
+    """
+    スレッドごとのメトリクス格納領域
+
+    所有スレッドだけが書き込むためロックは不要。読み取り時は全シャードを合算する。
+    """
+
+    __slots__ = ('series', 'counters', 'countdown')
+
+    def __init__(self):
+        self.series: Dict[Tuple[str, str], list] = {}
+        self.counters: Dict[Tuple[str, Tuple], float] = {}
+        self.countdown = 0
+
+    def get_series(self, key: Tuple[str, str]) -> list:
+        series = self.series.get(key)
+        if series is None:
+            series = self.series[key] = [0, 0, 0.0, float('inf'), 0.0, {}]
+        return series
+
+    def merge_from(self, other: '_Shard'):
+        """他のシャードの値を加算（otherへの書き込みが止まっているか、読み取り用の合算で使う）"""
+        # 所有スレッドが書き込み中でも辞書のコピーは安全
+        for key, values in list(other.series.items()):
+            merged = self.get_series(key)
+            merged[_COUNT] += values[_COUNT]
+            merged[_SAMPLED] += values[_SAMPLED]
+            merged[_SUM] += values[_SUM]
+            merged[_MIN] = min(merged[_MIN], values[_MIN])
+            merged[_MAX] = max(merged[_MAX], values[_MAX])
+            for index, bucket_count in list(values[_BUCKETS].items()):
+                merged[_BUCKETS][index] = merged[_BUCKETS].get(index, 0) + bucket_count
+        for key, value in list(other.counters.items()):
+            self.counters[key] = self.counters.get(key, 0.0) + value
+
+
+class _Timer:
+    """レイテンシ計測用のコンテキストマネージャ"""
+
+    __slots__ = ('registry', 'key', 'start_time')
+
+    def __init__(self, registry: 'MetricsRegistry', key: Tuple[str, str]):
+        self.registry = registry
+        self.key = key
+        self.start_time = None
+
+    def __enter__(self):
+        if self.registry.should_sample():
+            self.start_time = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        if self.start_time is None:
+            self.registry.count(*self.key)
+        else:
+            self.registry.observe(self.key[0], self.key[1], (time.perf_counter() - self.start_time) * 1000)
+        return False
+
+
+class MetricsRegistry:
+    """
+    呼び出し回数・カウンター・レイテンシヒストグラムのレジストリ
+
+    レイテンシは subsystem（resolver / command / endpoint など）と名前の組で集計する。
+    書き込みはスレッドローカルのシャードに対して行うため、ホットパスでロックを取らない。
+    """
+
+    def __init__(self, sample_rate: float = DEFAULT_SAMPLE_RATE):
+        self._local = threading.local()
+        # (所有スレッド, シャード)。終了したスレッドのシャードは_baseに合算して外す
+        self._shards: List[Tuple[threading.Thread, _Shard]] = []
+        self._base = _Shard()
+        self._lock = threading.Lock()
+        self.enabled = True
+        self.set_sample_rate(sample_rate)
+
+    def set_sample_rate(self, sample_rate: float):
+        """
+        レイテンシを計測する呼び出しの割合を設定
+
+        Args:
+            sample_rate: 0より大きく1以下の割合（0.1なら10回に1回計測）
+        """
+        sample_rate = min(1.0, max(sample_rate, 1e-6))
+        self.sample_rate = sample_rate
+        self._sample_interval = max(1, int(round(1.0 / sample_rate)))
+
+    def _shard(self) -> _Shard:
+        """現在のスレッドのシャードを取得"""
+        shard = getattr(self._local, 'shard', None)
+        if shard is None:
+            shard = self._local.shard = _Shard()
+            with self._lock:
+                self._fold_dead_shards()
+                self._shards.append((threading.current_thread(), shard))
+        return shard
+
+    def _fold_dead_shards(self):
+        """終了したスレッドのシャードを_baseに合算して外す（ロック内で呼び出す）"""
+        alive = []
+        for thread, shard in self._shards:
+            if thread.is_alive():
+                alive.append((thread, shard))
+            else:
+                self._base.merge_from(shard)
+        self._shards = alive
+
+    def should_sample(self) -> bool:
+        """この呼び出しのレイテンシを計測するか（スレッドごとに一定間隔で間引く）"""
+        if not self.enabled:
+            return False
+        if self._sample_interval == 1:
+            return True
+        shard = self._shard()
+        shard.countdown -= 1
+        if shard.countdown <= 0:
+            shard.countdown = self._sample_interval
+            return True
+        return False
+
+    def count(self, subsystem: str, name: str):
+        """レイテンシを計測しなかった呼び出しを数える"""
+        if self.enabled:
+            self._shard().get_series((subsystem, name))[_COUNT] += 1
+
+    def observe(self, subsystem: str, name: str, duration_ms: float):
+        """
+        レイテンシを記録
+
+        Args:
+            subsystem: 計測対象の種類（resolver / command / endpoint / function など）
+            name: リゾルバ名・コマンド名・ルートなど
+            duration_ms: 処理時間（ミリ秒）
+        """
+        if not self.enabled:
+            return
+        series = self._shard().get_series((subsystem, name))
+        series[_COUNT] += 1
+        series[_SAMPLED] += 1
+        series[_SUM] += duration_ms
+        if duration_ms < series[_MIN]:
+            series[_MIN] = duration_ms
+        if duration_ms > series[_MAX]:
+            series[_MAX] = duration_ms
+        index = _bucket_index(int(duration_ms * 1000))
+        buckets = series[_BUCKETS]
+        buckets[index] = buckets.get(index, 0) + 1
+
+    def inc(self, name: str, value: float = 1.0, **labels):
+        """
+        カウンターを加算
+
+        Args:
+            name: カウンター名
+            value: 加算値
+            labels: ラベル
+        """
+        if not self.enabled:
+            return
+        key = (name, tuple(sorted(labels.items())) if labels else ())
+        counters = self._shard().counters
+        counters[key] = counters.get(key, 0.0) + value
+
+    def timer(self, subsystem: str, name: str) -> _Timer:
+        """
+        with文でレイテンシを計測するタイマーを作成
+
+        Example:
+            with registry.timer("command", "create_object"):
+                ...
+        """
+        return _Timer(self, (subsystem, name))
+
+    def timed(self, subsystem: str, name: Optional[str] = None) -> Callable[[F], F]:
+        """
+        関数のレイテンシを計測するデコレータ
+
+        Args:
+            subsystem: 計測対象の種類
+            name: 名前（省略時は関数名）
+        """
+        def decorator(func: F) -> F:
+            key = (subsystem, name or func.__name__)
+
+            @functools.wraps(func)
+            def wrapper(*args, **kwargs):
+                with _Timer(self, key):
+                    return func(*args, **kwargs)
+            return cast(F, wrapper)
+        return decorator
+
+    def _merged(self):
+        """全シャードを合算した系列とカウンターを取得"""
+        total = _Shard()
+        with self._lock:
+            self._fold_dead_shards()
+            total.merge_from(self._base)
+            for _, shard in self._shards:
+                total.merge_from(shard)
+        return total.series, total.counters
+
+    @staticmethod
+    def _quantiles(buckets: Dict[int, int], total: int) -> Dict[float, float]:
+        """ヒストグラムからパーセンタイル（ミリ秒）を計算"""
+        result = {}
+        if not total:
+            return {q: 0.0 for q in QUANTILES}
+        targets = [(q, max(1, int(q * total + 0.5))) for q in QUANTILES]
+        seen = 0
+        position = 0
+        for index in sorted(buckets):
+            seen += buckets[index]
+            while position < len(targets) and seen >= targets[position][1]:
+                result[targets[position][0]] = _bucket_value(index) / 1000.0
+                position += 1
+            if position == len(targets):
+                break
+        return result
+
+    def get_latency(self, subsystem: str, name: str) -> Dict[str, Any]:
+        """特定の系列の統計を取得（未記録なら空の統計）"""
+        return self.snapshot(subsystem)['latency'].get(subsystem, {}).get(name, self._summarize(None))
+
+    def _summarize(self, values: Optional[list]) -> Dict[str, Any]:
+        """内部表現を統計の辞書に変換"""
+        if values is None:
+            values = [0, 0, 0.0, float('inf'), 0.0, {}]
+        sampled = values[_SAMPLED]
+        quantiles = self._quantiles(values[_BUCKETS], sampled)
+        return {
+            'count': values[_COUNT],
+            'sampled': sampled,
+            'sum_ms': values[_SUM],
+            'avg_ms': values[_SUM] / sampled if sampled else 0.0,
+            'min_ms': values[_MIN] if sampled else 0.0,
+            'max_ms': values[_MAX],
+            'p50_ms': quantiles[0.5],
+            'p95_ms': quantiles[0.95],
+            'p99_ms': quantiles[0.99],
+        }
+
+    def snapshot(self, subsystem: Optional[str] = None) -> Dict[str, Any]:
+        """
+        メトリクスのスナップショットを取得（JSONエクスポート用）
+
+        Args:
+            subsystem: 指定時はその種類のレイテンシのみ
+
+        Returns:
+            {'latency': {subsystem: {name: 統計}}, 'counters': {name: 値 or {ラベル: 値}}}
+        """
+        series, counters = self._merged()
+
+        latency: Dict[str, Dict[str, Any]] = {}
+        for (series_subsystem, name), values in sorted(series.items()):
+            if subsystem is not None and series_subsystem != subsystem:
+                continue
+            latency.setdefault(series_subsystem, {})[name] = self._summarize(values)
+
+        counter_values: Dict[str, Any] = {}
+        for (name, labels), value in sorted(counters.items()):
+            if labels:
+                label_key = ','.join(f"{k}={v}" for k, v in labels)
+                counter_values.setdefault(name, {})[label_key] = value
+            else:
+                counter_values[name] = value
+
+        return {
+            'latency': latency,
+            'counters': counter_values,
+            'sample_rate': self.sample_rate,
+        }
+
+    def to_prometheus(self, prefix: str = 'mcp') -> str:
+        """
+        Prometheusのテキスト形式でエクスポート
+
+        レイテンシはsummary（quantile / _sum / _count、秒単位）、
+        全呼び出し回数は <prefix>_calls_total として出力する。
+
+        Args:
+            prefix: メトリクス名の接頭辞
+
+        Returns:
+            Prometheus exposition形式のテキスト
+        """
+        series, counters = self._merged()
+        lines = []
+
+        latency_name = f"{prefix}_latency_seconds"
+        calls_name = f"{prefix}_calls_total"
+        if series:
+            lines.append(f"# HELP {latency_name} Sampled latency by subsystem and name")
+            lines.append(f"# TYPE {latency_name} summary")
+            for (subsystem, name), values in sorted(series.items()):
+                labels = f'subsystem="{_escape_label(subsystem)}",name="{_escape_label(name)}"'
+                quantiles = self._quantiles(values[_BUCKETS], values[_SAMPLED])
+                for q in QUANTILES:
+                    lines.append(f'{latency_name}{{{labels},quantile="{q}"}} {quantiles[q] / 1000.0:.9g}')
+                lines.append(f'{latency_name}_sum{{{labels}}} {values[_SUM] / 1000.0:.9g}')
+                lines.append(f'{latency_name}_count{{{labels}}} {values[_SAMPLED]}')
+
+            lines.append(f"# HELP {calls_name} Calls by subsystem and name")
+            lines.append(f"# TYPE {calls_name} counter")
+            for (subsystem, name), values in sorted(series.items()):
+                labels = f'subsystem="{_escape_label(subsystem)}",name="{_escape_label(name)}"'
+                lines.append(f'{calls_name}{{{labels}}} {values[_COUNT]}')
+
+        declared = set()
+        for (name, labels), value in sorted(counters.items()):
+            metric = f"{prefix}_{_sanitize_name(name)}_total"
+            if metric not in declared:
+                lines.append(f"# TYPE {metric} counter")
+                declared.add(metric)
+            label_text = ','.join(f'{_sanitize_name(k, label=True)}="{_escape_label(v)}"' for k, v in labels)
+            lines.append(f"{metric}{{{label_text}}} {value:.9g}" if label_text else f"{metric} {value:.9g}")
+
+        return '\n'.join(lines) + '\n'
+
+    def reset(self, subsystem: Optional[str] = None):
+        """
+        メトリクスをリセット
+
+        Args:
+            subsystem: 指定時はその種類のレイテンシと、subsystemラベルが一致するカウンターのみリセット
+        """
+        with self._lock:
+            self._fold_dead_shards()
+            shards = [self._base] + [shard for _, shard in self._shards]
+        for shard in shards:
+            if subsystem is None:
+                shard.series.clear()
+                shard.counters.clear()
+            else:
+                for key in [key for key in list(shard.series) if key[0] == subsystem]:
+                    shard.series.pop(key, None)
+                for key in [key for key in list(shard.counters) if ('subsystem', subsystem) in key[1]]:
+                    shard.counters.pop(key, None)
+
+
+def _escape_label(value: Any) -> str:
+    """Prometheusのラベル値をエスケープ"""
+    return str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+
+def _sanitize_name(name: str, label: bool = False) -> str:
+    """Prometheusのメトリクス名（[a-zA-Z0-9_:]）・ラベル名（[a-zA-Z0-9_]）に使えない文字を置換"""
+    name = (_INVALID_LABEL_CHARS if label else _INVALID_METRIC_CHARS).sub('_', str(name))
+    # ラベル名は数字で始められない（メトリクス名は接頭辞が付く）
+    return f"_{name}" if label and name[:1].isdigit() else name
+
+
+# グローバルインスタンス
+_registry = None
+_registry_lock = threading.Lock()
+
+
+def get_metrics_registry() -> MetricsRegistry:
+    """
+    共有メトリクスレジストリを取得
+
+    Returns:
+        MetricsRegistry: レジストリ
+    """
+    global _registry
+    if _registry is None:
+        with _registry_lock:
+            if _registry is None:
+                _registry = MetricsRegistry()
+    return _registry
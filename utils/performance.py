@@ -8,6 +8,8 @@ import functools
 import logging
 from typing import Dict, Any, Callable, Optional, TypeVar, cast
 
+from .metrics import get_metrics_registry
+
 # 型ヒント用
 F = TypeVar('F', bound=Callable[..., Any])
 
@@ -17,8 +19,8 @@ logger = logging.getLogger('unified_mcp.performance')
 # グローバル設定
 performance_tracking_enabled = True
 
-# 実行時間記録用の辞書
-_timing_stats = {}
+# 実行時間は共有メトリクスレジストリに記録（スレッドセーフ、パーセンタイル付き）
+METRICS_SUBSYSTEM = 'function'
 
 def enable_tracking():
     """パフォーマンス計測を有効化"""
@@ -34,13 +36,25 @@ def disable_tracking():
 
 def reset_stats():
     """計測統計をリセット"""
-    global _timing_stats
-    _timing_stats.clear()
+    get_metrics_registry().reset(METRICS_SUBSYSTEM)
     logger.info("パフォーマンス統計がリセットされました")
 
 def get_stats() -> Dict[str, Dict[str, Any]]:
     """計測統計を取得"""
-    return _timing_stats.copy()
+    latency = get_metrics_registry().snapshot(METRICS_SUBSYSTEM)['latency'].get(METRICS_SUBSYSTEM, {})
+    return {
+        name: {
+            'count': stats['count'],
+            'total_ms': stats['sum_ms'],
+            'min_ms': stats['min_ms'],
+            'max_ms': stats['max_ms'],
+            'avg_ms': stats['avg_ms'],
+            'p50_ms': stats['p50_ms'],
+            'p95_ms': stats['p95_ms'],
+            'p99_ms': stats['p99_ms']
+        }
+        for name, stats in latency.items()
+    }
 
 def track_time(func: F) -> F:
     """関数の実行時間を計測するデコレータ（シンプル版）"""
@@ -51,33 +65,21 @@ def track_time(func: F) -> F:
         
         # 関数名
         func_name = func.__name__
+        registry = get_metrics_registry()
+        if not registry.should_sample():
+            registry.count(METRICS_SUBSYSTEM, func_name)
+            return func(*args, **kwargs)
+        
         # 開始時間
-        start_time = time.time()
+        start_time = time.perf_counter()
         
         try:
             # 関数実行
             return func(*args, **kwargs)
         finally:
-            # 終了時間と処理時間の計算
-            end_time = time.time()
-            duration_ms = (end_time - start_time) * 1000
-            
-            # 統計情報を更新
-            if func_name not in _timing_stats:
-                _timing_stats[func_name] = {
-                    'count': 0,
-                    'total_ms': 0,
-                    'min_ms': float('inf'),
-                    'max_ms': 0,
-                    'avg_ms': 0
-                }
-            
-            stats = _timing_stats[func_name]
-            stats['count'] += 1
-            stats['total_ms'] += duration_ms
-            stats['min_ms'] = min(stats['min_ms'], duration_ms)
-            stats['max_ms'] = max(stats['max_ms'], duration_ms)
-            stats['avg_ms'] = stats['total_ms'] / stats['count']
+            # 処理時間を記録
+            duration_ms = (time.perf_counter() - start_time) * 1000
+            registry.observe(METRICS_SUBSYSTEM, func_name, duration_ms)
             
             # ログに記録（デバッグレベル）
             logger.debug(f"{func_name}: {duration_ms:.2f}ms")
@@ -98,44 +100,26 @@ def time_operation(name: Optional[str] = None):
         
         def __enter__(self):
             if performance_tracking_enabled:
-                self.start_time = time.time()
+                self.start_time = time.perf_counter()
             return self
         
         def __exit__(self, exc_type, exc_val, exc_tb):
             if not performance_tracking_enabled or self.start_time is None:
                 return
             
-            # 終了時間と処理時間の計算
-            end_time = time.time()
-            duration_ms = (end_time - self.start_time) * 1000
-            
-            op_name = self.operation_name
-            
-            # 統計情報を更新
-            if op_name not in _timing_stats:
-                _timing_stats[op_name] = {
-                    'count': 0,
-                    'total_ms': 0,
-                    'min_ms': float('inf'),
-                    'max_ms': 0,
-                    'avg_ms': 0
-                }
-            
-            stats = _timing_stats[op_name]
-            stats['count'] += 1
-            stats['total_ms'] += duration_ms
-            stats['min_ms'] = min(stats['min_ms'], duration_ms)
-            stats['max_ms'] = max(stats['max_ms'], duration_ms)
-            stats['avg_ms'] = stats['total_ms'] / stats['count']
+            # 処理時間を記録
+            duration_ms = (time.perf_counter() - self.start_time) * 1000
+            get_metrics_registry().observe(METRICS_SUBSYSTEM, self.operation_name, duration_ms)
             
             # ログに記録（デバッグレベル）
-            logger.debug(f"{op_name}: {duration_ms:.2f}ms")
+            logger.debug(f"{self.operation_name}: {duration_ms:.2f}ms")
     
     return Timer(name)
 
 def print_stats(threshold_ms: float = 0):
     """閾値以上の処理時間の統計情報を表示"""
-    if not _timing_stats:
+    timing_stats = get_stats()
+    if not timing_stats:
         print("パフォーマンス統計情報はありません")
         return
     
@@ -145,7 +129,7 @@ def print_stats(threshold_ms: float = 0):
     
     # 平均時間でソート
     sorted_stats = sorted(
-        _timing_stats.items(), 
+        timing_stats.items(), 
         key=lambda x: x[1]['avg_ms'], 
         reverse=True
     )